@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Replays a session recorded with `run_pygame.py --record PATH`.
+
+The game is rebuilt from the recorded seed and every recorded action is
+re-executed as fast as possible, with no frame limiter and, unless
+`--render` is given, no window. Each recorded state hash is checked; the
+first mismatch is reported and the replay stops.
+"""
+
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Add project root to Python path
+project_root = Path(__file__).parent.absolute()
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from src.utils.logger import get_logger
+from src.utils.session_recording import (
+    Checkpoint,
+    ReplayContext,
+    compute_state_hash,
+    decode_action_argument,
+    read_recording,
+)
+
+logger = get_logger(__name__)
+
+
+def replay_session(path: str, render: bool = False) -> bool:
+    """
+    Replays a recording and verifies its checkpoints.
+
+    Args:
+        path: The recording file.
+        render: Whether to draw every replayed step to a window.
+
+    Returns:
+        bool: True if every checkpoint matched.
+    """
+    if not render:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    seed, entries = read_recording(path)
+
+    # Imported after the video driver is chosen: importing the UI package opens the display.
+    import pygame
+    import src.narco_configs as game_configs
+    from src.game_setup import create_new_game
+    from src.ui_pygame import app
+
+    random.seed(seed)
+    player_inv, game_state, current_region = create_new_game()
+    ui_manager = app.start_session(player_inv, current_region, game_state, game_configs, autosave=False)
+    context = ReplayContext(player_inv, game_state, game_configs)
+
+    replayed = 0
+    verified = 0
+    for entry in entries:
+        if isinstance(entry, Checkpoint):
+            actual_hash = compute_state_hash(player_inv, game_state)
+            if actual_hash != entry.state_hash:
+                logger.error(
+                    f"Replay diverged at step {entry.step} (day {entry.day}): "
+                    f"expected state {entry.state_hash}, got {actual_hash}."
+                )
+                return False
+            verified += 1
+            continue
+
+        previous_view = ui_manager.current_view
+        for field_name in ("quantity_input_string", "tech_input_string"):
+            setattr(ui_manager, field_name, entry.inputs.get(field_name, ""))
+        action = ui_manager.app_actions[entry.action]
+        action(*[decode_action_argument(arg, context) for arg in entry.args])
+        replayed += 1
+
+        # Mirror the per-frame view bookkeeping of game_loop
+        if ui_manager.game_over_message is not None and ui_manager.current_view != "game_over":
+            ui_manager.current_view = "game_over"
+        if previous_view != ui_manager.current_view:
+            ui_manager.setup_buttons_for_current_view()
+        if render:
+            pygame.event.pump()
+            app.draw_current_view(game_state.current_player_region)
+            pygame.display.flip()
+
+    logger.info(f"Replayed {replayed} actions; {verified} checkpoints matched (seed {seed}).")
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a recorded Narco-Syndicate session.")
+    parser.add_argument("recording", help="Recording written by run_pygame.py --record.")
+    parser.add_argument("--render", action="store_true", help="Draw each replayed step in a window.")
+    args = parser.parse_args(argv)
+    return 0 if replay_session(args.recording, render=args.render) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
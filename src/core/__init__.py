@@ -2,9 +2,11 @@
 
 from .ai_rival import AIRival
 from .enums import CryptoCoin, DrugName, DrugQuality, RegionName
+from .event_journal import EventJournal
 from .market_event import MarketEvent
 from .player_inventory import PlayerInventory
 from .region import Region
+from .timeline import Timeline
 
 __all__ = [
     'DrugQuality',
@@ -15,4 +17,6 @@ __all__ = [
     'Region',
     'AIRival',
     'MarketEvent',
+    'Timeline',
+    'EventJournal',
 ]
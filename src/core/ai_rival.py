@@ -47,3 +47,9 @@ class AIRival:
         self.activity_level: float = activity_level
         self.is_busted: bool = False
         self.busted_days_remaining: int = 0
+
+    def clone(self) -> "AIRival":
+        """Returns an independent copy. Every attribute is immutable, so a flat copy suffices."""
+        clone = AIRival.__new__(AIRival)
+        clone.__dict__.update(self.__dict__)
+        return clone
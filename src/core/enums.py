@@ -120,3 +120,37 @@ class EventType(Enum):
     RIVAL_STASH_LEAKED = 'RIVAL_STASH_LEAKED' #: Opportunity to steal from a rival.
     URGENT_DELIVERY = 'URGENT_DELIVERY' #: Opportunity for a high-paying quick delivery.
     EXPERIMENTAL_DRUG_BATCH = 'EXPERIMENTAL_DRUG_BATCH' #: Opportunity to buy a risky new drug batch.
+
+
+class TimelineEventKind(Enum):
+    """Kinds of day-scheduled occurrences tracked on the GameState timeline."""
+
+    DEBT_PAYMENT_DUE = 'DEBT_PAYMENT_DUE'  #: A debt instalment falls due.
+    LAUNDERING_ARRIVAL = 'LAUNDERING_ARRIVAL'  #: Laundered cash arrives as crypto.
+    INFORMANT_AVAILABLE = 'INFORMANT_AVAILABLE'  #: Informant returns after a betrayal.
+    TURF_WAR_END = 'TURF_WAR_END'  #: A regional turf war runs its course.
+    SEASONAL_EVENT_START = 'SEASONAL_EVENT_START'  #: A seasonal event begins.
+    SEASONAL_EVENT_END = 'SEASONAL_EVENT_END'  #: The active seasonal event ends.
+
+
+class ConditionDependency(Enum):
+    """Game state inputs that win conditions and legacy scenarios can depend on."""
+
+    CASH = 'CASH'  #: Player cash on hand.
+    CRYPTO_HOLDINGS = 'CRYPTO_HOLDINGS'  #: Crypto wallet and staked DrugCoin value.
+    DRUG_STASH = 'DRUG_STASH'  #: Drug inventory valued at base prices.
+    REGIONAL_HEAT = 'REGIONAL_HEAT'  #: Heat levels across all regions.
+    CONTACT_TRUST = 'CONTACT_TRUST'  #: Trust levels with contacts.
+    LAUNDERED_TOTAL = 'LAUNDERED_TOTAL'  #: Total cash laundered so far.
+    SKILLS = 'SKILLS'  #: Unlocked skills.
+    DEBT_PAYMENTS = 'DEBT_PAYMENTS'  #: Debt instalments paid.
+    REGIONAL_SALES = 'REGIONAL_SALES'  #: Sales profit per region.
+    PLAYER_ASSETS = 'PLAYER_ASSETS'  #: Owned gear and large crypto transaction count.
+    LEGACY_SCENARIOS = 'LEGACY_SCENARIOS'  #: Legacy scenarios already achieved.
+
+
+class JournalRecordKind(Enum):
+    """Kinds of records kept in the event journal."""
+
+    MARKET_EVENT_ENDED = 'MARKET_EVENT_ENDED'  #: A market event ran its full duration.
+    MARKET_EVENT_DEPLETED = 'MARKET_EVENT_DEPLETED'  #: A market event ended early because its stock ran out.
@@ -0,0 +1,258 @@
+"""
+Provides the event journal, a compact record of what happened in the world.
+
+Mechanics record occurrences as small typed records (day, kind, region, event
+type, drug, quality, subject, value) instead of formatting and printing text.
+Text is produced only when a consumer (HUD, log file, informant) reads the
+records back, so headless runs pay no string formatting or stdout cost.
+
+Recent records are kept in memory in a bounded deque. When a spill path is
+configured, records are also appended to a binary file in batches. Enum
+fields are stored as member ordinals and subject strings are interned, so a
+record costs a few dozen bytes on disk. Buffered records are written when a
+campaign ends, when the game is saved and, failing that, at interpreter exit.
+"""
+
+import atexit
+import struct
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Type
+
+from .enums import DrugName, DrugQuality, EventType, JournalRecordKind, RegionName
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_RECORD_TAG = b"R"
+_STRING_TAG = b"S"
+# day, kind, region, event type, drug, quality, subject string id, value
+_RECORD_STRUCT = struct.Struct("<iBhhhhid")
+# string id, byte length; the UTF-8 bytes follow. A journal that later appends
+# to the same file redefines IDs from 0, so readers keep the latest definition.
+_STRING_HEADER_STRUCT = struct.Struct("<iH")
+
+# Journals that may hold unspilled records, flushed at interpreter exit
+_spilling_journals: "weakref.WeakSet[EventJournal]" = weakref.WeakSet()
+
+_ordinal_tables: Dict[type, Dict[Any, int]] = {}
+_member_tables: Dict[type, List[Any]] = {}
+
+
+def _to_ordinal(enum_cls: Type[Any], member: Optional[Any]) -> int:
+    if member is None:
+        return -1
+    table = _ordinal_tables.get(enum_cls)
+    if table is None:
+        table = {enum_member: index for index, enum_member in enumerate(enum_cls)}
+        _ordinal_tables[enum_cls] = table
+    return table[member]
+
+
+def _from_ordinal(enum_cls: Type[Any], ordinal: int) -> Optional[Any]:
+    if ordinal < 0:
+        return None
+    members = _member_tables.get(enum_cls)
+    if members is None:
+        members = list(enum_cls)
+        _member_tables[enum_cls] = members
+    return members[ordinal]
+
+
+class JournalRecord(NamedTuple):
+    """
+    A single journal entry.
+
+    Attributes:
+        day: Game day the record was made.
+        kind: What the record describes.
+        region: Region it happened in, if any.
+        event_type: Market event type involved, if any.
+        drug: Drug involved, if any.
+        quality: Drug quality involved, if any.
+        subject: Free-form subject (e.g. a rival's name) that is not an enum.
+        value: Numeric payload; meaning depends on `kind`.
+    """
+
+    day: int
+    kind: JournalRecordKind
+    region: Optional[RegionName] = None
+    event_type: Optional[EventType] = None
+    drug: Optional[DrugName] = None
+    quality: Optional[DrugQuality] = None
+    subject: Optional[str] = None
+    value: float = 0.0
+
+
+class EventJournal:
+    """
+    Keeps recent journal records in memory and optionally spills them to disk.
+
+    The spill file is opened only while a batch is written, so the journal
+    stays picklable. Its layout depends on enum member order; it is meant
+    for analysing runs of the same build, not as a long-term format.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 500,
+        spill_path: Optional[str] = None,
+        spill_batch_size: int = 256,
+    ) -> None:
+        """
+        Args:
+            capacity: Number of recent records kept in memory.
+            spill_path: Optional file to append every record to, in batches.
+            spill_batch_size: Number of records buffered before a spill.
+        """
+        self._records: Deque[JournalRecord] = deque(maxlen=capacity)
+        self.spill_path: Optional[str] = spill_path
+        self.spill_batch_size: int = spill_batch_size
+        self._pending: List[JournalRecord] = []
+        self._spilled_string_ids: Dict[str, int] = {}
+        self._string_ids_path: Optional[str] = spill_path # File the interned string IDs belong to
+        self.total_records: int = 0
+        if spill_path is not None:
+            _spilling_journals.add(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_pending"] = [] # Only the original writes its buffered records, so a copy cannot duplicate them
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self.spill_path is not None:
+            _spilling_journals.add(self)
+
+    def record(
+        self,
+        day: int,
+        kind: JournalRecordKind,
+        region: Optional[RegionName] = None,
+        event_type: Optional[EventType] = None,
+        drug: Optional[DrugName] = None,
+        quality: Optional[DrugQuality] = None,
+        subject: Optional[str] = None,
+        value: float = 0.0,
+    ) -> JournalRecord:
+        """Appends a record and returns it. No text is formatted here."""
+        entry = JournalRecord(day, kind, region, event_type, drug, quality, subject, value)
+        self._records.append(entry)
+        self.total_records += 1
+        if self.spill_path is not None:
+            self._pending.append(entry)
+            if len(self._pending) >= self.spill_batch_size:
+                self.flush()
+        return entry
+
+    def recent(self, count: Optional[int] = None) -> List[JournalRecord]:
+        """Returns the most recent in-memory records (all of them if `count` is None), oldest first."""
+        if count is None or count >= len(self._records):
+            return list(self._records)
+        if count <= 0:
+            return []
+        return list(self._records)[-count:]
+
+    def since_day(self, day: int) -> List[JournalRecord]:
+        """Returns the in-memory records made on or after `day`, oldest first."""
+        return [entry for entry in self._records if entry.day >= day]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def clone(self) -> "EventJournal":
+        """
+        Returns a copy with the same in-memory records that never spills.
+
+        Meant for lookahead copies of a game, whose records must not reach the
+        original's spill file. Records are immutable and shared.
+        """
+        clone = EventJournal.__new__(EventJournal)
+        clone._records = deque(self._records, maxlen=self._records.maxlen)
+        clone.spill_path = None
+        clone.spill_batch_size = self.spill_batch_size
+        clone._pending = []
+        clone._spilled_string_ids = {}
+        clone._string_ids_path = None
+        clone.total_records = self.total_records
+        return clone
+
+    def flush(self) -> None:
+        """Writes buffered records to the spill file, if one is configured."""
+        if self.spill_path is None or not self._pending:
+            return
+        if self._string_ids_path != self.spill_path:
+            self._spilled_string_ids.clear()
+            self._string_ids_path = self.spill_path
+        chunks: List[bytes] = []
+        for entry in self._pending:
+            subject_id = -1
+            if entry.subject is not None:
+                subject_id = self._spilled_string_ids.get(entry.subject, -1)
+                if subject_id < 0:
+                    subject_id = len(self._spilled_string_ids)
+                    self._spilled_string_ids[entry.subject] = subject_id
+                    encoded = entry.subject.encode("utf-8")
+                    chunks.append(_STRING_TAG + _STRING_HEADER_STRUCT.pack(subject_id, len(encoded)) + encoded)
+            chunks.append(_RECORD_TAG + _RECORD_STRUCT.pack(
+                entry.day,
+                _to_ordinal(JournalRecordKind, entry.kind),
+                _to_ordinal(RegionName, entry.region),
+                _to_ordinal(EventType, entry.event_type),
+                _to_ordinal(DrugName, entry.drug),
+                _to_ordinal(DrugQuality, entry.quality),
+                subject_id,
+                entry.value,
+            ))
+        with open(self.spill_path, "ab") as spill_file:
+            spill_file.write(b"".join(chunks))
+        self._pending.clear()
+
+
+@atexit.register
+def _flush_spilling_journals() -> None:
+    for journal in list(_spilling_journals):
+        try:
+            journal.flush()
+        except OSError as e:
+            logger.error("Could not write buffered journal records to %s: %s", journal.spill_path, e)
+
+
+def read_journal_file(path: str) -> Iterator[JournalRecord]:
+    """
+    Reads back the records an EventJournal spilled to `path`.
+
+    Args:
+        path: The spill file.
+
+    Yields:
+        JournalRecord: Records in the order they were written.
+    """
+    strings: Dict[int, str] = {}
+    with open(path, "rb") as spill_file:
+        data = spill_file.read()
+    offset = 0
+    while offset < len(data):
+        tag = data[offset:offset + 1]
+        offset += 1
+        if tag == _STRING_TAG:
+            string_id, length = _STRING_HEADER_STRUCT.unpack_from(data, offset)
+            offset += _STRING_HEADER_STRUCT.size
+            strings[string_id] = data[offset:offset + length].decode("utf-8")
+            offset += length
+            continue
+        if tag != _RECORD_TAG:
+            raise ValueError(f"Corrupt journal file {path!r} at byte {offset - 1}.")
+        day, kind, region, event_type, drug, quality, subject_id, value = _RECORD_STRUCT.unpack_from(data, offset)
+        offset += _RECORD_STRUCT.size
+        yield JournalRecord(
+            day,
+            _from_ordinal(JournalRecordKind, kind),
+            _from_ordinal(RegionName, region),
+            _from_ordinal(EventType, event_type),
+            _from_ordinal(DrugName, drug),
+            _from_ordinal(DrugQuality, quality),
+            strings[subject_id] if subject_id >= 0 else None,
+            value,
+        )
@@ -45,6 +45,12 @@ class MarketEvent:
     # Black Market event field
     black_market_quantity_available: Optional[int] = None
 
+    def clone(self) -> "MarketEvent":
+        """Returns an independent copy. Every field is immutable, so a flat copy suffices."""
+        clone = object.__new__(MarketEvent)
+        clone.__dict__.update(self.__dict__)
+        return clone
+
     def __str__(self) -> str:
         """Returns a string representation of the market event."""
         details: str = f'Event: {self.event_type.value}'
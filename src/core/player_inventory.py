@@ -2,7 +2,7 @@
 Manages the player's inventory, including drugs, cash, crypto, skills,
 and status.
 """
-from typing import Dict, List, Optional, Set, Union, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Union, TYPE_CHECKING
 
 from .enums import CryptoCoin, DrugName, DrugQuality, SkillID, ContactID # Added ContactID
 
@@ -38,6 +38,8 @@ class PlayerInventory:
         debt_payment_1_paid: Status of the first debt payment.
         debt_payment_2_paid: Status of the second debt payment.
         debt_payment_3_paid: Status of the third debt payment.
+        change_listeners: Observers notified when a drug quantity or crypto
+                          balance changes (see `_notify_drug_change`).
     """
 
     def __init__(
@@ -123,6 +125,51 @@ class PlayerInventory:
         self.completed_quests: List[QuestID] = []
         self.special_items: Dict[str, int] = {} # For quest items like "Special Supplies"
 
+        # Observers (e.g. NetWorthTracker) implementing on_drug_quantity_changed
+        # and on_crypto_balance_changed; kept in sync by the mutators below.
+        self.change_listeners: List[Any] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Listeners are derived caches; they re-attach on first use after a load.
+        state = self.__dict__.copy()
+        state["change_listeners"] = []
+        return state
+
+    def clone(self) -> "PlayerInventory":
+        """
+        Returns an independent copy of the inventory.
+
+        Each container is copied one level deep (two for drugs and quests)
+        and the values are shared. Change listeners stay with the original,
+        so a net worth tracker for the copy is created on first use.
+        """
+        clone = PlayerInventory.__new__(PlayerInventory)
+        clone.__dict__.update(self.__dict__)
+        clone.items = {drug_name: qualities.copy() for drug_name, qualities in self.items.items()}
+        clone.unlocked_skills = self.unlocked_skills.copy()
+        clone.contact_trusts = self.contact_trusts.copy()
+        clone.crypto_wallet = self.crypto_wallet.copy()
+        clone.staked_drug_coin = self.staked_drug_coin.copy()
+        clone.active_quests = {quest_id: quest_data.copy() for quest_id, quest_data in self.active_quests.items()}
+        clone.completed_quests = self.completed_quests.copy()
+        clone.special_items = self.special_items.copy()
+        clone.change_listeners = []
+        return clone
+
+    def _notify_drug_change(
+        self, drug_name: DrugName, quality: DrugQuality, old_quantity: int, new_quantity: int
+    ) -> None:
+        """Informs change listeners that a drug/quality quantity changed."""
+        for listener in self.change_listeners:
+            listener.on_drug_quantity_changed(drug_name, quality, old_quantity, new_quantity)
+
+    def _notify_crypto_change(
+        self, coin: CryptoCoin, old_balance: float, new_balance: float
+    ) -> None:
+        """Informs change listeners that a crypto balance changed."""
+        for listener in self.change_listeners:
+            listener.on_crypto_balance_changed(coin, old_balance, new_balance)
+
     def unlock_skill(self, skill_id_str: str, cost: int) -> bool:
         """
         Unlocks a skill if player has enough skill points.
@@ -173,8 +220,10 @@ class PlayerInventory:
         if quality not in self.items[drug_name]:
             self.items[drug_name][quality] = 0
 
+        old_quantity = self.items[drug_name][quality]
         self.items[drug_name][quality] += quantity_to_add
         self._recalculate_current_load()
+        self._notify_drug_change(drug_name, quality, old_quantity, old_quantity + quantity_to_add)
         return True
 
     def remove_drug(
@@ -200,6 +249,7 @@ class PlayerInventory:
         ):
             return False
 
+        old_quantity = self.items[drug_name][quality]
         self.items[drug_name][quality] -= quantity_to_remove
         if self.items[drug_name][quality] == 0:
             del self.items[drug_name][quality]
@@ -207,8 +257,21 @@ class PlayerInventory:
             del self.items[drug_name]
 
         self._recalculate_current_load()
+        self._notify_drug_change(drug_name, quality, old_quantity, old_quantity - quantity_to_remove)
         return True
 
+    def clear_drugs(self) -> None:
+        """Removes every drug from the inventory (e.g. a full police confiscation)."""
+        removed_items = [
+            (drug_name, quality, quantity)
+            for drug_name, qualities in self.items.items()
+            for quality, quantity in qualities.items()
+        ]
+        self.items.clear()
+        self.current_load = 0
+        for drug_name, quality, quantity in removed_items:
+            self._notify_drug_change(drug_name, quality, quantity, 0)
+
     def get_drug_item(
         self, drug_name: DrugName, quality: DrugQuality
     ) -> Optional[Dict[str, Union[DrugName, DrugQuality, int]]]:
@@ -258,7 +321,9 @@ class PlayerInventory:
         """
         if amount <= 0:
             return
-        self.crypto_wallet[coin] = self.crypto_wallet.get(coin, 0.0) + amount
+        old_balance = self.crypto_wallet.get(coin, 0.0)
+        self.crypto_wallet[coin] = old_balance + amount
+        self._notify_crypto_change(coin, old_balance, self.crypto_wallet[coin])
 
     def remove_crypto(self, coin: CryptoCoin, amount: float) -> bool:
         """
@@ -275,7 +340,9 @@ class PlayerInventory:
         if amount <= 0:
             return False
         if self.crypto_wallet.get(coin, 0.0) >= amount:
+            old_balance = self.crypto_wallet[coin]
             self.crypto_wallet[coin] -= amount
+            self._notify_crypto_change(coin, old_balance, self.crypto_wallet[coin])
             return True
         return False
 
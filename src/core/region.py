@@ -15,6 +15,7 @@ from .. import narco_configs # Modified to import module
 from .drug import Drug
 from .enums import DrugName, DrugQuality, EventType, RegionName, SkillID # Added SkillID
 from .market_event import MarketEvent
+from ..utils.random_streams import decision_rng
 
 
 if TYPE_CHECKING:
@@ -38,6 +39,15 @@ class Region:
                           tier, modifiers, and available qualities.
         active_market_events: List of MarketEvent objects active in this region.
         current_heat: Current police attention (heat) level in this region.
+        heat_listeners: Observers notified through `on_region_heat_changed`
+                        whenever `current_heat` is assigned.
+        last_updated_day: Day the market was last brought up to date (see
+                          `daily_updates.catch_up_region`); None if the region
+                          is not part of a game's daily updates.
+        market_listeners: Observers notified through `on_market_value_changed`
+                          and `on_market_events_changed` when the market is
+                          changed through `set_drug_market_value`, `set_stock`
+                          or the market event methods.
     """
 
     def __init__(self, name: str) -> None:
@@ -50,7 +60,65 @@ class Region:
         self.name: RegionName = RegionName(name) if isinstance(name, str) else name
         self.drug_market_data: Dict[DrugName, Dict[str, Any]] = {}
         self.active_market_events: List[MarketEvent] = []
-        self.current_heat: int = 0
+        self.heat_listeners: List[Any] = []
+        self.market_listeners: List[Any] = []
+        self.last_updated_day: Optional[int] = None
+        self._current_heat: int = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Listeners are derived caches; they re-attach on first use after a load.
+        state = self.__dict__.copy()
+        state["heat_listeners"] = []
+        state["market_listeners"] = []
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        # Saves from before market listeners and lazy updates existed
+        self.__dict__.setdefault("market_listeners", [])
+        self.__dict__.setdefault("last_updated_day", None)
+
+    def clone(self) -> "Region":
+        """
+        Returns an independent copy of the region.
+
+        The per-drug and per-quality market dicts are copied one level each;
+        their values (base prices, tiers, modifiers, stock) are immutable and
+        shared. Market events are copied. Listeners are not: like after a
+        load, they re-attach on first use.
+        """
+        clone = Region.__new__(Region)
+        clone.__dict__.update(self.__dict__)
+        market: Dict[DrugName, Dict[str, Any]] = {}
+        for drug_name, drug_data in self.drug_market_data.items():
+            drug_copy = drug_data.copy()
+            available_qualities = drug_data.get('available_qualities')
+            if available_qualities is not None:
+                drug_copy['available_qualities'] = {
+                    quality: quality_data.copy() for quality, quality_data in available_qualities.items()
+                }
+            market[drug_name] = drug_copy
+        clone.drug_market_data = market
+        if self.active_market_events:
+            clone.active_market_events = [event.clone() for event in self.active_market_events]
+        else:
+            clone.active_market_events = []
+        clone.heat_listeners = []
+        clone.market_listeners = []
+        return clone
+
+    @property
+    def current_heat(self) -> int:
+        """Current police attention (heat) level in this region."""
+        return self._current_heat
+
+    @current_heat.setter
+    def current_heat(self, value: int) -> None:
+        old_heat = self._current_heat
+        self._current_heat = value
+        if value != old_heat:
+            for listener in self.heat_listeners:
+                listener.on_region_heat_changed(self, old_heat, value)
 
     def modify_heat(self, amount: int) -> None:
         """
@@ -59,8 +127,56 @@ class Region:
         Args:
             amount: Amount to change heat by (can be negative).
         """
-        self.current_heat += amount
-        self.current_heat = max(0, self.current_heat)
+        self.current_heat = max(0, self.current_heat + amount)
+
+    def set_drug_market_value(self, drug_name: DrugName, key: str, value: Any) -> None:
+        """
+        Sets a per-drug market value (e.g. a modifier) and notifies market listeners.
+
+        Args:
+            drug_name: DrugName of the drug whose market data is changed.
+            key: Key in the drug's market data, e.g. 'player_buy_impact_modifier'.
+            value: The new value.
+        """
+        drug_data = self.drug_market_data[drug_name]
+        old_value = drug_data.get(key)
+        drug_data[key] = value
+        if value != old_value:
+            for listener in self.market_listeners:
+                listener.on_market_value_changed(self, drug_name, None, key, old_value, value)
+
+    def set_stock(self, drug_name: DrugName, quality: DrugQuality, quantity: int) -> None:
+        """
+        Sets the stock of a drug quality and notifies market listeners.
+
+        Args:
+            drug_name: DrugName of the drug.
+            quality: DrugQuality whose stock is set.
+            quantity: The new quantity available.
+        """
+        quality_data = self.drug_market_data[drug_name]['available_qualities'][quality]
+        old_quantity = quality_data.get('quantity_available')
+        quality_data['quantity_available'] = quantity
+        if quantity != old_quantity:
+            for listener in self.market_listeners:
+                listener.on_market_value_changed(
+                    self, drug_name, quality, 'quantity_available', old_quantity, quantity
+                )
+
+    def add_market_event(self, event: MarketEvent) -> None:
+        """Adds a market event to the region and notifies market listeners."""
+        self.active_market_events.append(event)
+        self.notify_market_events_changed()
+
+    def set_market_events(self, events: List[MarketEvent]) -> None:
+        """Replaces the region's market events and notifies market listeners."""
+        self.active_market_events = events
+        self.notify_market_events_changed()
+
+    def notify_market_events_changed(self) -> None:
+        """Tells market listeners that the events, or a field of one of them, changed."""
+        for listener in self.market_listeners:
+            listener.on_market_events_changed(self)
 
     def initialize_drug_market(
         self,
@@ -462,9 +578,8 @@ class Region:
         if not market_data or quality not in market_data.get('available_qualities', {}):
             return
 
-        stock_data = market_data['available_qualities'][quality]
-        current_qty = stock_data.get('quantity_available', 0)
-        stock_data['quantity_available'] = max(0, current_qty - quantity_bought)
+        current_qty = market_data['available_qualities'][quality].get('quantity_available', 0)
+        self.set_stock(drug_name, quality, max(0, current_qty - quantity_bought))
 
     def update_stock_on_sell(
         self, drug_name: DrugName, quality: DrugQuality, quantity: int
@@ -482,11 +597,10 @@ class Region:
         if not market_data or quality not in market_data.get('available_qualities', {}):
             return
 
-        stock_data = market_data['available_qualities'][quality]
-        current_qty = stock_data.get('quantity_available', 0)
+        current_qty = market_data['available_qualities'][quality].get('quantity_available', 0)
         # Current logic: player selling reduces available market stock.
         # This might represent market "absorbing" capacity or a temporary removal.
-        stock_data['quantity_available'] = max(0, current_qty - quantity)
+        self.set_stock(drug_name, quality, max(0, current_qty - quantity))
 
     def restock_market(self) -> None:
         """
@@ -495,23 +609,24 @@ class Region:
         Resets drug quantities to default random ranges, applies CHEAP_STASH
         event effects, and primes previous prices if not set.
         """
+        rng = decision_rng("restock", self.name)
         for drug_name_enum, drug_market_data_val in self.drug_market_data.items():
             tier = drug_market_data_val.get('tier')
             if tier is None:
                 continue
 
             available_qualities = drug_market_data_val.get('available_qualities', {})
-            for quality_enum, quality_data in list(available_qualities.items()):
+            for quality_enum in list(available_qualities):
                 current_stock = 0
                 if tier == 1 and quality_enum == DrugQuality.STANDARD:
                     current_stock = narco_configs.TIER1_STANDARD_INITIAL_STOCK
                 elif tier > 1:
                     if quality_enum == DrugQuality.PURE:
-                        current_stock = random.randint(*narco_configs.TIER_GT1_PURE_STOCK_RANGE)
+                        current_stock = rng.randint(*narco_configs.TIER_GT1_PURE_STOCK_RANGE)
                     elif quality_enum == DrugQuality.STANDARD:
-                        current_stock = random.randint(*narco_configs.TIER_GT1_STANDARD_STOCK_RANGE)
+                        current_stock = rng.randint(*narco_configs.TIER_GT1_STANDARD_STOCK_RANGE)
                     else:  # CUT
-                        current_stock = random.randint(*narco_configs.TIER_GT1_CUT_STOCK_RANGE)
+                        current_stock = rng.randint(*narco_configs.TIER_GT1_CUT_STOCK_RANGE)
 
                 # Apply CHEAP_STASH event modifications
                 for event in self.active_market_events:
@@ -522,7 +637,7 @@ class Region:
                         current_stock += event.temporary_stock_increase
                         break
 
-                quality_data['quantity_available'] = max(0, current_stock)
+                self.set_stock(drug_name_enum, quality_enum, max(0, current_stock))
 
         # Prime previous prices if they haven't been set (e.g., first turn)
         for drug_name_enum, drug_market_data_val in self.drug_market_data.items():
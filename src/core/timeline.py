@@ -0,0 +1,195 @@
+"""
+Provides the day-based timeline used to schedule future game occurrences.
+
+The `Timeline` is a priority queue of entries keyed by the day they fall due.
+Subsystems schedule an entry once (a debt deadline, a laundering arrival, the
+end of a turf war) instead of re-checking their own timers every day, and the
+daily update only pops the entries that are due. Entries carry a
+`TimelineEventKind` and a plain payload rather than a callable so the timeline
+stays picklable for save games; handlers are looked up by kind.
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+from .enums import TimelineEventKind
+
+
+class TimelineEntry:
+    """
+    A single scheduled occurrence on the timeline.
+
+    Attributes:
+        day (int): The game day on which the entry falls due.
+        kind (TimelineEventKind): What should happen when the entry is due.
+        payload (Any): Extra data the handler needs (e.g. a region or event ID).
+        key (Optional[str]): Optional de-duplication key. Scheduling a new entry
+            with the same key supersedes the older one.
+        priority (int): Ordering among entries due on the same day; lower runs first.
+    """
+
+    __slots__ = ("day", "kind", "payload", "key", "priority", "sequence", "cancelled")
+
+    def __init__(
+        self,
+        day: int,
+        kind: TimelineEventKind,
+        payload: Any = None,
+        key: Optional[str] = None,
+        priority: int = 0,
+        sequence: int = 0,
+    ) -> None:
+        self.day: int = day
+        self.kind: TimelineEventKind = kind
+        self.payload: Any = payload
+        self.key: Optional[str] = key
+        self.priority: int = priority
+        self.sequence: int = sequence
+        self.cancelled: bool = False
+
+    def __lt__(self, other: "TimelineEntry") -> bool:
+        return (self.day, self.priority, self.sequence) < (other.day, other.priority, other.sequence)
+
+    def __repr__(self) -> str:
+        return f"TimelineEntry(day={self.day}, kind={self.kind.name}, payload={self.payload!r}, key={self.key!r})"
+
+
+class Timeline:
+    """
+    A min-heap of `TimelineEntry` objects ordered by due day, priority, then insertion order.
+
+    Cancelled or superseded entries are dropped lazily when they reach the top
+    of the heap, so scheduling and cancelling are both O(log n).
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty timeline."""
+        self._heap: List[TimelineEntry] = []
+        self._keyed_entries: Dict[str, TimelineEntry] = {}
+        self._next_sequence: int = 0
+
+    def schedule(
+        self,
+        day: int,
+        kind: TimelineEventKind,
+        payload: Any = None,
+        key: Optional[str] = None,
+        priority: int = 0,
+    ) -> TimelineEntry:
+        """
+        Schedules an entry to fall due on the given day.
+
+        Args:
+            day: The game day on which the entry becomes due.
+            kind: The kind of occurrence, used to pick a handler.
+            payload: Optional data passed to the handler.
+            key: Optional key; an existing entry with the same key is cancelled.
+            priority: Ordering among entries due on the same day; lower runs first.
+
+        Returns:
+            TimelineEntry: The newly scheduled entry.
+        """
+        if key is not None:
+            self.cancel(key)
+        entry = TimelineEntry(int(day), kind, payload, key, priority, self._next_sequence)
+        self._next_sequence += 1
+        heapq.heappush(self._heap, entry)
+        if key is not None:
+            self._keyed_entries[key] = entry
+        return entry
+
+    def cancel(self, key: str) -> bool:
+        """
+        Cancels the pending entry registered under `key`.
+
+        Args:
+            key: The de-duplication key used when scheduling.
+
+        Returns:
+            bool: True if a pending entry was cancelled, False otherwise.
+        """
+        entry = self._keyed_entries.pop(key, None)
+        if entry is None:
+            return False
+        entry.cancelled = True
+        return True
+
+    def is_scheduled(self, key: str) -> bool:
+        """Returns True if an entry with the given key is still pending."""
+        return key in self._keyed_entries
+
+    def _discard_cancelled(self) -> None:
+        while self._heap and self._heap[0].cancelled:
+            heapq.heappop(self._heap)
+
+    def peek_next_day(self) -> Optional[int]:
+        """
+        Returns the due day of the earliest pending entry.
+
+        Returns:
+            Optional[int]: The earliest due day, or None if nothing is scheduled.
+        """
+        self._discard_cancelled()
+        return self._heap[0].day if self._heap else None
+
+    def pop_due(self, current_day: int) -> List[TimelineEntry]:
+        """
+        Removes and returns every pending entry due on or before `current_day`.
+
+        Entries are returned in due-day order; entries due on the same day are
+        ordered by priority, then by the order in which they were scheduled.
+
+        Args:
+            current_day: The day being processed.
+
+        Returns:
+            List[TimelineEntry]: The due entries, possibly empty.
+        """
+        due_entries: List[TimelineEntry] = []
+        while self._heap:
+            entry = self._heap[0]
+            if entry.cancelled:
+                heapq.heappop(self._heap)
+                continue
+            if entry.day > current_day:
+                break
+            heapq.heappop(self._heap)
+            if entry.key is not None and self._keyed_entries.get(entry.key) is entry:
+                del self._keyed_entries[entry.key]
+            due_entries.append(entry)
+        return due_entries
+
+    def pending_entries(self) -> List[Tuple[int, TimelineEventKind, Any]]:
+        """
+        Returns a sorted snapshot of pending entries as (day, kind, payload) tuples.
+
+        Useful for UI displays and debugging; does not modify the timeline.
+        """
+        return [
+            (entry.day, entry.kind, entry.payload)
+            for entry in sorted(self._heap)
+            if not entry.cancelled
+        ]
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._heap if not entry.cancelled)
+
+    def clone(self) -> "Timeline":
+        """
+        Returns an independent copy holding copies of the pending entries.
+
+        Cancelled entries are dropped. Payloads are shared, since they are
+        plain immutable values.
+        """
+        clone = Timeline.__new__(Timeline)
+        copies: Dict[int, TimelineEntry] = {}
+        for entry in self._heap:
+            if not entry.cancelled:
+                copies[id(entry)] = TimelineEntry(
+                    entry.day, entry.kind, entry.payload, entry.key, entry.priority, entry.sequence
+                )
+        clone._heap = list(copies.values())
+        heapq.heapify(clone._heap)
+        clone._keyed_entries = {key: copies[id(entry)] for key, entry in self._keyed_entries.items()}
+        clone._next_sequence = self._next_sequence
+        return clone
@@ -0,0 +1,324 @@
+"""
+Provides the world template, the compiled layout every new GameState starts from.
+
+Validating `REGION_DEFINITIONS`, converting names to enums and pricing every
+market is the same work for every game built from the same configuration.
+`get_world_template` does it once per configuration fingerprint (a hash of
+the config values that shape the world and of the engine) and keeps the immutable result in
+memory and, when `WORLD_TEMPLATE_CACHE_DIR` is set, on disk.
+
+`WorldTemplate.instantiate` then builds fresh Region objects from the
+template, redoing only the random stock draws. It makes exactly the same
+`random.randint` calls in the same order as building the world by hand
+(initial stock draws, then the restock of every region), so a seeded game
+gets the same world, and the same random stream afterwards, either way.
+"""
+
+import hashlib
+import os
+import pickle
+import random
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from ..utils.engine_fingerprint import engine_fingerprint
+from ..utils.logger import get_logger
+from ..utils.save_files import write_file_atomically
+from .enums import DrugName, DrugQuality, RegionName
+from .region import Region
+
+logger = get_logger(__name__)
+
+#: Config values the world layout and its starting prices are derived from.
+WORLD_TEMPLATE_CONFIG_KEYS: Tuple[str, ...] = (
+    "REGION_DEFINITIONS",
+    "TIER1_STANDARD_INITIAL_STOCK",
+    "TIER_GT1_PURE_STOCK_RANGE",
+    "TIER_GT1_STANDARD_STOCK_RANGE",
+    "TIER_GT1_CUT_STOCK_RANGE",
+    "HEAT_PRICE_INCREASE_THRESHOLDS",
+    "QUALITY_MULT_CUT_BUY",
+    "QUALITY_MULT_STANDARD_BUY",
+    "QUALITY_MULT_PURE_BUY",
+    "QUALITY_MULT_CUT_SELL",
+    "QUALITY_MULT_STANDARD_SELL",
+    "QUALITY_MULT_PURE_SELL",
+)
+
+StockRange = Tuple[int, int]
+
+
+class QualityTemplate(NamedTuple):
+    """
+    One drug quality on a market.
+
+    Attributes:
+        quality: The quality.
+        fixed_stock: Stock set on every restock, or None to draw from `stock_range`.
+        stock_range: Range a restock draws from when `fixed_stock` is None.
+        primed_buy_price: Starting previous buy price when the quality is in stock.
+        primed_sell_price: Starting previous sell price.
+    """
+
+    quality: DrugQuality
+    fixed_stock: Optional[int]
+    stock_range: StockRange
+    primed_buy_price: float
+    primed_sell_price: float
+
+
+class DrugTemplate(NamedTuple):
+    """One drug on a region's market."""
+
+    drug: DrugName
+    base_buy_price: float
+    base_sell_price: float
+    tier: int
+    qualities: Tuple[QualityTemplate, ...]
+
+
+class RegionTemplate(NamedTuple):
+    """One region: the key it is stored under in `GameState.all_regions`, its name and its market."""
+
+    key: RegionName
+    name: RegionName
+    drugs: Tuple[DrugTemplate, ...]
+
+
+class WorldTemplate(NamedTuple):
+    """
+    The validated world layout for one configuration.
+
+    Attributes:
+        fingerprint: Hash of the config values the template was compiled from.
+        regions: Regions in `all_regions` order.
+        setup_draws: Ranges of the initial stock draws, in order. Their values
+            are discarded by the restock that follows, but the draws are
+            replayed so the random stream matches building the world by hand.
+    """
+
+    fingerprint: str
+    regions: Tuple[RegionTemplate, ...]
+    setup_draws: Tuple[StockRange, ...]
+
+    def instantiate(self) -> Dict[RegionName, Region]:
+        """Builds fresh regions from the template, drawing their stock from `random`."""
+        randint = random.randint
+        for low, high in self.setup_draws:
+            randint(low, high)
+
+        all_regions: Dict[RegionName, Region] = {}
+        for region_template in self.regions:
+            region = Region(region_template.name)
+            market = region.drug_market_data
+            for drug_template in region_template.drugs:
+                available_qualities: Dict[DrugQuality, Dict[str, Any]] = {}
+                for quality_template in drug_template.qualities:
+                    stock = quality_template.fixed_stock
+                    if stock is None:
+                        stock = randint(*quality_template.stock_range)
+                    available_qualities[quality_template.quality] = {
+                        'quantity_available': stock,
+                        'previous_buy_price': quality_template.primed_buy_price if stock > 0 else 0.0,
+                        'previous_sell_price': quality_template.primed_sell_price,
+                    }
+                market[drug_template.drug] = {
+                    'base_buy_price': drug_template.base_buy_price,
+                    'base_sell_price': drug_template.base_sell_price,
+                    'tier': drug_template.tier,
+                    'player_buy_impact_modifier': 1.0,
+                    'player_sell_impact_modifier': 1.0,
+                    'rival_demand_modifier': 1.0,
+                    'rival_supply_modifier': 1.0,
+                    'last_rival_activity_turn': -1,
+                    'available_qualities': available_qualities,
+                }
+            all_regions[region_template.key] = region
+        return all_regions
+
+
+def world_config_fingerprint(game_configs: Any) -> str:
+    """
+    Hashes the config values a world template depends on, and the engine.
+
+    The engine fingerprint covers the template layout and the pricing code
+    that primes its prices, so a code change never reuses a stale disk cache.
+    """
+    values = tuple(getattr(game_configs, key, None) for key in WORLD_TEMPLATE_CONFIG_KEYS)
+    return hashlib.blake2b(repr((engine_fingerprint(), values)).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _stock_range(game_configs: Any, tier: int, quality: DrugQuality) -> Optional[StockRange]:
+    """Returns the range a restock draws from, or None for a fixed stock."""
+    if tier <= 1:
+        return None
+    if quality == DrugQuality.PURE:
+        return tuple(game_configs.TIER_GT1_PURE_STOCK_RANGE)
+    if quality == DrugQuality.STANDARD:
+        return tuple(game_configs.TIER_GT1_STANDARD_STOCK_RANGE)
+    return tuple(game_configs.TIER_GT1_CUT_STOCK_RANGE)
+
+
+def _validated_quality_ranges(
+    qualities_stock_ranges: Dict[Any, Any], drug_name_str: str, region_name_str: str
+) -> List[Tuple[DrugQuality, StockRange]]:
+    quality_ranges: List[Tuple[DrugQuality, StockRange]] = []
+    for quality_enum, stock_range_tuple in qualities_stock_ranges.items():
+        if not isinstance(quality_enum, DrugQuality) or \
+           not (isinstance(stock_range_tuple, tuple) and len(stock_range_tuple) == 2 and \
+                isinstance(stock_range_tuple[0], int) and isinstance(stock_range_tuple[1], int)):
+            logger.warning("Malformed quality_stock_ranges for drug '%s', quality '%s' in region %s. Skipping this quality.", drug_name_str, quality_enum, region_name_str)
+            continue
+        min_val, max_val = stock_range_tuple
+        if min_val < 0 or max_val < 0 or min_val > max_val:
+            logger.warning("Invalid min/max stock (%s,%s) for drug '%s', quality '%s' in region %s. Using (0,0).", min_val, max_val, drug_name_str, quality_enum, region_name_str)
+            min_val, max_val = 0, 0
+        quality_ranges.append((quality_enum, (min_val, max_val)))
+    return quality_ranges
+
+
+def _compile_drug(
+    game_configs: Any, drug_def_tuple: Any, region_name_str: str, setup_draws: List[StockRange]
+) -> Optional[DrugTemplate]:
+    """Validates one drug definition, recording its initial stock draws. Returns None if it is skipped."""
+    if len(drug_def_tuple) != 5:
+        logger.warning("Malformed drug definition for region %s. Expected 5 elements, got %d. Skipping this drug.", region_name_str, len(drug_def_tuple))
+        return None
+
+    drug_name_str, base_price, max_price, demand_factor, qualities_stock_ranges = drug_def_tuple
+    if not isinstance(drug_name_str, str) or \
+       not isinstance(base_price, (int, float)) or \
+       not isinstance(max_price, (int, float)) or \
+       not isinstance(demand_factor, int) or \
+       not isinstance(qualities_stock_ranges, dict):
+        logger.warning("Type mismatch in drug definition fields for '%s' in region %s. Skipping this drug.", drug_name_str, region_name_str)
+        return None
+    try:
+        drug_name = DrugName(drug_name_str)
+    except ValueError:
+        logger.warning("Invalid drug name string '%s' in region %s. Skipping this drug.", drug_name_str, region_name_str)
+        return None
+
+    # Initial stock draws: the configured ranges, then the tier defaults for qualities without one
+    tier = demand_factor
+    quality_ranges = _validated_quality_ranges(qualities_stock_ranges, drug_name_str, region_name_str)
+    setup_draws.extend(stock_range for _, stock_range in quality_ranges)
+    configured_qualities = {quality for quality, _ in quality_ranges}
+    qualities_to_init = [DrugQuality.STANDARD] if tier == 1 else [DrugQuality.CUT, DrugQuality.STANDARD, DrugQuality.PURE]
+    for quality in qualities_to_init:
+        default_range = _stock_range(game_configs, tier, quality)
+        if quality not in configured_qualities and default_range is not None:
+            setup_draws.append(default_range)
+
+    # Starting prices, computed by the real pricing code on an in-stock, zero-heat prototype
+    prototype = Region(RegionName.DOWNTOWN)
+    prototype.initialize_drug_market(drug_name, base_price, max_price, tier, {quality: 1 for quality in qualities_to_init})
+    qualities: List[QualityTemplate] = []
+    for quality in qualities_to_init:
+        stock_range = _stock_range(game_configs, tier, quality)
+        if stock_range is not None:
+            fixed_stock = None
+        elif tier == 1 and quality == DrugQuality.STANDARD:
+            fixed_stock = game_configs.TIER1_STANDARD_INITIAL_STOCK
+        else:
+            fixed_stock = 0
+        qualities.append(QualityTemplate(
+            quality,
+            fixed_stock,
+            stock_range or (0, 0),
+            prototype.get_buy_price(drug_name, quality),
+            prototype.get_sell_price(drug_name, quality),
+        ))
+    return DrugTemplate(drug_name, base_price, max_price, tier, tuple(qualities))
+
+
+def compile_world_template(game_configs: Any) -> WorldTemplate:
+    """
+    Validates `REGION_DEFINITIONS` and compiles it into a WorldTemplate.
+
+    Malformed entries are logged and skipped, as they always were when the
+    world was built directly.
+    """
+    regions: Dict[RegionName, RegionTemplate] = {}
+    setup_draws: List[StockRange] = []
+    for region_idx, region_data_tuple in enumerate(game_configs.REGION_DEFINITIONS):
+        try:
+            if len(region_data_tuple) != 3:
+                logger.warning(f"Malformed region definition at index {region_idx}. Expected 3 elements, got {len(region_data_tuple)}. Skipping.")
+                continue
+            region_enum, region_name_str, drugs_data = region_data_tuple
+            if not isinstance(region_enum, RegionName):
+                logger.warning(f"Invalid RegionName enum for entry {region_idx} ('{region_name_str}'). Skipping.")
+                continue
+            if not isinstance(region_name_str, str):
+                logger.warning(f"Region name for {region_enum.value} is not a string. Skipping.")
+                continue
+            if not isinstance(drugs_data, list):
+                logger.warning(f"Drugs data for {region_name_str} is not a list. Skipping drug initialization for this region.")
+                drugs_data = [] # Process region with no drugs
+            try:
+                region_name = RegionName(region_name_str)
+            except ValueError as e_region_name:
+                logger.warning(f"Could not initialize region with name '{region_name_str}' due to invalid RegionName enum value. Error: {e_region_name}. Skipping.")
+                continue
+        except (TypeError, ValueError, IndexError) as e_region_unpack:
+            logger.error(f"Error unpacking region definition at index {region_idx}: '{region_data_tuple}'. Error: {e_region_unpack}. Skipping.")
+            continue
+        except Exception as e_outer:
+            logger.error(f"Error processing region definition at index {region_idx}: {region_data_tuple}. Error: {e_outer}. Skipping.")
+            continue
+
+        drugs: Dict[DrugName, DrugTemplate] = {}
+        for drug_def_tuple in drugs_data:
+            try:
+                drug_template = _compile_drug(game_configs, drug_def_tuple, region_name_str, setup_draws)
+            except (TypeError, ValueError, IndexError) as e_drug:
+                logger.error(f"Error processing drug definition tuple '{drug_def_tuple}' in region {region_name_str}. Error: {e_drug}. Skipping this drug.")
+                continue
+            except Exception as e_drug_other:
+                logger.error(f"Unexpected error processing drug definition '{drug_def_tuple}' in region {region_name_str}. Error: {e_drug_other}. Skipping this drug.")
+                continue
+            if drug_template is not None:
+                drugs[drug_template.drug] = drug_template # A repeated drug replaces the earlier entry
+        regions[region_enum] = RegionTemplate(region_enum, region_name, tuple(drugs.values()))
+
+    return WorldTemplate(world_config_fingerprint(game_configs), tuple(regions.values()), tuple(setup_draws))
+
+
+_template_cache: Dict[str, WorldTemplate] = {}
+_TEMPLATE_CACHE_SIZE = 4
+
+
+def get_world_template(game_configs: Any) -> WorldTemplate:
+    """
+    Returns the world template for the current config values.
+
+    Templates are cached in memory by config fingerprint, and on disk under
+    `WORLD_TEMPLATE_CACHE_DIR` when that is set.
+    """
+    fingerprint = world_config_fingerprint(game_configs)
+    template = _template_cache.get(fingerprint)
+    if template is not None:
+        return template
+
+    cache_dir: Optional[str] = getattr(game_configs, "WORLD_TEMPLATE_CACHE_DIR", None)
+    cache_path = os.path.join(cache_dir, f"world_template_{fingerprint}.pickle") if cache_dir else None
+    if cache_path is not None and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as cache_file:
+                template = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable world template cache {cache_path!r}: {e}")
+            template = None
+    if template is None or template.fingerprint != fingerprint:
+        template = compile_world_template(game_configs)
+        if cache_path is not None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                write_file_atomically(cache_path, pickle.dumps(template, protocol=pickle.HIGHEST_PROTOCOL))
+            except OSError as e:
+                logger.warning(f"Could not write world template cache {cache_path!r}: {e}")
+
+    if len(_template_cache) >= _TEMPLATE_CACHE_SIZE:
+        _template_cache.pop(next(iter(_template_cache)))
+    _template_cache[fingerprint] = template
+    return template
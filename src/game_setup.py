@@ -0,0 +1,86 @@
+"""
+Builds a new game: the starting player, world and AI rivals.
+
+Shared by the Pygame launcher, session replays and headless simulations so
+that every one of them starts from exactly the same setup.
+"""
+
+import sys
+from typing import Tuple
+
+from .core.ai_rival import AIRival
+from .core.enums import DrugName, RegionName
+from .core.player_inventory import PlayerInventory
+from .core.region import Region
+from .game_state import GameState
+from .utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def create_new_game() -> Tuple[PlayerInventory, GameState, Region]:
+    """
+    Builds the starting player, world and rivals.
+
+    Seed `random` first for a reproducible game; replays rebuild the game
+    through this same function.
+    """
+    # Initialize core game components
+    player_inv = PlayerInventory()
+    game_state_instance = GameState()  # Instantiate GameState
+
+    # Initialize AI Rivals
+    ai_rivals_list = [
+        AIRival(
+            name="The Chemist",
+            primary_drug=DrugName.PILLS,
+            primary_region_name=RegionName.DOWNTOWN,
+            aggression=0.6,
+            activity_level=0.7,
+        ),
+        AIRival(
+            name="Silas",
+            primary_drug=DrugName.COKE,
+            primary_region_name=RegionName.DOWNTOWN,
+            aggression=0.8,
+            activity_level=0.5,
+        ),
+        AIRival(
+            name="Dockmaster Jones",
+            primary_drug=DrugName.SPEED,
+            primary_region_name=RegionName.DOCKS,
+            aggression=0.5,
+            activity_level=0.6,
+        ),
+        AIRival(
+            name="Mama Rosa",
+            primary_drug=DrugName.WEED,
+            primary_region_name=RegionName.SUBURBS,
+            aggression=0.4,
+            activity_level=0.8,
+        ),
+        AIRival(
+            name="Sergei",
+            primary_drug=DrugName.HEROIN,
+            primary_region_name=RegionName.DOCKS,
+            aggression=0.7,
+            activity_level=0.6,
+        ),
+    ]
+    game_state_instance.ai_rivals = ai_rivals_list
+
+    # Set initial player region
+    # Regions are initialized in GameState constructor.
+    # We need to set the current player region and get the instance.
+    initial_region_name = RegionName.DOWNTOWN  # Define the starting region name
+    game_state_instance.set_current_player_region(initial_region_name)
+    current_region_instance = game_state_instance.get_current_player_region()
+
+    if not current_region_instance:
+        # This should ideally not happen if initial_region_name is valid and regions are initialized.
+        logger.critical(
+            f"Initial region {initial_region_name.value} could not be set or found. Exiting."
+        )
+        sys.exit(1)
+
+    return player_inv, game_state_instance, current_region_instance
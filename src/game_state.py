@@ -7,12 +7,18 @@ cryptocurrency prices, and initializing the game world (regions and markets).
 It provides methods to update and access various aspects of the game state.
 """
 
-import random
+import math
+from bisect import bisect_left
+from itertools import accumulate
 from typing import Dict, List, Optional, Any, Tuple
 
-from .core.enums import CryptoCoin, DrugQuality, DrugName, RegionName  # Added DrugName
+from .core.enums import CryptoCoin, RegionName, TimelineEventKind
 from src.utils.logger import get_logger
+from src.utils.random_streams import decision_rng
 from .core.ai_rival import AIRival
+from .core.timeline import Timeline
+from .core.event_journal import EventJournal
+from .core.world_template import get_world_template
 from .core.region import (
     Region,
 )  # Assuming Region class has a 'name' attribute and a 'to_dict()' method
@@ -35,11 +41,16 @@ class GameState:
         informant_unavailable_until_day (Optional[int]): Day until which the informant
             is unavailable due to a previous betrayal or event.
         current_day (int): The current day in the game.
+        timeline (Timeline): Day-ordered queue of scheduled occurrences (debt
+            deadlines, laundering arrivals, turf war ends, seasonal events).
+        event_journal (EventJournal): Compact typed record of world events,
+            formatted into text only when read.
     """
 
     def __init__(self) -> None:
         """Initializes the GameState, setting up core attributes and the game world."""
         self.current_crypto_prices: Dict[CryptoCoin, float] = {}
+        self.crypto_prices_version: int = 0  # Bumped whenever current_crypto_prices changes
         self.ai_rivals: List[AIRival] = []
         self.all_regions: Dict[RegionName, Region] = {}
         self.current_player_region: Optional[Region] = None
@@ -61,6 +72,9 @@ class GameState:
         # Turf War Tracking
         self.active_turf_wars: Dict[RegionName, Dict[str, Any]] = {}
 
+        # Scheduled occurrences, popped by the daily update when they fall due
+        self.timeline: Timeline = Timeline()
+        self.event_journal: EventJournal = self._create_event_journal()
 
         # Initialize core game state and world regions
         self._initialize_core_state()
@@ -87,10 +101,47 @@ class GameState:
             logger.error("CRYPTO_PRICES_INITIAL not found in game_configs or is not a dictionary. Crypto prices not initialized.")
             # Optionally, populate with some hardcoded emergency defaults or raise error
             # For example: self.current_crypto_prices = {CryptoCoin.BITCOIN: 100.0}
+        self.crypto_prices_version += 1
 
         self.ai_rivals = []
         self.informant_unavailable_until_day = None  # Optional[int]
         self.current_day = 1  # int
+        self.timeline = Timeline()
+        self.event_journal.flush() # Keep spilled records from the previous game
+        self.event_journal = self._create_event_journal()
+        self._schedule_campaign_milestones()
+
+    def _create_event_journal(self) -> EventJournal:
+        """Creates the event journal configured by EVENT_JOURNAL_* settings in game_configs."""
+        return EventJournal(
+            capacity=getattr(game_configs, "EVENT_JOURNAL_CAPACITY", 500),
+            spill_path=getattr(game_configs, "EVENT_JOURNAL_SPILL_PATH", None),
+        )
+
+    def _schedule_campaign_milestones(self) -> None:
+        """
+        Schedules the fixed-day occurrences defined in game_configs on the timeline.
+
+        Debt payments fall due on their configured days and seasonal events start
+        on their configured `start_day`; the matching end entry is scheduled when
+        the event starts.
+        """
+        for payment_number in (1, 2, 3):
+            due_day = getattr(game_configs, f"DEBT_PAYMENT_{payment_number}_DUE_DAY", None)
+            if isinstance(due_day, int):
+                self.timeline.schedule(
+                    due_day, TimelineEventKind.DEBT_PAYMENT_DUE, payment_number,
+                    key=f"debt_payment_{payment_number}",
+                )
+
+        seasonal_events = getattr(game_configs, "SEASONAL_EVENTS", None)
+        if isinstance(seasonal_events, dict):
+            for event_id, event_config in seasonal_events.items():
+                start_day = event_config.get("start_day")
+                if not isinstance(start_day, int):
+                    logger.warning(f"Seasonal event '{event_id}' has no valid start_day. Not scheduled.")
+                    continue
+                self.timeline.schedule(start_day, TimelineEventKind.SEASONAL_EVENT_START, event_id)
 
     def initialize_crypto_prices(self, initial_prices: Dict[CryptoCoin, float]) -> None:
         """
@@ -104,17 +155,18 @@ class GameState:
         """
         self.current_crypto_prices = {} # Clear before setting
         if not isinstance(initial_prices, dict):
-            logger.error(f"initialize_crypto_prices expects a dictionary, got {type(initial_prices)}. Prices not set.")
+            logger.error("initialize_crypto_prices expects a dictionary, got %s. Prices not set.", type(initial_prices))
             return
 
         for coin_enum, price in initial_prices.items():
             if not isinstance(coin_enum, CryptoCoin):
-                logger.warning(f"Invalid key in provided initial_prices: {coin_enum}. Expected CryptoCoin enum. Skipping.")
+                logger.warning("Invalid key in provided initial_prices: %s. Expected CryptoCoin enum. Skipping.", coin_enum)
                 continue
             if not isinstance(price, (int, float)):
-                logger.warning(f"Invalid price value for {coin_enum.value} in provided initial_prices: {price}. Expected number. Skipping.")
+                logger.warning("Invalid price value for %s in provided initial_prices: %s. Expected number. Skipping.", coin_enum.value, price)
                 continue
             self.current_crypto_prices[coin_enum] = float(price)
+        self.crypto_prices_version += 1
 
 
     def update_daily_crypto_prices(
@@ -138,12 +190,13 @@ class GameState:
             )
             self.current_crypto_prices = game_configs.CRYPTO_PRICES_INITIAL.copy()
 
+        rng = decision_rng("crypto_prices")
         for (
             coin,
             price,
         ) in self.current_crypto_prices.items():  # coin is CryptoCoin, price is float
             if coin in volatility_map:  # volatility_map is Dict[CryptoCoin, float]
-                change_percent: float = random.uniform(
+                change_percent: float = rng.uniform(
                     -volatility_map[coin], volatility_map[coin]
                 )
                 new_price: float = price * (1 + change_percent)
@@ -157,106 +210,63 @@ class GameState:
                 )
                 new_price = max(min_price, new_price)
                 self.current_crypto_prices[coin] = round(new_price, 2)
+        self.crypto_prices_version += 1
 
-    def _initialize_world_regions(self) -> None:
-        """
-        Initializes all game regions, including their names and drug markets.
-        Region definitions are now loaded from game_configs.
+    def advance_crypto_prices(
+        self,
+        volatility_map: Dict[CryptoCoin, float],
+        min_prices_map: Dict[CryptoCoin, float],
+        days: int,
+    ) -> None:
         """
-        # The large region_definitions list and its type aliases (DrugDefinitionTuple, RegionDefinitionTuple)
-        # have been moved to game_configs.py
-
-        self.all_regions: Dict[RegionName, Region] = {}  # Clear any existing regions
-        for region_idx, region_data_tuple in enumerate(game_configs.REGION_DEFINITIONS):
-            try:
-                if len(region_data_tuple) != 3:
-                    logger.warning(f"Malformed region definition at index {region_idx}. Expected 3 elements, got {len(region_data_tuple)}. Skipping.")
-                    continue
+        Moves cryptocurrency prices forward several days in one step.
 
-                region_enum, region_name_str, drugs_data = region_data_tuple
+        Each coin follows the same daily random walk as `update_daily_crypto_prices`,
+        drawn for the whole span at once. In log space a price floored at its
+        minimum is x_t = max(floor, x_(t-1) + step_t), whose end value is
+        S_n + max(x_0, floor - min(S_1..S_n)) for the running sum S of the
+        steps. Prices are rounded once at the end rather than daily.
 
-                if not isinstance(region_enum, RegionName):
-                     logger.warning(f"Invalid RegionName enum for entry {region_idx} ('{region_name_str}'). Skipping.")
-                     continue
-                if not isinstance(region_name_str, str):
-                    logger.warning(f"Region name for {region_enum.value} is not a string. Skipping.")
-                    continue
-                if not isinstance(drugs_data, list):
-                    logger.warning(f"Drugs data for {region_name_str} is not a list. Skipping drug initialization for this region.")
-                    drugs_data = [] # Process region with no drugs
-
-                try:
-                    region: Region = Region(region_name_str)
-                except ValueError as e_region_name:
-                    logger.warning(f"Could not initialize region with name '{region_name_str}' due to invalid RegionName enum value. Error: {e_region_name}. Skipping.")
-                    continue
+        Args:
+            volatility_map: A dictionary mapping CryptoCoin enums to their volatility factor (float).
+            min_prices_map: A dictionary mapping CryptoCoin enums to their minimum possible price (float).
+            days: Number of days to advance.
+        """
+        if days <= 0:
+            return
+        if not self.current_crypto_prices:
+            logger.warning(
+                "Crypto prices were not initialized before update. Initializing with defaults."
+            )
+            self.current_crypto_prices = game_configs.CRYPTO_PRICES_INITIAL.copy()
 
-            except (TypeError, ValueError, IndexError) as e_region_unpack: # Catch errors from unpacking region_data_tuple
-                logger.error(f"Error unpacking region definition at index {region_idx}: '{region_data_tuple}'. Error: {e_region_unpack}. Skipping.")
-                continue
-            except Exception as e_outer:
-                logger.error(f"Error processing region definition at index {region_idx}: {region_data_tuple}. Error: {e_outer}. Skipping.")
+        rng = decision_rng("crypto_prices")
+        default_min_price = getattr(game_configs, "DEFAULT_MIN_CRYPTO_PRICE", 0.01)
+        for coin, price in self.current_crypto_prices.items():
+            if coin not in volatility_map:
                 continue
+            volatility: float = volatility_map[coin]
+            min_price: float = min_prices_map.get(coin, default_min_price)
+            log_path: List[float] = list(accumulate(
+                math.log1p(rng.uniform(-volatility, volatility)) for _ in range(days)
+            ))
+            log_floor: float = math.log(min_price) if min_price > 0 else -math.inf
+            log_start: float = math.log(price) if price > 0 else -math.inf
+            log_price: float = log_path[-1] + max(log_start, log_floor - min(log_path))
+            self.current_crypto_prices[coin] = round(max(min_price, math.exp(log_price)), 2)
+        self.crypto_prices_version += 1
 
-            for drug_idx, drug_def_tuple in enumerate(drugs_data):
-                try:
-                    if len(drug_def_tuple) != 5:
-                        logger.warning(f"Malformed drug definition for region {region_name_str} at drug index {drug_idx}. Expected 5 elements, got {len(drug_def_tuple)}. Skipping this drug.")
-                        continue
-
-                    drug_name_str, base_price, max_price, demand_factor, qualities_stock_ranges = drug_def_tuple
-
-                    if not isinstance(drug_name_str, str) or \
-                       not isinstance(base_price, (int, float)) or \
-                       not isinstance(max_price, (int, float)) or \
-                       not isinstance(demand_factor, int) or \
-                       not isinstance(qualities_stock_ranges, dict):
-                        logger.warning(f"Type mismatch in drug definition fields for '{drug_name_str}' in region {region_name_str}. Skipping this drug.")
-                        continue
-
-                    # Validate DrugName (Region.initialize_drug_market will also do this, but good for early catch)
-                    try:
-                        DrugName(drug_name_str)
-                    except ValueError:
-                        logger.warning(f"Invalid drug name string '{drug_name_str}' in region {region_name_str}. Skipping this drug.")
-                        continue
-
-                    quality_stock_map: Dict[DrugQuality, int] = {}
-                    for quality_enum, stock_range_tuple in qualities_stock_ranges.items():
-                        if not isinstance(quality_enum, DrugQuality) or \
-                           not (isinstance(stock_range_tuple, tuple) and len(stock_range_tuple) == 2 and \
-                                isinstance(stock_range_tuple[0], int) and isinstance(stock_range_tuple[1], int)):
-                            logger.warning(f"Malformed quality_stock_ranges for drug '{drug_name_str}', quality '{quality_enum}' in region {region_name_str}. Skipping this quality.")
-                            continue
-                        min_val, max_val = stock_range_tuple
-                        if min_val < 0 or max_val < 0 or min_val > max_val : # Added more checks for stock validity
-                             logger.warning(f"Invalid min/max stock ({min_val},{max_val}) for drug '{drug_name_str}', quality '{quality_enum}' in region {region_name_str}. Using (0,0).")
-                             min_val, max_val = 0,0 # Corrected to assign 0,0
-                        quality_stock_map[quality_enum] = random.randint(min_val, max_val)
-
-                    region.initialize_drug_market(
-                        drug_name_str,
-                        base_price,
-                        max_price,
-                        demand_factor,
-                        quality_stock_map,
-                    )
-                except (TypeError, ValueError, IndexError) as e_drug: # Catch errors from unpacking or processing drug_def_tuple
-                    logger.error(f"Error processing drug definition tuple '{drug_def_tuple}' in region {region_name_str}. Error: {e_drug}. Skipping this drug.")
-                    continue
-                except Exception as e_drug_other:
-                     logger.error(f"Unexpected error processing drug definition '{drug_def_tuple}' in region {region_name_str}. Error: {e_drug_other}. Skipping this drug.")
-                     continue
-            self.all_regions[region_enum] = region
-
-        # After all regions and their markets are initialized, restock them
-        for region_obj in self.all_regions.values():  # region_obj is Region
-            if hasattr(region_obj, "restock_market"):  # Check if method exists
-                region_obj.restock_market()
-            else:
-                logger.warning(
-                    f"Region {region_obj.name} does not have a restock_market method."
-                )
+    def _initialize_world_regions(self) -> None:
+        """
+        Initializes all game regions, including their names and drug markets.
+
+        Region definitions come from game_configs. They are validated and
+        priced once per configuration into a cached WorldTemplate (see
+        `core.world_template`); each new game only redraws the random stock.
+        """
+        self.all_regions: Dict[RegionName, Region] = get_world_template(game_configs).instantiate()
+        for region in self.all_regions.values():
+            region.last_updated_day = self.current_day
 
     def set_current_player_region(self, region_name: RegionName) -> None:
         """
@@ -270,9 +280,22 @@ class GameState:
         else:
             # This could raise an error or log a warning, depending on desired strictness
             logger.warning(
-                f"Attempted to set current region to an unknown or uninitialized region: {region_name}"
+                "Attempted to set current region to an unknown or uninitialized region: %s", region_name
             )
 
+    @property
+    def campaign_phase(self) -> int:
+        """
+        The 1-based campaign phase of the current day.
+
+        Phase n runs through day CAMPAIGN_PHASE_THRESHOLDS[n - 1]; days past
+        the last threshold stay in the final phase.
+        """
+        thresholds: List[int] = game_configs.CAMPAIGN_PHASE_THRESHOLDS
+        if not thresholds:
+            return 1
+        return min(bisect_left(thresholds, self.current_day), len(thresholds) - 1) + 1
+
     def get_current_player_region(self) -> Optional[Region]:
         """
         Retrieves the Region object for the player's current location.
@@ -332,6 +355,42 @@ class GameState:
             "win_condition_achieved": self.win_condition_achieved,
         }
 
+    def clone(self) -> "GameState":
+        """
+        Returns an independent copy of the game state, for lookahead and branching.
+
+        Much cheaper than `copy.deepcopy`: regions, rivals, the timeline and
+        the journal clone themselves, and everything else is copied one level
+        deep. Config-derived values are shared rather than copied, such as
+        the active seasonal event's effects and the data of each turf war
+        (replaced as a whole, never edited). The copy's journal never spills
+        to disk. Playing the same days with the same random draws on the
+        original and the copy gives the same results.
+
+        Returns:
+            GameState: The copy. `current_player_region` points into its own regions.
+        """
+        clone = GameState.__new__(GameState)
+        clone.__dict__.update(self.__dict__)
+        clone.current_crypto_prices = self.current_crypto_prices.copy()
+        clone.ai_rivals = [rival.clone() for rival in self.ai_rivals]
+        clone.all_regions = {name: region.clone() for name, region in self.all_regions.items()}
+        clone.current_player_region = None
+        if self.current_player_region is not None:
+            for name, region in self.all_regions.items():
+                if region is self.current_player_region:
+                    clone.current_player_region = clone.all_regions[name]
+                    break
+            else:
+                clone.current_player_region = self.current_player_region.clone()
+        clone.player_sales_profit_by_region = self.player_sales_profit_by_region.copy()
+        clone.achieved_legacy_scenarios = self.achieved_legacy_scenarios.copy()
+        clone.seasonal_event_name_map = self.seasonal_event_name_map.copy()
+        clone.active_turf_wars = self.active_turf_wars.copy()
+        clone.timeline = self.timeline.clone()
+        clone.event_journal = self.event_journal.clone()
+        return clone
+
 
 # Placeholder for testing the GameState class structure.
 # This would typically be part of your main application setup or test suite.
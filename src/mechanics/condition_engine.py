@@ -0,0 +1,135 @@
+# src/mechanics/condition_engine.py
+"""
+Dependency-tracked evaluation of win conditions and legacy scenarios.
+
+Each condition declares the `ConditionDependency` inputs it reads. On every
+evaluation the engine probes each dependency once (each probe is O(1) or
+bounded by a small fixed collection such as the contact list) and re-runs only
+the conditions whose inputs changed since the last evaluation; the others
+return their cached result. Adding more conditions therefore adds no probing
+cost, and a condition costs nothing on days its inputs do not move.
+"""
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Set
+
+from ..core.enums import ConditionDependency
+from .net_worth import calculate_crypto_portfolio_value, calculate_drug_stash_value, get_net_worth_tracker
+from .regional_heat import get_regional_heat_aggregate
+
+if TYPE_CHECKING:
+    from ..core.player_inventory import PlayerInventory
+    from ..game_state import GameState
+
+ConditionCheck = Callable[["PlayerInventory", "GameState", Any], Any]
+DependencyProbe = Callable[["PlayerInventory", "GameState"], Hashable]
+
+
+def _probe_crypto_holdings(player_inventory: "PlayerInventory", game_state: "GameState") -> Hashable:
+    tracker = get_net_worth_tracker(player_inventory, game_state)
+    if tracker is not None:
+        return tracker.crypto_value
+    return calculate_crypto_portfolio_value(player_inventory, game_state)
+
+
+def _probe_drug_stash(player_inventory: "PlayerInventory", game_state: "GameState") -> Hashable:
+    tracker = get_net_worth_tracker(player_inventory, game_state)
+    if tracker is not None:
+        return tracker.drug_value
+    return calculate_drug_stash_value(player_inventory)
+
+
+def _probe_regional_heat(player_inventory: "PlayerInventory", game_state: "GameState") -> Hashable:
+    aggregate = get_regional_heat_aggregate(game_state)
+    if aggregate is not None:
+        return (id(aggregate), aggregate.version)
+    return tuple(region.current_heat for region in (game_state.all_regions or {}).values())
+
+
+#: How to fingerprint each dependency. A condition is re-evaluated when any of
+#: its dependencies' fingerprints differs from the previous evaluation.
+DEPENDENCY_PROBES: Dict[ConditionDependency, DependencyProbe] = {
+    ConditionDependency.CASH: lambda inv, gs: inv.cash,
+    ConditionDependency.CRYPTO_HOLDINGS: _probe_crypto_holdings,
+    ConditionDependency.DRUG_STASH: _probe_drug_stash,
+    ConditionDependency.REGIONAL_HEAT: _probe_regional_heat,
+    ConditionDependency.CONTACT_TRUST: lambda inv, gs: tuple(inv.contact_trusts.items()),
+    ConditionDependency.LAUNDERED_TOTAL: lambda inv, gs: inv.total_laundered_cash,
+    ConditionDependency.SKILLS: lambda inv, gs: len(inv.unlocked_skills), # Skills are never re-locked
+    ConditionDependency.DEBT_PAYMENTS: lambda inv, gs: (
+        inv.debt_payment_1_paid, inv.debt_payment_2_paid, inv.debt_payment_3_paid
+    ),
+    ConditionDependency.REGIONAL_SALES: lambda inv, gs: tuple(gs.player_sales_profit_by_region.items()),
+    ConditionDependency.PLAYER_ASSETS: lambda inv, gs: (
+        inv.has_secure_phone, inv.large_crypto_transactions_completed
+    ),
+    ConditionDependency.LEGACY_SCENARIOS: lambda inv, gs: len(gs.achieved_legacy_scenarios),
+}
+
+_UNSET = object()
+
+
+class ConditionEngine:
+    """
+    Evaluates a registry of condition checks, re-running only those whose inputs changed.
+
+    Conditions without a dependency declaration are re-evaluated every time.
+    The engine binds to the inventory, game state and config it last evaluated;
+    evaluating against different objects (e.g. a new game) starts from scratch.
+    """
+
+    def __init__(
+        self,
+        checks: Mapping[str, ConditionCheck],
+        dependencies: Mapping[str, Iterable[ConditionDependency]],
+    ) -> None:
+        """
+        Args:
+            checks: Condition name to check function, in evaluation order.
+            dependencies: Condition name to the dependencies its check reads.
+        """
+        self.checks: Dict[str, ConditionCheck] = dict(checks)
+        self._dependents: Dict[ConditionDependency, List[str]] = {}
+        self._undeclared: List[str] = []
+        for name in self.checks:
+            if name not in dependencies:
+                self._undeclared.append(name)
+                continue
+            for dependency in dependencies[name]:
+                self._dependents.setdefault(dependency, []).append(name)
+        self._bound: Optional[tuple] = None
+        self._fingerprints: Dict[ConditionDependency, Any] = {}
+        self._results: Dict[str, Any] = {}
+        self.evaluations: int = 0 # Number of check function calls, for profiling
+
+    def invalidate(self) -> None:
+        """Forces every condition to be re-evaluated on the next call to `evaluate`."""
+        self._fingerprints.clear()
+        self._results.clear()
+
+    def evaluate(
+        self, player_inventory: "PlayerInventory", game_state: "GameState", game_configs_module: Any
+    ) -> Dict[str, Any]:
+        """
+        Returns the current result of every condition, keyed by name in registry order.
+
+        Args:
+            player_inventory: The player's inventory.
+            game_state: The current game state.
+            game_configs_module: The game configuration module passed to the checks.
+        """
+        bound = (player_inventory, game_state, game_configs_module)
+        if self._bound is None or any(current is not previous for current, previous in zip(bound, self._bound)):
+            self._bound = bound
+            self.invalidate()
+
+        stale: Set[str] = set(self._undeclared)
+        for dependency, names in self._dependents.items():
+            fingerprint = DEPENDENCY_PROBES[dependency](player_inventory, game_state)
+            if self._fingerprints.get(dependency, _UNSET) != fingerprint:
+                self._fingerprints[dependency] = fingerprint
+                stale.update(names)
+
+        for name, check in self.checks.items():
+            if name in stale or name not in self._results:
+                self._results[name] = check(player_inventory, game_state, game_configs_module)
+                self.evaluations += 1
+        return dict(self._results)
@@ -1,15 +1,21 @@
 # src/mechanics/daily_updates.py
 import math
-import random
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from ..core.enums import CryptoCoin, EventType, SkillID, ContactID # Added ContactID
+from ..core.enums import CryptoCoin, DrugName, EventType, SkillID, ContactID, TimelineEventKind # Added ContactID
 from ..core.market_event import MarketEvent
 from ..core.player_inventory import PlayerInventory
 from ..core.region import Region
+from ..core.timeline import TimelineEntry
 from ..game_state import GameState
 from ..mechanics import event_manager, market_impact
+from ..utils.importance_sampling import chance_event
+from ..utils.random_streams import decision_rng, set_stream_day
 from . import seasonal_events_manager # Import the new manager
+from . import turf_war_manager
+
+LAUNDERING_TIMELINE_KEY: str = "laundering_arrival"
+INFORMANT_TIMELINE_KEY: str = "informant_available"
 
 
 class DailyUpdateResult:
@@ -23,6 +29,7 @@ class DailyUpdateResult:
         self.pending_laundered_sc_processed: bool = False
         self.new_pending_laundered_sc: float = 0.0 # Data for app.py to update player_inventory
         self.new_pending_laundered_sc_arrival_day: Optional[int] = None # Data for app.py to update player_inventory
+        self.days_advanced: int = 1 # Days covered by this result; more than one after advance_days
 
 # --- Helper Functions for Daily Updates ---
 
@@ -71,28 +78,65 @@ def _handle_debt_payments(
     
     return game_over_msg, ui_messages, log_messages
 
+def catch_up_region(region: Region, game_state: GameState) -> None:
+    """
+    Brings a region's market up to the current day.
+
+    Markets are updated lazily: a region records the day it was last brought
+    up to date and catches up here when next accessed. Player and rival
+    impact decay and event aging are applied in closed form over the elapsed
+    days. A restock replaces the whole stock, so only the last day's restock
+    matters and it is drawn once, after the events are aged to that day as
+    the daily order has it. Heat is not part of the catch-up: every region's
+    heat is decayed daily (see `_perform_regional_updates`).
+
+    Args:
+        region: The region to bring up to date.
+        game_state: The game the region belongs to.
+    """
+    current_day = game_state.current_day
+    last_day = region.last_updated_day
+    region.last_updated_day = current_day
+    if last_day is None or last_day >= current_day:
+        return
+
+    elapsed_days = current_day - last_day
+    if elapsed_days > 1:
+        event_manager.update_active_events(region, current_day - 1, game_state.event_journal, days=elapsed_days - 1)
+    region.restock_market()
+    market_impact.decay_player_market_impact(region, days=elapsed_days)
+    market_impact.decay_rival_market_impact(region, current_day, days=elapsed_days)
+    event_manager.update_active_events(region, current_day, game_state.event_journal)
+
 def _perform_regional_updates(game_state: GameState, player_inventory: PlayerInventory, game_configs: Any) -> None:
-    """Performs daily updates for all regions."""
-    for r_name, r_obj in game_state.all_regions.items():
-        if hasattr(r_obj, "restock_market"): r_obj.restock_market()
+    """
+    Decays every region's heat and brings the player's region up to date.
+
+    Heat is read across all regions every day (win conditions, legacy
+    scenarios), so it is decayed eagerly; other markets catch up on access.
+    """
+    for r_obj in game_state.all_regions.values():
         market_impact.decay_regional_heat(r_obj, 1.0, player_inventory, game_configs) # Pass player_inv and game_configs
-        market_impact.decay_player_market_impact(r_obj)
-        market_impact.decay_rival_market_impact(r_obj, game_state.current_day)
-        event_manager.update_active_events(r_obj)
+    current_player_region = game_state.get_current_player_region()
+    if current_player_region is not None:
+        catch_up_region(current_player_region, game_state)
 
-def _update_crypto_prices(game_state: GameState, game_configs: Any) -> None:
-    """Updates daily crypto prices."""
-    game_state.update_daily_crypto_prices(game_configs.CRYPTO_VOLATILITY, game_configs.CRYPTO_MIN_PRICE)
+def _update_crypto_prices(game_state: GameState, game_configs: Any, days: int = 1) -> None:
+    """Updates crypto prices; several days move along one random walk."""
+    if days == 1:
+        game_state.update_daily_crypto_prices(game_configs.CRYPTO_VOLATILITY, game_configs.CRYPTO_MIN_PRICE)
+    else:
+        game_state.advance_crypto_prices(game_configs.CRYPTO_VOLATILITY, game_configs.CRYPTO_MIN_PRICE, days)
 
 def _process_staking_rewards(
-    player_inventory: PlayerInventory, game_configs: Any
+    player_inventory: PlayerInventory, game_configs: Any, days: int = 1
 ) -> List[str]:
-    """Processes daily staking rewards for DrugCoin."""
+    """Processes staking rewards for DrugCoin. Rewards are simple interest, so several days accrue at once."""
     ui_messages: List[str] = []
     if hasattr(player_inventory, "staked_drug_coin") and \
        player_inventory.staked_drug_coin.get("staked_amount", 0.0) > 0 and \
-       hasattr(game_configs, "DC_STAKING_DAILY_RETURN_PERCENT"):
-        reward = player_inventory.staked_drug_coin["staked_amount"] * game_configs.DC_STAKING_DAILY_RETURN_PERCENT
+       hasattr(game_configs, "DC_STAKING_DAILY_RETURN_PERCENT") and days > 0:
+        reward = player_inventory.staked_drug_coin["staked_amount"] * game_configs.DC_STAKING_DAILY_RETURN_PERCENT * days
         player_inventory.staked_drug_coin["pending_rewards"] = player_inventory.staked_drug_coin.get("pending_rewards", 0.0) + reward
         if reward > 1e-5: # Only message if reward is significant
             ui_messages.append(f"Accrued {reward:.4f} DC rewards. Collect at Tech Contact.")
@@ -125,6 +169,12 @@ def _process_laundering_arrival(
         
     return ui_messages, log_messages, processed_this_update, new_pending_sc, new_arrival_day
 
+def schedule_laundering_arrival(game_state: GameState, arrival_day: int) -> None:
+    """Schedules (or reschedules) the laundered cash arrival on the GameState timeline."""
+    game_state.timeline.schedule(
+        arrival_day, TimelineEventKind.LAUNDERING_ARRIVAL, key=LAUNDERING_TIMELINE_KEY
+    )
+
 def _trigger_random_market_event(
     game_state: GameState, player_inventory: PlayerInventory, game_configs: Any
 ) -> Tuple[List[str], List[str]]:
@@ -160,6 +210,9 @@ def _process_ai_rivals(game_state: GameState, game_configs: Any) -> Tuple[List[s
     def _capture_log_msg(msg: str): log_messages.append(msg)
 
     for rival_instance in game_state.ai_rivals:
+        rival_region = game_state.all_regions.get(rival_instance.primary_region_name)
+        if rival_region is not None and not rival_instance.is_busted:
+            catch_up_region(rival_region, game_state) # The rival may trade there
         market_impact.process_rival_turn(
             rival=rival_instance, all_regions_dict=game_state.all_regions,
             current_turn_number=game_state.current_day, game_configs=game_configs,
@@ -184,8 +237,9 @@ def _handle_player_blocking_events(
         isinstance(ev, MarketEvent) and ev.event_type == EventType.MUGGING
         for ev in current_player_region.active_market_events
     )
-    if not is_mugging_event_active and random.random() < game_configs.MUGGING_EVENT_CHANCE:
-        cash_loss_percentage = random.uniform(
+    mugging_rng = decision_rng("mugging")
+    if not is_mugging_event_active and chance_event("MUGGING_EVENT_CHANCE", game_configs.MUGGING_EVENT_CHANCE, mugging_rng):
+        cash_loss_percentage = mugging_rng.uniform(
             game_configs.MUGGING_CASH_LOSS_PERCENT_MIN, game_configs.MUGGING_CASH_LOSS_PERCENT_MAX
         )
         cash_lost = player_inventory.cash * cash_loss_percentage
@@ -214,7 +268,8 @@ def _handle_player_blocking_events(
     is_betrayal_event_active = any(isinstance(ev, MarketEvent) and ev.event_type == EventType.INFORMANT_BETRAYAL for ev in current_player_region.active_market_events)
 
     if not is_betrayal_event_active and not informant_already_unavailable and \
-       current_informant_trust < trust_threshold and random.random() < betrayal_chance:
+       current_informant_trust < trust_threshold and \
+       chance_event("INFORMANT_BETRAYAL_CHANCE", betrayal_chance, decision_rng("informant_betrayal")):
         
         informant_unavailable_until = game_state.current_day + unavailable_days
         
@@ -300,19 +355,25 @@ def _handle_player_blocking_events(
     return blocking_event_data, log_messages, informant_unavailable_until
 
 def _award_skill_points(
-    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    days: int = 1, through_day: Optional[int] = None,
 ) -> Tuple[List[str], List[str], int]:
-    """Awards skill points to the player if criteria are met."""
+    """Awards a skill point for each award day among the `days` days ending on `through_day` (default today)."""
     ui_messages: List[str] = []
     log_messages: List[str] = []
     skill_points_total = player_inventory.skill_points # Return current if not awarded
 
-    if game_state.current_day > 0 and \
-       game_state.current_day % game_configs.SKILL_POINTS_PER_X_DAYS == 0:
-        player_inventory.skill_points += 1
+    interval = game_configs.SKILL_POINTS_PER_X_DAYS
+    last_day = game_state.current_day if through_day is None else through_day
+    first_day = max(1, last_day - days + 1)
+    points = max(0, last_day // interval - (first_day - 1) // interval)
+    if points > 0:
+        player_inventory.skill_points += points
         skill_points_total = player_inventory.skill_points
-        ui_messages.append(f"Daily Update: +1 Skill Point. Total: {player_inventory.skill_points}")
-        log_messages.append(f"Awarded skill point (daily). Total: {player_inventory.skill_points}")
+        plural = "s" if points > 1 else ""
+        ui_messages.append(f"Daily Update: +{points} Skill Point{plural}. Total: {player_inventory.skill_points}")
+        awarded = "skill point" if points == 1 else f"{points} skill points"
+        log_messages.append(f"Awarded {awarded} (daily). Total: {player_inventory.skill_points}")
     return ui_messages, log_messages, skill_points_total
 
 def _check_for_bankruptcy(
@@ -326,38 +387,27 @@ def _check_for_bankruptcy(
         log_messages.append(f"{game_over_msg} Cash: ${player_inventory.cash:.2f}, Threshold: ${game_configs.BANKRUPTCY_THRESHOLD:.2f}")
     return game_over_msg, log_messages
 
-# --- Main Function ---
+# --- Timeline Handlers ---
+# Each handler receives the due entry's payload and records its outcome on the result.
 
-def perform_daily_updates(
-    game_state_data: GameState,
-    player_inventory_data: PlayerInventory,
-    game_configs_data: Any,
-) -> DailyUpdateResult:
-    result = DailyUpdateResult()
-
-    # 1. Debt Payments
+def _on_debt_payment_due(
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    payload: Any, result: DailyUpdateResult,
+) -> None:
     debt_game_over, debt_ui_msgs, debt_log_msgs = _handle_debt_payments(
-        game_state_data, player_inventory_data, game_configs_data
+        game_state, player_inventory, game_configs
     )
     result.ui_messages.extend(debt_ui_msgs)
     result.log_messages.extend(debt_log_msgs)
     if debt_game_over:
         result.game_over_message = debt_game_over
-        return result
-
-    # 2. Regional Updates
-    _perform_regional_updates(game_state_data, player_inventory_data, game_configs_data) # Pass all required args
 
-    # 3. Crypto Price Updates
-    _update_crypto_prices(game_state_data, game_configs_data)
-
-    # 4. Staking Rewards
-    staking_ui_msgs = _process_staking_rewards(player_inventory_data, game_configs_data)
-    result.ui_messages.extend(staking_ui_msgs)
-
-    # 5. Laundering Arrival
+def _on_laundering_arrival(
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    payload: Any, result: DailyUpdateResult,
+) -> None:
     launder_ui_msgs, launder_log_msgs, processed, new_sc, new_day = _process_laundering_arrival(
-        game_state_data, player_inventory_data
+        game_state, player_inventory
     )
     result.ui_messages.extend(launder_ui_msgs)
     result.log_messages.extend(launder_log_msgs)
@@ -365,31 +415,174 @@ def perform_daily_updates(
         result.pending_laundered_sc_processed = True # Signal to app.py that player_inventory needs persistent update
         result.new_pending_laundered_sc = new_sc
         result.new_pending_laundered_sc_arrival_day = new_day
+        # Clear the pending transfer here too so it cannot be rescheduled and credited twice
+        player_inventory.pending_laundered_sc = new_sc
+        player_inventory.pending_laundered_sc_arrival_day = new_day
+
+def _on_informant_available(
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    payload: Any, result: DailyUpdateResult,
+) -> None:
+    if game_state.informant_unavailable_until_day is not None and \
+       game_state.current_day >= game_state.informant_unavailable_until_day:
+        game_state.informant_unavailable_until_day = None
+        result.ui_messages.append("Your informant is available again.")
+        result.log_messages.append("Informant available again after betrayal.")
+
+def _on_turf_war_end(
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    payload: Any, result: DailyUpdateResult,
+) -> None:
+    ended_war_message = turf_war_manager.end_turf_war(game_state, payload)
+    if ended_war_message:
+        result.ui_messages.append(ended_war_message)
+        result.log_messages.append(f"Turf War Update: {ended_war_message}")
+
+def _on_seasonal_event_start(
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    payload: Any, result: DailyUpdateResult,
+) -> None:
+    seasonal_event_message = seasonal_events_manager.start_scheduled_seasonal_event(game_state, payload, game_configs)
+    if seasonal_event_message:
+        result.ui_messages.append(seasonal_event_message)
+        result.log_messages.append(f"Seasonal Event Update: {seasonal_event_message}")
 
+def _on_seasonal_event_end(
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    payload: Any, result: DailyUpdateResult,
+) -> None:
+    seasonal_event_message = seasonal_events_manager.end_scheduled_seasonal_event(game_state, payload, game_configs)
+    if seasonal_event_message:
+        result.ui_messages.append(seasonal_event_message)
+        result.log_messages.append(f"Seasonal Event Update: {seasonal_event_message}")
 
-    # 6. Random Market Event Triggering
-    event_ui_msgs, event_log_msgs = _trigger_random_market_event(
-        game_state_data, player_inventory_data, game_configs_data
-    )
+TIMELINE_HANDLERS: Dict[TimelineEventKind, Callable[[GameState, PlayerInventory, Any, Any, DailyUpdateResult], None]] = {
+    TimelineEventKind.DEBT_PAYMENT_DUE: _on_debt_payment_due,
+    TimelineEventKind.LAUNDERING_ARRIVAL: _on_laundering_arrival,
+    TimelineEventKind.INFORMANT_AVAILABLE: _on_informant_available,
+    TimelineEventKind.TURF_WAR_END: _on_turf_war_end,
+    TimelineEventKind.SEASONAL_EVENT_START: _on_seasonal_event_start,
+    TimelineEventKind.SEASONAL_EVENT_END: _on_seasonal_event_end,
+}
+
+def _process_due_timeline_entries(
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    result: DailyUpdateResult,
+) -> None:
+    """
+    Pops and handles every timeline entry due today.
+    Stops early if a handler ends the game (e.g. a missed debt payment).
+    """
+    # Laundering started through a path that did not schedule it (e.g. older UI actions)
+    if player_inventory.pending_laundered_sc_arrival_day is not None and \
+       not game_state.timeline.is_scheduled(LAUNDERING_TIMELINE_KEY):
+        schedule_laundering_arrival(game_state, player_inventory.pending_laundered_sc_arrival_day)
+
+    due_entries: List[TimelineEntry] = game_state.timeline.pop_due(game_state.current_day)
+    for entry in due_entries:
+        handler = TIMELINE_HANDLERS.get(entry.kind)
+        if handler is None:
+            result.log_messages.append(f"No handler for timeline entry {entry.kind.value}; skipped.")
+            continue
+        handler(game_state, player_inventory, game_configs, entry.payload, result)
+        if result.game_over_message:
+            return
+
+# --- Event Steps ---
+# Steps of a day whose outcome depends on chance; they leave no trace unless something fires.
+
+def _apply_random_market_event(
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    result: DailyUpdateResult,
+) -> None:
+    event_ui_msgs, event_log_msgs = _trigger_random_market_event(game_state, player_inventory, game_configs)
     result.ui_messages.extend(event_ui_msgs)
     result.log_messages.extend(event_log_msgs)
 
-    # 7. AI Rival Processing
-    rival_ui_msgs, rival_log_msgs = _process_ai_rivals(game_state_data, game_configs_data)
+def _apply_ai_rivals(game_state: GameState, game_configs: Any, result: DailyUpdateResult) -> None:
+    rival_ui_msgs, rival_log_msgs = _process_ai_rivals(game_state, game_configs)
     result.ui_messages.extend(rival_ui_msgs)
     result.log_messages.extend(rival_log_msgs)
 
-    # 8. Player-Affecting Blocking Events
+def _apply_player_blocking_events(
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    result: DailyUpdateResult,
+) -> None:
     # Only process if no game over yet and no blocking event from prior steps (though none currently set them)
-    if result.game_over_message is None and result.blocking_event_data is None:
-        blocking_event_data, blocking_log_msgs, informant_until = _handle_player_blocking_events(
-            game_state_data, player_inventory_data, game_configs_data
+    if result.game_over_message is not None or result.blocking_event_data is not None:
+        return
+    blocking_event_data, blocking_log_msgs, informant_until = _handle_player_blocking_events(
+        game_state, player_inventory, game_configs
+    )
+    result.log_messages.extend(blocking_log_msgs)
+    if blocking_event_data:
+        result.blocking_event_data = blocking_event_data
+    if informant_until is not None and informant_until != game_state.informant_unavailable_until_day : # check if it changed
+        result.informant_unavailable_until_day = informant_until # Signal to app.py to update game_state
+        game_state.timeline.schedule(
+            informant_until, TimelineEventKind.INFORMANT_AVAILABLE, key=INFORMANT_TIMELINE_KEY
         )
-        result.log_messages.extend(blocking_log_msgs)
-        if blocking_event_data:
-            result.blocking_event_data = blocking_event_data
-        if informant_until is not None and informant_until != game_state_data.informant_unavailable_until_day : # check if it changed
-            result.informant_unavailable_until_day = informant_until # Signal to app.py to update game_state
+
+def _apply_bankruptcy_check(
+    player_inventory: PlayerInventory, game_configs: Any, result: DailyUpdateResult
+) -> None:
+    # Only check if no game over message has been set by previous steps
+    if result.game_over_message is not None:
+        return
+    bankruptcy_game_over, bankruptcy_log_msgs = _check_for_bankruptcy(player_inventory, game_configs)
+    result.log_messages.extend(bankruptcy_log_msgs)
+    if bankruptcy_game_over:
+        result.game_over_message = bankruptcy_game_over
+        # No return here, let it fall through so all log messages are collected
+
+def _apply_opportunity_event(
+    game_state: GameState, player_inventory: PlayerInventory, game_configs: Any,
+    result: DailyUpdateResult,
+) -> None:
+    # Only if no other major blocking event or game over
+    if result.game_over_message is not None or result.blocking_event_data is not None:
+        return
+    opportunity_event_data = _try_trigger_opportunity_event(game_state, player_inventory, game_configs)
+    if opportunity_event_data:
+        result.blocking_event_data = opportunity_event_data # Use existing blocking_event_data structure
+        # The message from the event itself will be part of the popup data.
+        result.log_messages.append(f"Opportunity Event Triggered: {opportunity_event_data.get('title', 'Unknown Opportunity')}")
+
+# --- Main Functions ---
+
+def perform_daily_updates(
+    game_state_data: GameState,
+    player_inventory_data: PlayerInventory,
+    game_configs_data: Any,
+) -> DailyUpdateResult:
+    result = DailyUpdateResult()
+
+    # 1. Scheduled Timeline Entries (debt payments, laundering arrival, informant return,
+    #    turf war and seasonal event start/end). Only entries due today are touched.
+    _process_due_timeline_entries(game_state_data, player_inventory_data, game_configs_data, result)
+    if result.game_over_message:
+        return result
+
+    # 2. Regional Updates
+    _perform_regional_updates(game_state_data, player_inventory_data, game_configs_data) # Pass all required args
+
+    # 3. Crypto Price Updates
+    _update_crypto_prices(game_state_data, game_configs_data)
+
+    # 4. Staking Rewards
+    staking_ui_msgs = _process_staking_rewards(player_inventory_data, game_configs_data)
+    result.ui_messages.extend(staking_ui_msgs)
+
+    # 5. Laundering Arrival is handled by the timeline in step 1.
+
+    # 6. Random Market Event Triggering
+    _apply_random_market_event(game_state_data, player_inventory_data, game_configs_data, result)
+
+    # 7. AI Rival Processing
+    _apply_ai_rivals(game_state_data, game_configs_data, result)
+
+    # 8. Player-Affecting Blocking Events
+    _apply_player_blocking_events(game_state_data, player_inventory_data, game_configs_data, result)
 
     # 9. Skill Point Award
     skill_ui_msgs, skill_log_msgs, total_skill_pts = _award_skill_points(
@@ -401,31 +594,90 @@ def perform_daily_updates(
          result.skill_points_awarded_player_total = total_skill_pts # Update if changed
 
     # 10. Bankruptcy Check
-    # Only check if no game over message has been set by previous steps
-    if result.game_over_message is None:
-        bankruptcy_game_over, bankruptcy_log_msgs = _check_for_bankruptcy(
-            player_inventory_data, game_configs_data
-        )
-        result.log_messages.extend(bankruptcy_log_msgs)
-        if bankruptcy_game_over:
-            result.game_over_message = bankruptcy_game_over
-            # No return here, let it fall through so all log messages are collected
-            
-    # X. Seasonal Event Updates (after most other daily state changes, before final checks like bankruptcy if effects matter)
-    # Check and apply/end seasonal events. This might return a message for the UI.
-    seasonal_event_message = seasonal_events_manager.check_and_update_seasonal_events(game_state_data, game_configs_data)
-    if seasonal_event_message:
-        result.ui_messages.append(seasonal_event_message)
-        result.log_messages.append(f"Seasonal Event Update: {seasonal_event_message}")
+    _apply_bankruptcy_check(player_inventory_data, game_configs_data, result)
+
+    # X. Seasonal Event Updates are driven by timeline entries in step 1.
+
+    # Y. Opportunity Event Triggering
+    _apply_opportunity_event(game_state_data, player_inventory_data, game_configs_data, result)
+
+    return result
 
-    # Y. Opportunity Event Triggering (if no other major blocking event or game over)
-    if result.game_over_message is None and result.blocking_event_data is None:
-        opportunity_event_data = _try_trigger_opportunity_event(game_state_data, player_inventory_data, game_configs_data)
-        if opportunity_event_data:
-            result.blocking_event_data = opportunity_event_data # Use existing blocking_event_data structure
-            # The message from the event itself will be part of the popup data.
-            result.log_messages.append(f"Opportunity Event Triggered: {opportunity_event_data.get('title', 'Unknown Opportunity')}")
 
+def advance_days(
+    game_state_data: GameState,
+    player_inventory_data: PlayerInventory,
+    game_configs_data: Any,
+    days: int,
+) -> DailyUpdateResult:
+    """
+    Fast-forwards the game by up to `days` days, e.g. for jail time, a
+    laundering wait or a bot waiting in place.
+
+    Unlike `perform_daily_updates`, this moves `current_day` itself. The
+    bookkeeping steps run once for the whole span: staking rewards accrue in
+    closed form, skill points are counted from the days crossed, crypto
+    prices follow one random walk and heat outside the player's region decays
+    by the day count. Timeline entries, the player's region, market events,
+    rival turns and the player's blocking events still go day by day, since
+    their chances depend on the day's state; they only add messages when
+    something fires. Advancing stops after the first day that ends the game
+    or raises a popup, so the caller can show it.
+
+    Args:
+        game_state_data: The game to advance.
+        player_inventory_data: The player's inventory.
+        game_configs_data: The game configuration module/object.
+        days: Maximum number of days to advance.
+
+    Returns:
+        DailyUpdateResult: One result for the whole span. `days_advanced` is the
+        number of days actually played.
+    """
+    result = DailyUpdateResult()
+    result.days_advanced = 0
+    bookkeeping_days = 0 # Days that got past the timeline step, as perform_daily_updates returns early otherwise
+    current_player_region = game_state_data.get_current_player_region()
+
+    for _ in range(days):
+        game_state_data.current_day += 1
+        set_stream_day(game_state_data.current_day)
+        result.days_advanced += 1
+
+        _process_due_timeline_entries(game_state_data, player_inventory_data, game_configs_data, result)
+        if result.game_over_message:
+            break
+        bookkeeping_days += 1
+
+        # Events can add heat to the player's region, so its decay keeps the daily order
+        if current_player_region is not None:
+            market_impact.decay_regional_heat(current_player_region, 1.0, player_inventory_data, game_configs_data)
+            catch_up_region(current_player_region, game_state_data)
+
+        _apply_random_market_event(game_state_data, player_inventory_data, game_configs_data, result)
+        _apply_ai_rivals(game_state_data, game_configs_data, result)
+        _apply_player_blocking_events(game_state_data, player_inventory_data, game_configs_data, result)
+        _apply_bankruptcy_check(player_inventory_data, game_configs_data, result)
+        _apply_opportunity_event(game_state_data, player_inventory_data, game_configs_data, result)
+        if result.game_over_message or result.blocking_event_data:
+            break
+
+    for r_obj in game_state_data.all_regions.values():
+        if r_obj is not current_player_region:
+            market_impact.decay_regional_heat(r_obj, 1.0, player_inventory_data, game_configs_data, days=bookkeeping_days)
+    if bookkeeping_days > 0:
+        _update_crypto_prices(game_state_data, game_configs_data, days=bookkeeping_days)
+    result.ui_messages.extend(_process_staking_rewards(player_inventory_data, game_configs_data, days=bookkeeping_days))
+
+    skill_points_before = player_inventory_data.skill_points
+    skill_ui_msgs, skill_log_msgs, total_skill_pts = _award_skill_points(
+        game_state_data, player_inventory_data, game_configs_data,
+        days=bookkeeping_days, through_day=game_state_data.current_day - result.days_advanced + bookkeeping_days,
+    )
+    result.ui_messages.extend(skill_ui_msgs)
+    result.log_messages.extend(skill_log_msgs)
+    if total_skill_pts != skill_points_before:
+        result.skill_points_awarded_player_total = total_skill_pts
     return result
 
 
@@ -436,12 +688,13 @@ def _try_trigger_opportunity_event(
     Attempts to trigger a random opportunity event.
     If triggered, prepares and returns the event data for UI display.
     """
-    if random.random() < game_configs.OPPORTUNITY_EVENT_BASE_CHANCE:
+    rng = decision_rng("opportunity_event")
+    if rng.random() < game_configs.OPPORTUNITY_EVENT_BASE_CHANCE:
         available_events = list(game_configs.OPPORTUNITY_EVENTS_DEFINITIONS.keys())
         if not available_events:
             return None
         
-        event_type_enum = random.choice(available_events)
+        event_type_enum = rng.choice(available_events)
         event_def = game_configs.OPPORTUNITY_EVENTS_DEFINITIONS[event_type_enum]
         
         # Prepare dynamic data for the description template
@@ -454,8 +707,8 @@ def _try_trigger_opportunity_event(
             # Example: Pick a random high-tier drug and quantity
             # This needs a proper way to determine high-tier drugs and quantities
             possible_drugs = [DrugName.COKE, DrugName.HEROIN, DrugName.SPEED] # Example high-tier
-            drug_name_stolen = random.choice(possible_drugs)
-            quantity_stolen = random.randint(15, 40) # Example quantity
+            drug_name_stolen = rng.choice(possible_drugs)
+            quantity_stolen = rng.randint(15, 40) # Example quantity
             description = description.format(drug_name=drug_name_stolen.value, quantity=quantity_stolen)
             # Store these dynamic values if outcomes need them
             event_def["runtime_params"] = {"drug_name": drug_name_stolen, "quantity": quantity_stolen, "region_name": region_name}
@@ -464,26 +717,27 @@ def _try_trigger_opportunity_event(
             possible_drugs = [d for d in player_inventory.items if any(q > 0 for q in player_inventory.items[d].values())]
             if not possible_drugs: return None # Player has no drugs to deliver
             
-            drug_to_deliver = random.choice(possible_drugs)
+            drug_to_deliver = rng.choice(possible_drugs)
             # Find a quality of that drug the player has
             player_qualities = [q for q, qty in player_inventory.items[drug_to_deliver].items() if qty > 0]
             if not player_qualities: return None # Should not happen if possible_drugs is populated
-            quality_to_deliver = random.choice(player_qualities)
+            quality_to_deliver = rng.choice(player_qualities)
             
             max_quantity = player_inventory.get_quantity(drug_to_deliver, quality_to_deliver)
             if max_quantity == 0: return None
 
-            quantity_needed = random.randint(min(5, max_quantity), min(20, max_quantity)) # Deliver between 5 and 20, or max owned if less
+            quantity_needed = rng.randint(min(5, max_quantity), min(20, max_quantity)) # Deliver between 5 and 20, or max owned if less
             
             possible_regions = [r for r in game_state.all_regions.values() if r.name != current_player_region.name] if current_player_region else list(game_state.all_regions.values())
             if not possible_regions: return None # No other region to deliver to
-            target_region = random.choice(possible_regions)
+            target_region = rng.choice(possible_regions)
+            catch_up_region(target_region, game_state) # Its price is quoted below
             
             # Calculate reward: e.g., 20-50% over current sell price (if available)
             base_sell_price = target_region.get_sell_price(drug_to_deliver, quality_to_deliver, player_inventory, game_state)
             if base_sell_price <=0: base_sell_price = game_configs.MINIMUM_DRUG_PRICE * quantity_needed * 2 # fallback if not sold there
             
-            reward_premium_per_unit = base_sell_price * random.uniform(0.2, 0.5) 
+            reward_premium_per_unit = base_sell_price * rng.uniform(0.2, 0.5) 
             
             description = description.format(
                 quantity=quantity_needed, 
@@ -507,9 +761,9 @@ def _try_trigger_opportunity_event(
 
         elif event_type_enum == EventType.EXPERIMENTAL_DRUG_BATCH:
             possible_drugs = [DrugName.PILLS, DrugName.SPEED] # Example
-            drug_name_experimental = random.choice(possible_drugs)
-            quantity_experimental = random.randint(20, 50)
-            cost_experimental = quantity_experimental * random.randint(5, 20) # Low cost
+            drug_name_experimental = rng.choice(possible_drugs)
+            quantity_experimental = rng.randint(20, 50)
+            cost_experimental = quantity_experimental * rng.randint(5, 20) # Low cost
             description = description.format(drug_name=drug_name_experimental.value, quantity=quantity_experimental, cost=cost_experimental)
             event_def["runtime_params"] = {"drug_name": drug_name_experimental, "quantity_base": quantity_experimental, "cost": cost_experimental}
 
@@ -3,16 +3,20 @@ Core mechanics for player encounters, such as police stops.
 
 This module centralizes the logic for determining encounter chances,
 bribe outcomes, and search results, separating it from UI-specific presentation.
+Each resolver has an odds function (`police_stop_odds`, `bribe_odds`,
+`search_odds`) that enumerates the resolver's branches and returns the exact
+outcome distribution and expected losses without rolling anything.
 """
 import math
-import random
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-from .. import game_configs
+from .. import narco_configs as game_configs
 from ..core.enums import DrugName, DrugQuality
 from ..core.player_inventory import PlayerInventory
 from ..core.region import Region
 from ..game_state import GameState
+from ..utils.importance_sampling import chance_event
+from ..utils.random_streams import decision_rng
 
 
 def calculate_police_encounter_chance(region: Region, game_configs_data: Any) -> float:
@@ -34,52 +38,140 @@ def calculate_police_encounter_chance(region: Region, game_configs_data: Any) ->
     return max(0.05, min(encounter_chance, max_chance)) # Ensure a minimum chance if heat is high enough, capped by max_chance
 
 
-def resolve_bribe_attempt(player_inventory: PlayerInventory, region: Region, game_configs_data: Any) -> Dict[str, Any]:
+def _fine_multiplier(region: Region, game_configs_data: Any) -> int:
+    return 1 + region.current_heat // game_configs_data.POLICE_FINE_HEAT_DIVISOR
+
+
+def resolve_police_stop(player_inventory: PlayerInventory, region: Region, game_configs_data: Any) -> Dict[str, Any]:
     """
-    Resolves a bribe attempt during a police stop.
+    Rolls for a police stop on arrival in a region and applies its outcome.
+
+    A stop is a warning, a fine (paid from cash, scaled by heat) or a vehicle
+    search, which confiscates the whole stash with POLICE_STOP_CONFISCATION_CHANCE
+    when the player carries more than POLICE_STOP_CONTRABAND_THRESHOLD_UNITS.
     """
+    rng = decision_rng("police_stop")
+    stop_chance: float = calculate_police_encounter_chance(region, game_configs_data)
+    result: Dict[str, Any] = {
+        "message_key": "no_stop", "stop_chance": stop_chance, "fine_paid": 0.0,
+        "contraband_units": 0, "drugs_confiscated": False,
+    }
+    if rng.random() >= stop_chance:
+        return result
+
+    stop_type_val: float = rng.random()
+    if stop_type_val < game_configs_data.POLICE_STOP_SEVERITY_THRESHOLD_WARNING:
+        result["message_key"] = "stop_warning"
+    elif stop_type_val < game_configs_data.POLICE_STOP_SEVERITY_THRESHOLD_FINE:
+        fine_val: float = min(
+            player_inventory.cash,
+            float(
+                rng.randint(game_configs_data.POLICE_FINE_BASE_MIN, game_configs_data.POLICE_FINE_BASE_MAX)
+                * _fine_multiplier(region, game_configs_data)
+            ),
+        )
+        player_inventory.cash -= fine_val
+        result["message_key"] = "stop_fine"
+        result["fine_paid"] = fine_val
+    else:
+        contraband_units: int = sum(
+            qty for qualities in player_inventory.items.values() for qty in qualities.values()
+        )
+        result["contraband_units"] = contraband_units
+        if (
+            contraband_units > game_configs_data.POLICE_STOP_CONTRABAND_THRESHOLD_UNITS
+            and chance_event(
+                "POLICE_STOP_CONFISCATION_CHANCE", game_configs_data.POLICE_STOP_CONFISCATION_CHANCE, rng
+            )
+        ):
+            player_inventory.clear_drugs()
+            result["message_key"] = "stop_search_confiscated"
+            result["drugs_confiscated"] = True
+        elif contraband_units > 0:
+            result["message_key"] = "stop_search_missed"
+        else:
+            result["message_key"] = "stop_search_clean"
+    return result
+
+
+def _bribe_cost(player_inventory: PlayerInventory, game_configs_data: Any) -> float:
     bribe_min_cost_val = getattr(game_configs_data, "BRIBE_MIN_COST", 50.0)
     bribe_base_percent_val = getattr(game_configs_data, "BRIBE_BASE_COST_PERCENT_OF_CASH", 0.1)
+    return round(max(bribe_min_cost_val, player_inventory.cash * bribe_base_percent_val), 2)
 
-    bribe_cost: float = round(
-        max(
-            bribe_min_cost_val,
-            player_inventory.cash * bribe_base_percent_val,
-        ),
-        2,
-    )
-
-    if player_inventory.cash < bribe_cost:
-        return {"bribe_successful": False, "message_key": "bribe_too_poor", "cost_paid": 0.0, "bribe_amount_demanded": bribe_cost}
-
-    # Player offers bribe, so cash is deducted regardless of outcome for this part of logic
-    # The UI handler will confirm if player wants to offer this amount.
-    # This function assumes the offer is made.
-    # player_inventory.cash -= bribe_cost # This should be done by the caller after confirming the amount
 
+def _bribe_success_chance(region: Region, game_configs_data: Any) -> float:
     heat_points_above_threshold: int = max(
         0, region.current_heat - getattr(game_configs_data, "POLICE_STOP_HEAT_THRESHOLD", 50)
     )
     penalty: float = float(
         heat_points_above_threshold * getattr(game_configs_data, "BRIBE_SUCCESS_CHANCE_HEAT_PENALTY", 0.005)
     )
-    bribe_success_actual_chance: float = max(
+    return max(
         getattr(game_configs_data, "BRIBE_SUCCESS_MIN_CHANCE", 0.1),
         min(getattr(game_configs_data, "BRIBE_SUCCESS_MAX_CHANCE", 0.9), getattr(game_configs_data, "BRIBE_SUCCESS_CHANCE_BASE", 0.75) - penalty)
     )
 
-    if random.random() < bribe_success_actual_chance:
+
+def resolve_bribe_attempt(player_inventory: PlayerInventory, region: Region, game_configs_data: Any) -> Dict[str, Any]:
+    """
+    Resolves a bribe attempt during a police stop.
+    """
+    rng = decision_rng("police_stop")
+    bribe_cost: float = _bribe_cost(player_inventory, game_configs_data)
+
+    if player_inventory.cash < bribe_cost:
+        return {"bribe_successful": False, "message_key": "bribe_too_poor", "cost_paid": 0.0, "bribe_amount_demanded": bribe_cost}
+
+    # Player offers bribe, so cash is deducted regardless of outcome for this part of logic
+    # The UI handler will confirm if player wants to offer this amount.
+    # This function assumes the offer is made.
+    # player_inventory.cash -= bribe_cost # This should be done by the caller after confirming the amount
+
+    if rng.random() < _bribe_success_chance(region, game_configs_data):
         # Player cash reduction should happen here if successful, or if cost is non-refundable on attempt
         return {"bribe_successful": True, "message_key": "bribe_success", "cost_paid": bribe_cost, "bribe_amount_demanded": bribe_cost}
     else:
         return {"bribe_successful": False, "message_key": "bribe_fail_suspicious", "cost_paid": bribe_cost, "bribe_amount_demanded": bribe_cost}
 
 
+# Drugs whose presence raises the jail chance of a search. Stands in for a check
+# of drug tiers (tier 3+), which would need DRUG_DATA or region data here.
+HIGH_TIER_SEARCH_DRUGS = (DrugName.COKE, DrugName.HEROIN)
+
+
+def _confiscated_quantity(current_quantity: int, rounded_share: int) -> int:
+    """Units a search takes from a stack: the rounded-up share, at least one and at most the stack."""
+    if current_quantity <= 0:
+        return 0
+    return min(current_quantity, max(1, rounded_share))
+
+
+def _jail_chance(region: Region, has_high_tier_drugs: bool, game_configs_data: Any) -> float:
+    chance: float = 0.0
+    if region.current_heat >= getattr(game_configs_data, "JAIL_CHANCE_HEAT_THRESHOLD", 70):
+        chance += getattr(game_configs_data, "JAIL_CHANCE_BASE_IF_HEAT_THRESHOLD_MET", 0.2)
+    if has_high_tier_drugs:
+        chance += getattr(game_configs_data, "JAIL_CHANCE_IF_HIGH_TIER_DRUGS_FOUND", 0.25)
+    return min(chance, getattr(game_configs_data, "JAIL_CHANCE_MAX", 0.75))
+
+
+def _jail_days(region: Region, game_configs_data: Any) -> int:
+    days_in_jail_base = getattr(game_configs_data, "JAIL_TIME_DAYS_BASE", 1)
+    days_in_jail_heat_mult = getattr(game_configs_data, "JAIL_TIME_HEAT_MULTIPLIER", 0.1) # Days per heat point over threshold
+    jail_heat_thresh = getattr(game_configs_data, "JAIL_CHANCE_HEAT_THRESHOLD", 70)
+    days_in_jail_val: int = days_in_jail_base + int(
+        max(0, region.current_heat - jail_heat_thresh) * days_in_jail_heat_mult
+    )
+    return max(days_in_jail_base, days_in_jail_val)
+
+
 def resolve_search_outcome(player_inventory: PlayerInventory, region: Region, game_state: GameState, game_configs_data: Any) -> Dict[str, Any]:
     """
     Resolves the outcome of a police search.
     Logic adapted from text_ui_handlers.handle_police_stop_event.
     """
+    rng = decision_rng("police_stop")
     drugs_confiscated_details: List[str] = []
     fine_paid: float = 0.0 # Fines are not in the text_ui_handlers version of search, but keeping variable
     jail_days: int = 0
@@ -90,7 +182,7 @@ def resolve_search_outcome(player_inventory: PlayerInventory, region: Region, ga
     # So, random.random() < CONFISCATION_CHANCE_ON_SEARCH means they *do* find something IF inventory is not empty.
     confiscation_base_chance = getattr(game_configs_data, "CONFISCATION_CHANCE_ON_SEARCH", 0.5) # Chance to *start* confiscation if items exist
 
-    if not player_inventory.items or random.random() > confiscation_base_chance :
+    if not player_inventory.items or rng.random() > confiscation_base_chance :
         message_key = "search_clean"
         # No specific heat increase here in original text_ui_handlers logic for just being searched and clean
         return {"drugs_confiscated_details": [], "fine_paid": 0.0, "jail_days": 0, "heat_increase": 0, "message_key": message_key}
@@ -98,13 +190,13 @@ def resolve_search_outcome(player_inventory: PlayerInventory, region: Region, ga
     # Drugs found, proceed with confiscation & jail checks
     message_key = "search_drugs_found_confiscation" # Default if found
 
-    drug_to_confiscate_name_enum: DrugName = random.choice(
+    drug_to_confiscate_name_enum: DrugName = rng.choice(
         list(player_inventory.items.keys())
     )
     qualities_of_drug: Dict[DrugQuality, int] = player_inventory.items[
         drug_to_confiscate_name_enum
     ]
-    quality_to_confiscate_enum: DrugQuality = random.choice(
+    quality_to_confiscate_enum: DrugQuality = rng.choice(
         list(qualities_of_drug.keys())
     )
     current_quantity_val: int = qualities_of_drug[
@@ -113,19 +205,11 @@ def resolve_search_outcome(player_inventory: PlayerInventory, region: Region, ga
 
     conf_perc_min = getattr(game_configs_data, "CONFISCATION_PERCENTAGE_MIN", 0.1)
     conf_perc_max = getattr(game_configs_data, "CONFISCATION_PERCENTAGE_MAX", 0.5)
-    confiscation_percentage_val: float = random.uniform(conf_perc_min, conf_perc_max)
+    confiscation_percentage_val: float = rng.uniform(conf_perc_min, conf_perc_max)
 
-    quantity_to_confiscate_val: int = math.ceil(
+    quantity_to_confiscate_val: int = _confiscated_quantity(current_quantity_val, math.ceil(
         current_quantity_val * confiscation_percentage_val
-    )
-    quantity_to_confiscate_val = (
-        max(1, quantity_to_confiscate_val)
-        if current_quantity_val > 0
-        else 0
-    )
-    quantity_to_confiscate_val = min(
-        current_quantity_val, quantity_to_confiscate_val
-    )
+    ))
 
     if quantity_to_confiscate_val > 0:
         player_inventory.remove_drug(
@@ -137,43 +221,18 @@ def resolve_search_outcome(player_inventory: PlayerInventory, region: Region, ga
 
         heat_inc_conf_min = getattr(game_configs_data, "HEAT_INCREASE_CONFISCATION_MIN", 5)
         heat_inc_conf_max = getattr(game_configs_data, "HEAT_INCREASE_CONFISCATION_MAX", 15)
-        heat_increase = random.randint(heat_inc_conf_min, heat_inc_conf_max)
+        heat_increase = rng.randint(heat_inc_conf_min, heat_inc_conf_max)
     else:
         message_key = "search_drugs_found_no_confiscation" # Found but nothing taken (e.g. if only 1 unit and % was low)
 
 
     # Jail Check (only if drugs were found and potentially confiscated)
-    current_chance_of_jail_val: float = 0.0
-    jail_heat_thresh = getattr(game_configs_data, "JAIL_CHANCE_HEAT_THRESHOLD", 70) # Example value
-
-    if region.current_heat >= jail_heat_thresh:
-        current_chance_of_jail_val += getattr(game_configs_data, "JAIL_CHANCE_BASE_IF_HEAT_THRESHOLD_MET", 0.2)
-
-    has_high_tier_drugs_flag: bool = False
-    # Determine if high-tier drugs are present (original logic was a bit complex here)
-    # Simplified: check if any drug of tier 3+ is present
-    for drug_name_inv_enum, qualities_inv in player_inventory.items.items():
-        # Need to get tier for drug_name_inv_enum. This requires access to game_configs.DRUG_DATA or region data.
-        # For simplicity, let's assume tier 3+ drugs are COKE, HEROIN for this check.
-        # This should ideally come from a more robust tier checking mechanism.
-        if drug_name_inv_enum in [DrugName.COKE, DrugName.HEROIN] and any(qty > 0 for qty in qualities_inv.values()):
-            has_high_tier_drugs_flag = True
-            break
-
-    if has_high_tier_drugs_flag:
-        current_chance_of_jail_val += getattr(game_configs_data, "JAIL_CHANCE_IF_HIGH_TIER_DRUGS_FOUND", 0.25)
-
-    current_chance_of_jail_val = min(current_chance_of_jail_val, getattr(game_configs_data, "JAIL_CHANCE_MAX", 0.75))
-
-    if random.random() < current_chance_of_jail_val:
-        days_in_jail_base = getattr(game_configs_data, "JAIL_TIME_DAYS_BASE", 1)
-        days_in_jail_heat_mult = getattr(game_configs_data, "JAIL_TIME_HEAT_MULTIPLIER", 0.1) # Days per heat point over threshold
-
-        days_in_jail_val: int = days_in_jail_base + int(
-            max(0, region.current_heat - jail_heat_thresh) * days_in_jail_heat_mult
-        )
-        days_in_jail_val = max(days_in_jail_base, days_in_jail_val)
-        jail_days = days_in_jail_val
+    has_high_tier_drugs_flag: bool = any(
+        drug_name_inv_enum in HIGH_TIER_SEARCH_DRUGS and any(qty > 0 for qty in qualities_inv.values())
+        for drug_name_inv_enum, qualities_inv in player_inventory.items.items()
+    )
+    if rng.random() < _jail_chance(region, has_high_tier_drugs_flag, game_configs_data):
+        jail_days = _jail_days(region, game_configs_data)
 
         message_key = "search_drugs_lost_jailed" if drugs_confiscated_details else "search_jailed_no_confiscation"
         heat_increase += getattr(game_configs_data, "HEAT_INCREASE_JAIL", 10) # Additional heat for jail time
@@ -193,3 +252,150 @@ def resolve_search_outcome(player_inventory: PlayerInventory, region: Region, ga
         "heat_increase": heat_increase,
         "message_key": message_key
     }
+
+
+class EncounterOdds(NamedTuple):
+    """
+    The exact outcome distribution of an encounter, as its resolver would roll it.
+
+    Attributes:
+        outcome_chances: Chance of each outcome, by the resolver's message key.
+        expected_cash_loss: Expected cash paid (fines, bribe costs).
+        expected_confiscated_units: Expected drug units taken.
+        jail_day_chances: Chance of each jail sentence in days; 0 means not jailed.
+        expected_heat_increase: Expected heat added to the region.
+    """
+
+    outcome_chances: Dict[str, float]
+    expected_cash_loss: float
+    expected_confiscated_units: float
+    jail_day_chances: Dict[int, float]
+    expected_heat_increase: float
+
+    @property
+    def jail_chance(self) -> float:
+        return 1.0 - self.jail_day_chances.get(0, 0.0)
+
+
+def _clip_chance(chance: float) -> float:
+    return min(1.0, max(0.0, chance))
+
+
+def _expected_fine(cash: float, multiplier: int, fine_min: int, fine_max: int) -> float:
+    """Mean of min(cash, base * multiplier) over the equally likely base fines in [fine_min, fine_max]."""
+    last_uncapped = min(fine_max, math.floor(cash / multiplier)) # Base fines up to this one are paid in full
+    if last_uncapped < fine_min:
+        return float(cash)
+    uncapped_total = multiplier * (fine_min + last_uncapped) * (last_uncapped - fine_min + 1) / 2
+    return (uncapped_total + (fine_max - last_uncapped) * cash) / (fine_max - fine_min + 1)
+
+
+def _confiscation_distribution(quantity: int, share_min: float, share_max: float) -> Dict[int, float]:
+    """Chance of each number of units a search takes from a stack, for a share drawn uniformly from [share_min, share_max]."""
+    low, high = sorted((quantity * share_min, quantity * share_max))
+    if high == low:
+        return {_confiscated_quantity(quantity, math.ceil(low)): 1.0}
+    chances: Dict[int, float] = {}
+    for rounded in range(math.ceil(low), math.ceil(high) + 1):
+        overlap = min(high, rounded) - max(low, rounded - 1) # Shares in (rounded - 1, rounded] round up to `rounded`
+        if overlap > 0:
+            units = _confiscated_quantity(quantity, rounded)
+            chances[units] = chances.get(units, 0.0) + overlap / (high - low)
+    return chances
+
+
+def police_stop_odds(player_inventory: PlayerInventory, region: Region, game_configs_data: Any) -> EncounterOdds:
+    """
+    Computes the outcome distribution of `resolve_police_stop` in closed form, with no sampling.
+
+    This is the risk of travelling to `region` with the current stash and cash,
+    for bots and travel-risk displays.
+    """
+    stop_chance: float = _clip_chance(calculate_police_encounter_chance(region, game_configs_data))
+    warning_limit: float = _clip_chance(game_configs_data.POLICE_STOP_SEVERITY_THRESHOLD_WARNING)
+    fine_limit: float = max(warning_limit, _clip_chance(game_configs_data.POLICE_STOP_SEVERITY_THRESHOLD_FINE))
+    search_chance: float = stop_chance * (1.0 - fine_limit)
+    chances: Dict[str, float] = {
+        "no_stop": 1.0 - stop_chance,
+        "stop_warning": stop_chance * warning_limit,
+        "stop_fine": stop_chance * (fine_limit - warning_limit),
+    }
+
+    contraband_units: int = sum(qty for qualities in player_inventory.items.values() for qty in qualities.values())
+    expected_confiscated_units: float = 0.0
+    if contraband_units > game_configs_data.POLICE_STOP_CONTRABAND_THRESHOLD_UNITS:
+        confiscation_chance = _clip_chance(game_configs_data.POLICE_STOP_CONFISCATION_CHANCE)
+        chances["stop_search_confiscated"] = search_chance * confiscation_chance
+        chances["stop_search_missed"] = search_chance * (1.0 - confiscation_chance)
+        expected_confiscated_units = chances["stop_search_confiscated"] * contraband_units
+    else:
+        chances["stop_search_missed" if contraband_units > 0 else "stop_search_clean"] = search_chance
+
+    expected_fine: float = _expected_fine(
+        player_inventory.cash, _fine_multiplier(region, game_configs_data),
+        game_configs_data.POLICE_FINE_BASE_MIN, game_configs_data.POLICE_FINE_BASE_MAX,
+    )
+    return EncounterOdds(chances, chances["stop_fine"] * expected_fine, expected_confiscated_units, {0: 1.0}, 0.0)
+
+
+def bribe_odds(player_inventory: PlayerInventory, region: Region, game_configs_data: Any) -> EncounterOdds:
+    """
+    Computes the outcome distribution of `resolve_bribe_attempt`.
+
+    The expected cash loss is the bribe demanded, which is paid whether or not it works.
+    """
+    bribe_cost: float = _bribe_cost(player_inventory, game_configs_data)
+    if player_inventory.cash < bribe_cost:
+        return EncounterOdds({"bribe_too_poor": 1.0}, 0.0, 0.0, {0: 1.0}, 0.0)
+    success_chance: float = _clip_chance(_bribe_success_chance(region, game_configs_data))
+    return EncounterOdds(
+        {"bribe_success": success_chance, "bribe_fail_suspicious": 1.0 - success_chance}, bribe_cost, 0.0, {0: 1.0}, 0.0
+    )
+
+
+def search_odds(player_inventory: PlayerInventory, region: Region, game_configs_data: Any) -> EncounterOdds:
+    """
+    Computes the outcome distribution of `resolve_search_outcome` by enumerating
+    every stack the search can pick and every number of units it can take from it.
+    """
+    found_chance: float = (
+        _clip_chance(getattr(game_configs_data, "CONFISCATION_CHANCE_ON_SEARCH", 0.5)) if player_inventory.items else 0.0
+    )
+    chances: Dict[str, float] = {"search_clean": 1.0 - found_chance}
+    if found_chance == 0.0:
+        return EncounterOdds(chances, 0.0, 0.0, {0: 1.0}, 0.0)
+    share_min = getattr(game_configs_data, "CONFISCATION_PERCENTAGE_MIN", 0.1)
+    share_max = getattr(game_configs_data, "CONFISCATION_PERCENTAGE_MAX", 0.5)
+    confiscation_heat: float = (
+        getattr(game_configs_data, "HEAT_INCREASE_CONFISCATION_MIN", 5)
+        + getattr(game_configs_data, "HEAT_INCREASE_CONFISCATION_MAX", 15)
+    ) / 2
+    jail_heat: int = getattr(game_configs_data, "HEAT_INCREASE_JAIL", 10)
+    high_tier_stacks: List[Tuple[DrugName, DrugQuality]] = [
+        (drug, quality) for drug, qualities in player_inventory.items.items() if drug in HIGH_TIER_SEARCH_DRUGS
+        for quality, qty in qualities.items() if qty > 0
+    ]
+
+    expected_units, expected_heat, jail_chance = 0.0, 0.0, 0.0
+    for drug, qualities in player_inventory.items.items():
+        for quality, quantity in qualities.items():
+            stack_chance = found_chance / len(player_inventory.items) / len(qualities)
+            other_high_tier = any(stack != (drug, quality) for stack in high_tier_stacks)
+            for units, units_chance in _confiscation_distribution(quantity, share_min, share_max).items():
+                branch_chance = stack_chance * units_chance
+                # The jail roll sees the stash after the confiscation
+                high_tier_left = other_high_tier or (drug in HIGH_TIER_SEARCH_DRUGS and quantity - units > 0)
+                jailed_chance = branch_chance * _jail_chance(region, high_tier_left, game_configs_data)
+                free_key = "search_drugs_found_confiscation" if units > 0 else "search_drugs_found_no_confiscation"
+                jailed_key = "search_drugs_lost_jailed" if units > 0 else "search_jailed_no_confiscation"
+                chances[free_key] = chances.get(free_key, 0.0) + branch_chance - jailed_chance
+                chances[jailed_key] = chances.get(jailed_key, 0.0) + jailed_chance
+                expected_units += branch_chance * units
+                expected_heat += (branch_chance * confiscation_heat if units > 0 else 0.0) + jailed_chance * jail_heat
+                jail_chance += jailed_chance
+
+    jail_day_chances: Dict[int, float] = {0: 1.0 - jail_chance}
+    if jail_chance > 0.0:
+        jail_days = _jail_days(region, game_configs_data)
+        jail_day_chances[jail_days] = jail_day_chances.get(jail_days, 0.0) + jail_chance
+    return EncounterOdds(chances, 0.0, expected_units, jail_day_chances, expected_heat)
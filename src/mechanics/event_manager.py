@@ -9,18 +9,21 @@ This module includes functions to:
 """
 
 import math
-import random
 import sys  # For stderr logging
 from enum import Enum
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .. import narco_configs as game_configs # Alias to minimize changes below
 from ..core.ai_rival import AIRival
-from ..core.enums import DrugName, DrugQuality, EventType  # SkillID removed
+from ..core.enums import DrugName, DrugQuality, EventType, JournalRecordKind, RegionName  # SkillID removed
+from ..core.event_journal import EventJournal, JournalRecord
 from ..core.market_event import MarketEvent
 from ..core.player_inventory import PlayerInventory
 from ..core.region import Region
 from ..game_state import GameState
+from .event_selection import get_market_event_selector
+from ..utils.importance_sampling import chance_event
+from ..utils.random_streams import decision_rng
 # Specific config imports - these are numerous, consider accessing via game_configs object
 from ..narco_configs import ( # Changed here
     EVENT_TIER_TARGET_CHEAP_STASH,
@@ -29,7 +32,6 @@ from ..narco_configs import ( # Changed here
     EVENT_TIER_TARGET_THE_SETUP,
     FORCED_SALE_MIN_PRICE_PER_UNIT,  # Added based on usage
     FORCED_SALE_MIN_QUANTITY_TO_SELL,  # Added based on usage
-    MARKET_EVENT_WEIGHTS,
     SETUP_EVENT_MIN_CASH_FACTOR_FOR_BUY_DEAL,
     SETUP_EVENT_MIN_PRICE_PER_UNIT,
     SETUP_EVENT_MIN_QUANTITY_FACTOR_FOR_SELL_DEAL,
@@ -49,6 +51,7 @@ def _create_and_add_demand_spike(
         region: The Region object where the event might occur.
         game_state_instance: The current GameState object.
     """
+    rng = decision_rng("market_event", region.name)
     current_day: int = game_state_instance.current_day
     potential_targets: List[Tuple[DrugName, DrugQuality]] = []
     # drug_name_enum from region.drug_market_data.items() is already DrugName enum
@@ -69,7 +72,7 @@ def _create_and_add_demand_spike(
 
     target_drug_name_enum: DrugName
     target_quality: DrugQuality
-    target_drug_name_enum, target_quality = random.choice(potential_targets)
+    target_drug_name_enum, target_quality = rng.choice(potential_targets)
 
     for ev in region.active_market_events:  # ev is MarketEvent
         if (
@@ -100,12 +103,12 @@ def _create_and_add_demand_spike(
         event_type=EventType.DEMAND_SPIKE,
         target_drug_name=target_drug_name_enum,
         target_quality=target_quality,
-        sell_price_multiplier=random.uniform(sell_price_mult_min, sell_price_mult_max),
-        buy_price_multiplier=random.uniform(buy_price_mult_min, buy_price_mult_max),
-        duration_remaining_days=random.randint(duration_days_min, duration_days_max),
+        sell_price_multiplier=rng.uniform(sell_price_mult_min, sell_price_mult_max),
+        buy_price_multiplier=rng.uniform(buy_price_mult_min, buy_price_mult_max),
+        duration_remaining_days=rng.randint(duration_days_min, duration_days_max),
         start_day=current_day,
     )
-    region.active_market_events.append(event)
+    region.add_market_event(event)
     drug_name_str: str = (
         target_drug_name_enum.value
         if isinstance(target_drug_name_enum, DrugName)
@@ -138,6 +141,7 @@ def _create_and_add_supply_disruption(
         show_event_message_callback: Callback to display messages to the player.
         add_to_log_callback: Callback to add messages to the game log.
     """
+    rng = decision_rng("market_event", region.name)
     potential_targets: List[Tuple[DrugName, DrugQuality]] = []
     for (
         drug_name_enum,
@@ -167,7 +171,7 @@ def _create_and_add_supply_disruption(
 
     target_drug_name_enum: DrugName
     target_quality_enum: DrugQuality
-    target_drug_name_enum, target_quality_enum = random.choice(potential_targets)
+    target_drug_name_enum, target_quality_enum = rng.choice(potential_targets)
 
     for ev in region.active_market_events:  # ev is MarketEvent
         if (
@@ -214,7 +218,7 @@ def _create_and_add_supply_disruption(
         stock_reduction_factor=reduction_factor,
         min_stock_after_event=int(min_stock),
     )
-    region.active_market_events.append(event)
+    region.add_market_event(event)
 
     msg: str = f"Supply Alert! {target_drug_name_enum.value} ({target_quality_enum.name}) in {region.name.value} is now scarce due to a supply chain disruption for {duration} days!"  # type: ignore
     show_event_message_callback(msg)
@@ -231,6 +235,7 @@ def _create_and_add_police_crackdown(region: Region, current_day: int) -> None:
         region: The Region to affect.
         current_day: The current game day.
     """
+    rng = decision_rng("market_event", region.name)
     for ev in region.active_market_events:
         if ev.event_type == EventType.POLICE_CRACKDOWN:
             return
@@ -249,8 +254,8 @@ def _create_and_add_police_crackdown(region: Region, current_day: int) -> None:
         print(f"Error: Missing configuration for POLICE_CRACKDOWN event parameter: {e}. Event not created.", file=sys.stderr)
         return
 
-    duration: int = random.randint(duration_days_min, duration_days_max)
-    heat_amount: int = random.randint(heat_increase_min, heat_increase_max)
+    duration: int = rng.randint(duration_days_min, duration_days_max)
+    heat_amount: int = rng.randint(heat_increase_min, heat_increase_max)
     event: MarketEvent = MarketEvent(
         event_type=EventType.POLICE_CRACKDOWN,
         target_drug_name=None,
@@ -261,7 +266,7 @@ def _create_and_add_police_crackdown(region: Region, current_day: int) -> None:
         start_day=current_day,
         heat_increase_amount=heat_amount,
     )
-    region.active_market_events.append(event)
+    region.add_market_event(event)
     region.modify_heat(heat_amount)
     region_name_str: str = (
         region.name.value if isinstance(region.name, Enum) else str(region.name)
@@ -282,6 +287,7 @@ def _create_and_add_cheap_stash(region: Region, current_day: int) -> None:
         region: The Region to affect.
         current_day: The current game day.
     """
+    rng = decision_rng("market_event", region.name)
     potential_targets: List[Tuple[DrugName, DrugQuality]] = []
     for (
         drug_name_enum,
@@ -298,7 +304,7 @@ def _create_and_add_cheap_stash(region: Region, current_day: int) -> None:
 
     target_drug_name_enum: DrugName
     target_quality: DrugQuality
-    target_drug_name_enum, target_quality = random.choice(potential_targets)
+    target_drug_name_enum, target_quality = rng.choice(potential_targets)
 
     for ev in region.active_market_events:  # ev is MarketEvent
         if (
@@ -331,14 +337,14 @@ def _create_and_add_cheap_stash(region: Region, current_day: int) -> None:
         target_drug_name=target_drug_name_enum,
         target_quality=target_quality,
         sell_price_multiplier=1.0,
-        buy_price_multiplier=random.uniform(buy_price_mult_min, buy_price_mult_max),
-        duration_remaining_days=random.randint(duration_days_min, duration_days_max),
+        buy_price_multiplier=rng.uniform(buy_price_mult_min, buy_price_mult_max),
+        duration_remaining_days=rng.randint(duration_days_min, duration_days_max),
         start_day=current_day,
-        temporary_stock_increase=random.randint(
+        temporary_stock_increase=rng.randint(
             temp_stock_increase_min, temp_stock_increase_max
         ),
     )
-    region.active_market_events.append(event)
+    region.add_market_event(event)
     drug_name_str: str = (
         target_drug_name_enum.value
         if isinstance(target_drug_name_enum, DrugName)
@@ -365,11 +371,12 @@ def _create_and_add_the_setup(
         current_day: The current game day.
         player_inventory: The PlayerInventory object.
     """
+    rng = decision_rng("market_event", region.name)
     for ev in region.active_market_events:  # ev is MarketEvent
         if ev.event_type == EventType.THE_SETUP:
             return
 
-    is_buy_deal: bool = random.choice([True, False])
+    is_buy_deal: bool = rng.choice([True, False])
     possible_deal_drugs: List[Tuple[DrugName, int]] = [
         (drug_name_enum, data["tier"])
         for drug_name_enum, data in region.drug_market_data.items()  # data is Dict[str, Any]
@@ -380,12 +387,12 @@ def _create_and_add_the_setup(
 
     deal_drug_name_enum: DrugName
     tier: int
-    deal_drug_name_enum, tier = random.choice(possible_deal_drugs)
+    deal_drug_name_enum, tier = rng.choice(possible_deal_drugs)
 
     if not region.drug_market_data[deal_drug_name_enum].get("available_qualities"):
         return
 
-    deal_quality: DrugQuality = random.choice(
+    deal_quality: DrugQuality = rng.choice(
         list(region.drug_market_data[deal_drug_name_enum]["available_qualities"].keys())
     )
 
@@ -407,7 +414,7 @@ def _create_and_add_the_setup(
         print(f"Error: Missing configuration for THE_SETUP event parameter: {e}. Event not created.", file=sys.stderr)
         return
 
-    deal_quantity: int = random.randint(deal_quantity_min, deal_quantity_max)
+    deal_quantity: int = rng.randint(deal_quantity_min, deal_quantity_max)
     base_buy_price: float = region.drug_market_data[deal_drug_name_enum]["base_buy_price"]
     base_sell_price: float = region.drug_market_data[deal_drug_name_enum]["base_sell_price"]
 
@@ -418,11 +425,11 @@ def _create_and_add_the_setup(
     deal_price_per_unit: float
 
     if is_buy_deal:
-        deal_price_per_unit = base_buy_price * quality_mult_buy * random.uniform(buy_deal_price_mult_min, buy_deal_price_mult_max)
+        deal_price_per_unit = base_buy_price * quality_mult_buy * rng.uniform(buy_deal_price_mult_min, buy_deal_price_mult_max)
         if player_inventory.cash < deal_price_per_unit * deal_quantity * getattr(game_configs, "SETUP_EVENT_MIN_CASH_FACTOR_FOR_BUY_DEAL", 0.5): # Use getattr for safety
             return
     else:  # Sell deal
-        deal_price_per_unit = base_sell_price * quality_mult_sell * random.uniform(sell_deal_price_mult_min, sell_deal_price_mult_max)
+        deal_price_per_unit = base_sell_price * quality_mult_sell * rng.uniform(sell_deal_price_mult_min, sell_deal_price_mult_max)
         has_any_of_drug: bool = any(player_inventory.get_quantity(deal_drug_name_enum, qc) > 0 for qc in player_inventory.items.get(deal_drug_name_enum, {}))
         if not has_any_of_drug and player_inventory.get_quantity(deal_drug_name_enum, deal_quality) < deal_quantity * getattr(game_configs, "SETUP_EVENT_MIN_QUANTITY_FACTOR_FOR_SELL_DEAL", 0.25): # Use getattr
             return
@@ -443,7 +450,7 @@ def _create_and_add_the_setup(
         deal_price_per_unit=deal_price_per_unit,
         is_buy_deal=is_buy_deal,
     )
-    region.active_market_events.append(event)
+    region.add_market_event(event)
     region_name_str: str = (
         region.name.value if isinstance(region.name, Enum) else str(region.name)
     )
@@ -466,11 +473,12 @@ def _create_and_add_rival_busted(
         current_day: The current game day.
         ai_rivals: The list of all AIRival objects in the game.
     """
+    rng = decision_rng("market_event", region.name)
     eligible_rivals: List[AIRival] = [r for r in ai_rivals if not r.is_busted]
     if not eligible_rivals:
         return
 
-    busted_rival: AIRival = random.choice(eligible_rivals)
+    busted_rival: AIRival = rng.choice(eligible_rivals)
 
     for ev in region.active_market_events:  # ev is MarketEvent
         if ev.event_type == EventType.RIVAL_BUSTED and ev.target_drug_name == busted_rival.name:  # type: ignore # target_drug_name is Optional[DrugName] but here it's a string for rival name
@@ -486,7 +494,7 @@ def _create_and_add_rival_busted(
             # Proceed with bust but maybe default duration or log error further
             busted_rival.busted_days_remaining = 5 # Fallback
         else:
-            busted_rival.busted_days_remaining = random.randint(duration_days_min, duration_days_max)
+            busted_rival.busted_days_remaining = rng.randint(duration_days_min, duration_days_max)
     except KeyError as e:
         print(f"Error: Missing configuration for RIVAL_BUSTED event parameter: {e}. Using default bust duration.", file=sys.stderr)
         busted_rival.busted_days_remaining = 5 # Fallback
@@ -500,7 +508,7 @@ def _create_and_add_rival_busted(
         duration_remaining_days=busted_rival.busted_days_remaining,
         start_day=current_day,
     )
-    region.active_market_events.append(event)
+    region.add_market_event(event)
     print(
         f"\nMajor News: Notorious dealer {busted_rival.name} has been BUSTED by authorities! They'll be out of action for about {busted_rival.busted_days_remaining} days."
     )
@@ -523,6 +531,7 @@ def _create_and_add_drug_market_crash(
         show_event_message_callback: Callback for player messages.
         add_to_log_callback: Callback for game log.
     """
+    rng = decision_rng("market_event", region.name)
     potential_targets: List[Tuple[DrugName, DrugQuality]] = []
     for (
         drug_name_enum,
@@ -562,7 +571,7 @@ def _create_and_add_drug_market_crash(
 
     target_drug_name_enum: DrugName
     target_quality_enum: DrugQuality
-    target_drug_name_enum, target_quality_enum = random.choice(potential_targets)
+    target_drug_name_enum, target_quality_enum = rng.choice(potential_targets)
 
     for ev in region.active_market_events:  # ev is MarketEvent
         if (
@@ -605,7 +614,7 @@ def _create_and_add_drug_market_crash(
         price_reduction_factor=(1.0 - float(reduction_percent)),
         minimum_price_after_crash=float(min_price),
     )
-    region.active_market_events.append(event)
+    region.add_market_event(event)
 
     drug_name_str: str = target_drug_name_enum.value
     region_name_str: str = (
@@ -636,6 +645,7 @@ def _create_and_add_black_market_event(
     Returns:
         Optional[str]: A log message if the event is created, otherwise None.
     """
+    rng = decision_rng("black_market", region.name)
     potential_targets: List[Tuple[DrugName, DrugQuality]] = []
     for (
         drug_name_enum,
@@ -652,7 +662,7 @@ def _create_and_add_black_market_event(
 
     chosen_drug_name_enum: DrugName
     chosen_quality: DrugQuality
-    chosen_drug_name_enum, chosen_quality = random.choice(potential_targets)
+    chosen_drug_name_enum, chosen_quality = rng.choice(potential_targets)
 
     is_specific_event_active: bool = any(
         ev.event_type == EventType.BLACK_MARKET_OPPORTUNITY
@@ -678,7 +688,7 @@ def _create_and_add_black_market_event(
         print(f"Error: Missing configuration for BLACK_MARKET_OPPORTUNITY event parameter: {e}. Event not created.", file=sys.stderr)
         return None # Explicitly return None
 
-    quantity: int = random.randint(min_qty, max_qty)
+    quantity: int = rng.randint(min_qty, max_qty)
 
     event: MarketEvent = MarketEvent(
         event_type=EventType.BLACK_MARKET_OPPORTUNITY,
@@ -690,7 +700,7 @@ def _create_and_add_black_market_event(
         start_day=current_day,
         black_market_quantity_available=quantity,
     )
-    region.active_market_events.append(event)
+    region.add_market_event(event)
 
     drug_name_str: str = chosen_drug_name_enum.value
     region_name_str: str = (
@@ -709,6 +719,56 @@ def _create_and_add_black_market_event(
     return log_message
 
 
+# --- Uniform-signature spawners for weighted market events ---
+# Each adapts one _create_and_add_* function to the common signature
+# (region, game_state, player_inventory, ai_rivals, show_cb, log_cb).
+# They look the creator up at call time so it can be patched in tests.
+
+MarketEventSpawner = Callable[
+    [Region, GameState, PlayerInventory, List[AIRival], Callable[[str], None], Callable[[str], None]],
+    None,
+]
+
+
+def _spawn_demand_spike(region, game_state, player_inventory, ai_rivals, show_cb, log_cb) -> None:
+    _create_and_add_demand_spike(region, game_state)
+
+
+def _spawn_supply_disruption(region, game_state, player_inventory, ai_rivals, show_cb, log_cb) -> None:
+    _create_and_add_supply_disruption(region, game_state.current_day, game_state, show_cb, log_cb)
+
+
+def _spawn_police_crackdown(region, game_state, player_inventory, ai_rivals, show_cb, log_cb) -> None:
+    _create_and_add_police_crackdown(region, game_state.current_day)
+
+
+def _spawn_cheap_stash(region, game_state, player_inventory, ai_rivals, show_cb, log_cb) -> None:
+    _create_and_add_cheap_stash(region, game_state.current_day)
+
+
+def _spawn_the_setup(region, game_state, player_inventory, ai_rivals, show_cb, log_cb) -> None:
+    _create_and_add_the_setup(region, game_state.current_day, player_inventory)
+
+
+def _spawn_rival_busted(region, game_state, player_inventory, ai_rivals, show_cb, log_cb) -> None:
+    _create_and_add_rival_busted(region, game_state.current_day, ai_rivals)
+
+
+def _spawn_drug_market_crash(region, game_state, player_inventory, ai_rivals, show_cb, log_cb) -> None:
+    _create_and_add_drug_market_crash(region, game_state.current_day, show_cb, log_cb)
+
+
+MARKET_EVENT_SPAWNERS: Dict[EventType, MarketEventSpawner] = {
+    EventType.DEMAND_SPIKE: _spawn_demand_spike,
+    EventType.SUPPLY_DISRUPTION: _spawn_supply_disruption,
+    EventType.POLICE_CRACKDOWN: _spawn_police_crackdown,
+    EventType.CHEAP_STASH: _spawn_cheap_stash,
+    EventType.THE_SETUP: _spawn_the_setup,
+    EventType.RIVAL_BUSTED: _spawn_rival_busted,
+    EventType.DRUG_MARKET_CRASH: _spawn_drug_market_crash,
+}
+
+
 def trigger_random_market_event(
     region: Region,
     game_state: GameState,
@@ -737,18 +797,19 @@ def trigger_random_market_event(
         Optional[str]: A log message if a black market event was specifically created,
                        otherwise None for other events (which message themselves) or no event.
     """
+    rng = decision_rng("market_event", region.name)
     current_day: int = game_state.current_day
 
     black_market_message: Optional[str] = None
     if (
-        random.random() < game_configs_data.BLACK_MARKET_CHANCE
+        decision_rng("black_market", region.name).random() < game_configs_data.BLACK_MARKET_CHANCE
     ):  # Access attribute from module
         black_market_message = _create_and_add_black_market_event(
             region, current_day, player_inventory, show_event_message_callback
         )
 
     mugging_event_chance = getattr(game_configs_data, "MUGGING_EVENT_CHANCE", 0.10) # Default if not found
-    if random.random() < mugging_event_chance:
+    if chance_event("MUGGING_EVENT_CHANCE", mugging_event_chance, decision_rng("mugging", region.name)):
         _handle_mugging_event( # Removed assignment to mugging_occurred as it's not used
             player_inventory,
             region,
@@ -758,7 +819,7 @@ def trigger_random_market_event(
         )
 
     forced_fire_sale_chance = getattr(game_configs_data, "FORCED_FIRE_SALE_CHANCE", 0.02) # Default if not found
-    if random.random() < forced_fire_sale_chance:
+    if decision_rng("forced_fire_sale", region.name).random() < forced_fire_sale_chance:
         _handle_forced_fire_sale_event( # Removed assignment to forced_sale_occurred
             player_inventory,
             region,
@@ -773,61 +834,103 @@ def trigger_random_market_event(
         return black_market_message
 
     if (
-        random.random() < game_configs_data.EVENT_TRIGGER_CHANCE
+        rng.random() < game_configs_data.EVENT_TRIGGER_CHANCE
     ):  # Access attribute from module
-        event_creation_functions: Dict[EventType, Callable[..., None]] = {
-            EventType.DEMAND_SPIKE: _create_and_add_demand_spike,
-            EventType.SUPPLY_DISRUPTION: _create_and_add_supply_disruption,  # type: ignore # Signature mismatch, needs fixing if used
-            EventType.POLICE_CRACKDOWN: _create_and_add_police_crackdown,
-            EventType.CHEAP_STASH: _create_and_add_cheap_stash,
-            EventType.THE_SETUP: _create_and_add_the_setup,
-            EventType.RIVAL_BUSTED: _create_and_add_rival_busted,
-            EventType.DRUG_MARKET_CRASH: _create_and_add_drug_market_crash,  # type: ignore # Signature mismatch
-        }
-
-        weighted_event_list: List[EventType] = []
-        for event_type_str, weight_val in MARKET_EVENT_WEIGHTS.items():
-            try:
-                event_type_enum = EventType(event_type_str) # Convert string from config to Enum
-                weighted_event_list.extend([event_type_enum] * weight_val)
-            except ValueError:
-                # Log or handle the case where a string in MARKET_EVENT_WEIGHTS is not a valid EventType
-                add_to_log_callback(f"Warning: Invalid EventType string '{event_type_str}' in MARKET_EVENT_WEIGHTS config.")
-
-        if not weighted_event_list:
+        # Weights are compiled once from config; choosing is one draw plus a bisect
+        event_selector = get_market_event_selector(game_configs_data)
+        chosen_event_type_enum: Optional[EventType] = event_selector.choose(region.name, game_state.campaign_phase, rng)
+        if chosen_event_type_enum is None:
             return None
 
-        chosen_event_type_enum: EventType = random.choice(weighted_event_list)
-        creation_func = event_creation_functions[chosen_event_type_enum]
-
-        # Adjust calls based on specific function signatures
-        if chosen_event_type_enum == EventType.DEMAND_SPIKE:
-            creation_func(region, game_state)  # type: ignore
-        elif chosen_event_type_enum == EventType.SUPPLY_DISRUPTION:
-            creation_func(region, current_day, game_state, show_event_message_callback, add_to_log_callback)  # type: ignore
-        elif chosen_event_type_enum == EventType.POLICE_CRACKDOWN:
-            creation_func(region, current_day)  # type: ignore
-        elif chosen_event_type_enum == EventType.CHEAP_STASH:
-            creation_func(region, current_day)  # type: ignore
-        elif chosen_event_type_enum == EventType.THE_SETUP:
-            creation_func(region, current_day, player_inventory)  # type: ignore
-        elif chosen_event_type_enum == EventType.RIVAL_BUSTED:
-            creation_func(region, current_day, ai_rivals)  # type: ignore
-        elif chosen_event_type_enum == EventType.DRUG_MARKET_CRASH:
-            creation_func(region, current_day, show_event_message_callback, add_to_log_callback)  # type: ignore
+        spawner = MARKET_EVENT_SPAWNERS.get(chosen_event_type_enum)
+        if spawner is None:
+            add_to_log_callback(f"Warning: No spawner registered for market event {chosen_event_type_enum.value}.")
+            return None
+        spawner(region, game_state, player_inventory, ai_rivals, show_event_message_callback, add_to_log_callback)
         return None
     return None
 
 
-def update_active_events(region: Region) -> None:
+#: Journal used when update_active_events is called without one (legacy UI paths).
+default_event_journal: EventJournal = EventJournal()
+
+_EXPIRY_REASONS: Dict[JournalRecordKind, str] = {
+    JournalRecordKind.MARKET_EVENT_ENDED: "Duration ended",
+    JournalRecordKind.MARKET_EVENT_DEPLETED: "Stock depleted",
+}
+
+_EXPIRY_MESSAGE_TEMPLATES: Dict[EventType, str] = {
+    EventType.DEMAND_SPIKE: "The demand spike for {subject} has cooled off ({reason}).",
+    EventType.SUPPLY_DISRUPTION: "The supply chain disruption for {subject} has ended. Availability should return to normal. ({reason}).",
+    EventType.POLICE_CRACKDOWN: "The increased police scrutiny seems to have subsided ({reason}).",
+    EventType.CHEAP_STASH: "The cheap stash of {subject} is gone ({reason}).",
+    EventType.THE_SETUP: "The shady offer regarding {subject} has vanished ({reason}).",
+    EventType.RIVAL_BUSTED: "Looks like {subject} is back on the streets ({reason}).",
+    EventType.DRUG_MARKET_CRASH: "The market for {subject} has recovered from the crash ({reason}).",
+    EventType.BLACK_MARKET_OPPORTUNITY: "The black market opportunity for {subject} has ended ({reason}).",
+}
+
+
+def _journal_subject_name(record: JournalRecord) -> str:
+    if record.drug is not None and record.quality is not None:
+        subject_name = f"{record.quality.name} {record.drug.value}"
+        if record.event_type == EventType.THE_SETUP:
+            subject_name += " deal"
+        return subject_name
+    return record.subject or ""
+
+
+def format_journal_record(record: JournalRecord) -> str:
+    """
+    Formats a journal record as the text shown to the player.
+
+    Args:
+        record: A record from an EventJournal.
+
+    Returns:
+        str: The player-facing message.
+    """
+    region_name_display: str = record.region.value if record.region is not None else "Unknown region"
+    reason: Optional[str] = _EXPIRY_REASONS.get(record.kind)
+    if reason is None:
+        return f"Day {record.day}: {record.kind.value} in {region_name_display}."
+
+    subject_name = _journal_subject_name(record)
+    template = _EXPIRY_MESSAGE_TEMPLATES.get(record.event_type) if record.event_type is not None else None
+    if template is not None:
+        message = template.format(subject=subject_name, reason=reason)
+    else:
+        event_type_display = record.event_type.value if record.event_type is not None else "market event"
+        message = f"The event concerning {subject_name if subject_name else 'a ' + event_type_display} has ended ({reason})."
+    return f"Market Update in {region_name_display}: {message}"
+
+
+def update_active_events(
+    region: Region, current_day: int = 0, journal: Optional[EventJournal] = None, days: int = 1
+) -> None:
+    """
+    Ages the region's market events by one or more days and removes expired ones.
+
+    Each expiry is recorded in the event journal as a typed record, stamped
+    with the day the event ran out; the player-facing text is built by
+    `format_journal_record` only when read.
+
+    Args:
+        region: The region whose events are updated.
+        current_day: The last day being processed.
+        journal: Journal to record expiries in. Defaults to `default_event_journal`.
+        days: Number of days ending on `current_day` to age the events by.
+    """
+    if journal is None:
+        journal = default_event_journal
+    first_day: int = current_day - days + 1
     new_active_events: List[MarketEvent] = []
     for event in list(region.active_market_events):  # event is MarketEvent
-        event.duration_remaining_days -= 1
-        is_expired: bool = False
-        expiry_reason: str = "Duration ended"
-
-        if event.duration_remaining_days <= 0:
-            is_expired = True
+        remaining_days: int = event.duration_remaining_days
+        event.duration_remaining_days -= days
+        is_expired: bool = event.duration_remaining_days <= 0
+        expiry_day: int = first_day + max(0, remaining_days - 1)
+        record_kind: JournalRecordKind = JournalRecordKind.MARKET_EVENT_ENDED
 
         current_event_type: Union[EventType, str] = event.event_type
         if not isinstance(current_event_type, EventType):
@@ -842,63 +945,43 @@ def update_active_events(region: Region) -> None:
                 and event.black_market_quantity_available is not None
                 and event.black_market_quantity_available <= 0
             ):
-                if not is_expired:
-                    expiry_reason = "Stock depleted"
+                # A depleted deal closes on the first day, ended early if it had days left
+                if remaining_days > 1:
+                    record_kind = JournalRecordKind.MARKET_EVENT_DEPLETED
                 is_expired = True
+                expiry_day = first_day
 
         if not is_expired:
             new_active_events.append(event)
-        else:
-            subject_name: str = ""
-            deal_drug_str: Optional[str] = (
-                event.deal_drug_name.value if event.deal_drug_name else None
-            )
-            target_drug_str: Optional[str] = event.target_drug_name.value if event.target_drug_name else None  # type: ignore[attr-defined] # if target_drug_name is str for RIVAL_BUSTED
+            continue
 
-            if (
-                event.deal_drug_name
-                and event.deal_quality
-                and current_event_type == EventType.THE_SETUP
-            ):
-                subject_name = f"{event.deal_quality.name} {deal_drug_str} deal"
-            elif event.target_drug_name and event.target_quality:  # type: ignore[attr-defined]
-                subject_name = f"{event.target_quality.name} {target_drug_str}".strip()
-            elif current_event_type == EventType.RIVAL_BUSTED and event.target_drug_name:  # type: ignore[attr-defined] # Rival name is string
-                subject_name = str(event.target_drug_name)
-
-            region_name_display: str = (
-                region.name.value if isinstance(region.name, Enum) else str(region.name)
-            )
-            log_base: str = f"\nMarket Update in {region_name_display}: "
-            event_type_display: str = (
-                current_event_type.value
-                if isinstance(current_event_type, EventType)
-                else str(current_event_type)
-            )
-
-            message_map: Dict[EventType, str] = {
-                EventType.DEMAND_SPIKE: f"The demand spike for {subject_name} has cooled off ({expiry_reason}).",
-                EventType.SUPPLY_DISRUPTION: f"The supply chain disruption for {subject_name} has ended. Availability should return to normal. ({expiry_reason}).",
-                EventType.POLICE_CRACKDOWN: f"The increased police scrutiny seems to have subsided ({expiry_reason}).",
-                EventType.CHEAP_STASH: f"The cheap stash of {subject_name} is gone ({expiry_reason}).",
-                EventType.THE_SETUP: f"The shady offer regarding {subject_name} has vanished ({expiry_reason}).",
-                EventType.RIVAL_BUSTED: f"Looks like {subject_name} is back on the streets ({expiry_reason}).",
-                EventType.DRUG_MARKET_CRASH: f"The market for {subject_name} has recovered from the crash ({expiry_reason}).",
-                EventType.BLACK_MARKET_OPPORTUNITY: f"The black market opportunity for {subject_name} has ended ({expiry_reason}).",
-            }
-            # Ensure current_event_type is hashable (Enum member) for dict lookup
-            final_event_type_for_map = (
-                current_event_type
-                if isinstance(current_event_type, EventType)
-                else EventType(event_type_display)
-            )
-
-            default_message: str = (
-                f"The event concerning {subject_name if subject_name else 'a ' + event_type_display} has ended ({expiry_reason})."
-            )
-            print(log_base + message_map.get(final_event_type_for_map, default_message))
+        drug: Optional[DrugName] = None
+        quality: Optional[DrugQuality] = None
+        subject: Optional[str] = None
+        if (
+            event.deal_drug_name
+            and event.deal_quality
+            and current_event_type == EventType.THE_SETUP
+        ):
+            drug, quality = event.deal_drug_name, event.deal_quality
+        elif isinstance(event.target_drug_name, DrugName) and event.target_quality:  # type: ignore[attr-defined]
+            drug, quality = event.target_drug_name, event.target_quality
+        elif current_event_type == EventType.RIVAL_BUSTED and event.target_drug_name:  # type: ignore[attr-defined] # Rival name is string
+            subject = str(event.target_drug_name)
+        elif not isinstance(current_event_type, EventType):
+            subject = str(current_event_type) # Unknown event type; keep its name for the message
+
+        journal.record(
+            expiry_day,
+            record_kind,
+            region=region.name if isinstance(region.name, RegionName) else None,
+            event_type=current_event_type if isinstance(current_event_type, EventType) else None,
+            drug=drug,
+            quality=quality,
+            subject=subject,
+        )
 
-    region.active_market_events = new_active_events
+    region.set_market_events(new_active_events)
 
 
 def check_and_trigger_police_stop(region: Region, player_inventory: PlayerInventory, game_state: GameState) -> bool:  # type: ignore
@@ -947,6 +1030,7 @@ def _handle_mugging_event(
     Returns:
         True if the mugging successfully occurred and cash was lost, False otherwise.
     """
+    rng = decision_rng("mugging", region.name)
     if player_inventory.cash <= 0:
         return False
 
@@ -957,7 +1041,7 @@ def _handle_mugging_event(
         min_loss_pct = 0.05
         max_loss_pct = 0.15
 
-    percentage_lost: float = random.uniform(min_loss_pct, max_loss_pct)
+    percentage_lost: float = rng.uniform(min_loss_pct, max_loss_pct)
     cash_lost: int = math.floor(player_inventory.cash * percentage_lost)
 
     if cash_lost <= 0:
@@ -1000,6 +1084,7 @@ def _handle_forced_fire_sale_event(
     Returns:
         True if drugs were successfully sold in the fire sale, False otherwise.
     """
+    rng = decision_rng("forced_fire_sale", region.name)
     eligible_drugs: List[Dict[str, Union[DrugName, DrugQuality, int]]] = []
     for drug_name_enum, qualities in player_inventory.items.items():
         for quality_enum, quantity_val in qualities.items():
@@ -1018,7 +1103,7 @@ def _handle_forced_fire_sale_event(
         )
         return False
 
-    selected_drug_info: Dict[str, Union[DrugName, DrugQuality, int]] = random.choice(
+    selected_drug_info: Dict[str, Union[DrugName, DrugQuality, int]] = rng.choice(
         eligible_drugs
     )
     drug_name: DrugName = selected_drug_info["name"]  # type: ignore
@@ -1048,7 +1133,7 @@ def _handle_forced_fire_sale_event(
 
     normal_sell_price: float = region.get_sell_price(drug_name, drug_quality)
     if normal_sell_price <= 0:
-        add_message_to_log( # Using add_message_to_log for consistency if it's preferred over add_to_log_callback
+        add_to_log_callback(
             f"ForcedFireSale Event: Normal sell price for {drug_name.value} ({drug_quality.name}) in {region.name.value} is {normal_sell_price}. Event fizzled."
         )
         return False
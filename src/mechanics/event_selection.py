@@ -0,0 +1,190 @@
+"""
+Compiled weighted selection of random market events.
+
+`MARKET_EVENT_WEIGHTS` (and the optional per-region and per-phase override
+tables) are compiled once into cumulative-weight tables. Choosing an event is
+then a single `random.random()` draw and a `bisect` over the table, instead of
+expanding the weights into a list and converting config strings to
+`EventType` on every trigger.
+"""
+
+import bisect
+import random
+import sys  # For stderr logging
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ..core.enums import EventType, RegionName
+
+
+class WeightedEventTable:
+    """
+    An immutable cumulative-weight table over event types.
+
+    Attributes:
+        event_types (Tuple[EventType, ...]): Event types with a positive weight.
+        cumulative_weights (Tuple[float, ...]): Running weight totals, aligned
+            with `event_types`.
+        total_weight (float): Sum of all weights.
+    """
+
+    __slots__ = ("event_types", "cumulative_weights", "total_weight")
+
+    def __init__(self, weights: Mapping[EventType, float]) -> None:
+        event_types: List[EventType] = []
+        cumulative_weights: List[float] = []
+        running_total = 0.0
+        for event_type, weight in weights.items():
+            if weight <= 0:
+                continue
+            running_total += weight
+            event_types.append(event_type)
+            cumulative_weights.append(running_total)
+        self.event_types: Tuple[EventType, ...] = tuple(event_types)
+        self.cumulative_weights: Tuple[float, ...] = tuple(cumulative_weights)
+        self.total_weight: float = running_total
+
+    def choose(self, rng: Any = random) -> Optional[EventType]:
+        """
+        Picks an event type with probability proportional to its weight.
+
+        Args:
+            rng: Source of randomness providing `random()`. Defaults to the
+                `random` module.
+
+        Returns:
+            Optional[EventType]: The chosen event type, or None if the table is empty.
+        """
+        if not self.event_types:
+            return None
+        draw = rng.random() * self.total_weight
+        index = bisect.bisect_right(self.cumulative_weights, draw)
+        # Guard against draw == total_weight from floating point rounding
+        return self.event_types[min(index, len(self.event_types) - 1)]
+
+    def probability_of(self, event_type: EventType) -> float:
+        """Returns the selection probability of `event_type` in this table."""
+        if event_type not in self.event_types or self.total_weight <= 0:
+            return 0.0
+        index = self.event_types.index(event_type)
+        previous_total = self.cumulative_weights[index - 1] if index > 0 else 0.0
+        return (self.cumulative_weights[index] - previous_total) / self.total_weight
+
+
+def _parse_weights(raw_weights: Mapping[Any, Any], source_name: str) -> Dict[EventType, float]:
+    """Converts a config weight mapping (string or EventType keys) into EventType keys."""
+    parsed: Dict[EventType, float] = {}
+    for event_key, weight in raw_weights.items():
+        try:
+            event_type = event_key if isinstance(event_key, EventType) else EventType(str(event_key))
+        except ValueError:
+            print(f"Warning: Invalid EventType string '{event_key}' in {source_name} config.", file=sys.stderr)
+            continue
+        if not isinstance(weight, (int, float)):
+            print(f"Warning: Non-numeric weight {weight!r} for {event_type.value} in {source_name} config.", file=sys.stderr)
+            continue
+        parsed[event_type] = float(weight)
+    return parsed
+
+
+class MarketEventSelector:
+    """
+    Chooses random market event types from weights compiled out of game_configs.
+
+    Per-region and per-phase overrides replace the weight of the event types
+    they mention; a phase override is applied on top of a region override.
+    Each (region, phase) combination is compiled the first time it is used
+    and cached, so repeated triggers never rebuild a table.
+    """
+
+    def __init__(
+        self,
+        base_weights: Mapping[Any, Any],
+        region_overrides: Optional[Mapping[RegionName, Mapping[Any, Any]]] = None,
+        phase_overrides: Optional[Mapping[int, Mapping[Any, Any]]] = None,
+    ) -> None:
+        """
+        Args:
+            base_weights: Mapping of event type (or its string value) to weight,
+                e.g. `MARKET_EVENT_WEIGHTS`.
+            region_overrides: Optional weight overrides keyed by RegionName.
+            phase_overrides: Optional weight overrides keyed by campaign phase.
+        """
+        self.source_tables: Tuple[Any, Any, Any] = (base_weights, region_overrides, phase_overrides)
+        self._base_weights: Dict[EventType, float] = _parse_weights(base_weights, "MARKET_EVENT_WEIGHTS")
+        self._region_overrides: Dict[RegionName, Dict[EventType, float]] = {
+            region_name: _parse_weights(overrides, f"MARKET_EVENT_WEIGHT_OVERRIDES_BY_REGION[{region_name}]")
+            for region_name, overrides in (region_overrides or {}).items()
+        }
+        self._phase_overrides: Dict[int, Dict[EventType, float]] = {
+            phase: _parse_weights(overrides, f"MARKET_EVENT_WEIGHT_OVERRIDES_BY_PHASE[{phase}]")
+            for phase, overrides in (phase_overrides or {}).items()
+        }
+        self.default_table: WeightedEventTable = WeightedEventTable(self._base_weights)
+        self._tables: Dict[Tuple[Optional[RegionName], Optional[int]], WeightedEventTable] = {
+            (None, None): self.default_table
+        }
+
+    def table_for(self, region_name: Optional[RegionName] = None, phase: Optional[int] = None) -> WeightedEventTable:
+        """
+        Returns the compiled table for a region/phase, compiling it on first use.
+
+        Regions and phases without overrides share the default table.
+        """
+        key = (
+            region_name if region_name in self._region_overrides else None,
+            phase if phase in self._phase_overrides else None,
+        )
+        table = self._tables.get(key)
+        if table is None:
+            merged_weights = dict(self._base_weights)
+            if key[0] is not None:
+                merged_weights.update(self._region_overrides[key[0]])
+            if key[1] is not None:
+                merged_weights.update(self._phase_overrides[key[1]])
+            table = WeightedEventTable(merged_weights)
+            self._tables[key] = table
+        return table
+
+    def choose(
+        self,
+        region_name: Optional[RegionName] = None,
+        phase: Optional[int] = None,
+        rng: Any = random,
+    ) -> Optional[EventType]:
+        """
+        Chooses an event type for the given region and campaign phase.
+
+        Args:
+            region_name: The region the event would occur in, for region overrides.
+            phase: The current campaign phase, for phase overrides.
+            rng: Source of randomness providing `random()`.
+
+        Returns:
+            Optional[EventType]: The chosen event type, or None if no event has weight.
+        """
+        return self.table_for(region_name, phase).choose(rng)
+
+
+_market_event_selector: Optional[MarketEventSelector] = None
+
+
+def get_market_event_selector(game_configs: Any) -> MarketEventSelector:
+    """
+    Returns the selector compiled from `game_configs`, building it on first use.
+
+    The selector is rebuilt only if one of the weight tables in `game_configs`
+    has been replaced by a different object (e.g. a parameter sweep swapping
+    configs); the check is a few identity comparisons.
+    """
+    global _market_event_selector
+    source_tables = (
+        getattr(game_configs, "MARKET_EVENT_WEIGHTS", {}),
+        getattr(game_configs, "MARKET_EVENT_WEIGHT_OVERRIDES_BY_REGION", None),
+        getattr(game_configs, "MARKET_EVENT_WEIGHT_OVERRIDES_BY_PHASE", None),
+    )
+    if _market_event_selector is None or any(
+        current is not compiled
+        for current, compiled in zip(source_tables, _market_event_selector.source_tables)
+    ):
+        _market_event_selector = MarketEventSelector(*source_tables)
+    return _market_event_selector
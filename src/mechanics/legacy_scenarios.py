@@ -3,26 +3,24 @@
 Functions to check if any of the game's mid-game legacy scenarios have been met
 and to apply their bonuses.
 """
-from typing import TYPE_CHECKING, Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Callable
 
-from ..core.enums import SkillID, ContactID, RegionName, CryptoCoin # Added RegionName, CryptoCoin
+from ..core.enums import SkillID, ContactID, RegionName, ConditionDependency
 from .. import narco_configs as game_configs # For config constants
+from .condition_engine import ConditionEngine
+from .net_worth import calculate_crypto_portfolio_value, get_net_worth_tracker
+from .regional_heat import average_regional_heat
 
 if TYPE_CHECKING:
     from ..core.player_inventory import PlayerInventory
     from ..game_state import GameState
 
-# Helper to calculate crypto portfolio value (similar to win_conditions)
+# Helper to calculate crypto portfolio value (shared with win_conditions via net_worth)
 def _calculate_crypto_portfolio_value(player_inventory: "PlayerInventory", game_state: "GameState") -> float:
-    crypto_value = 0.0
-    for coin, balance in player_inventory.crypto_wallet.items():
-        crypto_value += balance * game_state.current_crypto_prices.get(coin, 0.0)
-    
-    staked_dc_amount = player_inventory.staked_drug_coin.get("staked_amount", 0.0)
-    pending_dc_rewards = player_inventory.staked_drug_coin.get("pending_rewards", 0.0)
-    dc_price = game_state.current_crypto_prices.get(CryptoCoin.DRUG_COIN, 0.0)
-    crypto_value += (staked_dc_amount + pending_dc_rewards) * dc_price
-    return crypto_value
+    tracker = get_net_worth_tracker(player_inventory, game_state)
+    if tracker is not None:
+        return tracker.crypto_value
+    return calculate_crypto_portfolio_value(player_inventory, game_state)
 
 def check_regional_baron(player_inventory: "PlayerInventory", game_state: "GameState", game_configs_module: Any) -> Optional[str]:
     """
@@ -71,13 +69,7 @@ def check_the_cleaner(player_inventory: "PlayerInventory", game_state: "GameStat
     if tech_contact_trust < game_configs_module.THE_CLEANER_MIN_TECH_CONTACT_TRUST:
         return None
 
-    total_heat = 0
-    num_regions = 0
-    if game_state.all_regions:
-        for region in game_state.all_regions.values():
-            total_heat += region.current_heat
-            num_regions += 1
-    average_heat = total_heat / num_regions if num_regions > 0 else float('inf') # Avoid division by zero; high if no regions
+    average_heat = average_regional_heat(game_state, default=float('inf')) # High if no regions
 
     if average_heat >= game_configs_module.THE_CLEANER_MAX_AVG_HEAT_MIDGAME:
         return None
@@ -91,6 +83,26 @@ LEGACY_SCENARIO_CHECKS: Dict[str, Callable[["PlayerInventory", "GameState", Any]
     "The Cleaner": check_the_cleaner,
 }
 
+# State each scenario check reads; the ConditionEngine re-runs a check only when one of these changes
+LEGACY_SCENARIO_DEPENDENCIES: Dict[str, tuple] = {
+    "Regional Baron": (ConditionDependency.REGIONAL_SALES, ConditionDependency.LEGACY_SCENARIOS),
+    "Crypto Whale": (
+        ConditionDependency.CRYPTO_HOLDINGS,
+        ConditionDependency.PLAYER_ASSETS,
+        ConditionDependency.LEGACY_SCENARIOS,
+    ),
+    "The Cleaner": (
+        ConditionDependency.LAUNDERED_TOTAL,
+        ConditionDependency.CONTACT_TRUST,
+        ConditionDependency.REGIONAL_HEAT,
+        ConditionDependency.LEGACY_SCENARIOS,
+    ),
+}
+
+def create_legacy_scenario_engine() -> ConditionEngine:
+    """Returns a ConditionEngine over LEGACY_SCENARIO_CHECKS."""
+    return ConditionEngine(LEGACY_SCENARIO_CHECKS, LEGACY_SCENARIO_DEPENDENCIES)
+
 def apply_legacy_scenario_bonus(
     scenario_name: str, 
     player_inventory: "PlayerInventory", 
@@ -9,7 +9,6 @@ This module includes functions to:
 - Decay regional heat levels, potentially modified by player skills.
 """
 
-import random
 from enum import Enum  # Added Enum for isinstance checks
 from typing import Any, Callable, Dict, Optional  # TYPE_CHECKING, cast, RegionName removed
 
@@ -18,6 +17,7 @@ from ..core.ai_rival import AIRival
 from ..core.enums import DrugName, SkillID, RegionName # RegionName added
 from ..core.player_inventory import PlayerInventory
 from ..core.region import Region
+from ..utils.random_streams import decision_rng
 
 
 def apply_player_buy_impact(
@@ -44,7 +44,7 @@ def apply_player_buy_impact(
         "player_buy_impact_modifier", 1.0
     )
     new_modifier: float = min(current_modifier + impact_factor, game_configs.PLAYER_BUY_IMPACT_MODIFIER_CAP)
-    region.drug_market_data[drug_name_enum]["player_buy_impact_modifier"] = new_modifier
+    region.set_drug_market_value(drug_name_enum, "player_buy_impact_modifier", new_modifier)
 
 
 def apply_player_sell_impact(
@@ -90,9 +90,7 @@ def apply_player_sell_impact(
     new_modifier: float = max(
         current_modifier - impact_factor, game_configs.PLAYER_SELL_IMPACT_MODIFIER_FLOOR
     )  # Cap minimum modifier
-    region.drug_market_data[drug_name_enum][
-        "player_sell_impact_modifier"
-    ] = new_modifier
+    region.set_drug_market_value(drug_name_enum, "player_sell_impact_modifier", new_modifier)
 
     # Add heat generation logic
     # Ensure game_configs_data has HEAT_FROM_SELLING_DRUG_TIER and SKILL_DEFINITIONS (for COMPARTMENTALIZATION)
@@ -123,24 +121,27 @@ def apply_player_sell_impact(
             region.modify_heat(int(round(generated_heat)))
 
 
-def decay_player_market_impact(region: Region) -> None:
+def decay_player_market_impact(region: Region, days: int = 1) -> None:
     """
     Gradually reduces player-specific market impacts over time.
 
     This function is called daily to slowly return player buy/sell impact
-    modifiers towards the neutral value of 1.0.
+    modifiers towards the neutral value of 1.0. The decay is linear, so
+    several days are applied at once.
 
     Args:
         region: The Region whose market impacts are to be decayed.
+        days: Number of days of decay to apply.
     """
+    decay: float = game_configs.PLAYER_MARKET_IMPACT_DECAY_RATE * days
     for drug_name, data in region.drug_market_data.items():
         buy_mod: float = data.get("player_buy_impact_modifier", 1.0)
         if buy_mod > 1.0:
-            data["player_buy_impact_modifier"] = max(1.0, buy_mod - game_configs.PLAYER_MARKET_IMPACT_DECAY_RATE)
+            region.set_drug_market_value(drug_name, "player_buy_impact_modifier", max(1.0, buy_mod - decay))
 
         sell_mod: float = data.get("player_sell_impact_modifier", 1.0)
         if sell_mod < 1.0:
-            data["player_sell_impact_modifier"] = min(1.0, sell_mod + game_configs.PLAYER_MARKET_IMPACT_DECAY_RATE)
+            region.set_drug_market_value(drug_name, "player_sell_impact_modifier", min(1.0, sell_mod + decay))
 
 
 def process_rival_turn(
@@ -181,11 +182,12 @@ def process_rival_turn(
                 show_on_screen_cb(f"Rival Alert: {rival.name} is back on the streets!")
         return
 
-    if random.random() > rival.activity_level:  # Check if rival acts this turn
+    rng = decision_rng("rival", rival.name)
+    if rng.random() > rival.activity_level:  # Check if rival acts this turn
         return
 
     last_action_day: int = getattr(rival, "last_action_day", 0)  # Get or default to 0
-    cooldown_period: int = random.randint(game_configs.RIVAL_COOLDOWN_MIN_DAYS, game_configs.RIVAL_COOLDOWN_MAX_DAYS)
+    cooldown_period: int = rng.randint(game_configs.RIVAL_COOLDOWN_MIN_DAYS, game_configs.RIVAL_COOLDOWN_MAX_DAYS)
     if current_turn_number - last_action_day < cooldown_period and last_action_day != 0:
         return  # Rival is in cooldown
 
@@ -213,14 +215,14 @@ def process_rival_turn(
 
     # Simplified action: buy or sell their primary drug
     if (
-        random.random() < rival.aggression
+        rng.random() < rival.aggression
     ):  # True means rival is buying (increasing demand)
         impact_magnitude_buy: float = game_configs.RIVAL_BASE_IMPACT_MAGNITUDE + (rival.aggression * game_configs.RIVAL_AGGRESSION_IMPACT_SCALE)
         current_demand_mod: float = drug_data.get("rival_demand_modifier", 1.0)
         new_demand_mod: float = min(
             current_demand_mod * (1 + impact_magnitude_buy), game_configs.RIVAL_DEMAND_MODIFIER_CAP
         )  # Cap max demand effect
-        drug_data["rival_demand_modifier"] = new_demand_mod
+        region_obj.set_drug_market_value(rival.primary_drug, "rival_demand_modifier", new_demand_mod)
         _log(
             f"Is buying up {rival.primary_drug.value} in {region_obj.name.value}, increasing demand! (Modifier: {new_demand_mod:.2f})"
         )
@@ -231,55 +233,60 @@ def process_rival_turn(
         new_supply_mod: float = max(
             current_supply_mod * (1 - impact_magnitude_sell), game_configs.RIVAL_SUPPLY_MODIFIER_FLOOR
         )  # Cap min supply effect
-        drug_data["rival_supply_modifier"] = new_supply_mod
+        region_obj.set_drug_market_value(rival.primary_drug, "rival_supply_modifier", new_supply_mod)
         _log(
             f"Is flooding {region_obj.name.value} with {rival.primary_drug.value}, increasing supply! (Modifier: {new_supply_mod:.2f})"
         )
 
-    drug_data["last_rival_activity_turn"] = current_turn_number
+    region_obj.set_drug_market_value(rival.primary_drug, "last_rival_activity_turn", current_turn_number)
 
 
-def decay_rival_market_impact(region: Region, current_turn_number: int) -> None:
+def decay_rival_market_impact(region: Region, current_turn_number: int, days: int = 1) -> None:
     """
     Gradually reduces AI rival-specific market impacts over time.
 
     If a rival hasn't been active in a market for a few turns, their
-    demand/supply modifiers gradually return to neutral (1.0).
+    demand/supply modifiers gradually return to neutral (1.0). Demand decays
+    by a flat amount and supply by a factor per day, so the days of decay
+    within the window are counted and applied at once.
 
     Args:
         region: The Region whose rival market impacts are to be decayed.
-        current_turn_number: The current game day/turn.
+        current_turn_number: The current game day/turn, the last day of the window.
+        days: Number of days ending on `current_turn_number` to apply.
     """
     # decay_rate: float = 0.1  # This was game_configs.RIVAL_MARKET_IMPACT_SUPPLY_DECAY_MULTIPLIER
+    first_turn_before_window: int = current_turn_number - days
     for drug_name, data in region.drug_market_data.items():
         if data.get("last_rival_activity_turn", -1) == -1:
             continue  # Skip if no rival activity recorded
 
-        turns_since_activity: int = (
-            current_turn_number - data["last_rival_activity_turn"]
-        )
-        if turns_since_activity > game_configs.RIVAL_ACTIVITY_DECAY_THRESHOLD_DAYS:  # Start decaying after threshold
+        # Decay starts once a day is more than the threshold past the last activity
+        decay_starts_after: int = data["last_rival_activity_turn"] + game_configs.RIVAL_ACTIVITY_DECAY_THRESHOLD_DAYS
+        decay_days: int = current_turn_number - max(first_turn_before_window, decay_starts_after)
+        if decay_days > 0:
             current_demand_mod: float = data.get("rival_demand_modifier", 1.0)
             if current_demand_mod > 1.0:
-                data["rival_demand_modifier"] = max(
-                    1.0, current_demand_mod - game_configs.RIVAL_MARKET_IMPACT_DECAY_RATE # Flat decay for demand
-                )
+                region.set_drug_market_value(drug_name, "rival_demand_modifier", max(
+                    1.0, current_demand_mod - game_configs.RIVAL_MARKET_IMPACT_DECAY_RATE * decay_days # Flat decay for demand
+                ))
             # elif current_demand_mod < 1.0: # This case should ideally not happen if rivals only increase demand mod
                 # data["rival_demand_modifier"] = min(
                 #     1.0, current_demand_mod * (1 + game_configs.RIVAL_MARKET_IMPACT_SUPPLY_DECAY_MULTIPLIER) # Incorrect use of supply mult here
                 # )
 
             current_supply_mod: float = data.get("rival_supply_modifier", 1.0)
+            supply_decay: float = game_configs.RIVAL_MARKET_IMPACT_SUPPLY_DECAY_MULTIPLIER
             # Rival selling makes supply_mod < 1.0 (more supply from player perspective means harder to sell)
             # Rival buying could make supply_mod > 1.0 (less supply from player perspective means easier to sell)
             if current_supply_mod < 1.0:
-                data["rival_supply_modifier"] = min(
-                    1.0, current_supply_mod * (1 + game_configs.RIVAL_MARKET_IMPACT_SUPPLY_DECAY_MULTIPLIER)
-                )  # Decay towards 1.0
+                region.set_drug_market_value(drug_name, "rival_supply_modifier", min(
+                    1.0, current_supply_mod * (1 + supply_decay) ** decay_days
+                ))  # Decay towards 1.0
             elif current_supply_mod > 1.0: # This case implies rival buying decreased available supply to player
-                data["rival_supply_modifier"] = max(
-                    1.0, current_supply_mod * (1 - game_configs.RIVAL_MARKET_IMPACT_SUPPLY_DECAY_MULTIPLIER) # Decay towards 1.0
-                )
+                region.set_drug_market_value(drug_name, "rival_supply_modifier", max(
+                    1.0, current_supply_mod * (1 - supply_decay) ** decay_days # Decay towards 1.0
+                ))
 
 
 def decay_regional_heat(
@@ -287,21 +294,24 @@ def decay_regional_heat(
     factor: float = 1.0,
     player_inv: Optional[PlayerInventory] = None,
     game_configs: Optional[Any] = None,
+    days: int = 1,
 ) -> None:
     """
     Decays the regional heat level over time.
 
     The decay amount is a percentage of current heat, with a minimum decay.
     If the player has the Ghost Protocol skill, the decay rate is boosted.
+    Once the percentage falls to the minimum it stays there, so over several
+    days only the percentage phase is stepped through; the rest is linear.
 
     Args:
         region: The Region whose heat is to be decayed.
         factor: A multiplier for the decay amount (e.g., for specific game events).
         player_inv: Optional PlayerInventory to check for skills.
         game_configs: Optional game configuration module for skill effect values.
+        days: Number of days of decay to apply.
     """
     decay_percentage = game_configs.REGIONAL_HEAT_DECAY_PERCENTAGE if game_configs else 0.05
-    decay_amount: int = int(region.current_heat * decay_percentage * factor)
 
     ghost_protocol_active = False
     ghost_protocol_boost = 0.0
@@ -310,11 +320,19 @@ def decay_regional_heat(
             ghost_protocol_boost = game_configs.GHOST_PROTOCOL_DECAY_BOOST_PERCENT
             ghost_protocol_active = True
 
-    if ghost_protocol_active:
-        decay_amount = int(decay_amount * (1 + ghost_protocol_boost))
-
     min_decay = game_configs.MIN_REGIONAL_HEAT_DECAY_AMOUNT if game_configs else 1
-    if region.current_heat > 0:
-        region.modify_heat(-max(min_decay, decay_amount))
+    heat: int = region.current_heat
+    days_left: int = days
+    while heat > 0 and days_left > 0:
+        decay_amount: int = int(heat * decay_percentage * factor)
+        if ghost_protocol_active:
+            decay_amount = int(decay_amount * (1 + ghost_protocol_boost))
+        if decay_amount <= min_decay:
+            heat -= min_decay * days_left
+            break
+        heat -= decay_amount
+        days_left -= 1
+    if heat != region.current_heat:
+        region.modify_heat(heat - region.current_heat)
     if region.current_heat < 0: # Ensure heat doesn't go below 0
         region.current_heat = 0
@@ -0,0 +1,212 @@
+# src/mechanics/net_worth.py
+"""
+Net worth and portfolio valuation for the player.
+
+Drug stash valuation uses a base price per drug taken from the first region in
+`REGION_DEFINITIONS` that lists it. That table is built once per
+`REGION_DEFINITIONS` object instead of on every valuation.
+
+`NetWorthTracker` keeps the drug stash value and the crypto wallet value up to
+date incrementally: it listens to `PlayerInventory` drug and crypto changes,
+and revalues the wallet only when `GameState.crypto_prices_version` changes.
+Reading `net_worth` is O(1) on the common path, cheap enough for the HUD every
+frame and for bulk simulations every day.
+"""
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from ..core.enums import CryptoCoin, DrugName, DrugQuality
+from .. import narco_configs as game_configs
+
+if TYPE_CHECKING:
+    from ..core.player_inventory import PlayerInventory
+    from ..game_state import GameState
+
+
+# Single-entry cache: the REGION_DEFINITIONS object the table was built from, and the table
+_cached_region_definitions: Any = None
+_cached_drug_base_prices: Optional[Dict[DrugName, float]] = None
+
+
+def get_drug_base_prices(game_configs_module: Any = game_configs) -> Dict[DrugName, float]:
+    """
+    Returns the valuation base price per drug, built once per REGION_DEFINITIONS.
+
+    The first region definition listing a drug supplies its base price. The
+    table is cached against the identity of `REGION_DEFINITIONS`, so replacing
+    the definitions (as tests and parameter sweeps do) produces a fresh table.
+
+    Args:
+        game_configs_module: The game configuration module/object.
+
+    Returns:
+        Dict[DrugName, float]: Base price per drug. Callers must not mutate it.
+    """
+    global _cached_region_definitions, _cached_drug_base_prices
+    region_definitions = getattr(game_configs_module, "REGION_DEFINITIONS", None)
+    if _cached_drug_base_prices is not None and region_definitions is _cached_region_definitions:
+        return _cached_drug_base_prices
+
+    drug_base_prices: Dict[DrugName, float] = {}
+    for region_def in region_definitions or []:
+        for drug_tuple in region_def[2]: # drug_def_tuple is (drug_name_str, base_price, max_price, ...)
+            try:
+                drug_name_enum = DrugName(drug_tuple[0])
+                if drug_name_enum not in drug_base_prices:
+                    drug_base_prices[drug_name_enum] = float(drug_tuple[1]) # base_price
+            except ValueError:
+                continue # Invalid drug name string in config
+
+    _cached_region_definitions = region_definitions
+    _cached_drug_base_prices = drug_base_prices
+    return drug_base_prices
+
+
+def calculate_crypto_portfolio_value(player_inventory: "PlayerInventory", game_state: "GameState") -> float:
+    """Values the crypto wallet plus staked DrugCoin (staked amount + pending rewards)."""
+    crypto_value = 0.0
+    for coin, balance in player_inventory.crypto_wallet.items():
+        crypto_value += balance * game_state.current_crypto_prices.get(coin, 0.0)
+
+    staked_dc_amount = player_inventory.staked_drug_coin.get("staked_amount", 0.0)
+    pending_dc_rewards = player_inventory.staked_drug_coin.get("pending_rewards", 0.0)
+    dc_price = game_state.current_crypto_prices.get(CryptoCoin.DRUG_COIN, 0.0)
+    crypto_value += (staked_dc_amount + pending_dc_rewards) * dc_price
+    return crypto_value
+
+
+def calculate_drug_stash_value(player_inventory: "PlayerInventory", game_configs_module: Any = game_configs) -> float:
+    """Values the drug stash at base prices, ignoring market conditions and quality."""
+    drug_base_prices = get_drug_base_prices(game_configs_module)
+    drug_stash_value = 0.0
+    for drug_name_enum, qualities in player_inventory.items.items():
+        base_price = drug_base_prices.get(drug_name_enum, 0.0) # Default to 0 if not found
+        for quantity in qualities.values():
+            drug_stash_value += quantity * base_price
+    return drug_stash_value
+
+
+def calculate_net_worth(player_inventory: "PlayerInventory", game_state: "GameState") -> float:
+    """Calculates the player's total net worth from scratch."""
+    return (
+        player_inventory.cash
+        + calculate_crypto_portfolio_value(player_inventory, game_state)
+        + calculate_drug_stash_value(player_inventory)
+    )
+
+
+class NetWorthTracker:
+    """
+    Maintains the player's valuation incrementally.
+
+    The tracker registers itself in `player_inventory.change_listeners`.
+    Cash and staked DrugCoin are read live since they are single fields.
+
+    Attributes:
+        player_inventory (PlayerInventory): The inventory being valued.
+        game_state (GameState): Source of current crypto prices.
+        drug_stash_value (float): Value of the drug stash at base prices.
+        wallet_value (float): Value of the crypto wallet at current prices.
+    """
+
+    def __init__(
+        self,
+        player_inventory: "PlayerInventory",
+        game_state: "GameState",
+        game_configs_module: Any = game_configs,
+    ) -> None:
+        self.player_inventory = player_inventory
+        self.game_state = game_state
+        self.game_configs_module = game_configs_module
+        self._drug_base_prices: Dict[DrugName, float] = {}
+        self._prices_version_seen: Optional[int] = None
+        self.drug_stash_value: float = 0.0
+        self.wallet_value: float = 0.0
+        self.resync()
+        player_inventory.change_listeners.append(self)
+
+    def resync(self) -> None:
+        """Recomputes every tracked component from scratch (after bulk edits)."""
+        self._drug_base_prices = get_drug_base_prices(self.game_configs_module)
+        self.drug_stash_value = calculate_drug_stash_value(self.player_inventory, self.game_configs_module)
+        self._revalue_wallet()
+
+    def detach(self) -> None:
+        """Stops listening to the inventory."""
+        if self in self.player_inventory.change_listeners:
+            self.player_inventory.change_listeners.remove(self)
+
+    def _revalue_wallet(self) -> None:
+        prices = self.game_state.current_crypto_prices
+        self.wallet_value = sum(
+            balance * prices.get(coin, 0.0)
+            for coin, balance in self.player_inventory.crypto_wallet.items()
+        )
+        self._prices_version_seen = self.game_state.crypto_prices_version
+
+    def _refresh_if_stale(self) -> None:
+        if self._prices_version_seen != self.game_state.crypto_prices_version:
+            self._revalue_wallet()
+        if get_drug_base_prices(self.game_configs_module) is not self._drug_base_prices:
+            self.resync()
+
+    # --- PlayerInventory listener interface ---
+
+    def on_drug_quantity_changed(
+        self, drug_name: DrugName, quality: DrugQuality, old_quantity: int, new_quantity: int
+    ) -> None:
+        self.drug_stash_value += (new_quantity - old_quantity) * self._drug_base_prices.get(drug_name, 0.0)
+
+    def on_crypto_balance_changed(self, coin: CryptoCoin, old_balance: float, new_balance: float) -> None:
+        if self._prices_version_seen != self.game_state.crypto_prices_version:
+            self._revalue_wallet() # Balances are already updated, so this includes the change
+            return
+        self.wallet_value += (new_balance - old_balance) * self.game_state.current_crypto_prices.get(coin, 0.0)
+
+    # --- Valuation ---
+
+    @property
+    def cash(self) -> float:
+        return self.player_inventory.cash
+
+    @property
+    def staked_value(self) -> float:
+        """Value of staked DrugCoin plus pending rewards at the current price."""
+        staked = self.player_inventory.staked_drug_coin
+        dc_price = self.game_state.current_crypto_prices.get(CryptoCoin.DRUG_COIN, 0.0)
+        return (staked.get("staked_amount", 0.0) + staked.get("pending_rewards", 0.0)) * dc_price
+
+    @property
+    def drug_value(self) -> float:
+        """Drug stash value at base prices."""
+        self._refresh_if_stale()
+        return self.drug_stash_value
+
+    @property
+    def crypto_value(self) -> float:
+        """Wallet plus staked DrugCoin value, as used by crypto win conditions."""
+        self._refresh_if_stale()
+        return self.wallet_value + self.staked_value
+
+    @property
+    def net_worth(self) -> float:
+        """Cash + crypto (wallet and staked) + drug stash at base prices."""
+        self._refresh_if_stale()
+        return self.cash + self.wallet_value + self.staked_value + self.drug_stash_value
+
+
+def get_net_worth_tracker(player_inventory: "PlayerInventory", game_state: "GameState") -> Optional[NetWorthTracker]:
+    """
+    Returns the tracker attached to `player_inventory` for `game_state`, creating it on first use.
+
+    Returns None for inventory-like objects that do not support change
+    listeners (e.g. test doubles), so callers can fall back to a full calculation.
+    """
+    listeners = getattr(player_inventory, "change_listeners", None)
+    if not isinstance(listeners, list):
+        return None
+    for listener in listeners:
+        if isinstance(listener, NetWorthTracker) and listener.game_state is game_state:
+            return listener
+    if not isinstance(getattr(game_state, "crypto_prices_version", None), int):
+        return None
+    return NetWorthTracker(player_inventory, game_state)
@@ -0,0 +1,102 @@
+# src/mechanics/regional_heat.py
+"""
+Running aggregate of heat across all regions.
+
+`RegionalHeatAggregate` listens to every region's heat changes and keeps the
+total up to date, so the average regional heat used by win conditions and
+legacy scenarios is O(1) instead of a loop over every region per check.
+"""
+from typing import TYPE_CHECKING, Dict, Optional
+
+from ..core.enums import RegionName
+
+if TYPE_CHECKING:
+    from ..core.region import Region
+    from ..game_state import GameState
+
+
+class RegionalHeatAggregate:
+    """
+    Maintains the total heat over a set of regions.
+
+    The aggregate registers itself in each region's `heat_listeners`.
+
+    Attributes:
+        regions (Dict[RegionName, Region]): The regions being aggregated.
+        total_heat (int): Sum of `current_heat` over all regions.
+        version (int): Incremented on every heat change, for cheap change detection.
+    """
+
+    def __init__(self, regions: Dict[RegionName, "Region"]) -> None:
+        self.regions = regions
+        self.total_heat: int = 0
+        self.region_count: int = 0
+        self.version: int = 0
+        self.resync()
+        for region in regions.values():
+            region.heat_listeners.append(self)
+
+    def resync(self) -> None:
+        """Recomputes the total from scratch."""
+        self.total_heat = sum(region.current_heat for region in self.regions.values())
+        self.region_count = len(self.regions)
+        self.version += 1
+
+    def detach(self) -> None:
+        """Stops listening to the regions."""
+        for region in self.regions.values():
+            if self in region.heat_listeners:
+                region.heat_listeners.remove(self)
+
+    def on_region_heat_changed(self, region: "Region", old_heat: int, new_heat: int) -> None:
+        self.total_heat += new_heat - old_heat
+        self.version += 1
+
+    def average(self, default: float = 0.0) -> float:
+        """Returns the average heat per region, or `default` if there are no regions."""
+        if self.region_count == 0:
+            return default
+        return self.total_heat / self.region_count
+
+
+def get_regional_heat_aggregate(game_state: "GameState") -> Optional[RegionalHeatAggregate]:
+    """
+    Returns the aggregate attached to `game_state.all_regions`, creating it on first use.
+
+    Returns None when the regions do not support heat listeners (e.g. test
+    doubles), so callers can fall back to a full calculation.
+    """
+    regions = getattr(game_state, "all_regions", None)
+    if not isinstance(regions, dict) or not regions:
+        return None
+    first_region = next(iter(regions.values()))
+    listeners = getattr(first_region, "heat_listeners", None)
+    if not isinstance(listeners, list):
+        return None
+    for listener in listeners:
+        if isinstance(listener, RegionalHeatAggregate) and listener.regions is regions:
+            if listener.region_count != len(regions):
+                listener.detach()
+                break
+            return listener
+    return RegionalHeatAggregate(regions)
+
+
+def average_regional_heat(game_state: "GameState", default: float = 0.0) -> float:
+    """
+    Returns the average heat across all regions.
+
+    Args:
+        game_state: The current game state.
+        default: Value returned when there are no regions.
+    """
+    aggregate = get_regional_heat_aggregate(game_state)
+    if aggregate is not None:
+        return aggregate.average(default)
+
+    total_heat = 0
+    num_regions = 0
+    for region in (game_state.all_regions or {}).values():
+        total_heat += region.current_heat
+        num_regions += 1
+    return total_heat / num_regions if num_regions > 0 else default
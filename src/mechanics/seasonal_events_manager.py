@@ -4,6 +4,8 @@ Manages seasonal events in the game.
 """
 from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple
 
+from ..core.enums import TimelineEventKind
+
 if TYPE_CHECKING:
     from ..game_state import GameState
     from ..narco_configs import SEASONAL_EVENTS # Assuming this will be defined
@@ -57,4 +59,31 @@ def check_and_update_seasonal_events(game_state: "GameState", game_configs: Any)
     
     return message_to_show
 
+def start_scheduled_seasonal_event(game_state: "GameState", event_id: str, game_configs: Any) -> Optional[str]:
+    """
+    Starts a seasonal event whose start day has come up on the GameState timeline.
+    Schedules the matching end entry and returns the start message.
+    Does nothing if another seasonal event is still running.
+    """
+    event_config = getattr(game_configs, "SEASONAL_EVENTS", {}).get(event_id)
+    if not event_config or game_state.current_seasonal_event:
+        return None
+    message_to_show = start_seasonal_event(game_state, event_id, event_config)
+    game_state.seasonal_event_name_map[event_id] = event_config.get("name", event_id) # Store friendly name
+    # Events end once current_day > end_day, so the end entry falls due the day after.
+    # Negative priority ends it before any other event scheduled to start that day.
+    end_day = event_config.get("end_day", game_state.current_day)
+    game_state.timeline.schedule(end_day + 1, TimelineEventKind.SEASONAL_EVENT_END, event_id, priority=-1)
+    return message_to_show
+
+def end_scheduled_seasonal_event(game_state: "GameState", event_id: str, game_configs: Any) -> Optional[str]:
+    """
+    Ends a seasonal event whose end day has come up on the GameState timeline.
+    Returns the end message, or None if the event is no longer the active one.
+    """
+    if game_state.current_seasonal_event != event_id:
+        return None
+    event_data = getattr(game_configs, "SEASONAL_EVENTS", {}).get(event_id)
+    return end_seasonal_event(game_state, event_id, event_data if event_data else {})
+
 [end of src/mechanics/seasonal_events_manager.py]
@@ -0,0 +1,300 @@
+# src/mechanics/state_hash.py
+"""
+Incremental 64-bit hash of a whole game.
+
+`StateHashTracker` keeps a Zobrist-style hash of a player inventory and game
+state: every tracked cell (a drug quantity, a crypto balance, a region's heat,
+a market modifier or stock level, a region's market events) contributes a
+64-bit value derived from what the cell is and what it holds, and the hash is
+the XOR of the contributions. A change XORs the cell's old contribution out
+and its new one in, so the hash costs O(1) per mutation and nothing per read,
+instead of a walk over every region's market. The tracker learns of changes
+from the inventory's `change_listeners` and each region's `heat_listeners`
+and `market_listeners`.
+
+Single fields (cash, the day, the player's heat, rivals, debts, skills and
+so on) are cheap to read and written from many places, so like the net worth
+tracker's cash they are folded in live when the hash is read.
+
+The hash is the same across processes and runs for the same state, so it
+serves as a desync check between replicas, as the search key for a
+transposition table, and to skip autosaves of an unchanged game.
+`compute_state_hash` is the full walk the incremental hash must agree with.
+Display-only values a getter caches on the market (previous prices) are not
+part of the state.
+"""
+import hashlib
+import struct
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from ..core.enums import CryptoCoin, DrugName, DrugQuality, RegionName
+
+if TYPE_CHECKING:
+    from ..core.player_inventory import PlayerInventory
+    from ..core.region import Region
+    from ..game_state import GameState
+
+#: Per-drug market values that are part of the state.
+HASHED_DRUG_MARKET_KEYS: Tuple[str, ...] = (
+    "player_buy_impact_modifier",
+    "player_sell_impact_modifier",
+    "rival_demand_modifier",
+    "rival_supply_modifier",
+    "last_rival_activity_turn",
+)
+#: Per-quality market values that are part of the state.
+HASHED_QUALITY_MARKET_KEYS: Tuple[str, ...] = ("quantity_available",)
+
+_MASK = (1 << 64) - 1
+_DOUBLE = struct.Struct("<d")
+
+
+def _digest(value: Any) -> int:
+    """Stable 64-bit digest of a value's repr (unlike `hash`, not salted per process)."""
+    return int.from_bytes(hashlib.blake2b(repr(value).encode(), digest_size=8).digest(), "little")
+
+
+@lru_cache(maxsize=None)
+def _feature_key(*feature: Any) -> int:
+    return _digest(feature)
+
+
+def _splitmix64(x: int) -> int:
+    x = (x + 0x9E3779B97F4A7C15) & _MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+
+def _cell(feature_key: int, value: Any) -> int:
+    """Contribution of a cell holding `value`. Numbers hash by value, so 1 and 1.0 agree."""
+    if isinstance(value, (int, float)):
+        bits = int.from_bytes(_DOUBLE.pack(value), "little")
+    else:
+        bits = _digest(value)
+    return _splitmix64(feature_key ^ bits)
+
+
+def _drug_cell(drug_name: DrugName, quality: DrugQuality, quantity: int) -> int:
+    if not quantity:
+        return 0 # An empty cell and a missing one are the same state
+    return _cell(_feature_key("drug", drug_name, quality), quantity)
+
+
+def _crypto_cell(coin: CryptoCoin, balance: float) -> int:
+    if not balance:
+        return 0
+    return _cell(_feature_key("crypto", coin), balance)
+
+
+def _heat_cell(region_name: RegionName, heat: int) -> int:
+    return _cell(_feature_key("heat", region_name), heat)
+
+
+def _market_cell(
+    region_name: RegionName, drug_name: DrugName, quality: Optional[DrugQuality], key: str, value: Any
+) -> int:
+    return _cell(_feature_key("market", region_name, drug_name, quality, key), value)
+
+
+def _events_cell(region: "Region") -> int:
+    if not region.active_market_events:
+        return 0
+    return _digest((region.name, region.active_market_events))
+
+
+def _market_hash(region: "Region") -> int:
+    region_hash = 0
+    for drug_name, drug_data in region.drug_market_data.items():
+        for key in HASHED_DRUG_MARKET_KEYS:
+            if drug_data.get(key) is not None:
+                region_hash ^= _market_cell(region.name, drug_name, None, key, drug_data[key])
+        for quality, quality_data in drug_data.get("available_qualities", {}).items():
+            for key in HASHED_QUALITY_MARKET_KEYS:
+                if quality_data.get(key) is not None:
+                    region_hash ^= _market_cell(region.name, drug_name, quality, key, quality_data[key])
+    return region_hash
+
+
+def _live_fields_hash(player_inventory: "PlayerInventory", game_state: "GameState") -> int:
+    """Digest of the single fields that are read at hash time rather than tracked."""
+    current_region = game_state.current_player_region
+    return _digest((
+        game_state.current_day,
+        current_region.name if current_region is not None else None,
+        game_state.game_won,
+        game_state.win_condition_achieved,
+        game_state.informant_unavailable_until_day,
+        game_state.current_seasonal_event,
+        tuple(game_state.current_crypto_prices.items()),
+        tuple((rival.name, rival.is_busted, rival.busted_days_remaining) for rival in game_state.ai_rivals),
+        tuple(game_state.active_turf_wars.items()),
+        tuple(region.last_updated_day for region in game_state.all_regions.values()),
+        tuple(game_state.achieved_legacy_scenarios),
+        player_inventory.cash,
+        player_inventory.heat,
+        player_inventory.max_capacity,
+        player_inventory.capacity_upgrades_purchased,
+        player_inventory.skill_points,
+        tuple(sorted(player_inventory.unlocked_skills)),
+        tuple(player_inventory.contact_trusts.items()),
+        tuple(player_inventory.staked_drug_coin.items()),
+        player_inventory.pending_laundered_sc,
+        player_inventory.pending_laundered_sc_arrival_day,
+        player_inventory.has_secure_phone,
+        player_inventory.ghost_network_access,
+        (player_inventory.debt_payment_1_paid, player_inventory.debt_payment_2_paid, player_inventory.debt_payment_3_paid),
+        player_inventory.total_laundered_cash,
+        player_inventory.large_crypto_transactions_completed,
+        tuple(player_inventory.active_quests.items()),
+        tuple(player_inventory.completed_quests),
+        tuple(player_inventory.special_items.items()),
+    ))
+
+
+def compute_state_hash(player_inventory: "PlayerInventory", game_state: "GameState") -> int:
+    """Computes the state hash with a full walk; the incremental tracker always agrees with it."""
+    return _tracked_hash(player_inventory, game_state) ^ _live_fields_hash(player_inventory, game_state)
+
+
+def _tracked_hash(player_inventory: "PlayerInventory", game_state: "GameState") -> int:
+    tracked_hash = 0
+    for drug_name, qualities in player_inventory.items.items():
+        for quality, quantity in qualities.items():
+            tracked_hash ^= _drug_cell(drug_name, quality, quantity)
+    for coin, balance in player_inventory.crypto_wallet.items():
+        tracked_hash ^= _crypto_cell(coin, balance)
+    for region in game_state.all_regions.values():
+        tracked_hash ^= _heat_cell(region.name, region.current_heat)
+        tracked_hash ^= _market_hash(region)
+        tracked_hash ^= _events_cell(region)
+    return tracked_hash
+
+
+class StateHashTracker:
+    """
+    Maintains the hash of a player inventory and game state incrementally.
+
+    The tracker registers itself in `player_inventory.change_listeners` and in
+    each region's `heat_listeners` and `market_listeners`.
+
+    Attributes:
+        player_inventory (PlayerInventory): The inventory being hashed.
+        game_state (GameState): The game state being hashed.
+        regions (Dict[RegionName, Region]): The regions listened to.
+        tracked_hash (int): XOR of the tracked cells' contributions.
+    """
+
+    def __init__(
+        self,
+        player_inventory: "PlayerInventory",
+        game_state: "GameState",
+        tracked_hash: Optional[int] = None,
+        event_hashes: Optional[Dict[RegionName, int]] = None,
+    ) -> None:
+        self.player_inventory = player_inventory
+        self.game_state = game_state
+        self.regions: Dict[RegionName, "Region"] = game_state.all_regions
+        self.region_count: int = len(self.regions)
+        self.tracked_hash: int = 0
+        self._event_hashes: Dict[RegionName, int] = {}
+        if tracked_hash is None or event_hashes is None:
+            self.resync()
+        else:
+            self.tracked_hash = tracked_hash
+            self._event_hashes = event_hashes.copy()
+        player_inventory.change_listeners.append(self)
+        for region in self.regions.values():
+            region.heat_listeners.append(self)
+            region.market_listeners.append(self)
+
+    def resync(self) -> None:
+        """Recomputes the tracked hash with a full walk (after edits that bypass the notifications)."""
+        self.tracked_hash = _tracked_hash(self.player_inventory, self.game_state)
+        self._event_hashes = {region.name: _events_cell(region) for region in self.regions.values()}
+        self.region_count = len(self.regions)
+
+    def detach(self) -> None:
+        """Stops listening to the inventory and the regions."""
+        if self in self.player_inventory.change_listeners:
+            self.player_inventory.change_listeners.remove(self)
+        for region in self.regions.values():
+            if self in region.heat_listeners:
+                region.heat_listeners.remove(self)
+            if self in region.market_listeners:
+                region.market_listeners.remove(self)
+
+    def copy_to(self, player_inventory: "PlayerInventory", game_state: "GameState") -> "StateHashTracker":
+        """
+        Returns a tracker for clones of this tracker's inventory and game state.
+
+        The clones must be unchanged since they were taken; no walk is done.
+        """
+        return StateHashTracker(player_inventory, game_state, self.tracked_hash, self._event_hashes)
+
+    def state_hash(self) -> int:
+        """Returns the 64-bit hash of the whole game."""
+        return self.tracked_hash ^ _live_fields_hash(self.player_inventory, self.game_state)
+
+    # --- PlayerInventory listener interface ---
+
+    def on_drug_quantity_changed(
+        self, drug_name: DrugName, quality: DrugQuality, old_quantity: int, new_quantity: int
+    ) -> None:
+        self.tracked_hash ^= _drug_cell(drug_name, quality, old_quantity) ^ _drug_cell(drug_name, quality, new_quantity)
+
+    def on_crypto_balance_changed(self, coin: CryptoCoin, old_balance: float, new_balance: float) -> None:
+        self.tracked_hash ^= _crypto_cell(coin, old_balance) ^ _crypto_cell(coin, new_balance)
+
+    # --- Region listener interface ---
+
+    def on_region_heat_changed(self, region: "Region", old_heat: int, new_heat: int) -> None:
+        self.tracked_hash ^= _heat_cell(region.name, old_heat) ^ _heat_cell(region.name, new_heat)
+
+    def on_market_value_changed(
+        self, region: "Region", drug_name: DrugName, quality: Optional[DrugQuality], key: str, old_value: Any, new_value: Any
+    ) -> None:
+        hashed_keys = HASHED_DRUG_MARKET_KEYS if quality is None else HASHED_QUALITY_MARKET_KEYS
+        if key not in hashed_keys:
+            return
+        if old_value is not None: # None means unset, which contributes nothing
+            self.tracked_hash ^= _market_cell(region.name, drug_name, quality, key, old_value)
+        if new_value is not None:
+            self.tracked_hash ^= _market_cell(region.name, drug_name, quality, key, new_value)
+
+    def on_market_events_changed(self, region: "Region") -> None:
+        # Events are few per region, so the region's events are rehashed as a whole
+        new_hash = _events_cell(region)
+        self.tracked_hash ^= self._event_hashes.get(region.name, 0) ^ new_hash
+        self._event_hashes[region.name] = new_hash
+
+
+def get_state_hash_tracker(player_inventory: "PlayerInventory", game_state: "GameState") -> Optional[StateHashTracker]:
+    """
+    Returns the tracker attached to `player_inventory` for `game_state`, creating it on first use.
+
+    Returns None for objects that do not support the listeners (e.g. test
+    doubles), so callers can fall back to `compute_state_hash`.
+    """
+    listeners = getattr(player_inventory, "change_listeners", None)
+    regions = getattr(game_state, "all_regions", None)
+    if not isinstance(listeners, list) or not isinstance(regions, dict):
+        return None
+    for listener in listeners:
+        if isinstance(listener, StateHashTracker) and listener.game_state is game_state:
+            if listener.regions is not regions or listener.region_count != len(regions):
+                listener.detach() # The world was replaced; start over
+                break
+            return listener
+    if not all(isinstance(getattr(region, "market_listeners", None), list) for region in regions.values()):
+        return None
+    return StateHashTracker(player_inventory, game_state)
+
+
+def state_hash(player_inventory: "PlayerInventory", game_state: "GameState") -> int:
+    """Returns the game's 64-bit state hash, incrementally maintained where possible."""
+    tracker = get_state_hash_tracker(player_inventory, game_state)
+    if tracker is None:
+        return compute_state_hash(player_inventory, game_state)
+    return tracker.state_hash()
@@ -2,11 +2,11 @@
 """
 Manages Turf War events in regions.
 """
-import random
 from typing import TYPE_CHECKING, Optional, List, Dict, Any, Set
 
-from ..core.enums import RegionName, DrugName, ContactID
+from ..core.enums import RegionName, DrugName, ContactID, TimelineEventKind
 from .. import narco_configs as game_configs # For TURF_WAR_CONFIG
+from ..utils.random_streams import decision_rng
 
 if TYPE_CHECKING:
     from ..game_state import GameState
@@ -22,12 +22,13 @@ def try_start_turf_war(game_state: "GameState", region: "Region", player_invento
         return None
 
     config = game_configs.TURF_WAR_CONFIG
-    if random.random() < config["base_chance_per_day_per_region"]:
+    rng = decision_rng("turf_war", region.name)
+    if rng.random() < config["base_chance_per_day_per_region"]:
         # A turf war starts!
-        duration = random.randint(config["min_duration_days"], config["max_duration_days"])
+        duration = rng.randint(config["min_duration_days"], config["max_duration_days"])
         end_day = game_state.current_day + duration
         
-        heat_increase = random.randint(config["heat_increase_on_start_min"], config["heat_increase_on_start_max"])
+        heat_increase = rng.randint(config["heat_increase_on_start_min"], config["heat_increase_on_start_max"])
         region.modify_heat(heat_increase)
 
         # Select affected drugs (from those available in the region)
@@ -42,18 +43,18 @@ def try_start_turf_war(game_state: "GameState", region: "Region", player_invento
         affected_drugs_details: List[Dict[str, Any]] = []
         
         # Ensure we don't try to pick more drugs than available
-        chosen_drug_names = random.sample(available_drugs_in_region, num_drugs_to_affect)
+        chosen_drug_names = rng.sample(available_drugs_in_region, num_drugs_to_affect)
 
         for drug_name_enum in chosen_drug_names:
-            volatility_mult = random.uniform(config["price_volatility_multiplier_min"], config["price_volatility_multiplier_max"])
+            volatility_mult = rng.uniform(config["price_volatility_multiplier_min"], config["price_volatility_multiplier_max"])
             # Determine if price goes up or down (50/50 chance for buy/sell independently or linked)
             # Simplified: Let's say buy prices generally go up, sell prices might go up or down due to instability
             buy_price_factor = volatility_mult 
-            sell_price_factor = 1.0 + random.uniform(- (volatility_mult-1)/2 , (volatility_mult-1) ) # More variance for sell
+            sell_price_factor = 1.0 + rng.uniform(- (volatility_mult-1)/2 , (volatility_mult-1) ) # More variance for sell
 
             availability_factor = 1.0
-            if random.random() < config.get("availability_reduction_chance", 0.5): # Default to 0.5 if not in config
-                 availability_factor = random.uniform(
+            if rng.random() < config.get("availability_reduction_chance", 0.5): # Default to 0.5 if not in config
+                 availability_factor = rng.uniform(
                      config["availability_reduction_factor_min"], 
                      config["availability_reduction_factor_max"]
                  )
@@ -77,7 +78,7 @@ def try_start_turf_war(game_state: "GameState", region: "Region", player_invento
         # Example: Iterate through contacts known to be in this region
         for contact_id, contact_def in game_configs.CONTACT_DEFINITIONS.items():
             if contact_def.get("region") == region.name: # Check if contact is primarily in this region
-                if random.random() < config["contact_unavailable_chance"]:
+                if rng.random() < config["contact_unavailable_chance"]:
                     affected_contacts_set.add(contact_id)
 
 
@@ -88,6 +89,11 @@ def try_start_turf_war(game_state: "GameState", region: "Region", player_invento
             "original_heat": region.current_heat - heat_increase # Store heat before this turf war's increase
         }
         game_state.active_turf_wars[region.name] = turf_war_data
+        # Wars end once current_day > end_day, so the end entry falls due the day after
+        game_state.timeline.schedule(
+            end_day + 1, TimelineEventKind.TURF_WAR_END, region.name,
+            key=f"turf_war_end_{region.name.value}",
+        )
         
         drug_names_str = ", ".join([d["drug_name"].value for d in affected_drugs_details])
         start_message = config["message_on_start_template"].format(region_name=region.name.value, drug_names_str=drug_names_str)
@@ -97,31 +103,37 @@ def try_start_turf_war(game_state: "GameState", region: "Region", player_invento
         return start_message
     return None
 
+def end_turf_war(game_state: "GameState", region_name: RegionName) -> Optional[str]:
+    """
+    Ends the turf war in the given region, if one is active.
+    Returns the end message, or None if no war was active there.
+    """
+    if region_name not in game_state.active_turf_wars:
+        return None
+    del game_state.active_turf_wars[region_name]
+    # Construct end message (assuming region_name is an Enum)
+    region_display_name = region_name.value if isinstance(region_name, RegionName) else str(region_name)
+    # For simplicity, effects like price/availability modifiers will naturally phase out
+    # as the turf war data is removed from active_turf_wars.
+    # If specific restoration of pre-war state was needed, it would happen here.
+    # e.g., region.current_heat = war_data.get("original_heat", region.current_heat) # Restore heat option
+    return game_configs.TURF_WAR_CONFIG["message_on_end_template"].format(region_name=region_display_name)
+
 def update_active_turf_wars(game_state: "GameState") -> Optional[str]:
     """
     Checks active turf wars and ends them if their duration is over.
     Returns an end message if a war ends.
+
+    The daily update ends wars through the GameState timeline instead; this
+    scan remains for callers that manage turf wars outside the daily tick.
     """
     ended_war_message = None
-    regions_to_end_war: List[RegionName] = []
-
-    for region_name, war_data in game_state.active_turf_wars.items():
-        if game_state.current_day > war_data["end_day"]:
-            regions_to_end_war.append(region_name)
-            
-            # Construct end message (assuming region_name is an Enum)
-            region_display_name = region_name.value if isinstance(region_name, RegionName) else str(region_name)
-            ended_war_message = game_configs.TURF_WAR_CONFIG["message_on_end_template"].format(region_name=region_display_name)
-            # Log end
-            # logger.info(f"Turf War ended in {region_display_name}.")
-            # For simplicity, effects like price/availability modifiers will naturally phase out
-            # as the turf war data is removed from active_turf_wars.
-            # If specific restoration of pre-war state was needed, it would happen here.
-            # e.g., region.current_heat = war_data.get("original_heat", region.current_heat) # Restore heat option
-            
+    regions_to_end_war: List[RegionName] = [
+        region_name for region_name, war_data in game_state.active_turf_wars.items()
+        if game_state.current_day > war_data["end_day"]
+    ]
     for region_name_key in regions_to_end_war:
-        if region_name_key in game_state.active_turf_wars:
-            del game_state.active_turf_wars[region_name_key]
+        ended_war_message = end_turf_war(game_state, region_name_key)
             
     return ended_war_message
 
@@ -2,10 +2,12 @@
 """
 Functions to check if any of the game's win conditions have been met.
 """
-from typing import TYPE_CHECKING, Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Any
 
-from ..core.enums import SkillID, ContactID, DrugName, DrugQuality, CryptoCoin
-from .. import narco_configs as game_configs
+from ..core.enums import SkillID, ContactID, DrugQuality, ConditionDependency
+from .condition_engine import ConditionEngine
+from .net_worth import calculate_crypto_portfolio_value, calculate_net_worth, get_net_worth_tracker
+from .regional_heat import average_regional_heat
 
 if TYPE_CHECKING:
     from ..core.player_inventory import PlayerInventory
@@ -13,45 +15,25 @@ if TYPE_CHECKING:
 
 
 def _calculate_net_worth(player_inventory: "PlayerInventory", game_state: "GameState") -> float:
-    """Calculates the player's total net worth."""
-    cash_value = player_inventory.cash
-    
-    crypto_value = 0.0
-    for coin, balance in player_inventory.crypto_wallet.items():
-        crypto_value += balance * game_state.current_crypto_prices.get(coin, 0.0)
-    
-    # Add staked DrugCoin value (staked amount + pending rewards)
-    staked_dc_amount = player_inventory.staked_drug_coin.get("staked_amount", 0.0)
-    pending_dc_rewards = player_inventory.staked_drug_coin.get("pending_rewards", 0.0)
-    dc_price = game_state.current_crypto_prices.get(CryptoCoin.DRUG_COIN, 0.0)
-    crypto_value += (staked_dc_amount + pending_dc_rewards) * dc_price
-
-    drug_stash_value = 0.0
-    # Use base prices for drugs to avoid fluctuations from market conditions for net worth
-    # This requires accessing REGION_DEFINITIONS to find a base price.
-    # For simplicity, we'll find the first definition of a drug and use its base_buy_price.
-    # A more robust approach would be to have a separate list of base values for each drug.
-    
-    # Create a quick lookup for drug base prices from the first region that defines them
-    # This is a simplified approach for valuation.
-    drug_base_prices: Dict[DrugName, float] = {}
-    if hasattr(game_configs, 'REGION_DEFINITIONS'):
-        for region_def in game_configs.REGION_DEFINITIONS:
-            for drug_tuple in region_def[2]: # drug_def_tuple is (drug_name_str, base_price, max_price, ...)
-                try:
-                    drug_name_enum = DrugName(drug_tuple[0])
-                    if drug_name_enum not in drug_base_prices:
-                        drug_base_prices[drug_name_enum] = float(drug_tuple[1]) # base_price
-                except ValueError:
-                    continue # Invalid drug name string in config
-
-    for drug_name_enum, qualities in player_inventory.items.items():
-        base_price = drug_base_prices.get(drug_name_enum, 0.0) # Default to 0 if not found
-        for quality, quantity in qualities.items():
-            # Could apply quality multipliers here if desired, but using base price is simpler
-            drug_stash_value += quantity * base_price 
-            
-    return cash_value + crypto_value + drug_stash_value
+    """
+    Returns the player's total net worth.
+
+    Reads the incrementally maintained NetWorthTracker when the inventory supports
+    change listeners; otherwise values everything from scratch. Drug base prices
+    come from a table built once per REGION_DEFINITIONS (see net_worth.py).
+    """
+    tracker = get_net_worth_tracker(player_inventory, game_state)
+    if tracker is not None:
+        return tracker.net_worth
+    return calculate_net_worth(player_inventory, game_state)
+
+
+def _calculate_crypto_portfolio_value(player_inventory: "PlayerInventory", game_state: "GameState") -> float:
+    """Returns the crypto wallet plus staked DrugCoin value, via the tracker when available."""
+    tracker = get_net_worth_tracker(player_inventory, game_state)
+    if tracker is not None:
+        return tracker.crypto_value
+    return calculate_crypto_portfolio_value(player_inventory, game_state)
 
 
 def check_target_net_worth(player_inventory: "PlayerInventory", game_state: "GameState", game_configs_module: Any) -> bool:
@@ -84,14 +66,7 @@ def check_cartel_crown(player_inventory: "PlayerInventory", game_state: "GameSta
 
 def check_digital_empire(player_inventory: "PlayerInventory", game_state: "GameState", game_configs_module: Any) -> bool:
     """Checks for the Digital Empire win condition."""
-    crypto_value = 0.0
-    for coin, balance in player_inventory.crypto_wallet.items():
-        crypto_value += balance * game_state.current_crypto_prices.get(coin, 0.0)
-    
-    staked_dc_amount = player_inventory.staked_drug_coin.get("staked_amount", 0.0)
-    pending_dc_rewards = player_inventory.staked_drug_coin.get("pending_rewards", 0.0)
-    dc_price = game_state.current_crypto_prices.get(CryptoCoin.DRUG_COIN, 0.0)
-    crypto_value += (staked_dc_amount + pending_dc_rewards) * dc_price
+    crypto_value = _calculate_crypto_portfolio_value(player_inventory, game_state)
         
     if crypto_value < game_configs_module.DIGITAL_EMPIRE_CRYPTO_VALUE:
         return False
@@ -116,14 +91,7 @@ def check_perfect_retirement(player_inventory: "PlayerInventory", game_state: "G
             player_inventory.debt_payment_3_paid):
         return False
         
-    # Average regional heat
-    total_heat = 0
-    num_regions = 0
-    if game_state.all_regions:
-        for region in game_state.all_regions.values():
-            total_heat += region.current_heat
-            num_regions += 1
-    average_heat = total_heat / num_regions if num_regions > 0 else 0
+    average_heat = average_regional_heat(game_state, default=0)
     
     if average_heat >= game_configs_module.PERFECT_RETIREMENT_MAX_AVG_HEAT:
         return False
@@ -140,4 +108,31 @@ WIN_CONDITION_CHECKS = {
     "Digital Empire": check_digital_empire,
     "Perfect Retirement": check_perfect_retirement,
 }
+
+_NET_WORTH_DEPENDENCIES = (
+    ConditionDependency.CASH,
+    ConditionDependency.CRYPTO_HOLDINGS,
+    ConditionDependency.DRUG_STASH,
+)
+
+# State each win condition reads; the ConditionEngine re-runs a check only when one of these changes
+WIN_CONDITION_DEPENDENCIES = {
+    "Target Net Worth": _NET_WORTH_DEPENDENCIES,
+    "The Cartel Crown": _NET_WORTH_DEPENDENCIES + (ConditionDependency.SKILLS,),
+    "Digital Empire": (
+        ConditionDependency.CRYPTO_HOLDINGS,
+        ConditionDependency.SKILLS,
+        ConditionDependency.PLAYER_ASSETS,
+    ),
+    "Perfect Retirement": _NET_WORTH_DEPENDENCIES + (
+        ConditionDependency.DEBT_PAYMENTS,
+        ConditionDependency.REGIONAL_HEAT,
+        ConditionDependency.CONTACT_TRUST,
+    ),
+}
+
+
+def create_win_condition_engine() -> ConditionEngine:
+    """Returns a ConditionEngine over WIN_CONDITION_CHECKS."""
+    return ConditionEngine(WIN_CONDITION_CHECKS, WIN_CONDITION_DEPENDENCIES)
 [end of src/mechanics/win_conditions.py]
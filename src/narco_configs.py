@@ -8,7 +8,7 @@ These configurations control the balance and features of the game.
 """
 
 # TEST_CONFIG_VAR = True # Commenting this out as it was for testing
-from typing import Dict, List, Union, Tuple, Any # Added Union for EventConfigValues, Tuple for definitions, Any for AI_RIVAL_DEFINITIONS
+from typing import Dict, List, Optional, Union, Tuple, Any # Added Union for EventConfigValues, Tuple for definitions, Any for AI_RIVAL_DEFINITIONS
 from .core.enums import CryptoCoin, DrugQuality, DrugName, RegionName, SkillID, ContactID # Added ContactID
 
 # --- Global Game Settings and Constants ---
@@ -555,6 +555,44 @@ MARKET_EVENT_WEIGHTS: Dict[str, int] = {  #: Weights for determining random mark
     "RIVAL_BUSTED": 1,
     "DRUG_MARKET_CRASH": 1,
 }
+MARKET_EVENT_WEIGHT_OVERRIDES_BY_REGION: Dict[RegionName, Dict[str, int]] = {}  #: Per-region replacements for MARKET_EVENT_WEIGHTS entries (e.g. {RegionName.DOCKS: {"SUPPLY_DISRUPTION": 4}}).
+MARKET_EVENT_WEIGHT_OVERRIDES_BY_PHASE: Dict[int, Dict[str, int]] = {}  #: Per-campaign-phase replacements for MARKET_EVENT_WEIGHTS entries, applied after region overrides.
+CAMPAIGN_PHASE_THRESHOLDS: List[int] = [45, 70, 100, 120]  #: Last day of each campaign phase, phase 1 first; later days stay in the final phase.
+
+# --- Event Journal ---
+EVENT_JOURNAL_CAPACITY: int = 500  #: Number of recent event journal records kept in memory.
+EVENT_JOURNAL_SPILL_PATH: Optional[str] = None  #: If set, every journal record is appended in batches to this binary file.
+
+# --- Autosave ---
+AUTOSAVE_ENABLED: bool = True  #: Whether the game autosaves at the end of each daily update.
+AUTOSAVE_DIRECTORY: str = "saves"  #: Directory autosave slots are written to.
+AUTOSAVE_SLOTS: int = 3  #: Number of rotating autosave slots.
+AUTOSAVE_COMPRESSION_LEVEL: int = 6  #: zlib compression level used for save files (0-9).
+WORLD_TEMPLATE_CACHE_DIR: Optional[str] = None  #: Directory compiled world templates are cached in across runs (None: memory only).
+
+# --- Simulation ---
+SIMULATION_MAX_DAYS: int = 60  #: Days a headless campaign runs for unless it is won or lost first.
+SIMULATION_POLICY_SPEND_FRACTION: float = 0.6  #: Share of cash the reference trading policy spends per purchase.
+SIMULATION_WORKER_PROCESSES: Optional[int] = None  #: Worker processes for campaign batches (None: one per CPU).
+SIMULATION_CHUNK_SIZE: int = 16  #: Campaigns handed to a worker per task.
+SIMULATION_QUANTILE_RELATIVE_ACCURACY: float = 0.01  #: Relative error of quantiles reported by simulation aggregates.
+SIMULATION_QUANTILE_MAX_BUCKETS: int = 2048  #: Bucket cap per quantile sketch, bounding aggregate size.
+SIMULATION_RESULTS_BATCH_SIZE: int = 500  #: Most campaigns the results store inserts per SQLite transaction.
+SIMULATION_RESULTS_QUEUE_SIZE: int = 10000  #: Campaigns the results store queues before `add` blocks on the writer.
+SIMULATION_SWEEP_INITIAL_SEEDS: int = 32  #: Campaigns each parameter sweep point plays in the first round.
+SIMULATION_SWEEP_ETA: int = 3  #: Successive halving keeps the best 1/ETA of the points per round and plays ETA times as many campaigns.
+SIMULATION_SWEEP_TARGET_SURVIVAL_RATE: float = 0.5  #: Share of campaigns not lost that the default sweep objective aims for.
+SIMULATION_RESULT_CACHE_DIR: Optional[str] = None  #: Directory campaign batch aggregates are cached in across runs (None: memory only).
+SIMULATION_RESULT_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  #: Size of the on-disk result cache before least recently used entries are evicted.
+SIMULATION_ENV_TRADE_LOT: int = 10  #: Most units one buy or sell action of the training environment trades.
+SIMULATION_MCTS_TIME_BUDGET: Optional[float] = 1.0  #: Seconds MctsPolicy searches per decision (None: only the simulation cap applies); mcts_policy ignores it.
+SIMULATION_MCTS_MAX_SIMULATIONS: Optional[int] = 300  #: Simulations the MCTS policy runs per decision (None: as many as the time budget allows); required by mcts_policy.
+SIMULATION_MCTS_HORIZON_DAYS: int = 6  #: Days an MCTS simulation plays ahead, through the tree and then the rollout.
+SIMULATION_MCTS_EXPLORATION: float = 0.7  #: UCB exploration constant of the MCTS policy; simulation values lie in [-1, 1].
+SIMULATION_MCTS_WIDENING_CONSTANT: float = 1.5  #: Progressive widening: after n visits, a node tries ceil(C * n ** alpha) plans and a plan as many outcomes.
+SIMULATION_MCTS_WIDENING_EXPONENT: float = 0.5  #: The alpha of progressive widening.
+SIMULATION_MCTS_BUY_CANDIDATES: int = 3  #: Best bargains of a market the MCTS policy considers buying.
+SIMULATION_MCTS_BUY_FRACTIONS: Tuple[float, ...] = (1.0, 0.5, 0.25)  #: Shares of its cash the MCTS policy considers spending on a purchase.
 
 # --- Cryptocurrency ---
 CRYPTO_PRICES_INITIAL: Dict[CryptoCoin, float] = (
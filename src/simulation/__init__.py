@@ -0,0 +1,38 @@
+"""Headless simulation: campaigns played without the UI, in bulk."""
+
+from .aggregation import OutcomeAggregate, QuantileSketch, RunningStats
+from .campaign import CampaignDay, CampaignOutcome, config_fingerprint, greedy_trader_policy, run_campaign
+from .comparison import PairedComparison, compare_variants
+from .env import NarcoEnv, VectorNarcoEnv
+from .mcts import MctsPolicy, mcts_policy
+from .rare_events import RareEventEstimate, estimate_rare_event
+from .result_cache import DiskResultCache, MemoryResultCache
+from .results_store import ResultsStore
+from .sweep import ParameterSweep, SweepResult, parameter_grid
+from .worker_pool import CampaignPool
+
+__all__ = [
+    'CampaignDay',
+    'CampaignOutcome',
+    'CampaignPool',
+    'DiskResultCache',
+    'MctsPolicy',
+    'MemoryResultCache',
+    'NarcoEnv',
+    'OutcomeAggregate',
+    'PairedComparison',
+    'ParameterSweep',
+    'QuantileSketch',
+    'RareEventEstimate',
+    'ResultsStore',
+    'RunningStats',
+    'SweepResult',
+    'VectorNarcoEnv',
+    'compare_variants',
+    'config_fingerprint',
+    'estimate_rare_event',
+    'greedy_trader_policy',
+    'mcts_policy',
+    'parameter_grid',
+    'run_campaign',
+]
@@ -0,0 +1,326 @@
+"""
+Streaming aggregation of campaign outcomes.
+
+Aggregates hold a fixed amount of state however many campaigns they have
+seen, so millions of runs can be summarized without keeping a record per
+run. Every aggregate can be merged with another built the same way: worker
+processes aggregate their own campaigns and the parent merges the partial
+aggregates, at a cost that depends only on their (bounded) size.
+
+- `RunningStats`: count, mean and variance by Welford's method, merged with
+  Chan et al.'s pairwise update, plus min and max.
+- `Histogram`: fixed-width bins with underflow and overflow counts.
+- `QuantileSketch`: a DDSketch-style sketch. Values are counted in
+  logarithmically sized buckets, so every quantile estimate is within
+  `relative_accuracy` of a true sample value. The number of buckets is capped
+  by collapsing the buckets closest to zero.
+- `OutcomeAggregate`: all of the above over `CampaignOutcome` records.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+from .. import narco_configs
+from .campaign import LEGACY_SCENARIO_NAMES, WIN_CONDITION_NAMES, CampaignOutcome
+
+
+class RunningStats:
+    """Online count, mean, variance, min and max of a stream of values."""
+
+    __slots__ = ("count", "mean", "_m2", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.mean: float = 0.0
+        self._m2: float = 0.0
+        self.minimum: float = math.inf
+        self.maximum: float = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: "RunningStats") -> None:
+        """Adds another stream's statistics to this one."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 with fewer than two values)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def stderr(self) -> float:
+        """Standard error of the mean."""
+        return self.stddev / math.sqrt(self.count) if self.count else 0.0
+
+
+class Histogram:
+    """
+    Counts of values in `bin_count` equal-width bins over [low, high).
+
+    Values below `low` or at or above `high` are counted in `underflow` and `overflow`.
+    """
+
+    __slots__ = ("low", "high", "counts", "underflow", "overflow")
+
+    def __init__(self, low: float, high: float, bin_count: int) -> None:
+        if high <= low or bin_count < 1:
+            raise ValueError("Histogram needs high > low and at least one bin.")
+        self.low: float = low
+        self.high: float = high
+        self.counts: List[int] = [0] * bin_count
+        self.underflow: int = 0
+        self.overflow: int = 0
+
+    @property
+    def bin_width(self) -> float:
+        return (self.high - self.low) / len(self.counts)
+
+    def add(self, value: float) -> None:
+        if value < self.low:
+            self.underflow += 1
+        elif value >= self.high:
+            self.overflow += 1
+        else:
+            self.counts[min(int((value - self.low) / self.bin_width), len(self.counts) - 1)] += 1
+
+    def merge(self, other: "Histogram") -> None:
+        """Adds another histogram's counts; both must have the same bins."""
+        if (other.low, other.high, len(other.counts)) != (self.low, self.high, len(self.counts)):
+            raise ValueError("Cannot merge histograms with different bins.")
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+    def bin_edges(self) -> List[float]:
+        return [self.low + i * self.bin_width for i in range(len(self.counts) + 1)]
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-error guarantees (DDSketch).
+
+    Attributes:
+        relative_accuracy (float): Maximum relative error of a quantile estimate
+            (while no buckets have been collapsed).
+        max_buckets (int): Bucket cap per sign; beyond it the buckets nearest zero are merged.
+        count (int): Number of values added.
+    """
+
+    __slots__ = ("relative_accuracy", "max_buckets", "count", "_gamma", "_log_gamma", "_positive", "_negative", "_zero_count")
+
+    MIN_INDEXABLE_VALUE = 1e-9 # Magnitudes below this are counted as zero
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        self.relative_accuracy: float = relative_accuracy
+        self.max_buckets: int = max_buckets
+        self.count: int = 0
+        self._gamma: float = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma: float = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero_count: int = 0
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _bucket_value(self, key: int) -> float:
+        return 2.0 * self._gamma ** key / (self._gamma + 1.0)
+
+    def _collapse(self, buckets: Dict[int, int]) -> None:
+        if len(buckets) <= self.max_buckets:
+            return
+        keys = sorted(buckets)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        buckets[target] += sum(buckets.pop(key) for key in keys[:excess])
+
+    def add(self, value: float, weight: int = 1) -> None:
+        self.count += weight
+        if value > self.MIN_INDEXABLE_VALUE:
+            buckets, key = self._positive, self._key(value)
+        elif value < -self.MIN_INDEXABLE_VALUE:
+            buckets, key = self._negative, self._key(-value)
+        else:
+            self._zero_count += weight
+            return
+        if key in buckets:
+            buckets[key] += weight
+        else:
+            buckets[key] = weight
+            self._collapse(buckets)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Adds another sketch's values; both must have the same relative accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy.")
+        for mine, theirs in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, bucket_count in theirs.items():
+                mine[key] = mine.get(key, 0) + bucket_count
+            self._collapse(mine)
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Returns the estimated q-quantile (0 <= q <= 1), or None if the sketch is empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+        seen += self._zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self._positive)) if self._positive else 0.0
+
+
+class StreamingMetric:
+    """RunningStats and a QuantileSketch over the same values."""
+
+    __slots__ = ("stats", "sketch")
+
+    def __init__(self, relative_accuracy: float, max_buckets: int) -> None:
+        self.stats = RunningStats()
+        self.sketch = QuantileSketch(relative_accuracy, max_buckets)
+
+    def add(self, value: float) -> None:
+        self.stats.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other: "StreamingMetric") -> None:
+        self.stats.merge(other.stats)
+        self.sketch.merge(other.sketch)
+
+    def summary(self, quantiles: Iterable[float] = (0.05, 0.25, 0.5, 0.75, 0.95)) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "mean": self.stats.mean, "stddev": self.stats.stddev,
+            "min": self.stats.minimum if self.stats.count else None,
+            "max": self.stats.maximum if self.stats.count else None,
+        }
+        for q in quantiles:
+            result[f"p{round(q * 100):02d}"] = self.sketch.quantile(q)
+        return result
+
+
+class OutcomeAggregate:
+    """
+    Constant-size summary of any number of campaign outcomes.
+
+    Attributes:
+        campaigns (int): Outcomes added.
+        wins (int): Campaigns that met a win condition.
+        game_overs (int): Campaigns that were lost.
+        win_conditions (Dict[str, int]): Wins per win condition.
+        legacy_scenarios (Dict[str, int]): Campaigns achieving each legacy scenario.
+        final_cash, net_worth, days_played, peak_heat (StreamingMetric): Per-metric statistics.
+        game_over_days (Histogram): Day of game over, one bin per day.
+        peak_heat_histogram (Histogram): Peak regional heat.
+    """
+
+    def __init__(self, max_days: Optional[int] = None, game_configs: Any = narco_configs) -> None:
+        max_days = game_configs.SIMULATION_MAX_DAYS if max_days is None else max_days
+        accuracy = getattr(game_configs, "SIMULATION_QUANTILE_RELATIVE_ACCURACY", 0.01)
+        max_buckets = getattr(game_configs, "SIMULATION_QUANTILE_MAX_BUCKETS", 2048)
+        self.campaigns: int = 0
+        self.wins: int = 0
+        self.game_overs: int = 0
+        self.win_conditions: Dict[str, int] = {name: 0 for name in WIN_CONDITION_NAMES}
+        self.legacy_scenarios: Dict[str, int] = {name: 0 for name in LEGACY_SCENARIO_NAMES}
+        self.final_cash = StreamingMetric(accuracy, max_buckets)
+        self.net_worth = StreamingMetric(accuracy, max_buckets)
+        self.days_played = StreamingMetric(accuracy, max_buckets)
+        self.peak_heat = StreamingMetric(accuracy, max_buckets)
+        self.game_over_days = Histogram(0, max_days + 1, max_days + 1)
+        self.peak_heat_histogram = Histogram(0, 300, 30)
+
+    def _metrics(self) -> Dict[str, StreamingMetric]:
+        return {
+            "final_cash": self.final_cash, "net_worth": self.net_worth,
+            "days_played": self.days_played, "peak_heat": self.peak_heat,
+        }
+
+    def add(self, outcome: CampaignOutcome) -> None:
+        self.campaigns += 1
+        if outcome.won:
+            self.wins += 1
+            if outcome.win_condition in self.win_conditions:
+                self.win_conditions[outcome.win_condition] += 1
+        if outcome.game_over_day >= 0:
+            self.game_overs += 1
+            self.game_over_days.add(outcome.game_over_day)
+        for scenario in outcome.legacy_scenarios:
+            if scenario in self.legacy_scenarios:
+                self.legacy_scenarios[scenario] += 1
+        self.final_cash.add(outcome.final_cash)
+        self.net_worth.add(outcome.net_worth)
+        self.days_played.add(outcome.days_played)
+        self.peak_heat.add(outcome.peak_heat)
+        self.peak_heat_histogram.add(outcome.peak_heat)
+
+    def merge(self, other: "OutcomeAggregate") -> None:
+        """Adds another aggregate; its cost does not depend on how many campaigns either holds."""
+        self.campaigns += other.campaigns
+        self.wins += other.wins
+        self.game_overs += other.game_overs
+        for name, count in other.win_conditions.items():
+            self.win_conditions[name] = self.win_conditions.get(name, 0) + count
+        for name, count in other.legacy_scenarios.items():
+            self.legacy_scenarios[name] = self.legacy_scenarios.get(name, 0) + count
+        for name, metric in self._metrics().items():
+            metric.merge(other._metrics()[name])
+        self.game_over_days.merge(other.game_over_days)
+        self.peak_heat_histogram.merge(other.peak_heat_histogram)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.campaigns if self.campaigns else 0.0
+
+    @property
+    def game_over_rate(self) -> float:
+        return self.game_overs / self.campaigns if self.campaigns else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the aggregate as plain data, e.g. for printing or JSON."""
+        return {
+            "campaigns": self.campaigns,
+            "win_rate": self.win_rate,
+            "game_over_rate": self.game_over_rate,
+            "win_conditions": dict(self.win_conditions),
+            "legacy_scenarios": dict(self.legacy_scenarios),
+            "game_over_days": {
+                day: count for day, count in enumerate(self.game_over_days.counts) if count
+            },
+            **{name: metric.summary() for name, metric in self._metrics().items()},
+        }
@@ -0,0 +1,477 @@
+"""
+Headless campaigns: the game played day by day without the UI.
+
+`run_campaign` seeds `random`, builds a new game through `create_new_game`
+and lets a policy trade and choose where to travel each day. Travel runs the
+same steps as the UI's travel action (daily updates, win conditions, legacy
+scenarios, police stop on arrival); popups are simply dismissed. The result
+is a small `CampaignOutcome` record that packs into a fixed row of floats,
+which is how worker processes hand results back (see `worker_pool`).
+Callers that want the day-by-day series pass `on_day` and get a
+`CampaignDay` after every travel.
+"""
+
+import hashlib
+import random
+import struct
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .. import narco_configs
+from ..core.enums import DrugName, DrugQuality, EventType, RegionName
+from ..core.player_inventory import PlayerInventory
+from ..core.region import Region
+from ..game_setup import create_new_game
+from ..game_state import GameState
+from ..mechanics import market_impact
+from ..mechanics.condition_engine import ConditionEngine
+from ..mechanics.daily_updates import DailyUpdateResult, advance_days, perform_daily_updates
+from ..mechanics.encounter_mechanics import resolve_police_stop
+from ..mechanics.legacy_scenarios import LEGACY_SCENARIO_CHECKS, apply_legacy_scenario_bonus, create_legacy_scenario_engine
+from ..mechanics.net_worth import calculate_net_worth
+from ..mechanics.win_conditions import WIN_CONDITION_CHECKS, create_win_condition_engine
+from ..utils import random_streams
+from ..utils.importance_sampling import importance_sampling
+
+#: Policy signature: trades at the current region, then returns where to travel next.
+#: A policy may set a `policy_version` attribute; bump it when its play changes so cached results are not reused.
+Policy = Callable[[PlayerInventory, GameState, Any, random.Random], RegionName]
+
+WIN_CONDITION_NAMES: Tuple[str, ...] = tuple(WIN_CONDITION_CHECKS)
+LEGACY_SCENARIO_NAMES: Tuple[str, ...] = tuple(LEGACY_SCENARIO_CHECKS)
+
+# Settings that change where or how fast campaigns run, never how they play out
+CONFIG_FINGERPRINT_EXCLUDED_KEYS = frozenset({
+    "AUTOSAVE_ENABLED", "AUTOSAVE_DIRECTORY", "AUTOSAVE_SLOTS", "AUTOSAVE_COMPRESSION_LEVEL",
+    "WORLD_TEMPLATE_CACHE_DIR", "SIMULATION_WORKER_PROCESSES", "SIMULATION_CHUNK_SIZE",
+    "SIMULATION_RESULTS_BATCH_SIZE", "SIMULATION_RESULTS_QUEUE_SIZE",
+    "SIMULATION_SWEEP_INITIAL_SEEDS", "SIMULATION_SWEEP_ETA", "SIMULATION_SWEEP_TARGET_SURVIVAL_RATE",
+    "SIMULATION_RESULT_CACHE_DIR", "SIMULATION_RESULT_CACHE_MAX_BYTES", "SIMULATION_ENV_TRADE_LOT",
+    "EVENT_JOURNAL_CAPACITY", "EVENT_JOURNAL_SPILL_PATH",
+})
+
+#: Config values to replace for a campaign batch, by config name (see `config_overrides`).
+ConfigOverrides = Dict[str, Any]
+
+
+def _canonical(value: Any) -> Any:
+    """Returns a structure whose repr does not depend on set or hash ordering."""
+    if isinstance(value, dict):
+        return tuple(sorted(((repr(_canonical(k)), _canonical(v)) for k, v in value.items()), key=lambda item: item[0]))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(_canonical(item)) for item in value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(item) for item in value)
+    return value
+
+
+def config_fingerprint(game_configs: Any = narco_configs, overrides: Optional[ConfigOverrides] = None) -> str:
+    """
+    Hashes every UPPER_CASE config value that can affect a campaign.
+
+    Two config modules (or namespaces) with the same fingerprint play every
+    seed identically, so it identifies the config a stored result came from.
+    `overrides` are hashed in place of the values they replace.
+    """
+    effective = {**vars(game_configs), **(overrides or {})}
+    values = tuple(
+        (key, _canonical(effective[key]))
+        for key in sorted(effective)
+        if key.isupper() and key not in CONFIG_FINGERPRINT_EXCLUDED_KEYS
+    )
+    return hashlib.blake2b(repr(values).encode("utf-8"), digest_size=16).hexdigest()
+
+
+@contextmanager
+def config_overrides(overrides: Optional[ConfigOverrides], game_configs: Any = narco_configs) -> Iterator[None]:
+    """
+    Replaces config values for the duration of the block, then restores them.
+
+    The game reads most values from the config module when it needs them, so
+    campaigns played inside the block use the overrides. Names a module
+    imported by value at load time (event_manager's event tier targets) keep
+    their original values. Overriding a name the config does not define
+    raises ValueError, so a misspelt parameter cannot silently do nothing.
+    """
+    overrides = overrides or {}
+    unknown = [key for key in overrides if not hasattr(game_configs, key)]
+    if unknown:
+        raise ValueError(f"Unknown config values: {', '.join(sorted(unknown))}")
+    originals = {key: getattr(game_configs, key) for key in overrides}
+    for key, value in overrides.items():
+        setattr(game_configs, key, value)
+    try:
+        yield
+    finally:
+        for key, value in originals.items():
+            setattr(game_configs, key, value)
+
+
+class CampaignOutcome(NamedTuple):
+    """
+    How one simulated campaign ended.
+
+    Attributes:
+        seed: Seed the campaign was played with.
+        days_played: Last day reached.
+        final_cash: Cash at the end.
+        net_worth: Net worth at the end.
+        game_over_day: Day the game was lost, or -1 if it was not.
+        won: Whether a win condition was met.
+        win_condition: Name of the win condition met, if any.
+        legacy_scenarios: Legacy scenarios achieved, in `LEGACY_SCENARIO_CHECKS` order.
+        peak_heat: Highest heat seen in any region at the end of a day.
+        likelihood_ratio: Weight of a campaign played with biased chances
+            (see `utils.importance_sampling`); 1.0 for an unbiased campaign.
+    """
+
+    seed: int
+    days_played: int
+    final_cash: float
+    net_worth: float
+    game_over_day: int
+    won: bool
+    win_condition: Optional[str]
+    legacy_scenarios: Tuple[str, ...]
+    peak_heat: int
+    likelihood_ratio: float = 1.0
+
+    def to_row(self) -> Tuple[float, ...]:
+        """Encodes the outcome as the floats of one `ROW_FORMAT` row."""
+        win_index = WIN_CONDITION_NAMES.index(self.win_condition) if self.win_condition in WIN_CONDITION_NAMES else -1
+        legacy_mask = sum(1 << i for i, name in enumerate(LEGACY_SCENARIO_NAMES) if name in self.legacy_scenarios)
+        return (
+            float(self.seed), float(self.days_played), self.final_cash, self.net_worth,
+            float(self.game_over_day), float(self.won), float(win_index), float(legacy_mask), float(self.peak_heat),
+            self.likelihood_ratio,
+        )
+
+    @classmethod
+    def from_row(cls, row: Tuple[float, ...]) -> "CampaignOutcome":
+        """Decodes a row written by `to_row`."""
+        seed, days_played, final_cash, net_worth, game_over_day, won, win_index, legacy_mask, peak_heat, likelihood_ratio = row
+        return cls(
+            seed=int(seed),
+            days_played=int(days_played),
+            final_cash=final_cash,
+            net_worth=net_worth,
+            game_over_day=int(game_over_day),
+            won=bool(won),
+            win_condition=WIN_CONDITION_NAMES[int(win_index)] if win_index >= 0 else None,
+            legacy_scenarios=tuple(name for i, name in enumerate(LEGACY_SCENARIO_NAMES) if int(legacy_mask) & (1 << i)),
+            peak_heat=int(peak_heat),
+            likelihood_ratio=likelihood_ratio,
+        )
+
+
+ROW_FORMAT = "<10d"
+ROW_SIZE = struct.calcsize(ROW_FORMAT)
+
+
+class CampaignDay(NamedTuple):
+    """
+    The state at the end of one campaign day, after travel and its daily update.
+
+    Attributes:
+        day: The day just played.
+        region: Region the player arrived in.
+        cash: Player cash.
+        net_worth: Player net worth.
+        inventory_units: Drug units carried.
+        skill_points: Unspent skill points.
+        skill_points_awarded: Skill points the daily update awarded.
+        debt_payments_made: Debt payments made so far (0-3).
+        region_heat: Heat of the region arrived in.
+        peak_heat: Highest heat of any region.
+        blocking_event: Whether the daily update stopped on an event popup.
+        game_over: Whether the day ended the game.
+    """
+
+    day: int
+    region: str
+    cash: float
+    net_worth: float
+    inventory_units: int
+    skill_points: int
+    skill_points_awarded: int
+    debt_payments_made: int
+    region_heat: int
+    peak_heat: int
+    blocking_event: bool
+    game_over: bool
+
+
+def buy_drug(
+    player_inventory: PlayerInventory, game_state: GameState, region: Region,
+    drug: DrugName, quality: DrugQuality, quantity: int,
+) -> bool:
+    """Buys at the current market price, as the market view's buy does. Returns False if it failed."""
+    price = region.get_buy_price(drug, quality, player_inventory, game_state)
+    if quantity <= 0 or price <= 0 or quantity > region.get_available_stock(drug, quality, game_state):
+        return False
+    if not player_inventory.process_buy_drug(drug, quality, quantity, quantity * price):
+        return False
+    region.update_stock_on_buy(drug, quality, quantity)
+    market_impact.apply_player_buy_impact(region, drug, quantity)
+    for event in region.active_market_events:
+        if (event.event_type == EventType.BLACK_MARKET_OPPORTUNITY and event.target_drug_name == drug
+                and event.target_quality == quality and event.black_market_quantity_available):
+            event.black_market_quantity_available = max(0, event.black_market_quantity_available - quantity)
+            region.notify_market_events_changed()
+            break
+    return True
+
+
+def sell_drug(
+    player_inventory: PlayerInventory, game_state: GameState, region: Region,
+    drug: DrugName, quality: DrugQuality, quantity: int, game_configs: Any = narco_configs,
+) -> bool:
+    """Sells at the current market price, as the market view's sell does. Returns False if it failed."""
+    price = region.get_sell_price(drug, quality, player_inventory, game_state)
+    revenue = quantity * price
+    if quantity <= 0 or price <= 0 or not player_inventory.process_sell_drug(drug, quality, quantity, revenue):
+        return False
+    region.update_stock_on_sell(drug, quality, quantity)
+    market_impact.apply_player_sell_impact(player_inventory, region, drug, quantity, game_configs, game_state)
+    game_state.player_sales_profit_by_region[region.name] = (
+        game_state.player_sales_profit_by_region.get(region.name, 0.0) + revenue
+    )
+    return True
+
+
+def travel(
+    player_inventory: PlayerInventory,
+    game_state: GameState,
+    destination: RegionName,
+    game_configs: Any,
+    win_engine: ConditionEngine,
+    legacy_engine: ConditionEngine,
+    on_daily_update: Optional[Callable[[DailyUpdateResult], None]] = None,
+) -> Optional[str]:
+    """
+    Travels to a region and plays out the day, as the UI's travel action does.
+
+    Args:
+        on_daily_update: Called with the day's `DailyUpdateResult`, if given.
+
+    Returns:
+        Optional[str]: The game over message if the day ended the game.
+    """
+    game_state.set_current_player_region(destination)
+    game_state.current_day += 1
+    random_streams.set_stream_day(game_state.current_day)
+    daily_result: DailyUpdateResult = perform_daily_updates(game_state, player_inventory, game_configs)
+    if _settle_daily_result(player_inventory, game_state, daily_result, game_configs, win_engine, legacy_engine, on_daily_update):
+        return daily_result.game_over_message
+
+    region = game_state.all_regions[destination]
+    stop_result = resolve_police_stop(player_inventory, region, game_configs)
+    if stop_result["message_key"] == "stop_fine" and player_inventory.cash < game_configs.BANKRUPTCY_THRESHOLD:
+        return "GAME OVER: A hefty fine bankrupted you!"
+    return None
+
+
+def wait(
+    player_inventory: PlayerInventory,
+    game_state: GameState,
+    days: int,
+    game_configs: Any,
+    win_engine: ConditionEngine,
+    legacy_engine: ConditionEngine,
+    on_daily_update: Optional[Callable[[DailyUpdateResult], None]] = None,
+) -> Optional[str]:
+    """
+    Stays in the current region for up to `days` days, fast-forwarded with `advance_days`.
+
+    Waiting stops early on a game over or a popup. Win conditions and legacy
+    scenarios are checked once at the end; there is no police stop, as the
+    player does not travel.
+
+    Args:
+        on_daily_update: Called with the span's `DailyUpdateResult`, if given.
+
+    Returns:
+        Optional[str]: The game over message if the wait ended the game.
+    """
+    daily_result: DailyUpdateResult = advance_days(game_state, player_inventory, game_configs, days)
+    _settle_daily_result(player_inventory, game_state, daily_result, game_configs, win_engine, legacy_engine, on_daily_update)
+    return daily_result.game_over_message
+
+
+def _settle_daily_result(
+    player_inventory: PlayerInventory,
+    game_state: GameState,
+    daily_result: DailyUpdateResult,
+    game_configs: Any,
+    win_engine: ConditionEngine,
+    legacy_engine: ConditionEngine,
+    on_daily_update: Optional[Callable[[DailyUpdateResult], None]],
+) -> bool:
+    """
+    Applies a daily result and checks win conditions and legacy scenarios, as the UI does.
+
+    Returns:
+        bool: True if the day ends here: the game is over, won, or a popup is showing.
+    """
+    if on_daily_update is not None:
+        on_daily_update(daily_result)
+    if daily_result.pending_laundered_sc_processed:
+        player_inventory.pending_laundered_sc = daily_result.new_pending_laundered_sc
+        player_inventory.pending_laundered_sc_arrival_day = daily_result.new_pending_laundered_sc_arrival_day
+    if daily_result.informant_unavailable_until_day is not None:
+        game_state.informant_unavailable_until_day = daily_result.informant_unavailable_until_day
+    if daily_result.game_over_message:
+        return True
+    if daily_result.blocking_event_data:
+        return True # The UI stops here until the popup is dismissed
+
+    for condition_name, condition_met in win_engine.evaluate(player_inventory, game_state, game_configs).items():
+        if condition_met:
+            game_state.game_won = True
+            game_state.win_condition_achieved = condition_name
+            return True
+    for scenario_key, achieved_name in legacy_engine.evaluate(player_inventory, game_state, game_configs).items():
+        if achieved_name and scenario_key not in game_state.achieved_legacy_scenarios:
+            apply_legacy_scenario_bonus(achieved_name, player_inventory, game_state, game_configs)
+    return False
+
+
+def greedy_trader_policy(
+    player_inventory: PlayerInventory, game_state: GameState, game_configs: Any, rng: random.Random
+) -> RegionName:
+    """
+    Reference policy: sells the whole stash, spends most of its cash on the
+    best bargain (lowest buy price relative to the drug's base price), then
+    travels to a random other region. It holds cash instead of buying when a
+    debt payment falls due on arrival.
+    """
+    region = game_state.get_current_player_region()
+    for drug, qualities in list(player_inventory.items.items()):
+        for quality, quantity in list(qualities.items()):
+            sell_drug(player_inventory, game_state, region, drug, quality, quantity, game_configs)
+
+    if not _debt_due_tomorrow(player_inventory, game_state, game_configs):
+        _buy_best_bargain(player_inventory, game_state, region, game_configs)
+    return rng.choice([name for name in game_state.all_regions if name != region.name])
+
+
+greedy_trader_policy.policy_version = 1 # type: ignore[attr-defined]
+
+
+def _debt_due_tomorrow(player_inventory: PlayerInventory, game_state: GameState, game_configs: Any) -> bool:
+    for number in (1, 2, 3):
+        if not getattr(player_inventory, f"debt_payment_{number}_paid"):
+            return game_state.current_day + 1 >= getattr(game_configs, f"DEBT_PAYMENT_{number}_DUE_DAY")
+    return False
+
+
+def _buy_best_bargain(
+    player_inventory: PlayerInventory, game_state: GameState, region: Region, game_configs: Any
+) -> None:
+    best: Optional[Tuple[float, DrugName, DrugQuality, float]] = None
+    for drug, market_data in region.drug_market_data.items():
+        for quality in market_data['available_qualities']:
+            price = region.get_buy_price(drug, quality, player_inventory, game_state)
+            if price > 0 and region.get_available_stock(drug, quality, game_state) > 0:
+                bargain = price / market_data['base_buy_price']
+                if best is None or bargain < best[0]:
+                    best = (bargain, drug, quality, price)
+    if best is not None:
+        _, drug, quality, price = best
+        budget = player_inventory.cash * game_configs.SIMULATION_POLICY_SPEND_FRACTION
+        quantity = min(
+            int(budget // price),
+            player_inventory.get_available_space(),
+            region.get_available_stock(drug, quality, game_state),
+        )
+        buy_drug(player_inventory, game_state, region, drug, quality, quantity)
+
+
+def _campaign_day(
+    player_inventory: PlayerInventory, game_state: GameState, daily_result: DailyUpdateResult,
+    peak_heat: int, game_over: bool,
+) -> CampaignDay:
+    region = game_state.get_current_player_region()
+    return CampaignDay(
+        day=game_state.current_day,
+        region=region.name.value,
+        cash=float(player_inventory.cash),
+        net_worth=float(calculate_net_worth(player_inventory, game_state)),
+        inventory_units=player_inventory.current_load,
+        skill_points=player_inventory.skill_points,
+        skill_points_awarded=daily_result.skill_points_awarded_player_total,
+        debt_payments_made=sum(
+            bool(getattr(player_inventory, f"debt_payment_{number}_paid")) for number in (1, 2, 3)
+        ),
+        region_heat=region.current_heat,
+        peak_heat=peak_heat,
+        blocking_event=daily_result.blocking_event_data is not None,
+        game_over=game_over,
+    )
+
+
+def run_campaign(
+    seed: int,
+    max_days: Optional[int] = None,
+    policy: Policy = greedy_trader_policy,
+    game_configs: Any = narco_configs,
+    on_day: Optional[Callable[[CampaignDay], None]] = None,
+    common_random_numbers: bool = False,
+    biased_chances: Optional[Dict[str, float]] = None,
+) -> CampaignOutcome:
+    """
+    Plays one campaign headlessly until it is won, lost or `max_days` is reached.
+
+    The engine draws from the global `random`, seeded with `seed`; the policy
+    gets its own generator so its choices never shift the engine's draws.
+    Recording days with `on_day` draws nothing, so it does not change the outcome.
+
+    With `common_random_numbers`, each random decision site draws from its own
+    substream of (seed, day, site) instead (see `utils.random_streams`), so
+    two config variants played on the same seed see the same luck wherever
+    their play has not diverged. Setting up the new game still uses the global
+    `random`.
+
+    With `biased_chances` (config name to chance, see
+    `utils.importance_sampling`), those rare-event rolls use the biased chances
+    and the outcome's `likelihood_ratio` carries the campaign's weight.
+    """
+    max_days = game_configs.SIMULATION_MAX_DAYS if max_days is None else max_days
+    random.seed(seed)
+    player_inventory, game_state, _ = create_new_game()
+    policy_rng = random.Random(seed)
+    win_engine, legacy_engine = create_win_condition_engine(), create_legacy_scenario_engine()
+
+    daily_results: List[DailyUpdateResult] = []
+    game_over_day, peak_heat = -1, 0
+    with (
+        random_streams.common_random_numbers(seed) if common_random_numbers else nullcontext(),
+        importance_sampling(biased_chances or {}) as likelihood_ratio,
+    ):
+        while game_state.current_day < max_days and not game_state.game_won:
+            destination = policy(player_inventory, game_state, game_configs, policy_rng)
+            game_over_message = travel(
+                player_inventory, game_state, destination, game_configs, win_engine, legacy_engine,
+                daily_results.append if on_day is not None else None,
+            )
+            day_peak_heat = max(region.current_heat for region in game_state.all_regions.values())
+            peak_heat = max(peak_heat, day_peak_heat)
+            if on_day is not None:
+                on_day(_campaign_day(player_inventory, game_state, daily_results.pop(), day_peak_heat, bool(game_over_message)))
+            if game_over_message:
+                game_over_day = game_state.current_day
+                break
+    game_state.event_journal.flush()
+
+    return CampaignOutcome(
+        seed=seed,
+        days_played=game_state.current_day,
+        final_cash=float(player_inventory.cash),
+        net_worth=float(calculate_net_worth(player_inventory, game_state)),
+        game_over_day=game_over_day,
+        won=bool(game_state.game_won),
+        win_condition=game_state.win_condition_achieved if game_state.game_won else None,
+        legacy_scenarios=tuple(name for name in LEGACY_SCENARIO_NAMES if name in game_state.achieved_legacy_scenarios),
+        peak_heat=peak_heat,
+        likelihood_ratio=likelihood_ratio.weight,
+    )
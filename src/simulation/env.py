@@ -0,0 +1,336 @@
+"""
+Gym-style environments over the engine, for training trading agents.
+
+`NarcoEnv` plays one campaign: `reset(seed)` starts a new game as
+`run_campaign` does, and `step(action)` applies one action and returns
+`(observation, reward, terminated, truncated, info)`. The reward is the
+change in net worth, read from the game's `NetWorthTracker`.
+
+Actions are integers:
+- `0 .. R-1`: travel to `REGION_ORDER[i]`, which plays out the day exactly
+  as `run_campaign`'s travel does (daily updates, win conditions, police stop);
+- `R + 2k`: buy up to `trade_lot` units of `STACK_ORDER[k]` (as many as
+  stock, cash and capacity allow);
+- `R + 2k + 1`: sell up to `trade_lot` units of `STACK_ORDER[k]`.
+Actions the mask rules out do nothing.
+
+The observation is a flat float64 buffer owned by the environment and
+rewritten in place; `OBSERVATION_LAYOUT` gives each field's offset and
+length. Steps build no observation objects. The buffer supports the buffer
+protocol, so with NumPy installed `numpy.frombuffer(env.observation)` is a
+zero-copy view of it. `action_mask` is a byte buffer updated along with it
+(1: the action does something now).
+
+Pricing a market is most of a step's cost, so each region's market fields
+hold what was last seen there, as a player remembers it: only the current
+region's market is refreshed after a step. Heat, holdings and crypto prices
+are always live. With `observe_all_markets`, every market is refreshed after
+each travel instead, about four times the cost of the day itself.
+
+`VectorNarcoEnv` steps N games in lockstep, each writing into its slice of
+one shared observation buffer and one shared mask buffer. The engine draws
+from the global `random`, so each game keeps its own generator state,
+swapped in around its step: a game plays the same whatever is stepped
+alongside it. Finished games are reset automatically with the next seed.
+"""
+
+import random
+from array import array
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .. import narco_configs
+from ..core.enums import CryptoCoin, DrugName, DrugQuality, RegionName
+from ..core.player_inventory import PlayerInventory
+from ..game_setup import create_new_game
+from ..game_state import GameState
+from ..mechanics.daily_updates import catch_up_region
+from ..mechanics.legacy_scenarios import create_legacy_scenario_engine
+from ..mechanics.net_worth import NetWorthTracker, get_net_worth_tracker
+from ..mechanics.win_conditions import create_win_condition_engine
+from .campaign import buy_drug, sell_drug, travel
+
+REGION_ORDER: Tuple[RegionName, ...] = tuple(RegionName)
+STACK_ORDER: Tuple[Tuple[DrugName, DrugQuality], ...] = tuple(
+    (drug, quality) for drug in DrugName for quality in DrugQuality
+)
+COIN_ORDER: Tuple[CryptoCoin, ...] = tuple(CryptoCoin)
+PLAYER_FIELDS: Tuple[str, ...] = ("cash", "day", "region", "free_space", "debt_payments_made")
+
+_REGION_INDEX: Dict[RegionName, int] = {name: i for i, name in enumerate(REGION_ORDER)}
+_REGIONS, _STACKS, _COINS = len(REGION_ORDER), len(STACK_ORDER), len(COIN_ORDER)
+
+
+def _observation_layout() -> Dict[str, Tuple[int, int]]:
+    fields = (
+        ("player", len(PLAYER_FIELDS)),
+        ("heat", _REGIONS),
+        ("buy_prices", _REGIONS * _STACKS), # Region-major: region i's stacks start at i * len(STACK_ORDER)
+        ("sell_prices", _REGIONS * _STACKS),
+        ("stock", _REGIONS * _STACKS),
+        ("inventory", _STACKS),
+        ("crypto_prices", _COINS),
+        ("crypto_holdings", _COINS),
+    )
+    layout, offset = {}, 0
+    for name, length in fields:
+        layout[name] = (offset, length)
+        offset += length
+    return layout
+
+
+#: (offset, length) of each observation field.
+OBSERVATION_LAYOUT: Dict[str, Tuple[int, int]] = _observation_layout()
+OBSERVATION_SIZE: int = sum(length for _, length in OBSERVATION_LAYOUT.values())
+ACTION_COUNT: int = _REGIONS + 2 * _STACKS
+
+_PLAYER = OBSERVATION_LAYOUT["player"][0]
+_HEAT = OBSERVATION_LAYOUT["heat"][0]
+_BUY = OBSERVATION_LAYOUT["buy_prices"][0]
+_SELL = OBSERVATION_LAYOUT["sell_prices"][0]
+_STOCK = OBSERVATION_LAYOUT["stock"][0]
+_INVENTORY = OBSERVATION_LAYOUT["inventory"][0]
+_CRYPTO_PRICES = OBSERVATION_LAYOUT["crypto_prices"][0]
+_CRYPTO_HOLDINGS = OBSERVATION_LAYOUT["crypto_holdings"][0]
+
+_NO_INFO: Mapping[str, Any] = MappingProxyType({})
+
+StepResult = Tuple[memoryview, float, bool, bool, Mapping[str, Any]]
+
+
+class NarcoEnv:
+    """
+    One campaign as a reinforcement learning environment.
+
+    Attributes:
+        max_days (int): Day after which an episode is truncated.
+        trade_lot (int): Most units one buy or sell action trades.
+        observe_all_markets (bool): Whether travel refreshes every region's market, not just the destination's.
+        observation (memoryview): The float64 observation buffer, rewritten in place.
+        action_mask (memoryview): One byte per action, 1 if the action does something now.
+        seed (Optional[int]): Seed of the current episode.
+        player_inventory (PlayerInventory): The current game's player.
+        game_state (GameState): The current game's world.
+    """
+
+    def __init__(
+        self,
+        max_days: Optional[int] = None,
+        trade_lot: Optional[int] = None,
+        game_configs: Any = narco_configs,
+        observation: Optional[memoryview] = None,
+        action_mask: Optional[memoryview] = None,
+        observe_all_markets: bool = False,
+    ) -> None:
+        self.max_days: int = game_configs.SIMULATION_MAX_DAYS if max_days is None else max_days
+        self.trade_lot: int = trade_lot or game_configs.SIMULATION_ENV_TRADE_LOT
+        self.game_configs = game_configs
+        self.observe_all_markets: bool = observe_all_markets
+        self.observation: memoryview = (
+            observation if observation is not None else memoryview(array("d", bytes(8 * OBSERVATION_SIZE)))
+        )
+        self.action_mask: memoryview = action_mask if action_mask is not None else memoryview(bytearray(ACTION_COUNT))
+        self.seed: Optional[int] = None
+        self.player_inventory: PlayerInventory
+        self.game_state: GameState
+        self._tracker: NetWorthTracker
+        self._net_worth: float = 0.0
+        self._done: bool = True
+
+    def reset(self, seed: int) -> memoryview:
+        """Starts a new game from `seed` and returns the observation buffer."""
+        random.seed(seed)
+        self.player_inventory, self.game_state, _ = create_new_game()
+        self._win_engine, self._legacy_engine = create_win_condition_engine(), create_legacy_scenario_engine()
+        tracker = get_net_worth_tracker(self.player_inventory, self.game_state)
+        assert tracker is not None # Real inventories always support change listeners
+        self._tracker = tracker
+        self._net_worth = tracker.net_worth
+        self.seed, self._done = seed, False
+        for region_index in range(_REGIONS):
+            self._write_region(region_index)
+        self._write_player()
+        return self.observation
+
+    def step(self, action: int) -> StepResult:
+        """
+        Applies one action.
+
+        Returns:
+            (observation, reward, terminated, truncated, info): `terminated`
+            when the game is won or lost, `truncated` when `max_days` is
+            reached. `info` is empty until the episode ends, then holds
+            "game_over_message", "won" and "net_worth".
+        """
+        if self._done:
+            raise RuntimeError("The episode has ended; call reset() first.")
+        if not 0 <= action < ACTION_COUNT:
+            raise ValueError(f"Action {action} is outside 0..{ACTION_COUNT - 1}.")
+
+        game_over_message: Optional[str] = None
+        if self.action_mask[action]:
+            if action >= _REGIONS:
+                self._trade(action - _REGIONS)
+                self._write_region(self._current_region_index())
+            else:
+                game_over_message = travel(
+                    self.player_inventory, self.game_state, REGION_ORDER[action], self.game_configs,
+                    self._win_engine, self._legacy_engine,
+                )
+                for region_index in range(_REGIONS) if self.observe_all_markets else (self._current_region_index(),):
+                    self._write_region(region_index)
+        self._write_player()
+
+        net_worth = self._tracker.net_worth
+        reward, self._net_worth = net_worth - self._net_worth, net_worth
+        terminated = game_over_message is not None or bool(self.game_state.game_won)
+        truncated = not terminated and self.game_state.current_day >= self.max_days
+        if not (terminated or truncated):
+            return self.observation, reward, False, False, _NO_INFO
+        self._done = True
+        self.action_mask[:] = bytes(ACTION_COUNT)
+        info = {"game_over_message": game_over_message, "won": bool(self.game_state.game_won), "net_worth": net_worth}
+        return self.observation, reward, terminated, truncated, info
+
+    def _current_region_index(self) -> int:
+        return _REGION_INDEX[self.game_state.get_current_player_region().name]
+
+    def _trade(self, trade_index: int) -> None:
+        stack_index, is_sell = divmod(trade_index, 2)
+        drug, quality = STACK_ORDER[stack_index]
+        inventory, region = self.player_inventory, self.game_state.get_current_player_region()
+        if is_sell:
+            quantity = min(self.trade_lot, inventory.get_quantity(drug, quality))
+            sell_drug(inventory, self.game_state, region, drug, quality, quantity, self.game_configs)
+            return
+        price = region.get_buy_price(drug, quality, inventory, self.game_state)
+        quantity = min(
+            self.trade_lot, int(inventory.cash // price), inventory.get_available_space(),
+            region.get_available_stock(drug, quality, self.game_state),
+        )
+        buy_drug(inventory, self.game_state, region, drug, quality, quantity)
+
+    def _write_region(self, region_index: int) -> None:
+        obs, inventory, game_state = self.observation, self.player_inventory, self.game_state
+        region = game_state.all_regions.get(REGION_ORDER[region_index])
+        if region is not None:
+            catch_up_region(region, game_state) # Markets away from the player are updated lazily
+        base = region_index * _STACKS
+        for stack_index, (drug, quality) in enumerate(STACK_ORDER):
+            i = base + stack_index
+            if region is None or drug not in region.drug_market_data:
+                obs[_BUY + i] = obs[_SELL + i] = obs[_STOCK + i] = 0.0
+                continue
+            obs[_BUY + i] = region.get_buy_price(drug, quality, inventory, game_state)
+            obs[_SELL + i] = region.get_sell_price(drug, quality, inventory, game_state)
+            obs[_STOCK + i] = region.get_available_stock(drug, quality, game_state)
+
+    def _write_player(self) -> None:
+        """Writes the player fields, heat, holdings and crypto prices, then the action mask."""
+        obs, mask, inventory, game_state = self.observation, self.action_mask, self.player_inventory, self.game_state
+        current = self._current_region_index()
+        free_space = inventory.get_available_space()
+        obs[_PLAYER] = inventory.cash
+        obs[_PLAYER + 1] = game_state.current_day
+        obs[_PLAYER + 2] = current
+        obs[_PLAYER + 3] = free_space
+        obs[_PLAYER + 4] = inventory.debt_payment_1_paid + inventory.debt_payment_2_paid + inventory.debt_payment_3_paid
+        for region_index, name in enumerate(REGION_ORDER):
+            region = game_state.all_regions.get(name)
+            obs[_HEAT + region_index] = region.current_heat if region is not None else 0.0
+            mask[region_index] = region is not None and region_index != current
+        for coin_index, coin in enumerate(COIN_ORDER):
+            obs[_CRYPTO_PRICES + coin_index] = game_state.current_crypto_prices.get(coin, 0.0)
+            obs[_CRYPTO_HOLDINGS + coin_index] = inventory.crypto_wallet.get(coin, 0.0)
+
+        items, cash, base = inventory.items, inventory.cash, current * _STACKS
+        for stack_index, (drug, quality) in enumerate(STACK_ORDER):
+            held = items[drug].get(quality, 0) if drug in items else 0
+            obs[_INVENTORY + stack_index] = held
+            buy_price = obs[_BUY + base + stack_index]
+            action = _REGIONS + 2 * stack_index
+            mask[action] = 0.0 < buy_price <= cash and free_space > 0 and obs[_STOCK + base + stack_index] > 0
+            mask[action + 1] = held > 0 and obs[_SELL + base + stack_index] > 0.0
+
+
+class VectorNarcoEnv:
+    """
+    N independent `NarcoEnv` games stepped in lockstep.
+
+    `reset(first_seed)` starts game `i` from seed `first_seed + i`. A finished
+    game is reset in the same step with the next unused seed (`first_seed + N`,
+    then `+ N + 1`, ... in the order games finish), so the same actions replay
+    the same batch. The finished episode's `info` is returned for that step,
+    and the game's observation is already the new episode's.
+
+    Attributes:
+        envs (List[NarcoEnv]): The games.
+        observations (array): N * OBSERVATION_SIZE float64 values, game-major.
+        action_masks (bytearray): N * ACTION_COUNT mask bytes, game-major.
+        rewards (array): Each game's reward from the last step.
+        terminated (bytearray): 1 for each game whose episode terminated in the last step.
+        truncated (bytearray): 1 for each game whose episode was truncated in the last step.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        max_days: Optional[int] = None,
+        trade_lot: Optional[int] = None,
+        game_configs: Any = narco_configs,
+        observe_all_markets: bool = False,
+    ) -> None:
+        if num_envs < 1:
+            raise ValueError("num_envs must be at least 1.")
+        self.num_envs: int = num_envs
+        self.observations: array = array("d", bytes(8 * num_envs * OBSERVATION_SIZE))
+        self.action_masks: bytearray = bytearray(num_envs * ACTION_COUNT)
+        self.rewards: array = array("d", bytes(8 * num_envs))
+        self.terminated: bytearray = bytearray(num_envs)
+        self.truncated: bytearray = bytearray(num_envs)
+        observations, masks = memoryview(self.observations), memoryview(self.action_masks)
+        self.envs: List[NarcoEnv] = [
+            NarcoEnv(
+                max_days, trade_lot, game_configs,
+                observations[i * OBSERVATION_SIZE:(i + 1) * OBSERVATION_SIZE],
+                masks[i * ACTION_COUNT:(i + 1) * ACTION_COUNT],
+                observe_all_markets,
+            )
+            for i in range(num_envs)
+        ]
+        self._random_states: List[Any] = [None] * num_envs
+        self._infos: List[Mapping[str, Any]] = [_NO_INFO] * num_envs
+        self._next_seed: int = 0
+
+    def reset(self, first_seed: int = 0) -> array:
+        """Starts every game and returns the shared observation buffer."""
+        outer_state = random.getstate()
+        for i, env in enumerate(self.envs):
+            env.reset(first_seed + i)
+            self._random_states[i] = random.getstate()
+        random.setstate(outer_state)
+        self._next_seed = first_seed + self.num_envs
+        return self.observations
+
+    def step(self, actions: Sequence[int]) -> Tuple[array, array, bytearray, bytearray, List[Mapping[str, Any]]]:
+        """
+        Steps every game with its action.
+
+        Returns:
+            (observations, rewards, terminated, truncated, infos), where the
+            first four are this object's shared buffers, updated in place.
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}.")
+        outer_state = random.getstate()
+        infos = self._infos
+        for i, (env, action) in enumerate(zip(self.envs, actions)):
+            random.setstate(self._random_states[i])
+            _, self.rewards[i], terminated, truncated, infos[i] = env.step(action)
+            self.terminated[i], self.truncated[i] = terminated, truncated
+            if terminated or truncated:
+                env.reset(self._next_seed)
+                self._next_seed += 1
+            self._random_states[i] = random.getstate()
+        random.setstate(outer_state)
+        return self.observations, self.rewards, self.terminated, self.truncated, infos
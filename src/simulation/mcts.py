@@ -0,0 +1,458 @@
+"""
+A Monte Carlo tree search player for headless campaigns.
+
+`MctsPolicy` is a campaign `Policy` that plans each day by playing simulated
+days on clones of the game (`GameState.clone`, `PlayerInventory.clone`)
+through the real engine: the same trades and `travel` as `run_campaign`, so
+daily updates, market pricing and impact, police stops and the win
+conditions all run in every simulation. That makes it a strong benchmark
+opponent for balance work and a stress test of the engine's hot paths.
+
+A decision is a `TradePlan`: sell the stash or keep it, buy one of the best
+bargains with a share of the cash or buy nothing, then travel. Plans are
+ranked by a one-day estimate of what they are worth at their destination.
+Days are random, so the search tree is closed-loop: a plan leads to the
+sampled next states, and nodes live in a transposition table keyed by the
+incremental state hash (`state_key`), so a state reached by different paths
+is one node. A played day's clone carries its parent's hash tracker, so
+keying it costs only that day's changes. Progressive widening keeps the
+tree narrow: after n visits, a node considers only its ceil(C * n ** alpha)
+best-ranked plans, and a plan that has reached as many sampled outcomes
+replays one of them from its stored clone instead of sampling a new one.
+New nodes are valued by a rollout with a cheap policy (`greedy_trader_policy`
+by default) up to the horizon.
+
+Simulations never touch the campaign's own randomness: the global `random`
+state is restored after each search, and common random numbers and
+importance sampling are off inside it. Each simulation reseeds `random` from
+the policy's generator, so a search capped by `max_simulations` without a
+time budget is reproducible; one cut short by the time budget is not. That is
+why `mcts_policy`, the form campaign pools and sweeps run and cache, searches
+by the simulation cap alone.
+"""
+
+import math
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .. import narco_configs
+from ..core.enums import DrugName, DrugQuality, RegionName
+from ..core.player_inventory import PlayerInventory
+from ..game_state import GameState
+from ..mechanics.legacy_scenarios import create_legacy_scenario_engine
+from ..mechanics.net_worth import calculate_net_worth
+from ..mechanics.state_hash import get_state_hash_tracker, state_hash
+from ..mechanics.win_conditions import create_win_condition_engine
+from ..utils.importance_sampling import importance_sampling
+from ..utils.random_streams import suspend_common_random_numbers
+from .campaign import Policy, buy_drug, greedy_trader_policy, sell_drug, travel
+
+# Simulation values: a lost campaign, a won one, and net worth changes squashed in between
+LOSS_VALUE = -1.0
+WIN_VALUE = 1.0
+
+
+class TradePlan(NamedTuple):
+    """
+    One day's decision.
+
+    Attributes:
+        sell_stash: Whether to sell every drug carried before buying.
+        buy: The drug and quality to buy, or None to buy nothing.
+        buy_fraction: Share of the cash (after selling) to spend on `buy`.
+        destination: Region to travel to.
+    """
+
+    sell_stash: bool
+    buy: Optional[Tuple[DrugName, DrugQuality]]
+    buy_fraction: float
+    destination: RegionName
+
+
+class SearchResult(NamedTuple):
+    """
+    What one decision's search found.
+
+    Attributes:
+        plan: The most visited plan at the root.
+        value: Mean simulation value of `plan`, in [-1, 1].
+        simulations: Simulations played.
+        nodes: States in the transposition table.
+        elapsed: Seconds spent searching.
+    """
+
+    plan: TradePlan
+    value: float
+    simulations: int
+    nodes: int
+    elapsed: float
+
+
+def state_key(player_inventory: PlayerInventory, game_state: GameState) -> int:
+    """The transposition key: the game's incremental state hash; equal keys are the same state for the search."""
+    return state_hash(player_inventory, game_state)
+
+
+def _clone_game(player_inventory: PlayerInventory, game_state: GameState) -> Tuple[PlayerInventory, GameState]:
+    """Clones a search state together with its state hash tracker, so the clone's key needs no full walk."""
+    tracker = get_state_hash_tracker(player_inventory, game_state)
+    player_inventory_clone, game_state_clone = player_inventory.clone(), game_state.clone()
+    if tracker is not None:
+        tracker.copy_to(player_inventory_clone, game_state_clone)
+    return player_inventory_clone, game_state_clone
+
+
+def apply_trades(
+    plan: TradePlan, player_inventory: PlayerInventory, game_state: GameState, game_configs: Any = narco_configs
+) -> None:
+    """Makes a plan's trades at the current region. Travel is left to the caller."""
+    region = game_state.get_current_player_region()
+    if plan.sell_stash:
+        for drug, qualities in list(player_inventory.items.items()):
+            for quality, quantity in list(qualities.items()):
+                sell_drug(player_inventory, game_state, region, drug, quality, quantity, game_configs)
+    if plan.buy is not None:
+        drug, quality = plan.buy
+        price = region.get_buy_price(drug, quality, player_inventory, game_state)
+        if price > 0:
+            quantity = min(
+                int(player_inventory.cash * plan.buy_fraction // price),
+                player_inventory.get_available_space(),
+                region.get_available_stock(drug, quality, game_state),
+            )
+            buy_drug(player_inventory, game_state, region, drug, quality, quantity)
+
+
+def candidate_plans(
+    player_inventory: PlayerInventory, game_state: GameState,
+    buy_candidates: int, buy_fractions: Tuple[float, ...],
+) -> List[TradePlan]:
+    """
+    Lists a state's plans, best first by a one-day estimate.
+
+    A plan is estimated as the cash it leaves plus its stash valued at the
+    destination's current sell prices, ignoring market impact and the day's
+    events. Only the `buy_candidates` best bargains (buy price relative to
+    the drug's base price) are considered for buying.
+    """
+    region = game_state.get_current_player_region()
+    sell_prices: Dict[Tuple[RegionName, DrugName, DrugQuality], float] = {}
+
+    def sell_price(region_name: RegionName, drug: DrugName, quality: DrugQuality) -> float:
+        price_key = (region_name, drug, quality)
+        price = sell_prices.get(price_key)
+        if price is None:
+            price = game_state.all_regions[region_name].get_sell_price(drug, quality, player_inventory, game_state)
+            sell_prices[price_key] = price
+        return price
+
+    stash = [
+        (drug, quality, quantity)
+        for drug, qualities in player_inventory.items.items() for quality, quantity in qualities.items() if quantity > 0
+    ]
+    bargains: List[Tuple[float, DrugName, DrugQuality, float]] = []
+    for drug, market_data in region.drug_market_data.items():
+        for quality in market_data['available_qualities']:
+            price = region.get_buy_price(drug, quality, player_inventory, game_state)
+            if price > 0 and region.get_available_stock(drug, quality, game_state) > 0:
+                bargains.append((price / market_data['base_buy_price'], drug, quality, price))
+    bargains.sort(key=lambda bargain: bargain[0])
+
+    destinations = [name for name in game_state.all_regions if name != region.name]
+    scored: List[Tuple[float, int, TradePlan]] = []
+    for sell_stash in ((True, False) if stash else (False,)):
+        cash = player_inventory.cash
+        held = [] if sell_stash else stash
+        if sell_stash:
+            cash += sum(quantity * sell_price(region.name, drug, quality) for drug, quality, quantity in stash)
+        space = player_inventory.max_capacity - sum(quantity for _, _, quantity in held)
+        purchases: List[Tuple[Optional[Tuple[DrugName, DrugQuality]], float, int, float]] = [(None, 0.0, 0, 0.0)]
+        for _, drug, quality, price in bargains[:buy_candidates]:
+            stock = region.get_available_stock(drug, quality, game_state)
+            for fraction in buy_fractions:
+                quantity = min(int(cash * fraction // price), space, stock)
+                if quantity > 0:
+                    purchases.append(((drug, quality), fraction, quantity, quantity * price))
+        for buy, fraction, quantity, cost in purchases:
+            for destination in destinations:
+                worth = cash - cost + sum(
+                    held_quantity * sell_price(destination, drug, quality) for drug, quality, held_quantity in held
+                )
+                if buy is not None:
+                    worth += quantity * sell_price(destination, *buy)
+                # The index keeps equal estimates in a stable order
+                scored.append((-worth, len(scored), TradePlan(sell_stash, buy, fraction, destination)))
+    scored.sort()
+    return [plan for _, _, plan in scored]
+
+
+class _Edge:
+    """A plan tried at a node: its statistics and the outcomes sampled so far."""
+
+    __slots__ = ("plan", "visits", "value_sum", "outcomes", "outcome_visits")
+
+    def __init__(self, plan: TradePlan) -> None:
+        self.plan: TradePlan = plan
+        self.visits: int = 0
+        self.value_sum: float = 0.0
+        self.outcomes: List["_Node"] = []
+        self.outcome_visits: List[int] = []
+
+
+class _Node:
+    """A state in the search: a clone of the game that is only ever cloned again, never played on."""
+
+    __slots__ = ("player_inventory", "game_state", "terminal_value", "visits", "plans", "edges")
+
+    def __init__(self, player_inventory: PlayerInventory, game_state: GameState, terminal_value: Optional[float]) -> None:
+        self.player_inventory: PlayerInventory = player_inventory
+        self.game_state: GameState = game_state
+        self.terminal_value: Optional[float] = terminal_value
+        self.visits: int = 0
+        self.plans: Optional[List[TradePlan]] = None # Ranked on first visit
+        self.edges: List[_Edge] = []
+
+
+@contextmanager
+def _isolated_lookahead() -> Iterator[None]:
+    """Lets simulated days draw from `random` without changing the campaign's own draws."""
+    random_state = random.getstate()
+    try:
+        # An empty bias makes every chance roll a plain draw that no campaign weight records
+        with suspend_common_random_numbers(), importance_sampling({}):
+            yield
+    finally:
+        random.setstate(random_state)
+
+
+class MctsPolicy:
+    """
+    Campaign policy that picks each day's trades and destination by Monte Carlo tree search.
+
+    Settings left as None are read from the game configs the policy is
+    called with (the `SIMULATION_MCTS_*` values).
+
+    Attributes:
+        time_budget (Optional[float]): Seconds to search per decision.
+        max_simulations (Optional[int]): Simulations to play per decision.
+        horizon_days (Optional[int]): Days a simulation plays ahead.
+        exploration (Optional[float]): UCB exploration constant.
+        widening_constant (Optional[float]): C of progressive widening.
+        widening_exponent (Optional[float]): alpha of progressive widening.
+        rollout_policy (Policy): Plays the days after the tree, up to the horizon.
+        last_search (Optional[SearchResult]): The most recent decision's search.
+    """
+
+    policy_version = 2
+
+    def __init__(
+        self,
+        time_budget: Optional[float] = None,
+        max_simulations: Optional[int] = None,
+        horizon_days: Optional[int] = None,
+        exploration: Optional[float] = None,
+        widening_constant: Optional[float] = None,
+        widening_exponent: Optional[float] = None,
+        rollout_policy: Policy = greedy_trader_policy,
+    ) -> None:
+        self.time_budget: Optional[float] = time_budget
+        self.max_simulations: Optional[int] = max_simulations
+        self.horizon_days: Optional[int] = horizon_days
+        self.exploration: Optional[float] = exploration
+        self.widening_constant: Optional[float] = widening_constant
+        self.widening_exponent: Optional[float] = widening_exponent
+        self.rollout_policy: Policy = rollout_policy
+        self.last_search: Optional[SearchResult] = None
+
+    def __call__(
+        self, player_inventory: PlayerInventory, game_state: GameState, game_configs: Any, rng: random.Random
+    ) -> RegionName:
+        """Searches, makes the chosen plan's trades and returns its destination."""
+        self.last_search = self.search(player_inventory, game_state, game_configs, rng)
+        apply_trades(self.last_search.plan, player_inventory, game_state, game_configs)
+        return self.last_search.plan.destination
+
+    def search(
+        self, player_inventory: PlayerInventory, game_state: GameState, game_configs: Any, rng: random.Random
+    ) -> SearchResult:
+        """
+        Searches from the current state without changing it.
+
+        Raises:
+            ValueError: If neither a time budget nor a simulation cap is set.
+        """
+        time_budget = _setting(self.time_budget, game_configs, "SIMULATION_MCTS_TIME_BUDGET")
+        max_simulations = _setting(self.max_simulations, game_configs, "SIMULATION_MCTS_MAX_SIMULATIONS")
+        if time_budget is None and max_simulations is None:
+            raise ValueError("MCTS needs a time budget or a simulation cap.")
+        search = _Search(
+            game_configs,
+            rng,
+            horizon_days=_setting(self.horizon_days, game_configs, "SIMULATION_MCTS_HORIZON_DAYS"),
+            exploration=_setting(self.exploration, game_configs, "SIMULATION_MCTS_EXPLORATION"),
+            widening_constant=_setting(self.widening_constant, game_configs, "SIMULATION_MCTS_WIDENING_CONSTANT"),
+            widening_exponent=_setting(self.widening_exponent, game_configs, "SIMULATION_MCTS_WIDENING_EXPONENT"),
+            rollout_policy=self.rollout_policy,
+        )
+
+        started = time.perf_counter()
+        deadline = None if time_budget is None else started + time_budget
+        root = search.add_root(player_inventory, game_state)
+        simulations = 0
+        with _isolated_lookahead():
+            while True:
+                search.simulate(root)
+                simulations += 1
+                if max_simulations is not None and simulations >= max_simulations:
+                    break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+
+        best = max(root.edges, key=lambda edge: (edge.visits, edge.value_sum))
+        return SearchResult(
+            plan=best.plan,
+            value=best.value_sum / best.visits,
+            simulations=simulations,
+            nodes=len(search.table),
+            elapsed=time.perf_counter() - started,
+        )
+
+
+def _setting(value: Any, game_configs: Any, name: str) -> Any:
+    return getattr(game_configs, name) if value is None else value
+
+
+class _Search:
+    """The transposition table and simulation loop of one decision's search."""
+
+    def __init__(
+        self, game_configs: Any, rng: random.Random, horizon_days: int, exploration: float,
+        widening_constant: float, widening_exponent: float, rollout_policy: Policy,
+    ) -> None:
+        self.game_configs = game_configs
+        self.rng = rng
+        self.horizon_days = horizon_days
+        self.exploration = exploration
+        self.widening_constant = widening_constant
+        self.widening_exponent = widening_exponent
+        self.rollout_policy = rollout_policy
+        self.buy_candidates: int = game_configs.SIMULATION_MCTS_BUY_CANDIDATES
+        self.buy_fractions: Tuple[float, ...] = tuple(game_configs.SIMULATION_MCTS_BUY_FRACTIONS)
+        self.table: Dict[int, _Node] = {}
+        self.start_net_worth = 0.0
+
+    def add_root(self, player_inventory: PlayerInventory, game_state: GameState) -> _Node:
+        root = _Node(player_inventory.clone(), game_state.clone(), None)
+        self.table[state_key(root.player_inventory, root.game_state)] = root
+        self.start_net_worth = calculate_net_worth(player_inventory, game_state)
+        return root
+
+    def _width(self, visits: int) -> int:
+        return max(1, math.ceil(self.widening_constant * visits ** self.widening_exponent))
+
+    def _value(self, player_inventory: PlayerInventory, game_state: GameState) -> float:
+        if game_state.game_won:
+            return WIN_VALUE
+        gain = calculate_net_worth(player_inventory, game_state) - self.start_net_worth
+        return math.tanh(gain / max(abs(self.start_net_worth), 1.0))
+
+    def _select(self, node: _Node) -> _Edge:
+        if node.plans is None:
+            node.plans = candidate_plans(node.player_inventory, node.game_state, self.buy_candidates, self.buy_fractions)
+        if len(node.edges) < min(self._width(node.visits), len(node.plans)):
+            edge = _Edge(node.plans[len(node.edges)])
+            node.edges.append(edge)
+            return edge
+        log_visits = math.log(max(node.visits, 1))
+        return max(node.edges, key=lambda edge: (
+            edge.value_sum / edge.visits + self.exploration * math.sqrt(log_visits / edge.visits)
+            if edge.visits else math.inf
+        ))
+
+    def _play_day(self, node: _Node, plan: TradePlan) -> Tuple[PlayerInventory, GameState, Optional[str]]:
+        player_inventory, game_state = _clone_game(node.player_inventory, node.game_state)
+        apply_trades(plan, player_inventory, game_state, self.game_configs)
+        game_over_message = travel(
+            player_inventory, game_state, plan.destination, self.game_configs,
+            create_win_condition_engine(), create_legacy_scenario_engine(),
+        )
+        return player_inventory, game_state, game_over_message
+
+    def _rollout(self, node: _Node, days: int) -> float:
+        if node.terminal_value is not None:
+            return node.terminal_value
+        player_inventory, game_state = node.player_inventory.clone(), node.game_state.clone()
+        win_engine, legacy_engine = create_win_condition_engine(), create_legacy_scenario_engine()
+        rollout_rng = random.Random(self.rng.getrandbits(64))
+        for _ in range(days):
+            destination = self.rollout_policy(player_inventory, game_state, self.game_configs, rollout_rng)
+            if travel(player_inventory, game_state, destination, self.game_configs, win_engine, legacy_engine):
+                return LOSS_VALUE
+            if game_state.game_won:
+                break
+        return self._value(player_inventory, game_state)
+
+    def simulate(self, root: _Node) -> None:
+        """Plays one simulation from the root and backs its value up the path."""
+        random.seed(self.rng.getrandbits(64))
+        path: List[Tuple[_Node, _Edge]] = []
+        node, depth, value = root, 0, None
+        while depth < self.horizon_days:
+            if node.terminal_value is not None:
+                value = node.terminal_value
+                break
+            edge = self._select(node)
+            path.append((node, edge))
+            depth += 1
+            if len(edge.outcomes) < self._width(edge.visits):
+                player_inventory, game_state, game_over_message = self._play_day(node, edge.plan)
+                key = state_key(player_inventory, game_state)
+                child = self.table.get(key)
+                is_new = child is None
+                if child is None:
+                    terminal_value = LOSS_VALUE if game_over_message else (WIN_VALUE if game_state.game_won else None)
+                    child = self.table[key] = _Node(player_inventory, game_state, terminal_value)
+                if child in edge.outcomes:
+                    edge.outcome_visits[edge.outcomes.index(child)] += 1
+                else:
+                    edge.outcomes.append(child)
+                    edge.outcome_visits.append(1)
+                node = child
+                if is_new:
+                    value = self._rollout(child, self.horizon_days - depth)
+                    break
+            else:
+                index = self.rng.choices(range(len(edge.outcomes)), weights=edge.outcome_visits)[0]
+                edge.outcome_visits[index] += 1
+                node = edge.outcomes[index]
+        if value is None:
+            value = node.terminal_value if node.terminal_value is not None else self._value(node.player_inventory, node.game_state)
+
+        node.visits += 1
+        for visited, edge in path:
+            visited.visits += 1
+            edge.visits += 1
+            edge.value_sum += value
+
+
+def mcts_policy(
+    player_inventory: PlayerInventory, game_state: GameState, game_configs: Any, rng: random.Random
+) -> RegionName:
+    """
+    `MctsPolicy` with the configured settings, as a module-level function worker processes can pickle.
+
+    The search stops after SIMULATION_MCTS_MAX_SIMULATIONS and ignores the
+    time budget: pools and sweeps cache batch results as reproducible, so
+    they must not depend on machine load.
+
+    Raises:
+        ValueError: If SIMULATION_MCTS_MAX_SIMULATIONS is None.
+    """
+    if game_configs.SIMULATION_MCTS_MAX_SIMULATIONS is None:
+        raise ValueError("mcts_policy needs SIMULATION_MCTS_MAX_SIMULATIONS; a time budget is not reproducible.")
+    return MctsPolicy(time_budget=math.inf)(player_inventory, game_state, game_configs, rng)
+
+
+mcts_policy.policy_version = MctsPolicy.policy_version # type: ignore[attr-defined]
@@ -0,0 +1,99 @@
+"""
+Rare-event rates from importance-sampled campaigns.
+
+To estimate how often something rare happens, e.g. a campaign lost within
+its first two weeks, campaigns are played with the chances of the rolls that
+cause it raised (`CampaignPool.run(seeds, biased_chances=...)`). Each outcome
+carries its likelihood ratio, and the mean of `likelihood_ratio * event` over
+the batch is an unbiased estimate of the event's rate in the unbiased game.
+A good bias makes the event common without letting the weights spread too
+far; `RareEventEstimate.effective_sample_size` shows how many unbiased
+campaigns the weighted batch is worth.
+"""
+
+import math
+from statistics import NormalDist
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from .aggregation import RunningStats
+from .campaign import CampaignOutcome, ConfigOverrides
+from .worker_pool import CampaignPool
+
+#: Whether an outcome counts as the event being estimated.
+RareEvent = Callable[[CampaignOutcome], bool]
+
+
+def game_over_event(outcome: CampaignOutcome) -> bool:
+    return outcome.game_over_day >= 0
+
+
+def game_over_by_day(day: int) -> RareEvent:
+    """Returns an event that holds for campaigns lost on or before `day`."""
+    def event(outcome: CampaignOutcome) -> bool:
+        return 0 <= outcome.game_over_day <= day
+    return event
+
+
+class RareEventEstimate(NamedTuple):
+    """
+    An event's rate in the unbiased game, estimated from weighted campaigns.
+
+    Attributes:
+        campaigns: Campaigns played.
+        hits: Campaigns in which the event happened, unweighted.
+        rate: Estimated rate of the event.
+        stderr: Standard error of `rate`.
+        confidence_interval: Normal-approximation interval for the rate, clipped to [0, 1].
+        effective_sample_size: (sum of weights)^2 / sum of squared weights.
+    """
+
+    campaigns: int
+    hits: int
+    rate: float
+    stderr: float
+    confidence_interval: Tuple[float, float]
+    effective_sample_size: float
+
+
+def estimate_rare_event(
+    outcomes: Iterable[CampaignOutcome],
+    event: RareEvent = game_over_event,
+    confidence: float = 0.95,
+) -> RareEventEstimate:
+    """Estimates an event's rate from outcomes weighted by their `likelihood_ratio`."""
+    weighted_hits = RunningStats()
+    hits, weight_sum, weight_square_sum = 0, 0.0, 0.0
+    for outcome in outcomes:
+        happened = event(outcome)
+        hits += happened
+        weighted_hits.add(outcome.likelihood_ratio if happened else 0.0)
+        weight_sum += outcome.likelihood_ratio
+        weight_square_sum += outcome.likelihood_ratio ** 2
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    rate, stderr = weighted_hits.mean, weighted_hits.stderr
+    return RareEventEstimate(
+        campaigns=weighted_hits.count,
+        hits=hits,
+        rate=rate,
+        stderr=stderr,
+        confidence_interval=(max(0.0, rate - z * stderr), min(1.0, rate + z * stderr)),
+        effective_sample_size=weight_sum ** 2 / weight_square_sum if weight_square_sum > 0.0 else 0.0,
+    )
+
+
+def estimate_with_pool(
+    pool: CampaignPool,
+    seeds: Iterable[int],
+    biased_chances: Dict[str, float],
+    event: RareEvent = game_over_event,
+    overrides: Optional[ConfigOverrides] = None,
+    confidence: float = 0.95,
+) -> RareEventEstimate:
+    """Plays importance-sampled campaigns on the pool and estimates the event's rate."""
+    return estimate_rare_event(pool.run(seeds, overrides, biased_chances), event, confidence)
+
+
+def relative_error(estimate: RareEventEstimate) -> float:
+    """Standard error relative to the rate (inf for a zero estimate); compare biases by it at equal cost."""
+    return estimate.stderr / estimate.rate if estimate.rate > 0.0 else math.inf
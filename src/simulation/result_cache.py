@@ -0,0 +1,272 @@
+"""
+Caches of campaign batch aggregates, keyed by everything the outcomes depend on.
+
+A `ResultCacheKey` names a batch by its effective config
+(`config_fingerprint`), the policy and its version, the engine (a hash of the
+game's source, see `utils.engine_fingerprint`), the campaign length, the seed range
+and whether common random numbers were used. Equal keys mean identical
+outcomes, so a cached aggregate can be returned instead of replaying the
+batch, and changing one parameter only misses the batches of the points it
+changes.
+
+`MemoryResultCache` lives for one process. `DiskResultCache` stores one
+pickled aggregate per key in a directory, named by the key's hash, plus a
+`manifest.json` listing every entry's key, size and last use. The manifest is
+what `entries` and `prune` read, so inspecting the cache never unpickles an
+aggregate. Once the files exceed `max_bytes`, the least recently used entries
+are deleted. Every file also carries its key, so a lost manifest is rebuilt
+from the files.
+
+A cache hit only marks its entry as used in memory; `flush` (called at the
+end of each sweep evaluation) and every `put` write the manifest. Writes merge
+in whatever another process sharing the directory wrote since, so concurrent
+sweeps do not drop each other's entries.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+
+from .. import narco_configs
+from ..utils.logger import get_logger
+from ..utils.save_files import write_file_atomically
+from .aggregation import OutcomeAggregate
+
+logger = get_logger(__name__)
+
+MANIFEST_FILE_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+ENTRY_EXTENSION = ".pickle"
+
+class ResultCacheKey(NamedTuple):
+    """Identifies one batch of campaigns: everything its outcomes depend on."""
+
+    config_hash: str
+    policy: str
+    engine: str
+    max_days: int
+    seed_start: int
+    seed_stop: int
+    common_random_numbers: bool = False
+
+    def digest(self) -> str:
+        return hashlib.blake2b(repr(tuple(self)).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class CacheEntry(NamedTuple):
+    """A manifest entry: a cached batch's key, file and use."""
+
+    key: ResultCacheKey
+    file_name: str
+    size: int
+    created: float
+    last_used: float
+
+    def to_manifest(self) -> Dict[str, Any]:
+        return {**self.key._asdict(), "file_name": self.file_name, "size": self.size,
+                "created": self.created, "last_used": self.last_used}
+
+    @classmethod
+    def from_manifest(cls, data: Dict[str, Any]) -> "CacheEntry":
+        return cls(
+            key=ResultCacheKey(**{field: data[field] for field in ResultCacheKey._fields}),
+            file_name=data["file_name"], size=data["size"], created=data["created"], last_used=data["last_used"],
+        )
+
+
+class MemoryResultCache:
+    """In-process cache of batch aggregates. Cached aggregates must not be modified."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[ResultCacheKey, OutcomeAggregate] = {}
+
+    def get(self, key: ResultCacheKey) -> Optional[OutcomeAggregate]:
+        return self._entries.get(key)
+
+    def put(self, key: ResultCacheKey, aggregate: OutcomeAggregate) -> None:
+        self._entries[key] = aggregate
+
+    def flush(self) -> None:
+        """Nothing to write; present so either cache can be used."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskResultCache:
+    """
+    Batch aggregates in a directory, evicted least recently used first.
+
+    Attributes:
+        directory (str): Where the entries and the manifest live.
+        max_bytes (int): Size the entry files are kept under.
+    """
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None, game_configs: Any = narco_configs) -> None:
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes or game_configs.SIMULATION_RESULT_CACHE_MAX_BYTES
+        self._entries: Optional[Dict[str, CacheEntry]] = None
+        self._removed: Set[str] = set() # Deleted since the manifest was last written, so merging must not restore them
+        self._synced: Set[str] = set() # Entries in the manifest as last read or written
+        self._dirty: bool = False # Entries were used since the manifest was last written
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.directory, MANIFEST_FILE_NAME)
+
+    def _path(self, file_name: str) -> str:
+        return os.path.join(self.directory, file_name)
+
+    def _loaded(self) -> Dict[str, CacheEntry]:
+        if self._entries is None:
+            self._load()
+        assert self._entries is not None
+        return self._entries
+
+    def _read_manifest(self) -> Dict[str, CacheEntry]:
+        with open(self.manifest_path, encoding="utf-8") as manifest_file:
+            data = json.load(manifest_file)
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported cache manifest version {data.get('version')!r}.")
+        return {entry.file_name: entry for entry in map(CacheEntry.from_manifest, data["entries"])}
+
+    def _load(self) -> None:
+        try:
+            self._entries = self._read_manifest()
+            self._synced = set(self._entries)
+        except FileNotFoundError:
+            self.rebuild()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Result cache manifest {self.manifest_path!r} is unreadable ({e}); rebuilding it.")
+            self.rebuild()
+
+    def _write_manifest(self, merge: bool = True) -> None:
+        entries = self._loaded()
+        if merge:
+            try:
+                self._merge(entries, self._read_manifest())
+            except (OSError, ValueError, KeyError, TypeError):
+                pass # Missing or unreadable: ours replaces it
+        os.makedirs(self.directory, exist_ok=True)
+        data = {"version": MANIFEST_VERSION, "entries": [entry.to_manifest() for entry in entries.values()]}
+        write_file_atomically(self.manifest_path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        self._removed.clear()
+        self._synced = set(entries)
+        self._dirty = False
+
+    def _merge(self, entries: Dict[str, CacheEntry], on_disk: Dict[str, CacheEntry]) -> None:
+        # Another process sharing the directory may have added, used or deleted entries since
+        for file_name in self._synced - on_disk.keys():
+            entries.pop(file_name, None)
+        for file_name, entry in on_disk.items():
+            if file_name in self._removed:
+                continue
+            ours = entries.get(file_name)
+            if ours is None or entry.last_used > ours.last_used:
+                entries[file_name] = entry
+
+    def flush(self) -> None:
+        """Writes the manifest if entries were used since it was last written."""
+        if self._dirty:
+            self._write_manifest()
+
+    def rebuild(self) -> List[CacheEntry]:
+        """Recreates the manifest from the entry files in the directory."""
+        entries: Dict[str, CacheEntry] = {}
+        if os.path.isdir(self.directory):
+            for file_name in os.listdir(self.directory):
+                if not file_name.endswith(ENTRY_EXTENSION):
+                    continue
+                path = self._path(file_name)
+                try:
+                    with open(path, "rb") as entry_file:
+                        key, _ = pickle.load(entry_file)
+                except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError) as e:
+                    logger.warning("Skipping unreadable result cache entry %r: %s", path, e)
+                    continue
+                modified = os.path.getmtime(path)
+                entries[file_name] = CacheEntry(ResultCacheKey(*key), file_name, os.path.getsize(path), modified, modified)
+        self._entries = entries
+        if os.path.isdir(self.directory):
+            self._write_manifest(merge=False)
+        return self.entries()
+
+    def entries(self) -> List[CacheEntry]:
+        """Returns the manifest's entries, most recently used first."""
+        return sorted(self._loaded().values(), key=lambda entry: entry.last_used, reverse=True)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry.size for entry in self._loaded().values())
+
+    def get(self, key: ResultCacheKey) -> Optional[OutcomeAggregate]:
+        """Returns the cached aggregate for a batch, or None, marking the entry as used (written by `flush`)."""
+        file_name = key.digest() + ENTRY_EXTENSION
+        entry = self._loaded().get(file_name)
+        if entry is None:
+            return None
+        try:
+            with open(self._path(file_name), "rb") as entry_file:
+                _, aggregate = pickle.load(entry_file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError) as e:
+            logger.warning("Dropping unreadable result cache entry %r: %s", file_name, e)
+            self._remove(file_name)
+            self._write_manifest()
+            return None
+        self._loaded()[file_name] = entry._replace(last_used=time.time())
+        self._dirty = True
+        return aggregate
+
+    def put(self, key: ResultCacheKey, aggregate: OutcomeAggregate) -> None:
+        """Stores a batch's aggregate, then evicts least recently used entries beyond `max_bytes`."""
+        file_name = key.digest() + ENTRY_EXTENSION
+        data = pickle.dumps((tuple(key), aggregate), protocol=pickle.HIGHEST_PROTOCOL)
+        os.makedirs(self.directory, exist_ok=True)
+        write_file_atomically(self._path(file_name), data)
+        now = time.time()
+        self._loaded()[file_name] = CacheEntry(key, file_name, len(data), now, now)
+        self._evict(keep=file_name)
+        self._write_manifest()
+
+    def _evict(self, keep: str) -> None:
+        entries = self._loaded()
+        total = self.total_bytes
+        for entry in sorted(entries.values(), key=lambda entry: entry.last_used):
+            if total <= self.max_bytes:
+                return
+            if entry.file_name != keep:
+                self._remove(entry.file_name)
+                total -= entry.size
+
+    def _remove(self, file_name: str) -> None:
+        self._loaded().pop(file_name, None)
+        self._removed.add(file_name)
+        try:
+            os.remove(self._path(file_name))
+        except FileNotFoundError:
+            pass
+
+    def prune(self, predicate: Callable[[CacheEntry], bool]) -> int:
+        """
+        Deletes every entry the predicate selects, e.g. entries from an older engine:
+        `cache.prune(lambda entry: entry.key.engine != engine_fingerprint())`.
+
+        Returns:
+            int: The number of entries deleted.
+        """
+        doomed = [entry.file_name for entry in self._loaded().values() if predicate(entry)]
+        for file_name in doomed:
+            self._remove(file_name)
+        if doomed:
+            self._write_manifest()
+        return len(doomed)
+
+    def clear(self) -> int:
+        """Deletes every entry. Returns the number deleted."""
+        return self.prune(lambda entry: True)
+
+    def __len__(self) -> int:
+        return len(self._loaded())
@@ -0,0 +1,267 @@
+"""
+Durable SQLite storage for simulated campaigns.
+
+`ResultsStore` keeps one row per campaign in `campaigns` and, when a
+campaign's days were recorded (`run_campaign(..., on_day=...)`), one row per
+day in `campaign_days`. Rows carry the `config_fingerprint` of the config they
+were played with, so results from different balance settings share a
+database and are told apart by query:
+
+    SELECT outcome, COUNT(*), AVG(net_worth) FROM campaigns
+    WHERE config_hash = ? GROUP BY outcome;
+
+Writes never touch the disk on the caller's thread. `add` puts the rows on a
+bounded queue; a writer thread owns the connection, takes whatever has queued
+up (at most `batch_size` campaigns) and inserts it in one transaction. The
+database runs in WAL mode, so analysts can read it while a batch is being
+written.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from .. import narco_configs
+from ..utils.logger import get_logger
+from .campaign import LEGACY_SCENARIO_NAMES, CampaignDay, CampaignOutcome, config_fingerprint
+
+logger = get_logger(__name__)
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS campaigns (
+    id INTEGER PRIMARY KEY,
+    config_hash TEXT NOT NULL,
+    policy TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    days_played INTEGER NOT NULL,
+    final_cash REAL NOT NULL,
+    net_worth REAL NOT NULL,
+    game_over_day INTEGER,
+    win_condition TEXT,
+    legacy_scenarios TEXT NOT NULL,
+    peak_heat INTEGER NOT NULL,
+    likelihood_ratio REAL NOT NULL DEFAULT 1.0
+);
+CREATE INDEX IF NOT EXISTS campaigns_by_config_seed ON campaigns (config_hash, seed);
+CREATE INDEX IF NOT EXISTS campaigns_by_config_outcome ON campaigns (config_hash, outcome);
+CREATE INDEX IF NOT EXISTS campaigns_by_seed ON campaigns (seed);
+CREATE TABLE IF NOT EXISTS campaign_days (
+    campaign_id INTEGER NOT NULL REFERENCES campaigns (id),
+    day INTEGER NOT NULL,
+    region TEXT NOT NULL,
+    cash REAL NOT NULL,
+    net_worth REAL NOT NULL,
+    inventory_units INTEGER NOT NULL,
+    skill_points INTEGER NOT NULL,
+    skill_points_awarded INTEGER NOT NULL,
+    debt_payments_made INTEGER NOT NULL,
+    region_heat INTEGER NOT NULL,
+    peak_heat INTEGER NOT NULL,
+    blocking_event INTEGER NOT NULL,
+    game_over INTEGER NOT NULL,
+    PRIMARY KEY (campaign_id, day)
+) WITHOUT ROWID;
+"""
+
+_CAMPAIGN_COLUMNS = (
+    "config_hash, policy, seed, outcome, days_played, final_cash, net_worth,"
+    " game_over_day, win_condition, legacy_scenarios, peak_heat, likelihood_ratio"
+)
+_INSERT_CAMPAIGN = f"INSERT INTO campaigns ({_CAMPAIGN_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_DAY = f"INSERT INTO campaign_days VALUES (?{', ?' * len(CampaignDay._fields)})"
+
+# One queued campaign: its row values and its (possibly empty) day series
+_QueuedCampaign = Tuple[Tuple[Any, ...], Sequence[CampaignDay]]
+_STOP = None
+
+
+def outcome_label(outcome: CampaignOutcome) -> str:
+    """Returns "won", "lost" or "survived" (reached the day limit)."""
+    if outcome.won:
+        return "won"
+    return "lost" if outcome.game_over_day >= 0 else "survived"
+
+
+def _open_writer_connection(path: str) -> sqlite3.Connection:
+    # Created here, then used only by the writer thread
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL") # A crash may lose the last batches but never corrupts the file
+    return connection
+
+
+def _migrate(connection: sqlite3.Connection) -> None:
+    # Version 1 databases predate importance sampling; their campaigns all had a weight of 1.0
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(campaigns)")}
+    if "likelihood_ratio" not in columns:
+        connection.execute("ALTER TABLE campaigns ADD COLUMN likelihood_ratio REAL NOT NULL DEFAULT 1.0")
+
+
+class ResultsStore:
+    """
+    Writes campaign results to a SQLite database on a background thread.
+
+    Use as a context manager, or call `close` when done. The reading methods
+    flush pending writes first, then read through their own connection.
+
+    Attributes:
+        path (str): Database file.
+        config_hash (str): Hash recorded for campaigns added without one.
+        batch_size (int): Most campaigns inserted per transaction.
+        campaigns_written (int): Campaigns committed so far.
+        last_error (Optional[Exception]): The last write failure, if any.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        config_hash: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        game_configs: Any = narco_configs,
+    ) -> None:
+        self.path: str = path
+        self.config_hash: str = config_hash or config_fingerprint(game_configs)
+        self.batch_size: int = batch_size or getattr(game_configs, "SIMULATION_RESULTS_BATCH_SIZE", 500)
+        self.campaigns_written: int = 0
+        self.last_error: Optional[Exception] = None
+        self._queue: "queue.Queue[Optional[_QueuedCampaign]]" = queue.Queue(
+            queue_size or getattr(game_configs, "SIMULATION_RESULTS_QUEUE_SIZE", 10000)
+        )
+        self._connection = _open_writer_connection(path)
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+            _migrate(self._connection)
+            self._connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._closed: bool = False
+        self._writer = threading.Thread(target=self._run, name="results-writer", daemon=True)
+        self._writer.start()
+
+    def add(
+        self,
+        outcome: CampaignOutcome,
+        days: Sequence[CampaignDay] = (),
+        policy: str = "",
+        config_hash: Optional[str] = None,
+    ) -> None:
+        """
+        Queues a campaign (and its recorded days) for writing.
+
+        Blocks only when the writer is `queue_size` campaigns behind.
+        """
+        if self._closed:
+            raise ValueError("ResultsStore is closed.")
+        row = (
+            config_hash or self.config_hash, policy, outcome.seed, outcome_label(outcome), outcome.days_played,
+            outcome.final_cash, outcome.net_worth, outcome.game_over_day if outcome.game_over_day >= 0 else None,
+            outcome.win_condition, ",".join(outcome.legacy_scenarios), outcome.peak_heat, outcome.likelihood_ratio,
+        )
+        self._queue.put((row, tuple(days)))
+
+    def add_many(self, outcomes: Iterable[CampaignOutcome], policy: str = "", config_hash: Optional[str] = None) -> None:
+        """Queues campaigns without day series, e.g. the results of `CampaignPool.run`."""
+        for outcome in outcomes:
+            self.add(outcome, policy=policy, config_hash=config_hash)
+
+    def flush(self) -> None:
+        """Waits until everything queued so far is committed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Writes everything queued and closes the database."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+        self._connection.close()
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def load_outcomes(self, config_hash: Optional[str] = None, policy: Optional[str] = None) -> List[CampaignOutcome]:
+        """Returns the stored outcomes for a config (this store's by default), in seed order."""
+        self.flush()
+        query = (
+            "SELECT seed, days_played, final_cash, net_worth, game_over_day, outcome, win_condition,"
+            " legacy_scenarios, peak_heat, likelihood_ratio FROM campaigns WHERE config_hash = ?"
+        )
+        params: List[Any] = [config_hash or self.config_hash]
+        if policy is not None:
+            query += " AND policy = ?"
+            params.append(policy)
+        with closing(sqlite3.connect(self.path)) as reader:
+            rows = reader.execute(query + " ORDER BY seed, id", params).fetchall()
+        return [
+            CampaignOutcome(
+                seed=seed, days_played=days_played, final_cash=final_cash, net_worth=net_worth,
+                game_over_day=-1 if game_over_day is None else game_over_day, won=outcome == "won",
+                win_condition=win_condition,
+                legacy_scenarios=tuple(name for name in LEGACY_SCENARIO_NAMES if name in legacy.split(",")),
+                peak_heat=peak_heat, likelihood_ratio=likelihood_ratio,
+            )
+            for (
+                seed, days_played, final_cash, net_worth, game_over_day, outcome, win_condition, legacy, peak_heat,
+                likelihood_ratio,
+            ) in rows
+        ]
+
+    def load_days(self, seed: int, config_hash: Optional[str] = None) -> List[CampaignDay]:
+        """Returns the recorded days of the most recent stored campaign with this seed."""
+        self.flush()
+        with closing(sqlite3.connect(self.path)) as reader:
+            rows = reader.execute(
+                "SELECT * FROM campaign_days WHERE campaign_id = ("
+                " SELECT MAX(id) FROM campaigns WHERE config_hash = ? AND seed = ?) ORDER BY day",
+                (config_hash or self.config_hash, seed),
+            ).fetchall()
+        return [
+            CampaignDay(*row[1:])._replace(blocking_event=bool(row[11]), game_over=bool(row[12]))
+            for row in rows
+        ]
+
+    def _run(self) -> None:
+        while True:
+            batch: List[_QueuedCampaign] = []
+            item = self._queue.get()
+            stopping = item is _STOP
+            if not stopping:
+                batch.append(item)
+            while len(batch) < self.batch_size and not stopping:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+            try:
+                if batch:
+                    self._write_batch(batch)
+            except Exception as e: # The writer must keep draining, or flush() would wait forever
+                self.last_error = e
+                logger.error("Writing %d simulated campaigns to %s failed: %s", len(batch), self.path, e)
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self._queue.task_done()
+            if stopping:
+                return
+
+    def _write_batch(self, batch: List[_QueuedCampaign]) -> None:
+        with self._connection: # One transaction per batch
+            cursor = self._connection.cursor()
+            for row, days in batch:
+                cursor.execute(_INSERT_CAMPAIGN, row)
+                if days:
+                    campaign_id = cursor.lastrowid
+                    cursor.executemany(_INSERT_DAY, ((campaign_id, *day) for day in days))
+        self.campaigns_written += len(batch)
@@ -0,0 +1,184 @@
+"""
+Parameter sweeps over `narco_configs` for balancing.
+
+A sweep point is a dict of config overrides, e.g.
+`{"MUGGING_EVENT_CHANCE": 0.05, "DEBT_PAYMENT_1_AMOUNT": 20000.0}`;
+`parameter_grid` builds every combination of a few value ranges. Each point
+is scored by playing a batch of seeded campaigns on a `CampaignPool` and
+applying an objective to the batch's `OutcomeAggregate`. Every point plays
+the same seeds, so differences between points come from the parameters and
+not from luck.
+
+`ParameterSweep.run` uses successive halving: every point plays a small
+batch, the best `1/eta` of them play `eta` times as many campaigns, and so
+on until one point is left (or `max_rounds` is reached). Clearly bad points
+stop costing anything after the first round. A round only plays the seeds a
+point has not played yet; its earlier batches are merged in.
+
+Batches are cached by `ResultCacheKey` (config hash, policy, engine,
+campaign length, seed range and random-number mode), so a point shared by two sweeps, or a
+second run of the same sweep, is not played again. With
+SIMULATION_RESULT_CACHE_DIR set, the cache is on disk and outlives the
+process (see `result_cache`).
+"""
+
+import itertools
+import math
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from .. import narco_configs
+from ..utils.engine_fingerprint import engine_fingerprint
+from .aggregation import OutcomeAggregate
+from .campaign import ConfigOverrides, Policy, config_fingerprint
+from .result_cache import DiskResultCache, MemoryResultCache, ResultCacheKey
+from .worker_pool import CampaignPool
+
+#: Scores a point from its campaigns; higher is better.
+Objective = Callable[[OutcomeAggregate], float]
+
+ResultCache = Union[MemoryResultCache, DiskResultCache]
+
+
+class SweepResult(NamedTuple):
+    """
+    How one sweep point scored.
+
+    Attributes:
+        overrides: The point's config overrides.
+        config_hash: `config_fingerprint` of the effective config.
+        aggregate: Outcomes of every campaign the point played.
+        score: Objective value of `aggregate`.
+        rounds: Successive-halving rounds the point took part in.
+    """
+
+    overrides: ConfigOverrides
+    config_hash: str
+    aggregate: OutcomeAggregate
+    score: float
+    rounds: int
+
+
+def parameter_grid(ranges: Dict[str, Sequence[Any]]) -> List[ConfigOverrides]:
+    """Returns one override dict per combination of the given values."""
+    names = list(ranges)
+    return [dict(zip(names, values)) for values in itertools.product(*(ranges[name] for name in names))]
+
+
+def policy_identity(policy: Policy) -> str:
+    """
+    Names a module-level policy function and its version, e.g.
+    "src.simulation.campaign.greedy_trader_policy@1". The version is the
+    function's `policy_version` attribute (1 if unset).
+    """
+    return f"{policy.__module__}.{policy.__qualname__}@{getattr(policy, 'policy_version', 1)}"
+
+
+def default_result_cache(game_configs: Any = narco_configs) -> ResultCache:
+    """Returns a disk cache under SIMULATION_RESULT_CACHE_DIR if it is set, else an in-memory cache."""
+    directory = getattr(game_configs, "SIMULATION_RESULT_CACHE_DIR", None)
+    return DiskResultCache(directory, game_configs=game_configs) if directory else MemoryResultCache()
+
+
+def survival_rate_objective(target: Optional[float] = None, game_configs: Any = narco_configs) -> Objective:
+    """
+    Returns an objective preferring points whose share of campaigns that are
+    not lost is closest to `target` (SIMULATION_SWEEP_TARGET_SURVIVAL_RATE by default).
+    """
+    target = game_configs.SIMULATION_SWEEP_TARGET_SURVIVAL_RATE if target is None else target
+
+    def objective(aggregate: OutcomeAggregate) -> float:
+        return -abs((1.0 - aggregate.game_over_rate) - target)
+    return objective
+
+
+class ParameterSweep:
+    """
+    Scores config override points by successive halving on a campaign pool.
+
+    Attributes:
+        pool (CampaignPool): Pool the campaigns are played on; its policy and
+            campaign length apply to every point.
+        objective (Objective): Scores a point's aggregate; higher is better.
+        cache (ResultCache): Batch aggregates by `ResultCacheKey`.
+        initial_seeds (int): Campaigns per point in the first round.
+        eta (int): Each round keeps the best `1/eta` of the points and plays
+            `eta` times as many campaigns with them.
+        first_seed (int): Seed of the first campaign of every point.
+    """
+
+    def __init__(
+        self,
+        pool: CampaignPool,
+        objective: Optional[Objective] = None,
+        cache: Optional[ResultCache] = None,
+        initial_seeds: Optional[int] = None,
+        eta: Optional[int] = None,
+        first_seed: int = 0,
+        game_configs: Any = narco_configs,
+    ) -> None:
+        self.pool: CampaignPool = pool
+        self.objective: Objective = objective or survival_rate_objective(game_configs=game_configs)
+        self.cache: ResultCache = cache if cache is not None else default_result_cache(game_configs)
+        self.initial_seeds: int = initial_seeds or game_configs.SIMULATION_SWEEP_INITIAL_SEEDS
+        self.eta: int = eta or game_configs.SIMULATION_SWEEP_ETA
+        if self.eta < 2:
+            raise ValueError("eta must be at least 2.")
+        self.first_seed: int = first_seed
+        self._game_configs = game_configs
+
+    def _cache_key(self, config_hash: str, seeds: range) -> ResultCacheKey:
+        return ResultCacheKey(
+            config_hash, policy_identity(self.pool.policy), engine_fingerprint(), self.pool.max_days,
+            seeds.start, seeds.stop, self.pool.common_random_numbers,
+        )
+
+    def evaluate(self, points: Sequence[ConfigOverrides], seeds: range) -> List[OutcomeAggregate]:
+        """Returns each point's aggregate over `seeds`, playing only batches that are not cached."""
+        keys = [self._cache_key(config_fingerprint(self._game_configs, point), seeds) for point in points]
+        found: Dict[ResultCacheKey, Optional[OutcomeAggregate]] = {}
+        for key in keys:
+            if key not in found:
+                found[key] = self.cache.get(key)
+        missing = {key: point for key, point in zip(keys, points) if found[key] is None}
+        computed = self.pool.aggregate_many([(seeds, point) for point in missing.values()]) if missing else []
+        for key, aggregate in zip(missing, computed):
+            self.cache.put(key, aggregate)
+            found[key] = aggregate
+        self.cache.flush() # Records the hits' use once per evaluation
+        return [found[key] for key in keys]
+
+    def _round_seeds(self, round_number: int) -> range:
+        """The seeds a point plays in a round, on top of those of earlier rounds."""
+        start = 0 if round_number == 0 else self.initial_seeds * self.eta ** (round_number - 1)
+        return range(self.first_seed + start, self.first_seed + self.initial_seeds * self.eta ** round_number)
+
+    def run(self, points: Sequence[ConfigOverrides], max_rounds: Optional[int] = None) -> List[SweepResult]:
+        """
+        Runs successive halving over the points.
+
+        Returns:
+            List[SweepResult]: One result per point, best first: points that
+            survived more rounds rank above those dropped earlier, then by score.
+        """
+        if not points:
+            return []
+        hashes = [config_fingerprint(self._game_configs, point) for point in points]
+        totals = [OutcomeAggregate(self.pool.max_days, self._game_configs) for _ in points]
+        rounds = [0] * len(points)
+        scores = [-math.inf] * len(points)
+        survivors = list(range(len(points)))
+        round_number = 0
+        while True:
+            batches = self.evaluate([points[i] for i in survivors], self._round_seeds(round_number))
+            for i, batch in zip(survivors, batches):
+                totals[i].merge(batch)
+                rounds[i] += 1
+                scores[i] = self.objective(totals[i])
+            round_number += 1
+            if len(survivors) == 1 or (max_rounds is not None and round_number >= max_rounds):
+                break
+            survivors.sort(key=lambda i: scores[i], reverse=True)
+            survivors = survivors[:max(1, math.ceil(len(survivors) / self.eta))]
+
+        results = [SweepResult(points[i], hashes[i], totals[i], scores[i], rounds[i]) for i in range(len(points))]
+        return sorted(results, key=lambda result: (result.rounds, result.score), reverse=True)
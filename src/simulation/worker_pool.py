@@ -0,0 +1,236 @@
+"""
+Runs batches of headless campaigns on a pool of worker processes.
+
+Workers are forked from a fork server that has already imported the game and
+built the config-derived data every campaign shares (see `worker_preload`).
+Those pages are shared copy-on-write, so memory grows with the campaigns
+being played rather than with the number of workers. Nothing from the game is
+pickled to the workers: a task is just a shared memory block name, a row
+number, a few seeds and the policy, which is pickled by name.
+
+Results do not come back as pickled objects either. Each batch gets one
+`multiprocessing.shared_memory` block holding a fixed-size row of floats per
+campaign (`CampaignOutcome.to_row`), and each worker writes its rows in
+place. The parent decodes the rows once the batch is done.
+
+For batches too large to keep a row per campaign, `CampaignPool.aggregate`
+has each task fold its campaigns into an `OutcomeAggregate` and return only
+that; the parent merges them as they arrive. Seeds are read lazily and only a
+bounded number of tasks is in flight at a time, the next one queued as each
+result arrives, so memory stays constant in the number of campaigns. `aggregate_many` does the same for several batches at
+once, e.g. one per point of a parameter sweep, so small batches still keep
+every worker busy.
+
+Every batch can carry config overrides, a small dict the worker applies with
+`config_overrides` around its chunk.
+"""
+
+import importlib
+import itertools
+import multiprocessing
+import os
+import queue
+import struct
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .. import narco_configs
+from .aggregation import OutcomeAggregate
+from .campaign import (
+    ROW_FORMAT, ROW_SIZE, CampaignOutcome, ConfigOverrides, Policy, config_overrides, greedy_trader_policy, run_campaign,
+)
+
+PRELOAD_MODULE = f"{__package__}.worker_preload"
+
+_ChunkTask = Tuple[str, int, List[int], int, Policy, Optional[ConfigOverrides], bool, Optional[Dict[str, float]]]
+_AggregateTask = Tuple[int, Sequence[int], int, Policy, Optional[ConfigOverrides], bool]
+
+#: One batch for `CampaignPool.aggregate_many`: its seeds and config overrides.
+AggregateJob = Tuple[Iterable[int], Optional[ConfigOverrides]]
+
+TASKS_IN_FLIGHT_PER_WORKER = 4 # Bounds how many aggregate tasks are queued ahead of the workers
+
+# Shared memory blocks this worker has attached to, by name. Only the current batch's is kept open.
+_attached_blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _init_worker() -> None:
+    # Already imported when forked from the fork server; builds the shared data for spawned workers.
+    importlib.import_module(PRELOAD_MODULE)
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    block = _attached_blocks.get(name)
+    if block is None:
+        for stale_block in _attached_blocks.values():
+            stale_block.close()
+        _attached_blocks.clear()
+        block = shared_memory.SharedMemory(name=name)
+        _attached_blocks[name] = block
+    return block
+
+
+def _run_chunk(task: _ChunkTask) -> int:
+    """Plays a chunk of campaigns and writes their rows into the batch's shared block."""
+    block_name, first_row, seeds, max_days, policy, overrides, common_random_numbers, biased_chances = task
+    block = _attach_block(block_name)
+    with config_overrides(overrides):
+        for row, seed in enumerate(seeds, first_row):
+            outcome = run_campaign(
+                seed, max_days, policy, common_random_numbers=common_random_numbers, biased_chances=biased_chances
+            )
+            struct.pack_into(ROW_FORMAT, block.buf, row * ROW_SIZE, *outcome.to_row())
+    return len(seeds)
+
+
+def _aggregate_chunk(task: _AggregateTask) -> Tuple[int, OutcomeAggregate]:
+    """Plays a chunk of campaigns and returns only their aggregate, tagged with its job's index."""
+    job_index, seeds, max_days, policy, overrides, common_random_numbers = task
+    aggregate = OutcomeAggregate(max_days)
+    with config_overrides(overrides):
+        for seed in seeds:
+            aggregate.add(run_campaign(seed, max_days, policy, common_random_numbers=common_random_numbers))
+    return job_index, aggregate
+
+
+def _seed_chunks(seeds: Iterable[int], chunk_size: int) -> Iterator[Sequence[int]]:
+    if isinstance(seeds, range): # Slices of a range are ranges: nothing is materialized
+        for start in range(0, len(seeds), chunk_size):
+            yield seeds[start:start + chunk_size]
+        return
+    iterator = iter(seeds)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def default_start_method() -> str:
+    """Returns "forkserver" where the platform supports it, else "spawn"."""
+    return "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class CampaignPool:
+    """
+    A pool of worker processes playing headless campaigns.
+
+    Use as a context manager, or call `close` when done.
+
+    Attributes:
+        processes (int): Number of worker processes.
+        max_days (int): Campaign length passed to `run_campaign`.
+        policy (Policy): Module-level policy function the campaigns are played with.
+        chunk_size (int): Campaigns per task sent to a worker.
+        start_method (str): multiprocessing start method used for the workers.
+        common_random_numbers (bool): Whether campaigns draw from per-decision-site
+            substreams (see `run_campaign`), for paired comparisons of config variants.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        max_days: Optional[int] = None,
+        policy: Policy = greedy_trader_policy,
+        chunk_size: Optional[int] = None,
+        start_method: Optional[str] = None,
+        game_configs: Any = narco_configs,
+        common_random_numbers: bool = False,
+    ) -> None:
+        self.processes: int = (
+            processes or getattr(game_configs, "SIMULATION_WORKER_PROCESSES", None) or os.cpu_count() or 1
+        )
+        # Resolved here so an override of SIMULATION_MAX_DAYS cannot split a batch's histogram bins
+        self.max_days: int = game_configs.SIMULATION_MAX_DAYS if max_days is None else max_days
+        self.policy: Policy = policy
+        self.chunk_size: int = chunk_size or getattr(game_configs, "SIMULATION_CHUNK_SIZE", 16)
+        self.start_method: str = start_method or default_start_method()
+        self.common_random_numbers: bool = common_random_numbers
+        context = multiprocessing.get_context(self.start_method)
+        if self.start_method == "forkserver":
+            context.set_forkserver_preload([PRELOAD_MODULE])
+        self._pool = context.Pool(self.processes, initializer=_init_worker)
+
+    def run(
+        self,
+        seeds: Iterable[int],
+        overrides: Optional[ConfigOverrides] = None,
+        biased_chances: Optional[Dict[str, float]] = None,
+    ) -> List[CampaignOutcome]:
+        """
+        Plays one campaign per seed and returns the outcomes in seed order.
+
+        With `biased_chances`, the campaigns are importance sampled and each
+        outcome carries its `likelihood_ratio` (see `rare_events`).
+        """
+        seeds = list(seeds)
+        if not seeds:
+            return []
+        block = shared_memory.SharedMemory(create=True, size=len(seeds) * ROW_SIZE)
+        try:
+            tasks: List[_ChunkTask] = [
+                (
+                    block.name, start, seeds[start:start + self.chunk_size], self.max_days, self.policy, overrides,
+                    self.common_random_numbers, biased_chances,
+                )
+                for start in range(0, len(seeds), self.chunk_size)
+            ]
+            for _ in self._pool.imap_unordered(_run_chunk, tasks):
+                pass
+            rows = bytes(block.buf[:len(seeds) * ROW_SIZE])
+        finally:
+            block.close()
+            block.unlink()
+        return [CampaignOutcome.from_row(row) for row in struct.iter_unpack(ROW_FORMAT, rows)]
+
+    def aggregate(self, seeds: Iterable[int], overrides: Optional[ConfigOverrides] = None) -> OutcomeAggregate:
+        """
+        Plays one campaign per seed and returns their aggregate.
+
+        Memory use does not grow with the number of seeds: seeds are read
+        lazily (pass a `range` for very large batches), at most a few tasks
+        per worker are queued at once, and each task returns a constant-size
+        aggregate that is merged as it arrives.
+        """
+        return self.aggregate_many([(seeds, overrides)])[0]
+
+    def aggregate_many(self, jobs: Sequence[AggregateJob]) -> List[OutcomeAggregate]:
+        """Runs several batches on the pool together and returns their aggregates in job order."""
+        totals = [OutcomeAggregate(self.max_days) for _ in jobs]
+        tasks = (
+            (job_index, chunk, self.max_days, self.policy, overrides, self.common_random_numbers)
+            for job_index, (seeds, overrides) in enumerate(jobs)
+            for chunk in _seed_chunks(seeds, self.chunk_size)
+        )
+        # Keep a fixed number of tasks in flight, queueing the next one as each result arrives,
+        # so no worker idles behind the slowest chunk of a window
+        finished: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        in_flight = 0
+        for task in itertools.islice(tasks, self.processes * TASKS_IN_FLIGHT_PER_WORKER):
+            self._pool.apply_async(_aggregate_chunk, (task,), callback=finished.put, error_callback=finished.put)
+            in_flight += 1
+        while in_flight:
+            result = finished.get()
+            in_flight -= 1
+            if isinstance(result, BaseException):
+                raise result
+            job_index, partial = result
+            totals[job_index].merge(partial)
+            task = next(tasks, None)
+            if task is not None:
+                self._pool.apply_async(_aggregate_chunk, (task,), callback=finished.put, error_callback=finished.put)
+                in_flight += 1
+        return totals
+
+    def close(self) -> None:
+        """Stops the workers after their current tasks."""
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self) -> "CampaignPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if exc_info[0] is not None:
+            self._pool.terminate()
+        self.close()
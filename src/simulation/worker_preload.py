@@ -0,0 +1,27 @@
+"""
+Shared setup for campaign worker processes.
+
+`CampaignPool` has its fork server import this module once. Importing it
+builds everything campaigns derive from `narco_configs`: the compiled world
+template, the drug base prices used for net worth, and a warm-up campaign
+that loads every lazily imported module and cache. It then calls
+`gc.freeze()`, which moves all of that to the permanent generation. Workers
+forked from the server share those pages copy-on-write, and because their
+garbage collector never visits frozen objects, it does not dirty the pages.
+
+When workers are spawned instead of forked, each worker imports this module
+itself. The results are identical; only the memory sharing is lost.
+"""
+
+import gc
+
+from .. import narco_configs
+from ..core.world_template import WorldTemplate, get_world_template
+from ..mechanics.net_worth import get_drug_base_prices
+from .campaign import run_campaign
+
+WORLD_TEMPLATE: WorldTemplate = get_world_template(narco_configs)
+DRUG_BASE_PRICES = get_drug_base_prices(narco_configs)
+
+run_campaign(0, max_days=1)
+gc.freeze()
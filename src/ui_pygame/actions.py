@@ -524,10 +524,7 @@ def action_travel_to_region(
         laundered_coin_to_use = getattr(
             player_inv, "laundered_crypto_type", default_laundered_coin
         )
-        player_inv.crypto_wallet[laundered_coin_to_use] = (
-            player_inv.crypto_wallet.get(laundered_coin_to_use, 0.0)
-            + player_inv.pending_laundered_sc
-        )
+        player_inv.add_crypto(laundered_coin_to_use, player_inv.pending_laundered_sc)
         player_inv.pending_laundered_sc = 0.0
         player_inv.pending_laundered_sc_arrival_day = None
 
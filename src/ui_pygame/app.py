@@ -5,9 +5,14 @@ It includes functions for managing game state, handling user input,
 and rendering the user interface.
 """
 
+import os
+import pickle
 import pygame
 import sys
 from src.utils.logger import get_logger
+from src.utils.autosave import AutosaveService
+from src.utils.save_files import load_save_file
+from src.utils.session_recording import ReplayContext, SessionRecorder, recorded_action, set_active_recorder
 from .ui_manager import UIManager
 import functools  # For partial functions
 import random  # For police stop simulation
@@ -28,7 +33,7 @@ from ..core.region import Region
 from ..core.market_event import MarketEvent  # Added for isinstance checks
 from ..game_state import GameState  # Added GameState import
 from ..mechanics import market_impact, event_manager
-from ..mechanics.encounter_mechanics import calculate_police_encounter_chance # Import new function
+from ..mechanics.encounter_mechanics import resolve_police_stop
 from src import narco_configs as game_configs_module # To access game_configs directly for MUGGING_EVENT_CHANCE
 
 from .ui_theme import (
@@ -73,6 +78,7 @@ from .ui_hud import (
     show_event_message as show_event_message_external,
     update_hud_timers as update_hud_timers_external,
     add_message_to_log,
+    scroll_log,
 )
 from .views.main_menu_view import draw_main_menu as draw_main_menu_external
 from .views.market_view import (
@@ -90,6 +96,7 @@ from .views.blocking_event_popup_view import (
     draw_blocking_event_popup as draw_blocking_event_popup_external,
 )
 from .views.game_over_view import draw_game_over_view as draw_game_over_view_external
+from .views.load_game_view import draw_load_game_view as draw_load_game_view_external
 from .views.informant_view import draw_informant_view as draw_informant_view_external
 from .views.generic_contact_view import draw_generic_contact_view as draw_generic_contact_view_external # Import new view
 from . import constants as UI_CONSTANTS 
@@ -107,58 +114,100 @@ game_state_data_cache: Optional[GameState] = None
 game_configs_data_cache: Optional[Any] = None
 player_inventory_cache: Optional[PlayerInventory] = None
 ui_manager: Optional[UIManager] = None
+autosave_service: Optional[AutosaveService] = None
 
-from ..mechanics.daily_updates import perform_daily_updates as perform_daily_updates_mechanics, DailyUpdateResult
-from ..mechanics.win_conditions import WIN_CONDITION_CHECKS
-from ..mechanics.legacy_scenarios import LEGACY_SCENARIO_CHECKS, apply_legacy_scenario_bonus
+from ..mechanics.daily_updates import perform_daily_updates as perform_daily_updates_mechanics, DailyUpdateResult, schedule_laundering_arrival
+from ..mechanics.win_conditions import create_win_condition_engine
+from ..mechanics.legacy_scenarios import create_legacy_scenario_engine, apply_legacy_scenario_bonus
 
+# Re-evaluate win/legacy checks only when the state they depend on changes
+win_condition_engine = create_win_condition_engine()
+legacy_scenario_engine = create_legacy_scenario_engine()
 
+
+@recorded_action("open_main_menu")
 def action_open_main_menu() -> None:
     ui_manager.current_view = "main_menu"
 
+@recorded_action("open_market")
 def action_open_market() -> None:
     ui_manager.current_view = "market"
 
+@recorded_action("open_inventory")
 def action_open_inventory() -> None:
     ui_manager.current_view = "inventory"
 
+@recorded_action("open_travel")
 def action_open_travel() -> None:
     ui_manager.current_view = "travel"
 
+@recorded_action("open_tech_contact")
 def action_open_tech_contact() -> None:
     ui_manager.current_view = "tech_contact"
 
+@recorded_action("open_skills")
 def action_open_skills() -> None:
     ui_manager.current_view = "skills"
 
+@recorded_action("open_upgrades")
 def action_open_upgrades() -> None:
     ui_manager.current_view = "upgrades"
 
+@recorded_action("open_informant")
 def action_open_informant() -> None:
     ui_manager.current_view = "informant"
 
+@recorded_action("meet_corrupt_official")
 def action_meet_corrupt_official() -> None:
     add_message_to_log("Attempting to meet Corrupt Official.")
     ui_manager.current_view = "corrupt_official_contact"
 
+@recorded_action("meet_forger")
 def action_meet_forger() -> None:
     add_message_to_log("Attempting to meet The Forger.")
     ui_manager.current_view = "forger_contact"
 
+@recorded_action("meet_logistics_expert")
 def action_meet_logistics_expert() -> None:
     add_message_to_log("Attempting to meet Logistics Expert.")
     ui_manager.current_view = "logistics_expert_contact"
 
+# Loading replaces the session, so the load menu actions are never recorded
+def action_open_load_game() -> None:
+    ui_manager.saved_games = ui_manager.save_index.load()
+    ui_manager.load_game_page = 0
+    ui_manager.current_view = "load_game"
+
+def action_change_load_game_page(delta: int) -> None:
+    ui_manager.load_game_page += delta
+    ui_manager.setup_buttons_for_current_view() # Same view, new page of buttons
+
+def action_load_saved_game(file_name: str) -> None:
+    path = os.path.join(ui_manager.save_index.save_directory, file_name)
+    try:
+        loaded_inventory, loaded_state = load_save_file(path)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError) as e:
+        logger.error(f"Could not load save {path!r}: {e}")
+        ui_manager.set_active_prompt_message(f"Error: could not load {file_name}.")
+        return
+    set_active_recorder(None) # A recording cannot span a load
+    start_session(loaded_inventory, loaded_state.current_player_region, loaded_state, game_configs_data_cache)
+    add_message_to_log(f"Loaded {file_name} (day {loaded_state.current_day}).")
+
+@recorded_action("close_blocking_event_popup")
 def action_close_blocking_event_popup() -> None:
     ui_manager.active_blocking_event_data = None
     ui_manager.current_view = "main_menu"
 
 def action_exit_game() -> None:
+    if autosave_service is not None:
+        autosave_service.close() # Finish the last autosave before exiting
     pygame.quit()
     sys.exit()
 
 
 # --- Quest Specific Actions ---
+@recorded_action("accept_quest")
 def action_accept_quest(quest_id_str: str):
     quest_id = QuestID(quest_id_str) # Convert string back to enum
     if quest_manager.accept_quest(player_inventory_cache, game_state_data_cache, quest_id):
@@ -170,6 +219,7 @@ def action_accept_quest(quest_id_str: str):
         add_message_to_log(f"Failed to accept quest: {quest_id_str}")
     ui_manager.current_view = "main_menu" # Go back to main menu or contact view
 
+@recorded_action("decline_quest")
 def action_decline_quest(quest_id_str: str):
     quest_id = QuestID(quest_id_str)
     quest_manager.decline_quest(player_inventory_cache, game_state_data_cache, quest_id)
@@ -178,6 +228,7 @@ def action_decline_quest(quest_id_str: str):
     add_message_to_log(f"Quest Declined: {quest_def['title']}")
     ui_manager.current_view = "main_menu"
 
+@recorded_action("complete_quest_stage")
 def action_complete_quest_stage(quest_id_str: str):
     quest_id = QuestID(quest_id_str)
     messages = quest_manager.complete_quest_stage(player_inventory_cache, game_state_data_cache, quest_id)
@@ -196,6 +247,7 @@ def action_complete_quest_stage(quest_id_str: str):
         ui_manager.current_view = "main_menu"
 
 
+@recorded_action("search_for_supplies")
 def action_search_for_supplies():
     quest_id = QuestID.FORGER_SUPPLY_RUN
     active_quest_data = player_inventory_cache.active_quests.get(quest_id)
@@ -227,6 +279,7 @@ def action_search_for_supplies():
 
 
 # --- Main Game Loop Actions ---
+@recorded_action("resolve_opportunity_event_choice")
 def action_resolve_opportunity_event_choice(choice_index: int):
     """Resolves the player's choice for an opportunity event."""
     event_data = ui_manager.active_blocking_event_data # This holds the opportunity event details
@@ -360,6 +413,7 @@ def action_resolve_opportunity_event_choice(choice_index: int):
     # ui_manager.setup_buttons_for_current_view() # Let main loop handle this due to view change
 
 
+@recorded_action("travel_to_region")
 def action_travel_to_region(
     destination_region: Region,
     player_inv_arg: PlayerInventory, 
@@ -375,6 +429,7 @@ def action_travel_to_region(
     game_state_data_cache.current_day += 1
     add_message_to_log(f"Advanced day to {game_state_data_cache.current_day}.")
 
+    journal_records_before: int = game_state_data_cache.event_journal.total_records
     daily_result: DailyUpdateResult = perform_daily_updates_mechanics(
         game_state_data_cache,
         player_inventory_cache,
@@ -385,7 +440,29 @@ def action_travel_to_region(
         show_event_message_external(msg)
     for msg in daily_result.log_messages:
         add_message_to_log(msg)
+    # Market events that ran out today are only journaled; their text is built here, for the log
+    new_journal_records: int = game_state_data_cache.event_journal.total_records - journal_records_before
+    for record in game_state_data_cache.event_journal.recent(new_journal_records):
+        add_message_to_log(event_manager.format_journal_record(record))
+
+    # Apply the day's state changes before the arrival is resolved, so the autosave below sees them
+    if daily_result.pending_laundered_sc_processed:
+        player_inventory_cache.pending_laundered_sc = daily_result.new_pending_laundered_sc
+        player_inventory_cache.pending_laundered_sc_arrival_day = daily_result.new_pending_laundered_sc_arrival_day
+
+    if daily_result.informant_unavailable_until_day is not None:
+        game_state_data_cache.informant_unavailable_until_day = daily_result.informant_unavailable_until_day
+
+    _resolve_travel_arrival(destination_region, daily_result)
+
+    # Save only once the whole arrival is applied (bonuses, the police stop), so reloading cannot undo it
+    game_lost = ui_manager.game_over_message is not None and not game_state_data_cache.game_won
+    if autosave_service is not None and not game_lost:
+        autosave_service.request_save(player_inventory_cache, game_state_data_cache)
+
 
+def _resolve_travel_arrival(destination_region: Region, daily_result: DailyUpdateResult) -> None:
+    """Plays out an arrival after the daily update: its popups, win and legacy checks, then the police stop."""
     if daily_result.game_over_message and not ui_manager.game_over_message:
         ui_manager.game_over_message = daily_result.game_over_message
         ui_manager.current_view = "game_over"
@@ -396,19 +473,13 @@ def action_travel_to_region(
         ui_manager.current_view = "blocking_event_popup"
         return
 
-    if daily_result.pending_laundered_sc_processed:
-        player_inventory_cache.pending_laundered_sc = daily_result.new_pending_laundered_sc
-        player_inventory_cache.pending_laundered_sc_arrival_day = daily_result.new_pending_laundered_sc_arrival_day
-
-    if daily_result.informant_unavailable_until_day is not None:
-        game_state_data_cache.informant_unavailable_until_day = daily_result.informant_unavailable_until_day
-
     if ui_manager.game_over_message or ui_manager.active_blocking_event_data:
         return
 
     if not game_state_data_cache.game_won:
-        for condition_name, check_function in WIN_CONDITION_CHECKS.items():
-            if check_function(player_inventory_cache, game_state_data_cache, game_configs_data_cache):
+        win_results = win_condition_engine.evaluate(player_inventory_cache, game_state_data_cache, game_configs_data_cache)
+        for condition_name, condition_met in win_results.items():
+            if condition_met:
                 game_state_data_cache.game_won = True
                 game_state_data_cache.win_condition_achieved = condition_name
                 ui_manager.game_over_message = f"YOU WON: {condition_name}!"
@@ -416,118 +487,103 @@ def action_travel_to_region(
                 return 
     
     if not game_state_data_cache.game_won:
-        for scenario_name_key, scenario_check_func in LEGACY_SCENARIO_CHECKS.items():
-            if scenario_name_key not in game_state_data_cache.achieved_legacy_scenarios:
-                achieved_scenario_name = scenario_check_func(player_inventory_cache, game_state_data_cache, game_configs_data_cache)
-                if achieved_scenario_name:
-                    bonus_messages = apply_legacy_scenario_bonus(
-                        achieved_scenario_name, 
-                        player_inventory_cache, 
-                        game_state_data_cache, 
-                        game_configs_data_cache
-                    )
-                    for msg in bonus_messages:
-                        show_event_message_external(msg)
-                        add_message_to_log(msg)
+        scenario_results = legacy_scenario_engine.evaluate(player_inventory_cache, game_state_data_cache, game_configs_data_cache)
+        for scenario_name_key, achieved_scenario_name in scenario_results.items():
+            if achieved_scenario_name and scenario_name_key not in game_state_data_cache.achieved_legacy_scenarios:
+                bonus_messages = apply_legacy_scenario_bonus(
+                    achieved_scenario_name, 
+                    player_inventory_cache, 
+                    game_state_data_cache, 
+                    game_configs_data_cache
+                )
+                for msg in bonus_messages:
+                    show_event_message_external(msg)
+                    add_message_to_log(msg)
 
     if game_state_data_cache.game_won or ui_manager.game_over_message or ui_manager.active_blocking_event_data:
         return
 
     region_heat_val: int = destination_region.current_heat
-    final_police_stop_chance_val = calculate_police_encounter_chance(destination_region, game_configs_data_cache)
+    stop_result = resolve_police_stop(player_inventory_cache, destination_region, game_configs_data_cache)
     add_message_to_log(
-        f"Police stop chance in {destination_region.name.value}: {final_police_stop_chance_val:.2f} (Heat: {region_heat_val})"
+        f"Police stop chance in {destination_region.name.value}: {stop_result['stop_chance']:.2f} (Heat: {region_heat_val})"
     )
-
-    if random.random() < final_police_stop_chance_val:
-        add_message_to_log("Police stop triggered.")
+    stop_key: str = stop_result["message_key"]
+    if stop_key == "no_stop":
         show_event_message_external(
-            f"Arriving in {destination_region.name.value}... flashing lights!"
+            f"Arrived safely in {destination_region.name.value}."
         )
-        stop_type_val: float = random.random()
-        if stop_type_val < game_configs_data_cache.POLICE_STOP_SEVERITY_THRESHOLD_WARNING:
+        add_message_to_log(f"Arrived safely in {destination_region.name.value}.")
+        ui_manager.current_view = "main_menu"
+        return
+
+    add_message_to_log("Police stop triggered.")
+    show_event_message_external(
+        f"Arriving in {destination_region.name.value}... flashing lights!"
+    )
+    if stop_key == "stop_warning":
+        ui_manager.active_blocking_event_data = {
+            "title": "Police Stop!",
+            "messages": [
+                f"Pulled over by {destination_region.name.value} PD.",
+                "They give you a stern look and a warning.",
+            ],
+            "button_text": "Continue",
+        }
+        add_message_to_log("Police stop: Warning.")
+    elif stop_key == "stop_fine":
+        fine_val: float = stop_result["fine_paid"]
+        ui_manager.active_blocking_event_data = {
+            "title": "Police Stop - Fine!",
+            "messages": [
+                "Police stop for 'random' check.",
+                f"Minor infraction. Fined ${fine_val:,.0f}.",
+            ],
+            "button_text": "Pay Fine",
+        }
+        show_event_message_external(f"Paid fine of ${fine_val:,.0f}.")
+        add_message_to_log(
+            f"Police stop: Fined ${fine_val:,.0f}. Cash remaining: ${player_inventory_cache.cash:.2f}"
+        )
+        if player_inventory_cache.cash < game_configs_data_cache.BANKRUPTCY_THRESHOLD:
+            ui_manager.game_over_message = "GAME OVER: A hefty fine bankrupted you!"
+            add_message_to_log(f"{ui_manager.game_over_message} Cash: ${player_inventory_cache.cash:.2f}")
+    else:
+        add_message_to_log(
+            f"Police stop: Searched. Carrying {stop_result['contraband_units']} units of contraband."
+        )
+        if stop_key == "stop_search_confiscated":
             ui_manager.active_blocking_event_data = {
-                "title": "Police Stop!",
-                "messages": [
-                    f"Pulled over by {destination_region.name.value} PD.",
-                    "They give you a stern look and a warning.",
-                ],
-                "button_text": "Continue",
+                "title": "Police Stop - Major Bust!",
+                "messages": ["Police search vehicle!", "All drugs confiscated!"],
+                "button_text": "Damn!",
             }
-            add_message_to_log("Police stop: Warning.")
-        elif stop_type_val < game_configs_data_cache.POLICE_STOP_SEVERITY_THRESHOLD_FINE:
-            fine_val: float = min(
-                player_inventory_cache.cash, 
-                float(
-                    random.randint(game_configs_data_cache.POLICE_FINE_BASE_MIN, game_configs_data_cache.POLICE_FINE_BASE_MAX)
-                    * (1 + destination_region.current_heat // game_configs_data_cache.POLICE_FINE_HEAT_DIVISOR)
-                ),
-            )
-            player_inventory_cache.cash -= fine_val
+            add_message_to_log("Police Stop: Searched, all drugs confiscated.")
+        elif stop_key == "stop_search_missed":
             ui_manager.active_blocking_event_data = {
-                "title": "Police Stop - Fine!",
+                "title": "Police Stop - Searched!",
                 "messages": [
-                    "Police stop for 'random' check.",
-                    f"Minor infraction. Fined ${fine_val:,.0f}.",
+                    "Police search vehicle!",
+                    (
+                        "You had contraband, but they missed it!"
+                        if stop_result["contraband_units"] > game_configs_data_cache.POLICE_STOP_CONTRABAND_THRESHOLD_UNITS
+                        else "Luckily, you were clean enough."
+                    ),
                 ],
-                "button_text": "Pay Fine",
+                "button_text": "Phew!",
             }
-            show_event_message_external(f"Paid fine of ${fine_val:,.0f}.")
-            add_message_to_log(
-                f"Police stop: Fined ${fine_val:,.0f}. Cash remaining: ${player_inventory_cache.cash:.2f}"
-            )
-            if player_inventory_cache.cash < game_configs_data_cache.BANKRUPTCY_THRESHOLD:
-                ui_manager.game_over_message = "GAME OVER: A hefty fine bankrupted you!"
-                add_message_to_log(f"{ui_manager.game_over_message} Cash: ${player_inventory_cache.cash:.2f}")
+            add_message_to_log("Police stop: Searched, no major confiscation.")
         else:
-            total_contraband_units_val: int = sum(
-                qty for qualities in player_inventory_cache.items.values() for qty in qualities.values()
-            )
-            add_message_to_log(
-                f"Police stop: Searched. Carrying {total_contraband_units_val} units of contraband."
-            )
-            if (
-                total_contraband_units_val > game_configs_data_cache.POLICE_STOP_CONTRABAND_THRESHOLD_UNITS
-                and random.random() < game_configs_data_cache.POLICE_STOP_CONFISCATION_CHANCE
-            ):
-                player_inventory_cache.items.clear() 
-                player_inventory_cache.current_load = 0
-                ui_manager.active_blocking_event_data = { 
-                    "title": "Police Stop - Major Bust!",
-                    "messages": ["Police search vehicle!", "All drugs confiscated!"],
-                    "button_text": "Damn!",
-                }
-                add_message_to_log("Police Stop: Searched, all drugs confiscated.")
-            elif total_contraband_units_val > 0:
-                ui_manager.active_blocking_event_data = {
-                    "title": "Police Stop - Searched!",
-                    "messages": [
-                        "Police search vehicle!",
-                        (
-                            "You had contraband, but they missed it!"
-                            if total_contraband_units_val > game_configs_data_cache.POLICE_STOP_CONTRABAND_THRESHOLD_UNITS
-                            else "Luckily, you were clean enough."
-                        ),
-                    ],
-                    "button_text": "Phew!",
-                }
-                add_message_to_log("Police stop: Searched, no major confiscation.")
-            else:
-                ui_manager.active_blocking_event_data = {
-                    "title": "Police Stop - Searched!",
-                    "messages": ["Police search vehicle!", "Luckily, you were clean."],
-                    "button_text": "Phew!",
-                }
-                add_message_to_log("Police stop: Searched, found nothing.")
-        ui_manager.current_view = "blocking_event_popup"
-    else:
-        show_event_message_external(
-            f"Arrived safely in {destination_region.name.value}."
-        )
-        add_message_to_log(f"Arrived safely in {destination_region.name.value}.")
-        ui_manager.current_view = "main_menu"
+            ui_manager.active_blocking_event_data = {
+                "title": "Police Stop - Searched!",
+                "messages": ["Police search vehicle!", "Luckily, you were clean."],
+                "button_text": "Phew!",
+            }
+            add_message_to_log("Police stop: Searched, found nothing.")
+    ui_manager.current_view = "blocking_event_popup"
 
 
+@recorded_action("ask_informant_rumor")
 def action_ask_informant_rumor(
     player_inv_arg: PlayerInventory, game_configs_arg: Any, game_state_instance_arg: GameState
 ) -> None:
@@ -563,6 +619,7 @@ def action_ask_informant_rumor(
         ui_manager.set_active_prompt_message(f"Error: Not enough cash. Need ${cost:.0f}.")
         add_message_to_log(f"Failed to buy rumor: Insufficient cash.")
 
+@recorded_action("ask_informant_rival_status")
 def action_ask_informant_rival_status(
     player_inv_arg: PlayerInventory, game_configs_arg: Any, game_state_instance_arg: GameState
 ) -> None:
@@ -611,6 +668,7 @@ def action_ask_informant_rival_status(
         ui_manager.set_active_prompt_message(f"Error: Not enough cash. Need ${cost:.0f}.")
         add_message_to_log(f"Failed to buy rival info: Insufficient cash.")
 
+@recorded_action("ask_informant_drug_info")
 def action_ask_informant_drug_info( 
     player_inv_arg: PlayerInventory, game_configs_arg: Any, game_state_instance_arg: GameState
 ) -> None:
@@ -644,6 +702,7 @@ def action_ask_informant_drug_info(
         ui_manager.set_active_prompt_message(f"Error: Not enough cash. Need ${cost:.0f}.")
         add_message_to_log(f"Failed to buy drug info: Insufficient cash.")
 
+@recorded_action("confirm_corrupt_official_bribe")
 def action_confirm_corrupt_official_bribe(contact_id: ContactID, service_id: str) -> None:
     if contact_id != ContactID.CORRUPT_OFFICIAL or service_id != "REDUCE_HEAT":
         add_message_to_log(f"Error: Corrupt official action called with wrong ID: {contact_id}/{service_id}")
@@ -698,6 +757,7 @@ def action_confirm_corrupt_official_bribe(contact_id: ContactID, service_id: str
         ui_manager.set_active_prompt_message(msg)
         add_message_to_log(msg)
     
+@recorded_action("initiate_buy")
 def action_initiate_buy(
     drug: DrugName, quality: DrugQuality, price: float, available: int
 ) -> None:
@@ -715,6 +775,7 @@ def action_initiate_buy(
         f"Initiating market transaction: buy {drug.value} ({quality.name}) at ${price:.2f}, {available} available."
     )
 
+@recorded_action("initiate_sell")
 def action_initiate_sell(
     drug: DrugName, quality: DrugQuality, price: float, available: int
 ) -> None:
@@ -732,6 +793,7 @@ def action_initiate_sell(
         f"Initiating market transaction: sell {drug.value} ({quality.name}) at ${price:.2f}, {available} available."
     )
 
+@recorded_action("confirm_transaction")
 def action_confirm_transaction(
     player_inv_arg: PlayerInventory, 
     market_region_arg: Region, 
@@ -778,6 +840,7 @@ def action_confirm_transaction(
                     event_item.black_market_quantity_available = max(
                         0, event_item.black_market_quantity_available - actual_reduction
                     )
+                    market_region.notify_market_events_changed()
                     add_message_to_log(
                         f"Black Market: Purchased {actual_reduction} from event stock. Remaining: {event_item.black_market_quantity_available}."
                     )
@@ -825,6 +888,7 @@ def action_confirm_transaction(
     ui_manager.quantity_input_string = ""
 
 
+@recorded_action("cancel_transaction")
 def action_cancel_transaction() -> None:
     add_message_to_log(
         f"Transaction cancelled. Was type: {ui_manager.current_transaction_type or ui_manager.tech_transaction_in_progress}, View: {ui_manager.current_view}"
@@ -839,6 +903,7 @@ def action_cancel_transaction() -> None:
     ui_manager.tech_transaction_in_progress = None
     ui_manager.active_prompt_message = None
 
+@recorded_action("unlock_skill")
 def action_unlock_skill(
     skill_id: SkillID, player_inv_arg: PlayerInventory, game_configs_arg: Any
 ) -> None:
@@ -881,6 +946,7 @@ def action_unlock_skill(
             f"Skill unlock failed for {skill_id.value}: Need {cost_val}, Has {player_inventory_cache.skill_points}"
         )
 
+@recorded_action("purchase_capacity_upgrade")
 def action_purchase_capacity_upgrade(
     player_inv_arg: PlayerInventory, game_configs_arg: Any
 ) -> None:
@@ -914,6 +980,7 @@ def action_purchase_capacity_upgrade(
             f"Capacity upgrade failed: Need ${cost_val:,.0f}, Has ${player_inventory_cache.cash:,.0f}"
         )
 
+@recorded_action("purchase_secure_phone")
 def action_purchase_secure_phone(
     player_inv_arg: PlayerInventory, game_configs_arg: Any
 ) -> None:
@@ -942,6 +1009,7 @@ def action_purchase_secure_phone(
         )
     ui_manager.current_view = "tech_contact"
 
+@recorded_action("collect_staking_rewards")
 def action_collect_staking_rewards(player_inv_arg: PlayerInventory) -> None:
     rewards_to_collect_val: float = player_inventory_cache.staked_drug_coin.get(
         "pending_rewards", 0.0
@@ -957,6 +1025,7 @@ def action_collect_staking_rewards(player_inv_arg: PlayerInventory) -> None:
         add_message_to_log("Collect staking rewards: No rewards available.")
 
 
+@recorded_action("initiate_tech_operation")
 def action_initiate_tech_operation(operation_type: str) -> None:
     add_message_to_log(f"Initiating tech operation: {operation_type}")
     ui_manager.tech_transaction_in_progress = operation_type
@@ -975,6 +1044,7 @@ def action_initiate_tech_operation(operation_type: str) -> None:
         action_purchase_ghost_network(player_inventory_cache, game_configs_data_cache)
         return
 
+@recorded_action("tech_select_coin")
 def action_tech_select_coin(coin: CryptoCoin) -> None:
     verb: str = (
         ui_manager.tech_transaction_in_progress.split("_")[0]
@@ -987,6 +1057,7 @@ def action_tech_select_coin(coin: CryptoCoin) -> None:
     ui_manager.set_active_prompt_message(f"Enter amount of {coin.value} to {verb}.")
 
 
+@recorded_action("purchase_ghost_network")
 def action_purchase_ghost_network(
     player_inv_arg: PlayerInventory, game_configs_arg: Any
 ) -> None:
@@ -1046,6 +1117,7 @@ def _calculate_tech_heat(player_inv: PlayerInventory, game_configs: Any) -> int:
     return int(round(effective_heat_val))
 
 
+@recorded_action("confirm_tech_operation")
 def action_confirm_tech_operation(
     player_inv_arg: PlayerInventory, game_state_arg: GameState, game_configs_arg: Any 
 ) -> None:
@@ -1140,6 +1212,7 @@ def action_confirm_tech_operation(
             player_inventory_cache.pending_laundered_sc_arrival_day = (
                 game_state_data_cache.current_day + game_configs_data_cache.LAUNDERING_DELAY_DAYS
             )
+            schedule_laundering_arrival(game_state_data_cache, player_inventory_cache.pending_laundered_sc_arrival_day)
             msg_str = f"Laundered ${amount_val:,.2f}. Fee ${fee_val:,.2f}. Arrives day {player_inventory_cache.pending_laundered_sc_arrival_day}. Heat +{launder_heat_val} in {region_name_str_val}."
             effective_heat_val = launder_heat_val
             success_flag = True
@@ -1195,15 +1268,188 @@ def action_confirm_tech_operation(
     # ui_manager.setup_buttons_for_current_view() # Let main loop handle
 
 
+def snapshot_text_inputs() -> Dict[str, str]:
+    """Returns the typed text that confirm actions read, for session recording."""
+    return {
+        "quantity_input_string": ui_manager.quantity_input_string,
+        "tech_input_string": ui_manager.tech_input_string,
+    }
+
+
+def draw_current_view(current_player_region_for_frame: Optional[Region]) -> None:
+    """Draws the active view, popup, HUD and prompt for one frame (without flipping the display)."""
+    screen.fill(RICH_BLACK)
+    if ui_manager.current_view == "game_over":
+        draw_game_over_view_external(
+            screen,
+            ui_manager.game_over_message if ui_manager.game_over_message else "Game Over", 
+            ui_manager.game_over_buttons, 
+        )
+    elif ui_manager.current_view == "main_menu":
+        draw_main_menu_external(screen, ui_manager.main_menu_buttons)
+    elif ui_manager.current_view == "load_game":
+        page_saves, page_count = ui_manager.saved_games_page()
+        draw_load_game_view_external(
+            screen, page_saves, ui_manager.load_game_page, page_count,
+            ui_manager.thumbnail_cache, ui_manager.load_game_view_buttons,
+        )
+    elif ui_manager.current_view == "market" and current_player_region_for_frame:
+        draw_market_view_external(screen, current_player_region_for_frame, player_inventory_cache, ui_manager.market_view_buttons, ui_manager.market_item_buttons, game_state_data_cache)
+    elif ui_manager.current_view == "inventory":
+        draw_inventory_view_external(screen, player_inventory_cache, ui_manager.inventory_view_buttons)
+    elif ui_manager.current_view == "travel" and current_player_region_for_frame:
+        draw_travel_view_external(screen, current_player_region_for_frame, ui_manager.travel_view_buttons)
+    
+    elif ui_manager.current_view == "informant":
+        contact_def = game_configs_data_cache.CONTACT_DEFINITIONS.get(ContactID.INFORMANT)
+        if contact_def: 
+             draw_generic_contact_view_external(
+                screen, ContactID.INFORMANT, contact_def,
+                ui_manager.contact_specific_buttons.get(ContactID.INFORMANT, []),
+                player_inventory_cache.contact_trusts.get(ContactID.INFORMANT, 0)
+            )
+    elif ui_manager.current_view == "tech_contact" or \
+         ui_manager.current_view == "tech_input_coin_select" or \
+         ui_manager.current_view == "tech_input_amount":
+        contact_def = game_configs_data_cache.CONTACT_DEFINITIONS.get(ContactID.TECH_CONTACT)
+        tech_ui_state_dict: Dict[str, Any] = { 
+            "current_view": ui_manager.current_view, 
+            "tech_transaction_in_progress": ui_manager.tech_transaction_in_progress,
+            "coin_for_tech_transaction": ui_manager.coin_for_tech_transaction,
+            "tech_input_string": ui_manager.tech_input_string,
+            "active_prompt_message": ui_manager.active_prompt_message,
+            "prompt_message_timer": ui_manager.prompt_message_timer,
+            "tech_input_box_rect": ui_manager.tech_input_box_rect,
+        }
+        if contact_def: 
+            draw_tech_contact_view_external(screen, player_inventory_cache, game_state_data_cache, game_configs_data_cache, 
+                                            ui_manager.contact_specific_buttons.get(ContactID.TECH_CONTACT, []), tech_ui_state_dict)
+    
+    elif ui_manager.current_view == "skills":
+        draw_skills_view_external(screen, player_inventory_cache, game_state_data_cache, game_configs_data_cache, ui_manager.skills_view_buttons)
+    elif ui_manager.current_view == "upgrades":
+        draw_upgrades_view_external(screen, player_inventory_cache, game_state_data_cache, game_configs_data_cache, ui_manager.upgrades_view_buttons)
+    
+    elif ui_manager.current_view == "corrupt_official_contact": 
+        contact_def = game_configs_data_cache.CONTACT_DEFINITIONS.get(ContactID.CORRUPT_OFFICIAL)
+        if contact_def:
+            draw_generic_contact_view_external(
+                screen, ContactID.CORRUPT_OFFICIAL, contact_def,
+                ui_manager.contact_specific_buttons.get(ContactID.CORRUPT_OFFICIAL, []),
+                player_inventory_cache.contact_trusts.get(ContactID.CORRUPT_OFFICIAL, 0)
+            )
+    elif ui_manager.current_view == "forger_contact":
+        contact_def = game_configs_data_cache.CONTACT_DEFINITIONS.get(ContactID.THE_FORGER)
+        if contact_def:
+            draw_generic_contact_view_external(
+                screen, ContactID.THE_FORGER, contact_def,
+                ui_manager.contact_specific_buttons.get(ContactID.THE_FORGER, []),
+                player_inventory_cache.contact_trusts.get(ContactID.THE_FORGER, 0)
+            )
+    elif ui_manager.current_view == "logistics_expert_contact":
+        contact_def = game_configs_data_cache.CONTACT_DEFINITIONS.get(ContactID.LOGISTICS_EXPERT)
+        if contact_def:
+            draw_generic_contact_view_external(
+                screen, ContactID.LOGISTICS_EXPERT, contact_def,
+                ui_manager.contact_specific_buttons.get(ContactID.LOGISTICS_EXPERT, []),
+                player_inventory_cache.contact_trusts.get(ContactID.LOGISTICS_EXPERT, 0)
+            )
+
+    elif ui_manager.current_view in ["market_buy_input", "market_sell_input"]:
+        transaction_ui_state_dict: Dict[str, Any] = { 
+            "quantity_input_string": ui_manager.quantity_input_string,
+            "drug_for_transaction": ui_manager.drug_for_transaction,
+            "quality_for_transaction": ui_manager.quality_for_transaction,
+            "price_for_transaction": ui_manager.price_for_transaction,
+            "available_for_transaction": ui_manager.available_for_transaction,
+            "current_transaction_type": ui_manager.current_transaction_type,
+            "active_prompt_message": ui_manager.active_prompt_message,
+            "prompt_message_timer": ui_manager.prompt_message_timer,
+            "input_box_rect": ui_manager.input_box_rect,
+        }
+        draw_transaction_input_view_external(
+            screen, ui_manager.transaction_input_buttons, transaction_ui_state_dict
+        )
+
+    if ( 
+        ui_manager.current_view != "game_over"
+        and ui_manager.current_view == "blocking_event_popup"
+        and ui_manager.active_blocking_event_data
+    ):
+        draw_blocking_event_popup_external(
+            screen, ui_manager.active_blocking_event_data, ui_manager.blocking_event_popup_buttons
+        )
+
+    if ( 
+        ui_manager.current_view != "game_over" and current_player_region_for_frame
+    ):
+        draw_hud_external(screen, player_inventory_cache, current_player_region_for_frame, game_state_data_cache)
+
+    if ( 
+        ui_manager.active_prompt_message
+        and ui_manager.prompt_message_timer > 0
+        and ui_manager.current_view not in ["game_over", "blocking_event_popup"]
+    ):
+        is_prompt_handled_local: bool = ( 
+            ui_manager.current_view
+            in ["market_buy_input", "market_sell_input", "tech_input_amount"]
+        ) or ( 
+            ui_manager.current_view == "tech_contact"
+            and locals().get("tech_ui_state_dict", {}).get("active_prompt_message") 
+            and (
+                "Select cryptocurrency"
+                not in locals()
+                .get("tech_ui_state_dict", {})
+                .get("active_prompt_message", "")
+                and "Enter amount"
+                not in locals()
+                .get("tech_ui_state_dict", {})
+                .get("active_prompt_message", "")
+            )
+        )
+        if not is_prompt_handled_local:
+            prompt_y_pos_val: int = UI_CONSTANTS.SCREEN_HEIGHT - UI_CONSTANTS.PROMPT_DEFAULT_Y_OFFSET
+            if ui_manager.current_view == "tech_contact": 
+                prompt_y_pos_val = UI_CONSTANTS.SCREEN_HEIGHT - UI_CONSTANTS.PROMPT_TECH_CONTACT_Y_OFFSET
+            prompt_color_val: Tuple[int, int, int] = (
+                IMPERIAL_RED
+                if any(
+                    err_word in ui_manager.active_prompt_message 
+                    for err_word in ["Error", "Invalid", "Not enough"]
+                )
+                else (
+                    GOLDEN_YELLOW
+                    if "Skill" in ui_manager.active_prompt_message 
+                    else EMERALD_GREEN
+                )
+            )
+            draw_text(
+                screen,
+                ui_manager.active_prompt_message, 
+                UI_CONSTANTS.SCREEN_WIDTH // 2,
+                prompt_y_pos_val,
+                font=FONT_MEDIUM, 
+                color=prompt_color_val,
+                center_aligned=True,
+                max_width=UI_CONSTANTS.SCREEN_WIDTH - (2 * UI_CONSTANTS.LARGE_PADDING), 
+            )
+
+
 # --- Main Game Loop ---
-def game_loop(
+def start_session(
     player_inventory: PlayerInventory,
     initial_current_region: Optional[Region],
     game_state_ext: GameState,
     game_configs_ext: Any,
-) -> None:
-    """The main game loop."""
-    global game_state_data_cache, game_configs_data_cache, player_inventory_cache, ui_manager
+    autosave: bool = True,
+) -> UIManager:
+    """
+    Binds the game objects to the UI and builds the initial view; shared by play and replay.
+
+    Args:
+        autosave: Whether to autosave after each daily update (if AUTOSAVE_ENABLED).
+    """
+    global game_state_data_cache, game_configs_data_cache, player_inventory_cache, ui_manager, autosave_service
 
     game_state_data_cache = game_state_ext
     game_configs_data_cache = game_configs_ext
@@ -1246,6 +1492,11 @@ def game_loop(
         "decline_quest": action_decline_quest,
         "complete_quest_stage": action_complete_quest_stage,
         "search_for_supplies": action_search_for_supplies,
+        "resolve_opportunity_event_choice": action_resolve_opportunity_event_choice,
+        # Save/load actions
+        "open_load_game": action_open_load_game,
+        "change_load_game_page": action_change_load_game_page,
+        "load_saved_game": action_load_saved_game,
         # Add any other specific contact service actions here if they are not generic
     }
     ui_manager = UIManager(game_state_data_cache, player_inventory_cache, game_configs_data_cache, app_actions_map)
@@ -1260,11 +1511,45 @@ def game_loop(
     
     ui_manager.setup_buttons_for_current_view() # Initial setup
 
+    if autosave_service is not None:
+        autosave_service.close()
+        autosave_service = None
+    if autosave and getattr(game_configs_data_cache, "AUTOSAVE_ENABLED", False):
+        autosave_service = AutosaveService(
+            getattr(game_configs_data_cache, "AUTOSAVE_DIRECTORY", "saves"),
+            slot_count=getattr(game_configs_data_cache, "AUTOSAVE_SLOTS", 3),
+            compression_level=getattr(game_configs_data_cache, "AUTOSAVE_COMPRESSION_LEVEL", 6),
+        )
+    return ui_manager
+
+
+def game_loop(
+    player_inventory: PlayerInventory,
+    initial_current_region: Optional[Region],
+    game_state_ext: GameState,
+    game_configs_ext: Any,
+    recorder: Optional[SessionRecorder] = None,
+) -> None:
+    """
+    The main game loop.
+
+    Args:
+        recorder: Optional session recorder; every player action taken in this
+            loop is recorded to it so the session can be replayed.
+    """
+    start_session(player_inventory, initial_current_region, game_state_ext, game_configs_ext)
+
+    if recorder is not None:
+        recorder.attach(
+            ReplayContext(player_inventory_cache, game_state_data_cache, game_configs_data_cache),
+            snapshot_text_inputs,
+        )
+        set_active_recorder(recorder)
+
     running: bool = True
     while running:
         current_player_region_for_frame: Optional[Region] = game_state_data_cache.current_player_region
         previous_view: str = ui_manager.current_view
-        mouse_pos: Tuple[int, int] = pygame.mouse.get_pos()
 
         if ui_manager.game_over_message is not None and ui_manager.current_view != "game_over":
             previous_view = ui_manager.current_view
@@ -1278,6 +1563,9 @@ def game_loop(
             if event_pygame.type == pygame.QUIT:
                 running = False
 
+            if event_pygame.type == pygame.MOUSEWHEEL:
+                scroll_log(event_pygame.y)  # Wheel up scrolls back through the log history
+
             current_buttons_to_check = ui_manager.active_buttons_list
             if ui_manager.current_view == "market":
                  current_buttons_to_check = ui_manager.market_view_buttons + ui_manager.market_item_buttons
@@ -1333,159 +1621,14 @@ def game_loop(
         if ui_manager.prompt_message_timer <= 0:
             ui_manager.active_prompt_message = None
 
-        screen.fill(RICH_BLACK)
-        if ui_manager.current_view == "game_over":
-            draw_game_over_view_external(
-                screen,
-                ui_manager.game_over_message if ui_manager.game_over_message else "Game Over", 
-                ui_manager.game_over_buttons, 
-            )
-        elif ui_manager.current_view == "main_menu":
-            draw_main_menu_external(screen, ui_manager.main_menu_buttons)
-        elif ui_manager.current_view == "market" and current_player_region_for_frame:
-            draw_market_view_external(screen, current_player_region_for_frame, player_inventory_cache, ui_manager.market_view_buttons, ui_manager.market_item_buttons, game_state_data_cache)
-        elif ui_manager.current_view == "inventory":
-            draw_inventory_view_external(screen, player_inventory_cache, ui_manager.inventory_view_buttons)
-        elif ui_manager.current_view == "travel" and current_player_region_for_frame:
-            draw_travel_view_external(screen, current_player_region_for_frame, ui_manager.travel_view_buttons)
-        
-        elif ui_manager.current_view == "informant":
-            contact_def = game_configs_data_cache.CONTACT_DEFINITIONS.get(ContactID.INFORMANT)
-            if contact_def: 
-                 draw_generic_contact_view_external(
-                    screen, ContactID.INFORMANT, contact_def,
-                    ui_manager.contact_specific_buttons.get(ContactID.INFORMANT, []),
-                    player_inventory_cache.contact_trusts.get(ContactID.INFORMANT, 0)
-                )
-        elif ui_manager.current_view == "tech_contact" or \
-             ui_manager.current_view == "tech_input_coin_select" or \
-             ui_manager.current_view == "tech_input_amount":
-            contact_def = game_configs_data_cache.CONTACT_DEFINITIONS.get(ContactID.TECH_CONTACT)
-            tech_ui_state_dict: Dict[str, Any] = { 
-                "current_view": ui_manager.current_view, 
-                "tech_transaction_in_progress": ui_manager.tech_transaction_in_progress,
-                "coin_for_tech_transaction": ui_manager.coin_for_tech_transaction,
-                "tech_input_string": ui_manager.tech_input_string,
-                "active_prompt_message": ui_manager.active_prompt_message,
-                "prompt_message_timer": ui_manager.prompt_message_timer,
-                "tech_input_box_rect": ui_manager.tech_input_box_rect,
-            }
-            if contact_def: 
-                draw_tech_contact_view_external(screen, player_inventory_cache, game_state_data_cache, game_configs_data_cache, 
-                                                ui_manager.contact_specific_buttons.get(ContactID.TECH_CONTACT, []), tech_ui_state_dict)
-        
-        elif ui_manager.current_view == "skills":
-            draw_skills_view_external(screen, player_inventory_cache, game_state_data_cache, game_configs_data_cache, ui_manager.skills_view_buttons)
-        elif ui_manager.current_view == "upgrades":
-            draw_upgrades_view_external(screen, player_inventory_cache, game_state_data_cache, game_configs_data_cache, ui_manager.upgrades_view_buttons)
-        
-        elif ui_manager.current_view == "corrupt_official_contact": 
-            contact_def = game_configs_data_cache.CONTACT_DEFINITIONS.get(ContactID.CORRUPT_OFFICIAL)
-            if contact_def:
-                draw_generic_contact_view_external(
-                    screen, ContactID.CORRUPT_OFFICIAL, contact_def,
-                    ui_manager.contact_specific_buttons.get(ContactID.CORRUPT_OFFICIAL, []),
-                    player_inventory_cache.contact_trusts.get(ContactID.CORRUPT_OFFICIAL, 0)
-                )
-        elif ui_manager.current_view == "forger_contact":
-            contact_def = game_configs_data_cache.CONTACT_DEFINITIONS.get(ContactID.THE_FORGER)
-            if contact_def:
-                draw_generic_contact_view_external(
-                    screen, ContactID.THE_FORGER, contact_def,
-                    ui_manager.contact_specific_buttons.get(ContactID.THE_FORGER, []),
-                    player_inventory_cache.contact_trusts.get(ContactID.THE_FORGER, 0)
-                )
-        elif ui_manager.current_view == "logistics_expert_contact":
-            contact_def = game_configs_data_cache.CONTACT_DEFINITIONS.get(ContactID.LOGISTICS_EXPERT)
-            if contact_def:
-                draw_generic_contact_view_external(
-                    screen, ContactID.LOGISTICS_EXPERT, contact_def,
-                    ui_manager.contact_specific_buttons.get(ContactID.LOGISTICS_EXPERT, []),
-                    player_inventory_cache.contact_trusts.get(ContactID.LOGISTICS_EXPERT, 0)
-                )
-
-        elif ui_manager.current_view in ["market_buy_input", "market_sell_input"]:
-            transaction_ui_state_dict: Dict[str, Any] = { 
-                "quantity_input_string": ui_manager.quantity_input_string,
-                "drug_for_transaction": ui_manager.drug_for_transaction,
-                "quality_for_transaction": ui_manager.quality_for_transaction,
-                "price_for_transaction": ui_manager.price_for_transaction,
-                "available_for_transaction": ui_manager.available_for_transaction,
-                "current_transaction_type": ui_manager.current_transaction_type,
-                "active_prompt_message": ui_manager.active_prompt_message,
-                "prompt_message_timer": ui_manager.prompt_message_timer,
-                "input_box_rect": ui_manager.input_box_rect,
-            }
-            draw_transaction_input_view_external(
-                screen, ui_manager.transaction_input_buttons, transaction_ui_state_dict
-            )
-
-        if ( 
-            ui_manager.current_view != "game_over"
-            and ui_manager.current_view == "blocking_event_popup"
-            and ui_manager.active_blocking_event_data
-        ):
-            draw_blocking_event_popup_external(
-                screen, ui_manager.active_blocking_event_data, ui_manager.blocking_event_popup_buttons
-            )
-
-        if ( 
-            ui_manager.current_view != "game_over" and current_player_region_for_frame
-        ):
-            draw_hud_external(screen, player_inventory_cache, current_player_region_for_frame, game_state_data_cache)
-
-        if ( 
-            ui_manager.active_prompt_message
-            and ui_manager.prompt_message_timer > 0
-            and ui_manager.current_view not in ["game_over", "blocking_event_popup"]
-        ):
-            is_prompt_handled_local: bool = ( 
-                ui_manager.current_view
-                in ["market_buy_input", "market_sell_input", "tech_input_amount"]
-            ) or ( 
-                ui_manager.current_view == "tech_contact"
-                and locals().get("tech_ui_state_dict", {}).get("active_prompt_message") 
-                and (
-                    "Select cryptocurrency"
-                    not in locals()
-                    .get("tech_ui_state_dict", {})
-                    .get("active_prompt_message", "")
-                    and "Enter amount"
-                    not in locals()
-                    .get("tech_ui_state_dict", {})
-                    .get("active_prompt_message", "")
-                )
-            )
-            if not is_prompt_handled_local:
-                prompt_y_pos_val: int = UI_CONSTANTS.SCREEN_HEIGHT - UI_CONSTANTS.PROMPT_DEFAULT_Y_OFFSET
-                if ui_manager.current_view == "tech_contact": 
-                    prompt_y_pos_val = UI_CONSTANTS.SCREEN_HEIGHT - UI_CONSTANTS.PROMPT_TECH_CONTACT_Y_OFFSET
-                prompt_color_val: Tuple[int, int, int] = (
-                    IMPERIAL_RED
-                    if any(
-                        err_word in ui_manager.active_prompt_message 
-                        for err_word in ["Error", "Invalid", "Not enough"]
-                    )
-                    else (
-                        GOLDEN_YELLOW
-                        if "Skill" in ui_manager.active_prompt_message 
-                        else EMERALD_GREEN
-                    )
-                )
-                draw_text(
-                    screen,
-                    ui_manager.active_prompt_message, 
-                    UI_CONSTANTS.SCREEN_WIDTH // 2,
-                    prompt_y_pos_val,
-                    font=FONT_MEDIUM, 
-                    color=prompt_color_val,
-                    center_aligned=True,
-                    max_width=UI_CONSTANTS.SCREEN_WIDTH - (2 * UI_CONSTANTS.LARGE_PADDING), 
-                )
+        draw_current_view(current_player_region_for_frame)
 
         pygame.display.flip()
         clock.tick(UI_CONSTANTS.FPS)
 
+    set_active_recorder(None)
+    if autosave_service is not None:
+        autosave_service.close() # Finish the last autosave before exiting
     pygame.quit()
     sys.exit()
 
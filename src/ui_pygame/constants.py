@@ -93,6 +93,11 @@ TECH_INPUT_BOX_Y_POS: int = 200 # Same Y as market for now
 TECH_INPUT_BOX_WIDTH: int = 250
 TECH_INPUT_BOX_HEIGHT: int = 40
 
+# Load Game View
+LOAD_GAME_SAVES_PER_PAGE: int = 6
+LOAD_GAME_ROW_START_Y: int = 135 # First save row, just inside the content panel
+LOAD_GAME_ROW_HEIGHT: int = 84
+
 # General Padding/Margins
 SMALL_PADDING: int = 5
 MEDIUM_PADDING: int = 10
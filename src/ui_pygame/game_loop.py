@@ -127,8 +127,7 @@ def game_loop(
             laundered_coin_enum = CryptoCoin[laundered_coin_type_str] \
                 if laundered_coin_type_str in CryptoCoin.__members__ else CryptoCoin.DRUG_COIN
 
-            current_balance = inv_cache.crypto_wallet.get(laundered_coin_enum, 0.0)
-            inv_cache.crypto_wallet[laundered_coin_enum] = current_balance + inv_cache.pending_laundered_sc
+            inv_cache.add_crypto(laundered_coin_enum, inv_cache.pending_laundered_sc)
             inv_cache.pending_laundered_sc = 0.0
             inv_cache.pending_laundered_sc_arrival_day = None
 
@@ -0,0 +1,183 @@
+# message_log.py
+"""
+Bounded message history for the HUD log with deferred word wrapping.
+
+Messages are stored raw in a bounded deque; nothing is measured when a
+message is added. Wrapping happens only when the HUD asks for the lines it is
+about to draw, and each message keeps its wrapped lines for the current width,
+so a busy day that logs dozens of messages costs one deque append per message
+and every retained message is measured at most once.
+"""
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+#: Measures the rendered width of a string in pixels (e.g. `lambda s: FONT.size(s)[0]`).
+TextWidthFunction = Callable[[str], int]
+
+
+def wrap_message(message: str, max_width: int, measure_width: TextWidthFunction) -> Tuple[str, ...]:
+    """
+    Word-wraps a message so each line measures less than `max_width`.
+
+    A single word wider than `max_width` is kept on its own line.
+
+    Args:
+        message: The message to wrap.
+        max_width: Maximum line width in pixels.
+        measure_width: Function returning the rendered width of a string.
+
+    Returns:
+        Tuple[str, ...]: The wrapped lines.
+    """
+    wrapped_lines: List[str] = []
+    current_line = ""
+    for word in message.split(" "):
+        candidate = current_line + " " + word if current_line else word
+        if not current_line or measure_width(candidate) < max_width:
+            current_line = candidate
+        else:
+            wrapped_lines.append(current_line)
+            current_line = word
+    if current_line:
+        wrapped_lines.append(current_line)
+    return tuple(wrapped_lines)
+
+
+class _LogEntry:
+    """A raw message and its wrapped lines at the log's current width (None until wrapped)."""
+
+    __slots__ = ("message", "lines")
+
+    def __init__(self, message: str) -> None:
+        self.message: str = message
+        self.lines: Optional[Tuple[str, ...]] = None
+
+
+class MessageLog:
+    """
+    A ring buffer of raw log messages that wraps lazily at render time.
+
+    Each message keeps its wrapped lines next to it, so a message is measured
+    at most once per log width, and the log keeps a running count of wrapped
+    lines for scrolling.
+
+    Attributes:
+        history_size (int): Maximum number of raw messages retained for scrolling.
+    """
+
+    def __init__(self, history_size: int = 200) -> None:
+        self.history_size: int = history_size
+        self._entries: Deque[_LogEntry] = deque()
+        self._layout_width: Optional[int] = None
+        self._wrapped_line_count: int = 0 # Lines of the entries wrapped at _layout_width
+        self._unwrapped_count: int = 0
+
+    def add(self, message: str) -> None:
+        """Appends a message; the oldest one is dropped once the history is full."""
+        if len(self._entries) >= self.history_size:
+            self._forget(self._entries.popleft())
+        self._entries.append(_LogEntry(message))
+        self._unwrapped_count += 1
+
+    def clear(self) -> None:
+        """Removes every message."""
+        self._entries.clear()
+        self._wrapped_line_count = 0
+        self._unwrapped_count = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def messages(self) -> List[str]:
+        """Returns the raw retained messages, oldest first."""
+        return [entry.message for entry in self._entries]
+
+    def _forget(self, entry: _LogEntry) -> None:
+        if entry.lines is None:
+            self._unwrapped_count -= 1
+        else:
+            self._wrapped_line_count -= len(entry.lines)
+
+    def _use_width(self, max_width: int) -> None:
+        if max_width == self._layout_width:
+            return
+        for entry in self._entries:
+            entry.lines = None
+        self._layout_width = max_width
+        self._wrapped_line_count = 0
+        self._unwrapped_count = len(self._entries)
+
+    def _wrapped(self, entry: _LogEntry, max_width: int, measure_width: TextWidthFunction) -> Tuple[str, ...]:
+        if entry.lines is None:
+            entry.lines = wrap_message(entry.message, max_width, measure_width)
+            self._wrapped_line_count += len(entry.lines)
+            self._unwrapped_count -= 1
+        return entry.lines
+
+    def max_scroll_offset(self, max_lines: int, max_width: int, measure_width: TextWidthFunction) -> int:
+        """
+        Returns the largest useful scroll offset: the wrapped history length minus the visible lines.
+
+        Only messages not yet wrapped at `max_width` are measured; otherwise
+        this reads the running line count.
+
+        Args:
+            max_lines: Number of lines the log area can show.
+            max_width: Maximum line width in pixels.
+            measure_width: Function returning the rendered width of a string.
+
+        Returns:
+            int: The offset at which the oldest retained line is at the top, or 0.
+        """
+        self._use_width(max_width)
+        if self._unwrapped_count:
+            for entry in self._entries:
+                self._wrapped(entry, max_width, measure_width)
+        return max(0, self._wrapped_line_count - max(0, max_lines))
+
+    def visible_lines(
+        self,
+        max_lines: int,
+        max_width: int,
+        measure_width: TextWidthFunction,
+        scroll_offset: int = 0,
+    ) -> List[str]:
+        """
+        Returns the wrapped lines to draw, oldest first.
+
+        Only the newest messages needed to fill `max_lines` (plus the
+        `scroll_offset` lines scrolled past) are wrapped.
+
+        Args:
+            max_lines: Number of lines the log area can show.
+            max_width: Maximum line width in pixels.
+            measure_width: Function returning the rendered width of a string.
+            scroll_offset: Number of lines scrolled back from the newest line.
+
+        Returns:
+            List[str]: Up to `max_lines` lines.
+        """
+        if max_lines <= 0:
+            return []
+        self._use_width(max_width)
+        skip = max(0, scroll_offset)
+        newest_first: List[str] = []
+        for entry in reversed(self._entries):
+            lines = self._wrapped(entry, max_width, measure_width)
+            if skip >= len(lines):
+                skip -= len(lines)
+                continue
+            newest_first.extend(reversed(lines[:len(lines) - skip]))
+            skip = 0
+            if len(newest_first) >= max_lines:
+                break
+        if not newest_first: # Scrolled past the oldest line: show the oldest lines
+            oldest: List[str] = []
+            for entry in self._entries:
+                oldest.extend(self._wrapped(entry, max_width, measure_width))
+                if len(oldest) >= max_lines:
+                    break
+            return oldest[:max_lines]
+        del newest_first[max_lines:]
+        newest_first.reverse()
+        return newest_first
@@ -19,39 +19,51 @@ from .ui_theme import (
     GOLDEN_YELLOW,
     draw_text,
 )
+from .message_log import MessageLog
 
 # --- Constants ---
-MAX_LOG_MESSAGES: int = 7  # Max number of messages in the persistent log
+MAX_LOG_MESSAGES: int = 7  # Max number of lines shown in the persistent log
+LOG_HISTORY_SIZE: int = 200  # Raw messages kept for scrolling back through the log
 FPS = 60  # Frames per second for test mode
 
 # --- HUD State Variables ---
-ui_log_messages: List[str] = []  # For persistent log display
+ui_message_log: MessageLog = MessageLog(LOG_HISTORY_SIZE)  # For persistent log display
+log_scroll_offset: int = 0  # Lines scrolled back from the newest log line
+
+
+def _measure_log_text(text: str) -> int:
+    return FONT_XSMALL.size(text)[0]
 
 
 def add_message_to_log(message: str):
-    """Adds a message to the persistent UI log."""
-    global ui_log_messages
-    # Simple word wrapping for log messages (optional, basic version)
-    # This could be more sophisticated if needed.
-    log_line_max_width_approx = SCREEN_WIDTH // 2 - 30  # Approx width of log area
-
-    words = message.split(" ")
-    wrapped_message_lines = []
-    current_line = ""
-    for word in words:
-        if FONT_XSMALL.size(current_line + " " + word)[0] < log_line_max_width_approx:
-            current_line += " " + word if current_line else word
-        else:
-            wrapped_message_lines.append(current_line)
-            current_line = word
-    if current_line:  # Add any remaining part of the message
-        wrapped_message_lines.append(current_line)
-
-    for line in wrapped_message_lines:
-        ui_log_messages.append(line)
-
-    while len(ui_log_messages) > MAX_LOG_MESSAGES:
-        ui_log_messages.pop(0)  # Remove the oldest message(s) to maintain max length
+    """
+    Adds a message to the persistent UI log.
+
+    The message is stored raw; wrapping is deferred until the log is drawn.
+    """
+    ui_message_log.add(message)
+
+
+def _log_line_width() -> int:
+    return SCREEN_WIDTH // 2 - 30  # Approx width of log area
+
+
+def scroll_log(lines: int) -> None:
+    """
+    Scrolls the log back (positive) or forward (negative) by a number of lines.
+
+    The offset stops at the oldest retained line, so scrolling forward again responds at once.
+    """
+    global log_scroll_offset
+    max_offset = ui_message_log.max_scroll_offset(MAX_LOG_MESSAGES, _log_line_width(), _measure_log_text)
+    log_scroll_offset = min(max(0, log_scroll_offset + lines), max_offset)
+
+
+def get_visible_log_lines() -> List[str]:
+    """Returns the wrapped log lines currently in view, oldest first."""
+    return ui_message_log.visible_lines(
+        MAX_LOG_MESSAGES, _log_line_width(), _measure_log_text, log_scroll_offset
+    )
 
 
 def show_event_message(
@@ -81,7 +93,6 @@ def draw_hud(
     """
     Draws the main game HUD, including the persistent log.
     """
-    global ui_log_messages
 
     screen_width = surface.get_width()
     screen_height = surface.get_height()
@@ -260,7 +271,7 @@ def draw_hud(
 
     # Log messages with alternating background
     current_log_y = log_area_y_start + 30
-    for i, msg in enumerate(ui_log_messages):
+    for i, msg in enumerate(get_visible_log_lines()):
         # Alternating row background
         if i % 2 == 0:
             row_rect = pygame.Rect(
@@ -284,7 +295,7 @@ def draw_hud(
 
 
 # Example usage (for testing this module standalone, if needed):
-# Define SCREEN_WIDTH if running standalone for the log_line_max_width_approx in add_message_to_log
+# Define SCREEN_WIDTH if running standalone for the log_line_max_width_approx in get_visible_log_lines
 SCREEN_WIDTH = 1024
 if __name__ == "__main__":
     pygame.init()
@@ -12,6 +12,7 @@ from ..core.region import Region
 from ..game_state import GameState
 from src import narco_configs # Renamed for clarity and direct access
 from ..mechanics import quest_manager # Import quest_manager
+from ..utils.save_index import SaveIndex, SaveSummary, ThumbnailCache
 
 from .ui_theme import (
     FONT_XLARGE, FONT_LARGE, FONT_MEDIUM, FONT_SMALL, FONT_XSMALL, FONT_LARGE_BOLD,
@@ -86,6 +87,14 @@ class UIManager:
         self.active_blocking_event_data: Optional[Dict] = None
         self.game_over_message: Optional[str] = None
 
+        # Load game menu: the index is read when the menu opens, never per save file
+        save_directory: str = getattr(game_configs, "AUTOSAVE_DIRECTORY", "saves")
+        self.save_index = SaveIndex(save_directory)
+        self.thumbnail_cache = ThumbnailCache(save_directory)
+        self.saved_games: List[SaveSummary] = []
+        self.load_game_page: int = 0
+        self.load_game_view_buttons: List[Button] = []
+
         self.setup_buttons_for_current_view()
 
     def set_active_prompt_message(self, message: str, duration_frames: int = UI_CONSTANTS.PROMPT_DURATION_FRAMES) -> None:
@@ -149,6 +158,7 @@ class UIManager:
             ("Meet Logistics Expert", self.app_actions.get('meet_logistics_expert', placeholder_action), lambda gs: self._is_contact_available(ContactID.LOGISTICS_EXPERT)),
             ("Skills", self.app_actions.get('open_skills', placeholder_action), None),
             ("Upgrades", self.app_actions.get('open_upgrades', placeholder_action), None),
+            ("Load Game", self.app_actions.get('open_load_game', placeholder_action), None),
         ]
 
         active_forger_quest = self.player_inventory.active_quests.get(QuestID.FORGER_SUPPLY_RUN)
@@ -425,6 +435,9 @@ class UIManager:
             # ... setup upgrade buttons ...
             self.upgrades_view_buttons.append(self._create_back_button())
             self.active_buttons_list = self.upgrades_view_buttons
+        elif self.current_view == "load_game":
+            self._setup_load_game_buttons()
+            self.active_buttons_list = self.load_game_view_buttons
         elif self.current_view in ["market_buy_input", "market_sell_input"]:
              self._setup_transaction_input_buttons()
              self.active_buttons_list = self.transaction_input_buttons
@@ -438,6 +451,35 @@ class UIManager:
             temp_fallback_button = self._create_action_button("Back to Menu", self.app_actions.get('open_main_menu', placeholder_action), 50,50,200,50)
             self.active_buttons_list = [temp_fallback_button]
     
+    def saved_games_page(self) -> Tuple[List[SaveSummary], int]:
+        """Returns the saves on the current load-game page and the page count."""
+        per_page = UI_CONSTANTS.LOAD_GAME_SAVES_PER_PAGE
+        page_count = max(1, (len(self.saved_games) + per_page - 1) // per_page)
+        self.load_game_page = min(max(0, self.load_game_page), page_count - 1)
+        start = self.load_game_page * per_page
+        return self.saved_games[start:start + per_page], page_count
+
+    def _setup_load_game_buttons(self):
+        self.load_game_view_buttons.clear()
+        page_saves, page_count = self.saved_games_page()
+        load_action = self.app_actions.get('load_saved_game', placeholder_action)
+        btn_w, btn_h = 120, 36
+        btn_x = UI_CONSTANTS.SCREEN_WIDTH - btn_w - 70
+        for row, summary in enumerate(page_saves):
+            btn_y = UI_CONSTANTS.LOAD_GAME_ROW_START_Y + row * UI_CONSTANTS.LOAD_GAME_ROW_HEIGHT + 18
+            self.load_game_view_buttons.append(
+                self._create_action_button("Load", load_action, btn_x, btn_y, btn_w, btn_h, action_args=(summary.file_name,), font=FONT_SMALL)
+            )
+        page_action = self.app_actions.get('change_load_game_page', placeholder_action)
+        nav_y = UI_CONSTANTS.SCREEN_HEIGHT - UI_CONSTANTS.STD_BUTTON_HEIGHT - UI_CONSTANTS.LARGE_PADDING
+        self.load_game_view_buttons.append(
+            self._create_action_button("< Prev", page_action, UI_CONSTANTS.LARGE_PADDING, nav_y, btn_w, btn_h, action_args=(-1,), font=FONT_SMALL, is_enabled=self.load_game_page > 0)
+        )
+        self.load_game_view_buttons.append(
+            self._create_action_button("Next >", page_action, UI_CONSTANTS.LARGE_PADDING + btn_w + UI_CONSTANTS.STD_BUTTON_SPACING, nav_y, btn_w, btn_h, action_args=(1,), font=FONT_SMALL, is_enabled=self.load_game_page < page_count - 1)
+        )
+        self.load_game_view_buttons.append(self._create_back_button())
+
     def _setup_game_over_buttons(self):
         self.game_over_buttons.clear()
         popup_width_val = UI_CONSTANTS.SCREEN_WIDTH * UI_CONSTANTS.POPUP_WIDTH_RATIO
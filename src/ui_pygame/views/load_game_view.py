@@ -0,0 +1,123 @@
+# views/load_game_view.py
+"""
+Handles drawing the Load Game view: one page of saves from the save index.
+
+Only the summaries on the current page are drawn, and thumbnails are
+rendered on first display, cached on disk by ThumbnailCache and the most
+recently shown ones are kept in memory, so paging through hundreds of saves
+stays instant without holding every thumbnail ever loaded.
+"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Optional
+
+import pygame
+
+from ...utils.save_index import SaveSummary, ThumbnailCache
+from ..ui_components import Button
+from ..ui_theme import (
+    EMERALD_GREEN, FONT_SMALL, FONT_XSMALL, GOLDEN_YELLOW, IMPERIAL_RED, MEDIUM_GREY,
+    PLATINUM, TEXT_COLOR, YALE_BLUE,
+    draw_text,
+)
+from ..ui_base_elements import draw_content_panel, draw_main_container, draw_view_background, draw_view_title
+from ..constants import LOAD_GAME_ROW_HEIGHT, LOAD_GAME_ROW_START_Y, LOAD_GAME_SAVES_PER_PAGE
+
+# Layout constants
+CONTENT_PANEL_Y = 120
+CONTENT_PANEL_HEIGHT = 560
+ROW_X = 60
+THUMBNAIL_WIDTH = 128
+THUMBNAIL_HEIGHT = 72
+TEXT_X = ROW_X + THUMBNAIL_WIDTH + 20
+MAX_THUMBNAIL_HEAT = 100 # Heat at which a thumbnail bar is full height
+MAX_LOADED_THUMBNAILS = 3 * LOAD_GAME_SAVES_PER_PAGE # The current page and its neighbours
+
+# Thumbnail path -> surface (None if it would not load), least recently shown first
+_loaded_thumbnails: "OrderedDict[str, Optional[pygame.Surface]]" = OrderedDict()
+
+
+def render_save_thumbnail(summary: SaveSummary, path: str) -> None:
+    """Renders a save's thumbnail (regional heat bars and day) and writes it to `path`."""
+    thumbnail = pygame.Surface((THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT))
+    thumbnail.fill((12, 22, 38))
+    heats = [heat for _, heat in sorted(summary.region_heat.items())]
+    if heats:
+        bar_width = THUMBNAIL_WIDTH // len(heats)
+        for i, heat in enumerate(heats):
+            ratio = min(1.0, heat / MAX_THUMBNAIL_HEAT)
+            bar_height = max(2, int((THUMBNAIL_HEIGHT - 20) * ratio))
+            color = IMPERIAL_RED if ratio > 0.6 else GOLDEN_YELLOW if ratio > 0.3 else EMERALD_GREEN
+            pygame.draw.rect(thumbnail, color, (i * bar_width + 2, THUMBNAIL_HEIGHT - bar_height - 2, bar_width - 4, bar_height))
+    draw_text(thumbnail, f"Day {summary.day}", 4, 2, font=FONT_XSMALL, color=PLATINUM)
+    pygame.image.save(thumbnail, path)
+
+
+def _get_thumbnail(summary: SaveSummary, thumbnail_cache: ThumbnailCache) -> Optional[pygame.Surface]:
+    path = thumbnail_cache.get(summary, render_save_thumbnail)
+    if path is None:
+        return None
+    if path in _loaded_thumbnails:
+        _loaded_thumbnails.move_to_end(path)
+        return _loaded_thumbnails[path]
+    try:
+        surface = pygame.image.load(path)
+    except (pygame.error, OSError):
+        surface = None # Remembered so a damaged file is not re-read every frame
+    _loaded_thumbnails[path] = surface
+    if len(_loaded_thumbnails) > MAX_LOADED_THUMBNAILS:
+        _loaded_thumbnails.popitem(last=False)
+    return surface
+
+
+def draw_load_game_view(
+    surface: pygame.Surface,
+    page_saves: List[SaveSummary],
+    page_number: int,
+    page_count: int,
+    thumbnail_cache: ThumbnailCache,
+    buttons: List[Button],
+):
+    """
+    Draws one page of the save list.
+
+    Args:
+        surface: Surface to draw on.
+        page_saves: The saves on this page, in display order.
+        page_number: Zero-based page shown.
+        page_count: Total number of pages.
+        thumbnail_cache: Where thumbnails are cached on disk.
+        buttons: Load buttons (one per row) plus paging and Back buttons.
+    """
+    draw_view_background(surface)
+    draw_main_container(surface, height_offset=40)
+    draw_view_title(surface, "LOAD GAME", border_color=(70, 130, 180))
+    content_panel = draw_content_panel(surface, CONTENT_PANEL_Y, CONTENT_PANEL_HEIGHT)
+
+    if not page_saves:
+        draw_text(surface, "No saved games yet.", content_panel.centerx, content_panel.centery,
+                  font=FONT_SMALL, color=MEDIUM_GREY, center_aligned=True)
+    for row, summary in enumerate(page_saves):
+        y = LOAD_GAME_ROW_START_Y + row * LOAD_GAME_ROW_HEIGHT
+        if row % 2 == 0: # Alternating row background
+            pygame.draw.rect(surface, (12, 22, 38), (ROW_X - 10, y - 6, content_panel.width - 20, LOAD_GAME_ROW_HEIGHT - 4))
+        thumbnail = _get_thumbnail(summary, thumbnail_cache)
+        if thumbnail is not None:
+            surface.blit(thumbnail, (ROW_X, y))
+        pygame.draw.rect(surface, YALE_BLUE, (ROW_X, y, THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT), 1)
+
+        saved_at = datetime.fromtimestamp(summary.timestamp).strftime("%Y-%m-%d %H:%M")
+        draw_text(surface, summary.title(),
+                  TEXT_X, y + 4, font=FONT_SMALL, color=PLATINUM)
+        draw_text(surface, f"Cash: ${summary.cash:,.0f}   Net worth: ${summary.net_worth:,.0f}",
+                  TEXT_X, y + 28, font=FONT_SMALL, color=GOLDEN_YELLOW)
+        draw_text(surface, f"Saved {saved_at}" + ("  (won)" if summary.game_won else ""),
+                  TEXT_X, y + 50, font=FONT_XSMALL, color=TEXT_COLOR)
+
+    if page_count > 1:
+        draw_text(surface, f"Page {page_number + 1} / {page_count}", content_panel.centerx, content_panel.bottom - 20,
+                  font=FONT_XSMALL, color=MEDIUM_GREY, center_aligned=True)
+
+    mouse_pos = pygame.mouse.get_pos()
+    for button in buttons:
+        button.draw(surface, mouse_pos)
@@ -1,3 +1,3 @@
-from .logger import get_logger
+from .logger import RateLimitFilter, configure_logging, get_logger, set_subsystem_level, shutdown_logging
 
-__all__ = ['get_logger']
+__all__ = ['get_logger', 'configure_logging', 'set_subsystem_level', 'shutdown_logging', 'RateLimitFilter']
@@ -0,0 +1,152 @@
+"""
+Background autosave for the player's game.
+
+Saving happens in two steps so the UI never waits on compression or disk:
+
+1. On the calling (UI) thread, `AutosaveService.request_save` pickles the
+   player inventory and game state into an immutable byte string. This is the
+   consistent snapshot; it costs well under a millisecond for a normal game
+   and is timed in `last_snapshot_seconds`.
+2. A worker thread compresses the snapshot and writes it through a temporary
+   file that is renamed over the slot, so a crash mid-write never leaves a
+   truncated save. Slots rotate, keeping the newest `slot_count` autosaves,
+   and the directory's save index is updated after each write.
+
+If saves are requested faster than the worker writes them, only the newest
+pending snapshot is kept. A request for a game whose state hash matches the
+last saved one is skipped without snapshotting.
+"""
+
+import os
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from ..mechanics.state_hash import state_hash
+from .logger import get_logger
+from .save_files import SAVE_FILE_EXTENSION, encode_save_file, snapshot_game, write_file_atomically
+from .save_index import SaveIndex, SaveSummary, build_save_summary
+
+logger = get_logger(__name__)
+
+
+class AutosaveService:
+    """
+    Writes rotating autosaves on a background thread.
+
+    Attributes:
+        save_directory (str): Directory the slot files are written to.
+        slot_count (int): Number of rotating autosave slots.
+        compression_level (int): zlib level used by the worker.
+        saves_written (int): Saves completed so far.
+        saves_skipped (int): Requests skipped because the game had not changed since the last save.
+        last_snapshot_seconds (float): Time the last `request_save` spent on the caller's thread.
+        last_error (Optional[Exception]): The last write failure, if any.
+        index (SaveIndex): The save directory's index; slots are reused oldest first.
+    """
+
+    def __init__(self, save_directory: str, slot_count: int = 3, compression_level: int = 6) -> None:
+        if slot_count < 1:
+            raise ValueError("slot_count must be at least 1.")
+        self.save_directory: str = save_directory
+        self.slot_count: int = slot_count
+        self.compression_level: int = compression_level
+        self.saves_written: int = 0
+        self.saves_skipped: int = 0
+        self.last_snapshot_seconds: float = 0.0
+        self.last_error: Optional[Exception] = None
+        self.index: SaveIndex = SaveIndex(save_directory)
+        self._pending: Optional[Tuple[bytes, SaveSummary]] = None
+        self._last_state_hash: Optional[int] = None
+        self._busy: bool = False
+        self._closed: bool = False
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    def slot_path(self, slot: int) -> str:
+        """Returns the file path of an autosave slot."""
+        return os.path.join(self.save_directory, f"autosave_{slot + 1}{SAVE_FILE_EXTENSION}")
+
+    def existing_saves(self) -> List[str]:
+        """Returns the slot files present on disk, newest first."""
+        paths = [self.slot_path(slot) for slot in range(self.slot_count)]
+        return sorted((path for path in paths if os.path.exists(path)), key=os.path.getmtime, reverse=True)
+
+    def request_save(self, player_inventory: Any, game_state: Any) -> None:
+        """
+        Snapshots the game and queues it for writing.
+
+        Only the snapshot is taken on the caller's thread; compression and
+        I/O happen on the worker. A snapshot still waiting to be written is
+        replaced by this newer one. Nothing is done if the game's state hash
+        equals that of the last requested save.
+        """
+        if self._closed:
+            return
+        game_state.event_journal.flush() # The spill file is complete up to every save
+        started = time.perf_counter()
+        game_hash = state_hash(player_inventory, game_state)
+        if game_hash == self._last_state_hash:
+            self.saves_skipped += 1
+            return
+        self._last_state_hash = game_hash
+        snapshot = snapshot_game(player_inventory, game_state)
+        # The worker picks the slot and fills in the summary's file name
+        summary = build_save_summary("", player_inventory, game_state)
+        self.last_snapshot_seconds = time.perf_counter() - started
+        with self._condition:
+            self._pending = (snapshot, summary)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="autosave-writer", daemon=True)
+                self._worker.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every requested save is written. Returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Writes any pending save and stops the worker."""
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                (snapshot, summary), self._pending = self._pending, None
+                self._busy = True
+            try:
+                self._write(snapshot, summary)
+            except OSError as e:
+                self.last_error = e
+                self._last_state_hash = None # Let the next request retry the unsaved game
+                logger.error("Autosave failed: %s", e)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+    def _choose_slot_path(self) -> str:
+        """Returns the first unused slot, or else the slot holding the oldest indexed autosave."""
+        timestamps = {summary.file_name: summary.timestamp for summary in self.index.entries()}
+        slot_paths = [self.slot_path(slot) for slot in range(self.slot_count)]
+        for path in slot_paths:
+            if os.path.basename(path) not in timestamps:
+                return path
+        return min(slot_paths, key=lambda path: timestamps[os.path.basename(path)])
+
+    def _write(self, snapshot: bytes, summary: SaveSummary) -> None:
+        os.makedirs(self.save_directory, exist_ok=True)
+        path = self._choose_slot_path()
+        summary = summary._replace(file_name=os.path.basename(path))
+        write_file_atomically(path, encode_save_file(snapshot, summary.to_header(), self.compression_level))
+        self.index.update(summary)
+        self.saves_written += 1
@@ -0,0 +1,42 @@
+"""
+A fingerprint of the game engine's source code.
+
+Anything that stores results which only the same engine can reproduce keys
+them by this hash: cached campaign aggregates (`simulation.result_cache`) and
+session recordings (`utils.session_recording`), whose replays depend on the
+exact order of random draws. Any change to the listed sources changes the
+fingerprint, so stale results are rejected instead of silently disagreeing.
+"""
+
+import hashlib
+import os
+from typing import Optional
+
+_SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Source whose changes can change campaign outcomes or the cached aggregates. Config values are keyed separately.
+ENGINE_SOURCE_PATHS = (
+    "core", "mechanics", "game_state.py", "game_setup.py", os.path.join("utils", "random_streams.py"),
+    os.path.join("utils", "importance_sampling.py"), os.path.join("simulation", "campaign.py"),
+    os.path.join("simulation", "aggregation.py"),
+)
+
+_engine_fingerprint: Optional[str] = None
+
+
+def engine_fingerprint() -> str:
+    """Hashes the engine's source files, so any code change invalidates cached results."""
+    global _engine_fingerprint
+    if _engine_fingerprint is None:
+        digest = hashlib.blake2b(digest_size=16)
+        for relative_path in ENGINE_SOURCE_PATHS:
+            path = os.path.join(_SOURCE_ROOT, relative_path)
+            file_paths = (
+                sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".py"))
+                if os.path.isdir(path) else [path]
+            )
+            for file_path in file_paths:
+                digest.update(os.path.relpath(file_path, _SOURCE_ROOT).encode("utf-8"))
+                with open(file_path, "rb") as source_file:
+                    digest.update(source_file.read())
+        _engine_fingerprint = digest.hexdigest()
+    return _engine_fingerprint
@@ -0,0 +1,98 @@
+"""
+Importance sampling of the game's rare random events.
+
+A few chance rolls cause most of the frustrating losses: a police search
+confiscating the whole stash, muggings and informant betrayal. Estimating how
+often they end a campaign by plain Monte Carlo takes an enormous number of
+runs, because the interesting campaigns are so rare.
+
+These rolls go through `chance_event`, named by the config value that sets
+their chance. Normally it is the plain `rng.random() < probability` draw.
+Inside `importance_sampling(biased_chances)` a named roll uses the biased
+chance instead, and the active `LikelihoodRatio` multiplies in
+`probability / biased` for a hit and `(1 - probability) / (1 - biased)` for a
+miss. A campaign's outcome weighted by the final ratio is an unbiased sample
+of the unbiased game, so rare outcomes can be made common and then weighted
+back down (see `simulation.rare_events`).
+"""
+
+import random
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+#: Config values whose rolls can be biased.
+BIASABLE_CHANCES = ("POLICE_STOP_CONFISCATION_CHANCE", "MUGGING_EVENT_CHANCE", "INFORMANT_BETRAYAL_CHANCE")
+
+
+class LikelihoodRatio:
+    """
+    Weight of one campaign played with biased chances, and its roll counts.
+
+    Attributes:
+        biased_chances (Dict[str, float]): Chance used for each biased roll, by config name.
+        weight (float): Product of the likelihood ratios of every biased roll so far.
+        rolls (Dict[str, int]): Biased rolls made, by config name.
+        hits (Dict[str, int]): Biased rolls that hit, by config name.
+    """
+
+    def __init__(self, biased_chances: Dict[str, float]) -> None:
+        unknown = [name for name in biased_chances if name not in BIASABLE_CHANCES]
+        if unknown:
+            raise ValueError(f"Chances that cannot be biased: {', '.join(sorted(unknown))}")
+        # A biased chance of 0 or 1 never samples one side of the roll, which would bias the estimate
+        invalid = [name for name, chance in biased_chances.items() if not 0.0 < chance < 1.0]
+        if invalid:
+            raise ValueError(f"Biased chances must be strictly between 0 and 1: {', '.join(sorted(invalid))}")
+        self.biased_chances: Dict[str, float] = dict(biased_chances)
+        self.weight: float = 1.0
+        self.rolls: Dict[str, int] = {name: 0 for name in biased_chances}
+        self.hits: Dict[str, int] = {name: 0 for name in biased_chances}
+
+    def roll(self, name: str, probability: float, rng: Any) -> bool:
+        """Rolls a biased event and folds its likelihood ratio into `weight`."""
+        biased = self.biased_chances[name]
+        hit = rng.random() < biased
+        self.rolls[name] += 1
+        if hit:
+            self.hits[name] += 1
+            self.weight *= probability / biased
+        else:
+            self.weight *= (1.0 - probability) / (1.0 - biased)
+        return hit
+
+
+_active_ratio: Optional[LikelihoodRatio] = None
+
+
+def chance_event(name: str, probability: float, rng: Any = random) -> bool:
+    """
+    Rolls an event that happens with `probability`.
+
+    Args:
+        name: Config value the chance comes from, e.g. "MUGGING_EVENT_CHANCE".
+        probability: The event's chance in the unbiased game.
+        rng: Generator to draw from, usually the site's `decision_rng`.
+
+    Returns:
+        bool: Whether the event happens. Inside `importance_sampling`, a
+        biased roll uses its biased chance instead.
+    """
+    if _active_ratio is None or name not in _active_ratio.biased_chances:
+        return rng.random() < probability
+    return _active_ratio.roll(name, probability, rng)
+
+
+@contextmanager
+def importance_sampling(biased_chances: Dict[str, float]) -> Iterator[LikelihoodRatio]:
+    """
+    Biases the named rolls for the duration of the block.
+
+    Raises:
+        ValueError: If a name is not in `BIASABLE_CHANCES` or a chance is not strictly between 0 and 1.
+    """
+    global _active_ratio
+    previous, _active_ratio = _active_ratio, LikelihoodRatio(biased_chances)
+    try:
+        yield _active_ratio
+    finally:
+        _active_ratio = previous
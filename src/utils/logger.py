@@ -1,36 +1,245 @@
+"""
+Logging setup for the game.
+
+Every logger returned by `get_logger` writes to a shared in-memory queue via a
+`QueueHandler`. A single `QueueListener` thread drains the queue and does the
+actual I/O (console and, optionally, a rotating log file), so a slow terminal
+or a piped batch run never blocks the game loop or a simulation tick.
+
+Levels can be changed at runtime per subsystem (logger name prefix, e.g.
+"src.mechanics"), and repetitive messages can be rate limited and sampled
+before they ever reach the queue.
+"""
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
 
 # Configure the logger
 LOGGING_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOGGING_LEVEL = logging.INFO # Default to INFO, can be changed
 
-def get_logger(name: str, level: int = LOGGING_LEVEL) -> logging.Logger:
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drops repetitive records that exceed a per-message budget.
+
+    Records are grouped by (logger name, level, unformatted message), so
+    `logger.warning("Sold %s units", units)` counts as one message whatever
+    its arguments. Grouping needs those lazy `%` arguments: an f-string is
+    formatted before logging sees it, so each distinct text is its own group.
+    Within each interval the first `max_per_interval` records of a group pass.
+    After that, only every `sample_every`-th record passes (none if 0). The
+    first record let through after suppression notes how many were dropped.
+
+    Groups whose interval ended without suppressing anything are swept once
+    per interval, and at most `max_groups` are tracked (oldest dropped first).
+    """
+
+    def __init__(
+        self, max_per_interval: int = 10, interval_seconds: float = 1.0, sample_every: int = 0, max_groups: int = 1024
+    ) -> None:
+        super().__init__()
+        self.max_per_interval = max_per_interval
+        self.interval_seconds = interval_seconds
+        self.sample_every = sample_every
+        self.max_groups = max_groups
+        self._lock = threading.Lock()
+        # key -> [interval start, passed count, suppressed count], oldest interval first
+        self._groups: Dict[Tuple[str, int, str], List[float]] = {}
+        self._last_sweep = time.monotonic()
+
+    def _sweep(self, now: float) -> None:
+        self._last_sweep = now
+        for key, group in list(self._groups.items()):
+            if now - group[0] < self.interval_seconds:
+                break # Later groups started more recently
+            if not group[2]: # Keep groups that still owe a suppression note
+                del self._groups[key]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep >= self.interval_seconds:
+                self._sweep(now)
+            group = self._groups.get(key)
+            if group is None or now - group[0] >= self.interval_seconds:
+                suppressed = int(group[2]) if group is not None else 0
+                self._groups.pop(key, None)
+                while len(self._groups) >= self.max_groups:
+                    del self._groups[next(iter(self._groups))]
+                self._groups[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} [{suppressed} similar message(s) suppressed]"
+                return True
+            if group[1] < self.max_per_interval:
+                group[1] += 1
+                return True
+            group[2] += 1
+            if self.sample_every > 0 and int(group[2]) % self.sample_every == 0:
+                return True
+            return False
+
+
+# --- Shared backend state ---
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_output_handlers: List[logging.Handler] = []
+_listener: Optional[logging.handlers.QueueListener] = None
+_backend_lock = threading.Lock()
+_rate_limit_filter: Optional[RateLimitFilter] = None
+_subsystem_levels: Dict[str, int] = {}
+_managed_loggers: Set[str] = set() # Names of loggers handed out by get_logger
+
+
+def _make_console_handler() -> logging.Handler:
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter(LOGGING_FORMAT))
+    return console_handler
+
+
+def _restart_listener(handlers: List[logging.Handler]) -> None:
+    """Replaces the output handlers, flushing anything already queued to the old ones."""
+    global _listener, _output_handlers
+    if _listener is not None:
+        _listener.stop() # Drains the queue before returning
+        for handler in _output_handlers:
+            if handler not in handlers:
+                handler.close()
+    _output_handlers = handlers
+    _listener = logging.handlers.QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def _ensure_listener() -> None:
+    with _backend_lock:
+        if _listener is None:
+            _restart_listener([_make_console_handler()])
+
+
+def _resolve_level(name: str) -> int:
+    """Returns the level of the most specific configured subsystem covering `name`."""
+    best_match = ""
+    level = LOGGING_LEVEL
+    for subsystem, subsystem_level in _subsystem_levels.items():
+        if (name == subsystem or name.startswith(subsystem + ".")) and len(subsystem) >= len(best_match):
+            best_match, level = subsystem, subsystem_level
+    return level
+
+
+def configure_logging(
+    file_path: Optional[str] = None,
+    max_bytes: int = 1_000_000,
+    backup_count: int = 3,
+    console: bool = True,
+    rate_limit: Optional[RateLimitFilter] = None,
+) -> None:
+    """
+    Configures where queued log records are written.
+
+    Args:
+        file_path: Optional log file; rotated when it exceeds `max_bytes`.
+        max_bytes: Size at which the log file is rotated.
+        backup_count: Number of rotated log files to keep.
+        console: Whether to also write to stdout.
+        rate_limit: Optional filter applied to every record before it is
+            queued, e.g. `RateLimitFilter(max_per_interval=5)`. None disables it.
+    """
+    global _rate_limit_filter
+    handlers: List[logging.Handler] = []
+    if console:
+        handlers.append(_make_console_handler())
+    if file_path is not None:
+        file_handler = logging.handlers.RotatingFileHandler(
+            file_path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        file_handler.setFormatter(logging.Formatter(LOGGING_FORMAT))
+        handlers.append(file_handler)
+
+    with _backend_lock:
+        if _rate_limit_filter is not None:
+            _queue_handler.removeFilter(_rate_limit_filter)
+        _rate_limit_filter = rate_limit
+        if rate_limit is not None:
+            _queue_handler.addFilter(rate_limit)
+        _restart_listener(handlers)
+
+
+def set_subsystem_level(subsystem: str, level: int) -> None:
+    """
+    Sets the level for every logger under a subsystem, now and for loggers created later.
+
+    Args:
+        subsystem: Logger name prefix, e.g. "src.mechanics" or "src.game_state".
+        level: The logging level (e.g., logging.INFO, logging.DEBUG).
+    """
+    _subsystem_levels[subsystem] = level
+    for name in _managed_loggers:
+        if name == subsystem or name.startswith(subsystem + "."):
+            logging.getLogger(name).setLevel(_resolve_level(name))
+
+
+def shutdown_logging() -> None:
+    """Stops the writer thread after flushing every queued record."""
+    global _listener
+    with _backend_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        for handler in _output_handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                pass # Stream already closed (e.g. stdout replaced at interpreter exit)
+
+
+atexit.register(shutdown_logging)
+
+
+def _restart_after_fork() -> None:
+    # The writer thread does not survive fork; give a forked child its own queue and writer.
+    global _log_queue, _listener, _backend_lock
+    _log_queue = queue.SimpleQueue()
+    _queue_handler.queue = _log_queue
+    _backend_lock = threading.Lock()
+    if _listener is not None:
+        _listener = None
+        _restart_listener(_output_handlers)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """
     Creates and configures a logger instance.
 
+    Records are handed to the background writer thread; the caller never
+    waits on console or file I/O.
+
     Args:
         name: The name for the logger (usually __name__ of the calling module).
-        level: The logging level (e.g., logging.INFO, logging.DEBUG).
+        level: The logging level (e.g., logging.INFO, logging.DEBUG). Defaults
+            to the level configured for the logger's subsystem, or LOGGING_LEVEL.
 
     Returns:
         A configured logging.Logger instance.
     """
+    _ensure_listener()
     logger = logging.getLogger(name)
-    logger.setLevel(level)
+    logger.setLevel(level if level is not None else _resolve_level(name))
+    _managed_loggers.add(name)
 
     # Prevent duplicate handlers if logger is already configured
-    if not logger.handlers:
-        # Create a console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-
-        # Create a formatter and set it for the handler
-        formatter = logging.Formatter(LOGGING_FORMAT)
-        console_handler.setFormatter(formatter)
-
-        # Add the handler to the logger
-        logger.addHandler(console_handler)
+    if _queue_handler not in logger.handlers:
+        logger.addHandler(_queue_handler)
 
     return logger
 
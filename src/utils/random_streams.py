@@ -0,0 +1,112 @@
+"""
+Named random substreams for common-random-numbers simulation.
+
+The game normally draws every random number from the global `random` module,
+so one extra draw anywhere shifts every later draw. When two config variants
+are compared on the same seed, a variant that makes one more police check
+gets different muggings, events and restocks for the rest of the campaign,
+and the comparison drowns in noise.
+
+Each random decision site gets its generator from `decision_rng(site, key)`.
+Outside `common_random_numbers`, that is the `random` module itself, so
+normal play and replays draw exactly as before. Inside it, the site gets its
+own `random.Random` seeded from (seed, day, site, key). A site sees the same
+numbers on the same day whatever other sites did, so variants share their
+randomness wherever their play has not diverged.
+
+Site names in use:
+- Keyed by region: "restock", "market_event", "black_market",
+  "forced_fire_sale", "turf_war" and "mugging" (the market-event mugging).
+- Keyed by rival name: "rival".
+- Unkeyed: "crypto_prices", "mugging" (the daily blocking-event mugging),
+  "informant_betrayal", "opportunity_event" and "police_stop".
+"""
+
+import hashlib
+import random
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class RandomStreams:
+    """
+    Generators per decision site for one campaign seed, rederived each day.
+
+    Attributes:
+        seed (int): The campaign seed the streams are derived from.
+        day (int): Day the current streams belong to.
+    """
+
+    def __init__(self, seed: int) -> None:
+        self.seed: int = seed
+        self.day: int = 0
+        self._streams: Dict[Tuple[str, str], random.Random] = {}
+
+    def set_day(self, day: int) -> None:
+        if day != self.day:
+            self.day = day
+            self._streams.clear()
+
+    def stream(self, site: str, key: Any = None) -> random.Random:
+        """Returns the site's generator for the current day, creating it on first use."""
+        stream_key = (site, str(getattr(key, "value", key)))
+        stream = self._streams.get(stream_key)
+        if stream is None:
+            digest = hashlib.blake2b(
+                f"{self.seed}|{self.day}|{stream_key[0]}|{stream_key[1]}".encode("utf-8"), digest_size=8
+            ).digest()
+            stream = random.Random(int.from_bytes(digest, "little"))
+            self._streams[stream_key] = stream
+        return stream
+
+
+_active_streams: Optional[RandomStreams] = None
+
+
+def decision_rng(site: str, key: Any = None) -> Any:
+    """
+    Returns the generator a random decision site draws from.
+
+    Args:
+        site: Name of the decision site, e.g. "mugging".
+        key: Optional sub-key, e.g. the region, for sites that run once per region or rival.
+
+    Returns:
+        The site's substream inside `common_random_numbers`, else the `random` module.
+    """
+    if _active_streams is None:
+        return random
+    return _active_streams.stream(site, key)
+
+
+def set_stream_day(day: int) -> None:
+    """Moves the active streams to a new day. Does nothing outside `common_random_numbers`."""
+    if _active_streams is not None:
+        _active_streams.set_day(day)
+
+
+@contextmanager
+def common_random_numbers(seed: int) -> Iterator[RandomStreams]:
+    """Routes every decision site to its own substream of `seed` for the duration of the block."""
+    global _active_streams
+    previous, _active_streams = _active_streams, RandomStreams(seed)
+    try:
+        yield _active_streams
+    finally:
+        _active_streams = previous
+
+
+@contextmanager
+def suspend_common_random_numbers() -> Iterator[None]:
+    """
+    Sends every decision site back to the `random` module for the duration of the block.
+
+    For lookahead that plays simulated days inside a campaign: it must not
+    draw from, or move the day of, the campaign's own streams.
+    """
+    global _active_streams
+    previous, _active_streams = _active_streams, None
+    try:
+        yield
+    finally:
+        _active_streams = previous
@@ -0,0 +1,109 @@
+"""
+The save file format.
+
+A save file is:
+
+    b"NSAV" | version (1 byte) | header length (uint32 LE) | header (UTF-8 JSON) | zlib(pickle((PlayerInventory, GameState)))
+
+The header is a small summary of the save (day, region, cash, ...) that can
+be read without decompressing or unpickling the game, so save listings stay
+cheap (see save_index.py). Version 1 files, written before headers existed,
+have no length or header and are still loadable.
+"""
+
+import json
+import os
+import pickle
+import struct
+import tempfile
+import zlib
+from typing import Any, Dict, Tuple
+
+SAVE_FILE_MAGIC = b"NSAV"
+SAVE_FILE_VERSION = 2
+SAVE_FILE_EXTENSION = ".sav"
+
+_HEADER_LENGTH_STRUCT = struct.Struct("<I")
+_PREFIX_SIZE = len(SAVE_FILE_MAGIC) + 1
+
+
+def snapshot_game(player_inventory: Any, game_state: Any) -> bytes:
+    """Serializes the player inventory and game state into a save payload."""
+    return pickle.dumps((player_inventory, game_state), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def encode_save_file(snapshot: bytes, header: Dict[str, Any], compression_level: int = 6) -> bytes:
+    """Returns the on-disk bytes for a snapshot and its summary header."""
+    encoded_header = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    return b"".join((
+        SAVE_FILE_MAGIC,
+        bytes([SAVE_FILE_VERSION]),
+        _HEADER_LENGTH_STRUCT.pack(len(encoded_header)),
+        encoded_header,
+        zlib.compress(snapshot, compression_level),
+    ))
+
+
+def write_file_atomically(path: str, data: bytes) -> None:
+    """Writes `data` to `path` via a temporary file and rename, so readers see the old or new file, never a partial one."""
+    # A unique temporary name, so processes writing the same file never share one
+    directory, file_name = os.path.split(os.path.abspath(path))
+    temp_fd, temp_path = tempfile.mkstemp(prefix=f".{file_name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(temp_fd, "wb") as temp_file:
+            temp_file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_version(prefix: bytes, path: str) -> int:
+    if len(prefix) < _PREFIX_SIZE or prefix[:len(SAVE_FILE_MAGIC)] != SAVE_FILE_MAGIC or prefix[-1] not in (1, SAVE_FILE_VERSION):
+        raise ValueError(f"{path!r} is not a supported save file.")
+    return prefix[-1]
+
+
+def read_save_header(path: str) -> Dict[str, Any]:
+    """
+    Reads only the summary header of a save file.
+
+    Returns:
+        Dict[str, Any]: The header; empty for version 1 files, which have none.
+
+    Raises:
+        ValueError: If the file is not a supported save file.
+    """
+    with open(path, "rb") as save_file:
+        version = _read_version(save_file.read(_PREFIX_SIZE), path)
+        if version == 1:
+            return {}
+        (header_length,) = _HEADER_LENGTH_STRUCT.unpack(save_file.read(_HEADER_LENGTH_STRUCT.size))
+        return json.loads(save_file.read(header_length).decode("utf-8"))
+
+
+def load_save_file(path: str) -> Tuple[Any, Any]:
+    """
+    Loads a save file.
+
+    Only load saves you created; the payload is a pickle.
+
+    Returns:
+        Tuple[PlayerInventory, GameState]: The restored game.
+
+    Raises:
+        ValueError: If the file is not a supported save file.
+    """
+    with open(path, "rb") as save_file:
+        data = save_file.read()
+    payload_start = _PREFIX_SIZE
+    if _read_version(data[:_PREFIX_SIZE], path) > 1:
+        (header_length,) = _HEADER_LENGTH_STRUCT.unpack_from(data, _PREFIX_SIZE)
+        payload_start += _HEADER_LENGTH_STRUCT.size + header_length
+    player_inventory, game_state = pickle.loads(zlib.decompress(data[payload_start:]))
+    return player_inventory, game_state
@@ -0,0 +1,237 @@
+"""
+Save listings that never open the saves themselves.
+
+Every save directory holds an `index.json` mapping save file names to a
+`SaveSummary` (day, region, cash, net worth, campaign phase, timestamp, ...).
+The summary is built from `GameState.get_game_state_summary` plus the
+player's finances when the save is taken. It is stored both in the index and
+in the save's own header, so a lost or stale index can be rebuilt from
+headers without unpickling anything. A load menu lists hundreds of saves with
+a single read of the index.
+
+Thumbnails for the menu are generated lazily, only for summaries actually
+shown, and cached on disk next to the saves, keyed by the save's timestamp.
+"""
+
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ..mechanics.net_worth import calculate_net_worth, get_net_worth_tracker
+from .logger import get_logger
+from .save_files import SAVE_FILE_EXTENSION, read_save_header, write_file_atomically
+
+logger = get_logger(__name__)
+
+INDEX_FILE_NAME = "index.json"
+INDEX_VERSION = 1
+THUMBNAIL_DIRECTORY_NAME = "thumbnails"
+
+
+class SaveSummary(NamedTuple):
+    """What a save listing shows about one save."""
+
+    file_name: str
+    day: int
+    region: Optional[str]
+    cash: float
+    net_worth: float
+    campaign_phase: Optional[int]
+    timestamp: float
+    game_won: bool = False
+    region_heat: Dict[str, int] = {}
+
+    def to_header(self) -> Dict[str, Any]:
+        """Returns the JSON-compatible form stored in headers and the index."""
+        return self._asdict()
+
+    def title(self) -> str:
+        """Returns the listing's headline: file, day, region and campaign phase."""
+        phase_text = f" | Phase {self.campaign_phase}" if self.campaign_phase is not None else ""
+        return f"{self.file_name}  -  Day {self.day} in {self.region or 'Unknown'}{phase_text}"
+
+    @classmethod
+    def from_header(cls, header: Dict[str, Any]) -> "SaveSummary":
+        """Builds a summary from a header or index entry, ignoring unknown keys."""
+        return cls(**{field: header[field] for field in cls._fields if field in header})
+
+
+def build_save_summary(
+    file_name: str, player_inventory: Any, game_state: Any, timestamp: Optional[float] = None
+) -> SaveSummary:
+    """
+    Summarizes a game for its save header and the save index.
+
+    Net worth comes from the NetWorthTracker when one is attached, so this
+    is cheap enough to run on the UI thread.
+    """
+    state_summary = game_state.get_game_state_summary()
+    tracker = get_net_worth_tracker(player_inventory, game_state)
+    net_worth = tracker.net_worth if tracker is not None else calculate_net_worth(player_inventory, game_state)
+    return SaveSummary(
+        file_name=file_name,
+        day=state_summary["current_day"],
+        region=state_summary["current_player_region_name"],
+        cash=float(player_inventory.cash),
+        net_worth=float(net_worth),
+        campaign_phase=game_state.campaign_phase,
+        timestamp=time.time() if timestamp is None else timestamp,
+        game_won=bool(state_summary["game_won"]),
+        region_heat={
+            region_name.value: region.current_heat for region_name, region in game_state.all_regions.items()
+        },
+    )
+
+
+class SaveIndex:
+    """
+    The `index.json` of one save directory.
+
+    Attributes:
+        save_directory (str): The directory the index describes.
+    """
+
+    def __init__(self, save_directory: str) -> None:
+        self.save_directory: str = save_directory
+        self._summaries: Optional[Dict[str, SaveSummary]] = None
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.save_directory, INDEX_FILE_NAME)
+
+    def load(self) -> List[SaveSummary]:
+        """
+        Returns every indexed save, newest first, reading only the index file.
+
+        Rebuilds the index from save headers if it is missing or unreadable.
+        """
+        try:
+            with open(self.index_path, encoding="utf-8") as index_file:
+                data = json.load(index_file)
+            if data.get("version") != INDEX_VERSION:
+                raise ValueError(f"Unsupported save index version {data.get('version')!r}.")
+            self._summaries = {
+                file_name: SaveSummary.from_header(entry) for file_name, entry in data["saves"].items()
+            }
+        except FileNotFoundError:
+            self.rebuild()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Save index {self.index_path!r} is unreadable ({e}); rebuilding from save headers.")
+            self.rebuild()
+        return self.entries()
+
+    def entries(self) -> List[SaveSummary]:
+        """Returns the indexed saves held in memory, newest first."""
+        if self._summaries is None:
+            return self.load()
+        return sorted(self._summaries.values(), key=lambda summary: summary.timestamp, reverse=True)
+
+    def update(self, summary: SaveSummary) -> None:
+        """Adds or replaces a save's entry and rewrites the index atomically."""
+        if self._summaries is None:
+            self.load()
+        assert self._summaries is not None
+        self._summaries[summary.file_name] = summary
+        self._write()
+
+    def remove(self, file_name: str) -> None:
+        """Drops a save's entry (e.g. after the file was deleted) and rewrites the index."""
+        if self._summaries is None:
+            self.load()
+        assert self._summaries is not None
+        if self._summaries.pop(file_name, None) is not None:
+            self._write()
+
+    def rebuild(self) -> List[SaveSummary]:
+        """Recreates the index from the headers of every save in the directory."""
+        summaries: Dict[str, SaveSummary] = {}
+        if os.path.isdir(self.save_directory):
+            for file_name in os.listdir(self.save_directory):
+                if not file_name.endswith(SAVE_FILE_EXTENSION):
+                    continue
+                path = os.path.join(self.save_directory, file_name)
+                try:
+                    header = read_save_header(path)
+                except (OSError, ValueError) as e:
+                    logger.warning("Skipping unreadable save %r: %s", path, e)
+                    continue
+                if not header: # Written before save headers existed
+                    header = {"day": 0, "region": None, "cash": 0.0, "net_worth": 0.0,
+                              "campaign_phase": None, "timestamp": os.path.getmtime(path)}
+                header["file_name"] = file_name
+                summaries[file_name] = SaveSummary.from_header(header)
+        self._summaries = summaries
+        if os.path.isdir(self.save_directory):
+            self._write()
+        return self.entries()
+
+    def _write(self) -> None:
+        assert self._summaries is not None
+        os.makedirs(self.save_directory, exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "saves": {file_name: summary.to_header() for file_name, summary in self._summaries.items()},
+        }
+        write_file_atomically(self.index_path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+
+class ThumbnailCache:
+    """
+    Lazily generated save thumbnails, cached as files under `<save dir>/thumbnails`.
+
+    A thumbnail is named after its save and the save's timestamp, so
+    overwriting a save slot makes the old thumbnail stale; stale thumbnails
+    are deleted when the new one is generated. The outcome for each save
+    version is remembered, failed renders included, so a menu redrawn every
+    frame only touches the disk when a save changes.
+    """
+
+    def __init__(self, save_directory: str, extension: str = ".png") -> None:
+        self.directory: str = os.path.join(save_directory, THUMBNAIL_DIRECTORY_NAME)
+        self.extension: str = extension
+        # Save file name -> (thumbnail path of the version last seen, that path or None if rendering failed)
+        self._known: Dict[str, Tuple[str, Optional[str]]] = {}
+
+    def _stem(self, file_name: str) -> str:
+        return os.path.splitext(file_name)[0]
+
+    def path_for(self, summary: SaveSummary) -> str:
+        """Returns where the thumbnail for this version of the save lives."""
+        return os.path.join(
+            self.directory, f"{self._stem(summary.file_name)}-{int(summary.timestamp * 1000)}{self.extension}"
+        )
+
+    def get(self, summary: SaveSummary, render: Callable[[SaveSummary, str], None]) -> Optional[str]:
+        """
+        Returns the thumbnail path for a save, rendering it first if it is not cached.
+
+        Args:
+            summary: The save to get a thumbnail for.
+            render: Writes a thumbnail image for `summary` to the given path.
+
+        Returns:
+            Optional[str]: The thumbnail path, or None if rendering failed.
+        """
+        path = self.path_for(summary)
+        known = self._known.get(summary.file_name)
+        if known is not None and known[0] == path:
+            return known[1]
+        if os.path.exists(path):
+            self._known[summary.file_name] = (path, path)
+            return path
+        os.makedirs(self.directory, exist_ok=True)
+        prefix = f"{self._stem(summary.file_name)}-"
+        for stale_name in os.listdir(self.directory):
+            if stale_name.startswith(prefix) and stale_name[len(prefix):-len(self.extension)].isdigit():
+                os.remove(os.path.join(self.directory, stale_name))
+        temp_path = os.path.join(self.directory, f"{prefix}rendering{self.extension}")
+        try:
+            render(summary, temp_path)
+            os.replace(temp_path, path)
+        except Exception as e: # Whatever `render` raises, a missing thumbnail must not break the menu
+            logger.warning("Could not render thumbnail for %r: %s", summary.file_name, e)
+            self._known[summary.file_name] = (path, None)
+            return None
+        self._known[summary.file_name] = (path, path)
+        return path
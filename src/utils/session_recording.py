@@ -0,0 +1,291 @@
+"""
+Recording of player sessions as a compact, replayable command stream.
+
+A session is the RNG seed the game was started with, followed by every
+player action in the order it was taken, plus periodic state-hash
+checkpoints. Because all game randomness comes from the seeded `random`
+module, re-running the same actions from the same seed reproduces the same
+game; the checkpoints prove it.
+
+Action arguments are encoded without pickling: game objects become
+references (`{"ref": "player_inventory"}`, `{"region": "Downtown"}`) that are
+resolved against the replaying game, and enums become `{"enum": ..., "value": ...}`.
+Recordings are JSON lines, one command or checkpoint per line. The header
+carries the engine fingerprint: a recording made by different engine code
+would draw random numbers in a different order, so it is refused rather than
+replayed into a false divergence.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+from ..core import enums as core_enums
+from ..core.player_inventory import PlayerInventory
+from ..core.region import Region
+from .engine_fingerprint import engine_fingerprint
+
+RECORDING_FORMAT = "narco-session"
+RECORDING_VERSION = 2
+
+_ENUM_CLASSES: Dict[str, type] = {
+    name: value
+    for name, value in vars(core_enums).items()
+    if inspect.isclass(value) and issubclass(value, Enum) and value is not Enum
+}
+
+
+class RecordedCommand(NamedTuple):
+    """One player action: its step number, action name, encoded arguments and text-input state."""
+
+    step: int
+    action: str
+    args: List[Any]
+    inputs: Dict[str, str]
+
+
+class Checkpoint(NamedTuple):
+    """A state hash taken after `step` commands, on game day `day`."""
+
+    step: int
+    day: int
+    state_hash: str
+
+
+class ReplayContext(NamedTuple):
+    """The objects of the replaying game that encoded references resolve to."""
+
+    player_inventory: PlayerInventory
+    game_state: Any
+    game_configs: Any
+
+
+def encode_action_argument(value: Any, context: ReplayContext) -> Any:
+    """
+    Encodes an action argument as JSON-compatible data.
+
+    Raises:
+        TypeError: If the value has no known encoding.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return {"enum": type(value).__name__, "value": value.value}
+    if value is context.player_inventory:
+        return {"ref": "player_inventory"}
+    if value is context.game_state:
+        return {"ref": "game_state"}
+    if value is context.game_configs:
+        return {"ref": "game_configs"}
+    if isinstance(value, Region):
+        return {"region": value.name.value}
+    if isinstance(value, (list, tuple)):
+        return [encode_action_argument(item, context) for item in value]
+    raise TypeError(f"Cannot record action argument of type {type(value).__name__}: {value!r}")
+
+
+def decode_action_argument(encoded: Any, context: ReplayContext) -> Any:
+    """Resolves an encoded action argument against the replaying game."""
+    if isinstance(encoded, list):
+        return [decode_action_argument(item, context) for item in encoded]
+    if not isinstance(encoded, dict):
+        return encoded
+    if "enum" in encoded:
+        return _ENUM_CLASSES[encoded["enum"]](encoded["value"])
+    if "ref" in encoded:
+        return getattr(context, encoded["ref"])
+    if "region" in encoded:
+        return context.game_state.all_regions[core_enums.RegionName(encoded["region"])]
+    raise ValueError(f"Unknown encoded action argument: {encoded!r}")
+
+
+def compute_state_hash(player_inventory: PlayerInventory, game_state: Any) -> str:
+    """
+    Hashes the game state a replay must reproduce.
+
+    Covers the player's cash, stash, crypto, skills and trust, the day, the
+    current region, every region's heat and stock, crypto prices and
+    campaign flags.
+    """
+    current_region = getattr(game_state, "current_player_region", None)
+    regions = tuple(
+        (
+            region_name.value,
+            region.current_heat,
+            tuple(sorted(
+                (drug.value, quality.name, data.get("quantity_available", 0))
+                for drug, market in region.drug_market_data.items()
+                for quality, data in market.get("available_qualities", {}).items()
+            )),
+            len(region.active_market_events),
+        )
+        for region_name, region in sorted(game_state.all_regions.items(), key=lambda item: item[0].value)
+    )
+    canonical_state = (
+        game_state.current_day,
+        current_region.name.value if current_region is not None else None,
+        repr(player_inventory.cash),
+        player_inventory.current_load,
+        tuple(sorted(
+            (drug.value, quality.name, quantity)
+            for drug, qualities in player_inventory.items.items()
+            for quality, quantity in qualities.items()
+        )),
+        tuple(sorted((coin.value, repr(balance)) for coin, balance in player_inventory.crypto_wallet.items())),
+        tuple(sorted((key, repr(value)) for key, value in player_inventory.staked_drug_coin.items())),
+        tuple(sorted(player_inventory.unlocked_skills)),
+        tuple(sorted((contact.value, trust) for contact, trust in player_inventory.contact_trusts.items())),
+        tuple(sorted((coin.value, repr(price)) for coin, price in game_state.current_crypto_prices.items())),
+        tuple(game_state.achieved_legacy_scenarios),
+        getattr(game_state, "game_won", False),
+        regions,
+    )
+    return hashlib.blake2b(repr(canonical_state).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SessionRecorder:
+    """
+    Collects the commands and checkpoints of one play session.
+
+    Attributes:
+        seed (int): The seed `random` was initialised with before the game was created.
+        commands (List[RecordedCommand]): Recorded player actions, in order.
+        checkpoints (List[Checkpoint]): State hashes, taken whenever the day advances.
+    """
+
+    def __init__(self, seed: int) -> None:
+        self.seed: int = seed
+        self.commands: List[RecordedCommand] = []
+        self.checkpoints: List[Checkpoint] = []
+        self.context: Optional[ReplayContext] = None
+        self.input_snapshot: Callable[[], Dict[str, str]] = dict
+        self._last_checkpoint_day: Optional[int] = None
+
+    def attach(self, context: ReplayContext, input_snapshot: Callable[[], Dict[str, str]]) -> None:
+        """
+        Binds the recorder to the running game and records the starting checkpoint.
+
+        Args:
+            context: The live game objects that action arguments may refer to.
+            input_snapshot: Returns the UI text-input state actions read
+                (e.g. the typed quantity), recorded with every command.
+        """
+        self.context = context
+        self.input_snapshot = input_snapshot
+        self.checkpoint()
+
+    def record(self, action: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        """Records an action invocation before it runs."""
+        if self.context is None:
+            return
+        if kwargs:
+            args = args + tuple(kwargs[name] for name in sorted(kwargs))
+        encoded_args = [encode_action_argument(arg, self.context) for arg in args]
+        inputs = {key: value for key, value in self.input_snapshot().items() if value}
+        self.commands.append(RecordedCommand(len(self.commands) + 1, action, encoded_args, inputs))
+
+    def checkpoint(self, force: bool = True) -> None:
+        """Records a state hash; with `force=False`, only if the day advanced since the last one."""
+        if self.context is None:
+            return
+        day = self.context.game_state.current_day
+        if not force and day == self._last_checkpoint_day:
+            return
+        self._last_checkpoint_day = day
+        self.checkpoints.append(Checkpoint(
+            len(self.commands), day, compute_state_hash(self.context.player_inventory, self.context.game_state)
+        ))
+
+    def save(self, path: str) -> None:
+        """Writes the session as JSON lines: a header, then commands and checkpoints in step order."""
+        with open(path, "w", encoding="utf-8") as recording_file:
+            write_recording(recording_file, self.seed, self.commands, self.checkpoints)
+
+
+def write_recording(
+    recording_file: TextIO, seed: int, commands: List[RecordedCommand], checkpoints: List[Checkpoint]
+) -> None:
+    """Writes a recording to an open text file."""
+    header = {"format": RECORDING_FORMAT, "version": RECORDING_VERSION, "engine": engine_fingerprint(), "seed": seed}
+    recording_file.write(json.dumps(header) + "\n")
+    checkpoint_index = 0
+    for command in [None] + list(commands):
+        step = command.step if command is not None else 0
+        if command is not None:
+            recording_file.write(json.dumps({"c": [command.step, command.action, command.args, command.inputs]}, separators=(",", ":")) + "\n")
+        while checkpoint_index < len(checkpoints) and checkpoints[checkpoint_index].step <= step:
+            checkpoint = checkpoints[checkpoint_index]
+            recording_file.write(json.dumps({"k": [checkpoint.step, checkpoint.day, checkpoint.state_hash]}, separators=(",", ":")) + "\n")
+            checkpoint_index += 1
+
+
+def read_recording(path: str) -> Tuple[int, Iterator[Union[RecordedCommand, Checkpoint]]]:
+    """
+    Reads a recording file.
+
+    Returns:
+        The seed, and an iterator over commands and checkpoints in recorded order.
+
+    Raises:
+        ValueError: If the file is not a session recording of a supported version,
+            or was recorded with a different engine and so cannot replay faithfully.
+    """
+    with open(path, encoding="utf-8") as recording_file:
+        lines = recording_file.read().splitlines()
+    header = json.loads(lines[0]) if lines else {}
+    if header.get("format") != RECORDING_FORMAT or header.get("version") != RECORDING_VERSION:
+        raise ValueError(f"{path!r} is not a version {RECORDING_VERSION} session recording.")
+    if header.get("engine") != engine_fingerprint():
+        raise ValueError(f"{path!r} was recorded with a different game engine and cannot be replayed.")
+
+    def entries() -> Iterator[Union[RecordedCommand, Checkpoint]]:
+        for line in lines[1:]:
+            entry = json.loads(line)
+            if "c" in entry:
+                yield RecordedCommand(*entry["c"])
+            elif "k" in entry:
+                yield Checkpoint(*entry["k"])
+
+    return int(header["seed"]), entries()
+
+
+# --- Action instrumentation ---
+
+_active_recorder: Optional[SessionRecorder] = None
+_recording_depth: int = 0
+
+
+def set_active_recorder(recorder: Optional[SessionRecorder]) -> None:
+    """Sets the recorder that `recorded_action` functions report to (None to stop recording)."""
+    global _active_recorder
+    _active_recorder = recorder
+
+
+def recorded_action(action_name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorates a player action so calls are recorded while a recorder is active.
+
+    Only the outermost action is recorded when actions call each other, since
+    replaying it re-runs the inner ones. A checkpoint is taken after any
+    action that advances the day.
+    """
+    def decorator(action: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(action)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            global _recording_depth
+            recorder = _active_recorder
+            if recorder is None or _recording_depth > 0:
+                return action(*args, **kwargs)
+            recorder.record(action_name, args, kwargs)
+            _recording_depth += 1
+            try:
+                return action(*args, **kwargs)
+            finally:
+                _recording_depth -= 1
+                recorder.checkpoint(force=False)
+        wrapper.recorded_action_name = action_name # type: ignore[attr-defined]
+        return wrapper
+    return decorator
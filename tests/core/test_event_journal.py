@@ -0,0 +1,74 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from src.core.event_journal import EventJournal, _flush_spilling_journals, read_journal_file
+from src.core.enums import DrugName, DrugQuality, EventType, JournalRecordKind, RegionName
+
+
+class TestEventJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.spill_path = os.path.join(self.temp_dir.name, "journal.bin")
+
+    def test_in_memory_records_are_bounded(self):
+        journal = EventJournal(capacity=3)
+        for day in range(1, 6):
+            journal.record(day, JournalRecordKind.MARKET_EVENT_ENDED)
+        self.assertEqual([record.day for record in journal.recent()], [3, 4, 5])
+        self.assertEqual([record.day for record in journal.recent(2)], [4, 5])
+        self.assertEqual([record.day for record in journal.since_day(5)], [5])
+        self.assertEqual(journal.total_records, 5)
+
+    def test_spills_in_batches_and_reads_back(self):
+        journal = EventJournal(spill_path=self.spill_path, spill_batch_size=2)
+        first = journal.record(
+            4, JournalRecordKind.MARKET_EVENT_ENDED, RegionName.DOCKS, EventType.DEMAND_SPIKE,
+            DrugName.COKE, DrugQuality.PURE, value=1.5,
+        )
+        self.assertFalse(os.path.exists(self.spill_path)) # Batch not full yet
+        second = journal.record(5, JournalRecordKind.MARKET_EVENT_DEPLETED, subject="The Chemist")
+        third = journal.record(6, JournalRecordKind.MARKET_EVENT_ENDED, subject="The Chemist")
+        journal.flush()
+        self.assertEqual(list(read_journal_file(self.spill_path)), [first, second, third])
+
+    def test_second_journal_appending_to_same_file_redefines_strings(self):
+        first_journal = EventJournal(spill_path=self.spill_path)
+        first_journal.record(1, JournalRecordKind.MARKET_EVENT_ENDED, subject="Rival A")
+        first_journal.flush()
+        second_journal = EventJournal(spill_path=self.spill_path)
+        second_journal.record(2, JournalRecordKind.MARKET_EVENT_ENDED, subject="Rival B")
+        second_journal.flush()
+        self.assertEqual([record.subject for record in read_journal_file(self.spill_path)], ["Rival A", "Rival B"])
+
+    def test_journal_is_picklable(self):
+        journal = EventJournal(spill_path=self.spill_path)
+        journal.record(1, JournalRecordKind.MARKET_EVENT_ENDED, RegionName.DOWNTOWN)
+        restored = pickle.loads(pickle.dumps(journal))
+        self.assertEqual(restored.recent(), journal.recent())
+
+    def test_clone_keeps_records_but_never_spills(self):
+        journal = EventJournal(spill_path=self.spill_path, spill_batch_size=1)
+        first = journal.record(1, JournalRecordKind.MARKET_EVENT_ENDED, RegionName.DOWNTOWN)
+        clone = journal.clone()
+        clone.record(2, JournalRecordKind.MARKET_EVENT_ENDED, RegionName.DOCKS)
+        clone.flush()
+        self.assertEqual(len(clone), 2)
+        self.assertEqual(journal.recent(), [first])
+        self.assertEqual(list(read_journal_file(self.spill_path)), [first])
+
+
+    def test_pending_records_are_written_at_exit(self):
+        journal = EventJournal(spill_path=self.spill_path)
+        first = journal.record(1, JournalRecordKind.MARKET_EVENT_ENDED, RegionName.DOWNTOWN)
+        restored = pickle.loads(pickle.dumps(journal)) # Loaded saves spill too
+        second = restored.record(2, JournalRecordKind.MARKET_EVENT_ENDED, RegionName.DOCKS)
+        _flush_spilling_journals()
+        self.assertCountEqual(read_journal_file(self.spill_path), [first, second])
+
+
+if __name__ == '__main__':
+    unittest.main()
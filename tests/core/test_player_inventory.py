@@ -1,5 +1,6 @@
 # tests/core/test_player_inventory.py
 import unittest
+from unittest.mock import MagicMock
 from src.core.player_inventory import PlayerInventory
 from src.core.enums import DrugName, DrugQuality, CryptoCoin, SkillID # Added DrugName, CryptoCoin
 # Assuming game_configs might be needed for default values if not mocking them all
@@ -341,5 +342,26 @@ class TestPlayerInventoryTransactions(unittest.TestCase):
         self.assertEqual(self.player_inv.get_quantity(self.drug_coke, self.quality_standard), 0) # No drugs
         self.assertEqual(self.player_inv.current_load, 0) # Load unchanged
 
+    def test_clone_is_independent(self):
+        self.player_inv.add_drug(self.drug_coke, self.quality_standard, 10)
+        self.player_inv.add_crypto(CryptoCoin.BITCOIN, 2.0)
+        listener = MagicMock()
+        self.player_inv.change_listeners.append(listener)
+
+        clone = self.player_inv.clone()
+        self.assertEqual(clone.items, self.player_inv.items)
+        self.assertEqual(clone.change_listeners, [])
+        clone.remove_drug(self.drug_coke, self.quality_standard, 4)
+        clone.remove_crypto(CryptoCoin.BITCOIN, 1.0)
+        clone.unlocked_skills.add("TEST_SKILL")
+        clone.cash += 100
+
+        self.assertEqual(self.player_inv.get_quantity(self.drug_coke, self.quality_standard), 10)
+        self.assertEqual(self.player_inv.crypto_wallet[CryptoCoin.BITCOIN], 2.0)
+        self.assertNotIn("TEST_SKILL", self.player_inv.unlocked_skills)
+        self.assertEqual(self.player_inv.cash, self.initial_cash)
+        listener.on_drug_quantity_changed.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
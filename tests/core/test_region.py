@@ -391,6 +391,63 @@ class TestRegion(unittest.TestCase):
         # Standard stock would be 30 (from mock_randint) + 50 from cheap stash
         self.assertEqual(self.region.drug_market_data[self.drug_name]["available_qualities"][self.quality_standard]["quantity_available"], 30 + stash_increase)
 
+    def test_clone_copies_market_and_events(self):
+        event = MarketEvent(
+            event_type=EventType.DEMAND_SPIKE,
+            target_drug_name=self.drug_name,
+            target_quality=self.quality_standard,
+            sell_price_multiplier=1.5,
+            buy_price_multiplier=1.2,
+            duration_remaining_days=3,
+            start_day=1,
+        )
+        self.region.active_market_events.append(event)
+        self.region.current_heat = 20
+        listener = MagicMock()
+        self.region.heat_listeners.append(listener)
+
+        clone = self.region.clone()
+        self.assertEqual(clone.name, self.region.name)
+        self.assertEqual(clone.drug_market_data, self.region.drug_market_data)
+        self.assertEqual(clone.current_heat, 20)
+        self.assertEqual(clone.heat_listeners, [])
+
+        clone.update_stock_on_buy(self.drug_name, self.quality_standard, 40)
+        clone.drug_market_data[self.drug_name]["rival_demand_modifier"] = 2.0
+        clone.active_market_events[0].duration_remaining_days -= 1
+        clone.modify_heat(5)
+        market_data = self.region.drug_market_data[self.drug_name]
+        self.assertEqual(market_data["available_qualities"][self.quality_standard]["quantity_available"], 150)
+        self.assertEqual(market_data["rival_demand_modifier"], 1.0)
+        self.assertEqual(event.duration_remaining_days, 3)
+        self.assertEqual(self.region.current_heat, 20)
+        listener.on_region_heat_changed.assert_not_called()
+
+    def test_market_changes_notify_market_listeners(self):
+        listener = MagicMock()
+        self.region.market_listeners.append(listener)
+
+        self.region.update_stock_on_buy(self.drug_name, self.quality_standard, 20)
+        listener.on_market_value_changed.assert_called_once_with(
+            self.region, self.drug_name, self.quality_standard, "quantity_available", 150, 130
+        )
+        self.region.set_drug_market_value(self.drug_name, "rival_demand_modifier", 1.4)
+        listener.on_market_value_changed.assert_called_with(
+            self.region, self.drug_name, None, "rival_demand_modifier", 1.0, 1.4
+        )
+        self.region.set_drug_market_value(self.drug_name, "rival_demand_modifier", 1.4) # Unchanged: no notification
+        self.assertEqual(listener.on_market_value_changed.call_count, 2)
+
+        event = MarketEvent(
+            event_type=EventType.DEMAND_SPIKE, target_drug_name=self.drug_name, target_quality=self.quality_standard,
+            sell_price_multiplier=1.5, buy_price_multiplier=1.2, duration_remaining_days=3, start_day=1,
+        )
+        self.region.add_market_event(event)
+        self.region.set_market_events([])
+        self.assertEqual(self.region.active_market_events, [])
+        self.assertEqual(listener.on_market_events_changed.call_count, 2)
+        self.assertEqual(self.region.clone().market_listeners, [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,94 @@
+import pickle
+import unittest
+
+from src.core.timeline import Timeline
+from src.core.enums import TimelineEventKind, RegionName
+
+
+class TestTimeline(unittest.TestCase):
+
+    def setUp(self):
+        self.timeline = Timeline()
+
+    def test_empty_timeline(self):
+        self.assertEqual(len(self.timeline), 0)
+        self.assertIsNone(self.timeline.peek_next_day())
+        self.assertEqual(self.timeline.pop_due(100), [])
+
+    def test_pop_due_returns_only_due_entries_in_day_order(self):
+        self.timeline.schedule(10, TimelineEventKind.TURF_WAR_END, RegionName.DOCKS)
+        self.timeline.schedule(3, TimelineEventKind.DEBT_PAYMENT_DUE, 1)
+        self.timeline.schedule(5, TimelineEventKind.LAUNDERING_ARRIVAL)
+
+        self.assertEqual(self.timeline.peek_next_day(), 3)
+        due = self.timeline.pop_due(5)
+        self.assertEqual([entry.day for entry in due], [3, 5])
+        self.assertEqual(due[0].payload, 1)
+        self.assertEqual(len(self.timeline), 1)
+        self.assertEqual(self.timeline.peek_next_day(), 10)
+
+    def test_same_day_entries_keep_priority_then_schedule_order(self):
+        self.timeline.schedule(7, TimelineEventKind.SEASONAL_EVENT_START, "second")
+        self.timeline.schedule(7, TimelineEventKind.SEASONAL_EVENT_START, "third")
+        self.timeline.schedule(7, TimelineEventKind.SEASONAL_EVENT_END, "first", priority=-1)
+
+        due = self.timeline.pop_due(7)
+        self.assertEqual([entry.payload for entry in due], ["first", "second", "third"])
+
+    def test_skipping_many_days_pops_everything_overdue(self):
+        for day in (2, 4, 6, 8):
+            self.timeline.schedule(day, TimelineEventKind.DEBT_PAYMENT_DUE, day)
+        due = self.timeline.pop_due(1000)
+        self.assertEqual([entry.payload for entry in due], [2, 4, 6, 8])
+        self.assertEqual(len(self.timeline), 0)
+
+    def test_rescheduling_same_key_supersedes_previous_entry(self):
+        self.timeline.schedule(5, TimelineEventKind.LAUNDERING_ARRIVAL, key="launder")
+        self.timeline.schedule(8, TimelineEventKind.LAUNDERING_ARRIVAL, key="launder")
+
+        self.assertEqual(len(self.timeline), 1)
+        self.assertEqual(self.timeline.pop_due(6), [])
+        due = self.timeline.pop_due(8)
+        self.assertEqual(len(due), 1)
+        self.assertFalse(self.timeline.is_scheduled("launder"))
+
+    def test_cancel(self):
+        self.timeline.schedule(5, TimelineEventKind.INFORMANT_AVAILABLE, key="informant")
+        self.assertTrue(self.timeline.is_scheduled("informant"))
+        self.assertTrue(self.timeline.cancel("informant"))
+        self.assertFalse(self.timeline.cancel("informant"))
+        self.assertEqual(self.timeline.pop_due(10), [])
+
+    def test_pending_entries_snapshot(self):
+        self.timeline.schedule(9, TimelineEventKind.TURF_WAR_END, RegionName.DOCKS)
+        self.timeline.schedule(4, TimelineEventKind.DEBT_PAYMENT_DUE, 2)
+        self.assertEqual(
+            self.timeline.pending_entries(),
+            [(4, TimelineEventKind.DEBT_PAYMENT_DUE, 2), (9, TimelineEventKind.TURF_WAR_END, RegionName.DOCKS)],
+        )
+        self.assertEqual(len(self.timeline), 2) # Snapshot does not consume entries
+
+    def test_timeline_is_picklable(self):
+        self.timeline.schedule(5, TimelineEventKind.LAUNDERING_ARRIVAL, key="launder")
+        restored = pickle.loads(pickle.dumps(self.timeline))
+        self.assertTrue(restored.is_scheduled("launder"))
+        self.assertEqual(len(restored.pop_due(5)), 1)
+
+    def test_clone_is_independent(self):
+        self.timeline.schedule(5, TimelineEventKind.LAUNDERING_ARRIVAL, key="launder")
+        self.timeline.schedule(3, TimelineEventKind.DEBT_PAYMENT_DUE, 1)
+        self.timeline.schedule(4, TimelineEventKind.INFORMANT_AVAILABLE, key="informant")
+        self.timeline.cancel("informant")
+
+        clone = self.timeline.clone()
+        self.assertEqual(clone.pending_entries(), self.timeline.pending_entries())
+        self.assertTrue(clone.cancel("launder"))
+        clone.schedule(2, TimelineEventKind.TURF_WAR_END, RegionName.DOCKS)
+        self.assertEqual([entry.day for entry in clone.pop_due(10)], [2, 3])
+
+        self.assertTrue(self.timeline.is_scheduled("launder"))
+        self.assertEqual([entry.day for entry in self.timeline.pop_due(10)], [3, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src import narco_configs
+from src.core import world_template
+from src.core.enums import DrugName, DrugQuality, RegionName
+from src.core.region import Region
+from src.core.world_template import compile_world_template, get_world_template, world_config_fingerprint
+from src.game_state import GameState
+
+TEST_REGION_DEFINITIONS = [
+    (RegionName.DOWNTOWN, "Downtown", [
+        ("Weed", 50, 80, 1, {DrugQuality.STANDARD: (100, 200), DrugQuality.PURE: (5, 9)}),
+        ("Coke", 1000, 1500, 3, {DrugQuality.PURE: (10, 20), DrugQuality.CUT: (30, 20)}),
+    ]),
+    (RegionName.DOCKS, "Docks", [
+        ("Speed", 120, 250, 2, {}),
+        ("Weed", 40, 70, 1, {DrugQuality.STANDARD: (1, 3)}),
+        ("Speed", 130, 260, 2, {DrugQuality.CUT: (1, 2)}), # Replaces the first Speed entry
+    ]),
+    (RegionName.SUBURBS, "Suburbs", "not a list"),
+    ("bad key", "Suburbs", []),
+]
+
+
+def build_regions_directly(region_definitions):
+    """Builds the regions the way GameState did before world templates existed."""
+    all_regions = {}
+    for region_enum, region_name, drugs in region_definitions:
+        if not isinstance(region_enum, RegionName):
+            continue
+        region = Region(region_name)
+        for drug_name, buy, sell, tier, ranges in (drugs if isinstance(drugs, list) else []):
+            stocks = {}
+            for quality, (low, high) in ranges.items():
+                if low > high:
+                    low, high = 0, 0
+                stocks[quality] = random.randint(low, high)
+            region.initialize_drug_market(drug_name, buy, sell, tier, stocks)
+        all_regions[region_enum] = region
+    for region in all_regions.values():
+        region.restock_market()
+    return all_regions
+
+
+class TestWorldTemplate(unittest.TestCase):
+
+    def setUp(self):
+        world_template._template_cache.clear()
+        self.addCleanup(world_template._template_cache.clear)
+
+    def assert_same_world(self, built, expected):
+        self.assertEqual(list(built), list(expected))
+        for key, region in built.items():
+            self.assertEqual(region.name, expected[key].name)
+            self.assertEqual(region.drug_market_data, expected[key].drug_market_data)
+
+    def test_matches_direct_construction_and_random_stream(self):
+        for definitions in (TEST_REGION_DEFINITIONS, narco_configs.REGION_DEFINITIONS):
+            with patch.object(narco_configs, "REGION_DEFINITIONS", definitions):
+                for seed in (0, 7, 123):
+                    random.seed(seed)
+                    expected = build_regions_directly(definitions)
+                    expected_next_draw = random.random()
+                    random.seed(seed)
+                    built = get_world_template(narco_configs).instantiate()
+                    self.assert_same_world(built, expected)
+                    self.assertEqual(random.random(), expected_next_draw)
+
+    def test_instances_do_not_share_market_data(self):
+        template = get_world_template(narco_configs)
+        first, second = template.instantiate(), template.instantiate()
+        first[RegionName.DOWNTOWN].drug_market_data[DrugName.WEED]['available_qualities'][DrugQuality.STANDARD]['quantity_available'] = -1
+        self.assertNotEqual(
+            second[RegionName.DOWNTOWN].drug_market_data[DrugName.WEED]['available_qualities'][DrugQuality.STANDARD]['quantity_available'], -1
+        )
+
+    def test_compiled_once_per_config_fingerprint(self):
+        with patch.object(world_template, "compile_world_template", wraps=compile_world_template) as compile_mock:
+            GameState()
+            GameState()
+            self.assertEqual(compile_mock.call_count, 1)
+            with patch.object(narco_configs, "TIER1_STANDARD_INITIAL_STOCK", 42):
+                game_state = GameState()
+            self.assertEqual(compile_mock.call_count, 2)
+        weed = game_state.all_regions[RegionName.DOWNTOWN].drug_market_data[DrugName.WEED]
+        self.assertEqual(weed['available_qualities'][DrugQuality.STANDARD]['quantity_available'], 42)
+
+    def test_disk_cache_is_reused_across_processes(self):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                patch.object(narco_configs, "WORLD_TEMPLATE_CACHE_DIR", cache_dir, create=True):
+            template = get_world_template(narco_configs)
+            cache_path = os.path.join(cache_dir, f"world_template_{world_config_fingerprint(narco_configs)}.pickle")
+            self.assertTrue(os.path.exists(cache_path))
+
+            world_template._template_cache.clear() # As in a fresh process
+            with patch.object(world_template, "compile_world_template") as compile_mock:
+                self.assertEqual(get_world_template(narco_configs), template)
+            compile_mock.assert_not_called()
+
+
+    def test_engine_change_invalidates_the_fingerprint(self):
+        fingerprint = world_config_fingerprint(narco_configs)
+        with patch.object(world_template, "engine_fingerprint", return_value="another engine"):
+            self.assertNotEqual(world_config_fingerprint(narco_configs), fingerprint)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from src.core.enums import ConditionDependency, ContactID, RegionName
+from src.core.player_inventory import PlayerInventory
+from src.core.region import Region
+from src.mechanics.condition_engine import ConditionEngine
+from src.mechanics.regional_heat import average_regional_heat, get_regional_heat_aggregate
+from src.mechanics.win_conditions import WIN_CONDITION_CHECKS, WIN_CONDITION_DEPENDENCIES
+from src.mechanics.legacy_scenarios import LEGACY_SCENARIO_CHECKS, LEGACY_SCENARIO_DEPENDENCIES
+
+
+def make_game_state():
+    return SimpleNamespace(
+        all_regions={RegionName.DOWNTOWN: Region(RegionName.DOWNTOWN), RegionName.DOCKS: Region(RegionName.DOCKS)},
+        current_crypto_prices={},
+        crypto_prices_version=0,
+        player_sales_profit_by_region={},
+        achieved_legacy_scenarios=[],
+    )
+
+
+class TestRegionalHeatAggregate(unittest.TestCase):
+
+    def setUp(self):
+        self.game_state = make_game_state()
+        self.downtown = self.game_state.all_regions[RegionName.DOWNTOWN]
+        self.docks = self.game_state.all_regions[RegionName.DOCKS]
+
+    def test_average_follows_modify_heat_and_assignment(self):
+        self.downtown.modify_heat(10)
+        aggregate = get_regional_heat_aggregate(self.game_state)
+        self.assertEqual(aggregate.average(), 5.0)
+
+        self.docks.modify_heat(30)
+        self.downtown.current_heat = 0
+        self.assertEqual(average_regional_heat(self.game_state), 15.0)
+        self.docks.modify_heat(-100) # Clamped at 0
+        self.assertEqual(aggregate.total_heat, 0)
+        self.assertIs(get_regional_heat_aggregate(self.game_state), aggregate)
+
+    def test_new_regions_dict_gets_a_new_aggregate(self):
+        aggregate = get_regional_heat_aggregate(self.game_state)
+        self.game_state.all_regions = {RegionName.SUBURBS: Region(RegionName.SUBURBS)}
+        self.assertIsNot(get_regional_heat_aggregate(self.game_state), aggregate)
+
+    def test_falls_back_for_test_doubles(self):
+        game_state = Mock(all_regions={RegionName.DOWNTOWN: Mock(current_heat=4), RegionName.DOCKS: Mock(current_heat=8)})
+        self.assertIsNone(get_regional_heat_aggregate(game_state))
+        self.assertEqual(average_regional_heat(game_state), 6.0)
+        self.assertEqual(average_regional_heat(Mock(all_regions={}), default=float('inf')), float('inf'))
+
+
+class TestConditionEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.inventory = PlayerInventory(max_capacity=100, starting_cash=0.0)
+        self.game_state = make_game_state()
+        self.calls = []
+
+        def cash_check(inv, gs, cfg):
+            self.calls.append("cash")
+            return inv.cash >= 100
+
+        def heat_check(inv, gs, cfg):
+            self.calls.append("heat")
+            return average_regional_heat(gs) < 10
+
+        def undeclared_check(inv, gs, cfg):
+            self.calls.append("undeclared")
+            return False
+
+        self.engine = ConditionEngine(
+            {"Cash": cash_check, "Heat": heat_check, "Undeclared": undeclared_check},
+            {"Cash": (ConditionDependency.CASH,), "Heat": (ConditionDependency.REGIONAL_HEAT,)},
+        )
+        self.configs = Mock()
+
+    def evaluate(self):
+        return self.engine.evaluate(self.inventory, self.game_state, self.configs)
+
+    def test_first_evaluation_runs_everything(self):
+        self.assertEqual(self.evaluate(), {"Cash": False, "Heat": True, "Undeclared": False})
+        self.assertEqual(self.calls, ["cash", "heat", "undeclared"])
+
+    def test_only_conditions_with_changed_dependencies_rerun(self):
+        self.evaluate()
+        self.calls.clear()
+
+        self.evaluate()
+        self.assertEqual(self.calls, ["undeclared"]) # Undeclared conditions always rerun
+
+        self.calls.clear()
+        self.inventory.cash = 150.0
+        self.assertTrue(self.evaluate()["Cash"])
+        self.assertEqual(self.calls, ["cash", "undeclared"])
+
+        self.calls.clear()
+        self.game_state.all_regions[RegionName.DOCKS].modify_heat(40)
+        self.assertFalse(self.evaluate()["Heat"])
+        self.assertEqual(self.calls, ["heat", "undeclared"])
+
+    def test_rebinding_to_new_game_state_invalidates_results(self):
+        self.evaluate()
+        self.calls.clear()
+        self.game_state = make_game_state()
+        self.evaluate()
+        self.assertEqual(self.calls, ["cash", "heat", "undeclared"])
+
+    def test_registered_conditions_declare_dependencies(self):
+        self.assertEqual(set(WIN_CONDITION_DEPENDENCIES), set(WIN_CONDITION_CHECKS))
+        self.assertEqual(set(LEGACY_SCENARIO_DEPENDENCIES), set(LEGACY_SCENARIO_CHECKS))
+
+    def test_legacy_engine_picks_up_trust_change(self):
+        engine = ConditionEngine(LEGACY_SCENARIO_CHECKS, LEGACY_SCENARIO_DEPENDENCIES)
+        configs = SimpleNamespace(
+            REGIONAL_BARON_SALES_THRESHOLD_PER_REGION=1000,
+            REGIONAL_BARON_REGIONS_REQUIRED=2,
+            CRYPTO_WHALE_PORTFOLIO_VALUE_MIDGAME=1000,
+            CRYPTO_WHALE_MIN_LARGE_TRANSACTIONS=1,
+            THE_CLEANER_TOTAL_LAUNDERED_THRESHOLD=500,
+            THE_CLEANER_MIN_TECH_CONTACT_TRUST=50,
+            THE_CLEANER_MAX_AVG_HEAT_MIDGAME=20,
+        )
+        self.inventory.total_laundered_cash = 1000
+        self.inventory.contact_trusts[ContactID.TECH_CONTACT] = 10
+        self.assertIsNone(engine.evaluate(self.inventory, self.game_state, configs)["The Cleaner"])
+        self.inventory.contact_trusts[ContactID.TECH_CONTACT] = 80
+        self.assertEqual(engine.evaluate(self.inventory, self.game_state, configs)["The Cleaner"], "The Cleaner")
+
+
+if __name__ == '__main__':
+    unittest.main()
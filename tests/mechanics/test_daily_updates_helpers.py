@@ -1,9 +1,24 @@
+import random
 import unittest
 from unittest.mock import Mock, patch
 
 from src.core.player_inventory import PlayerInventory
+from src.game_setup import create_new_game
 from src.game_state import GameState
 from src.mechanics.daily_updates import _handle_debt_payments # Import the specific helper
+from src.mechanics.daily_updates import (
+    DailyUpdateResult,
+    advance_days,
+    perform_daily_updates,
+    _award_skill_points,
+    _perform_regional_updates,
+    _process_due_timeline_entries,
+    catch_up_region,
+    schedule_laundering_arrival,
+)
+from src.core.enums import DrugName, DrugQuality, EventType, RegionName, TimelineEventKind
+from src.core.market_event import MarketEvent
+from src.utils.random_streams import common_random_numbers, set_stream_day
 # Assuming narco_configs is where DEBT_PAYMENT_X_AMOUNT and _DUE_DAY are
 from src import narco_configs 
 
@@ -318,6 +333,213 @@ class TestCheckForBankruptcy(unittest.TestCase):
         self.assertEqual(len(log_msgs), 0)
 
 
+class TestTimelineDrivenUpdates(unittest.TestCase):
+
+    def setUp(self):
+        self.game_state = GameState()
+        self.player_inventory = PlayerInventory()
+
+    def test_game_state_schedules_debt_payments(self):
+        pending = self.game_state.timeline.pending_entries()
+        debt_days = [day for day, kind, _ in pending if kind == TimelineEventKind.DEBT_PAYMENT_DUE]
+        self.assertEqual(
+            debt_days,
+            [narco_configs.DEBT_PAYMENT_1_DUE_DAY, narco_configs.DEBT_PAYMENT_2_DUE_DAY, narco_configs.DEBT_PAYMENT_3_DUE_DAY],
+        )
+
+    def test_debt_only_processed_when_timeline_entry_is_due(self):
+        self.game_state.current_day = narco_configs.DEBT_PAYMENT_1_DUE_DAY
+        self.player_inventory.cash = narco_configs.DEBT_PAYMENT_1_AMOUNT + 100
+        result = DailyUpdateResult()
+
+        _process_due_timeline_entries(self.game_state, self.player_inventory, narco_configs, result)
+
+        self.assertTrue(self.player_inventory.debt_payment_1_paid)
+        self.assertIn("Debt Payment 1 made!", result.ui_messages)
+        # Entry consumed: processing the same day again does nothing
+        second_result = DailyUpdateResult()
+        _process_due_timeline_entries(self.game_state, self.player_inventory, narco_configs, second_result)
+        self.assertEqual(second_result.ui_messages, [])
+
+    def test_missed_debt_payment_is_game_over(self):
+        self.game_state.current_day = narco_configs.DEBT_PAYMENT_1_DUE_DAY
+        self.player_inventory.cash = 0.0
+        result = DailyUpdateResult()
+
+        _process_due_timeline_entries(self.game_state, self.player_inventory, narco_configs, result)
+
+        self.assertEqual(result.game_over_message, "GAME OVER: Failed Debt Payment 1!")
+
+    def test_laundering_arrival_fires_once_on_arrival_day(self):
+        self.player_inventory.pending_laundered_sc = 500.0
+        self.player_inventory.pending_laundered_sc_arrival_day = 4
+        schedule_laundering_arrival(self.game_state, 4)
+
+        self.game_state.current_day = 3
+        early_result = DailyUpdateResult()
+        _process_due_timeline_entries(self.game_state, self.player_inventory, narco_configs, early_result)
+        self.assertFalse(early_result.pending_laundered_sc_processed)
+
+        self.game_state.current_day = 4
+        result = DailyUpdateResult()
+        _process_due_timeline_entries(self.game_state, self.player_inventory, narco_configs, result)
+        self.assertTrue(result.pending_laundered_sc_processed)
+        self.assertEqual(self.player_inventory.pending_laundered_sc, 0.0)
+        self.assertIsNone(self.player_inventory.pending_laundered_sc_arrival_day)
+
+    def test_unscheduled_pending_laundering_is_picked_up(self):
+        self.player_inventory.pending_laundered_sc = 200.0
+        self.player_inventory.pending_laundered_sc_arrival_day = 2
+        self.game_state.current_day = 2
+        result = DailyUpdateResult()
+
+        _process_due_timeline_entries(self.game_state, self.player_inventory, narco_configs, result)
+
+        self.assertTrue(result.pending_laundered_sc_processed)
+
+    def test_informant_becomes_available_when_due(self):
+        self.game_state.informant_unavailable_until_day = 6
+        self.game_state.timeline.schedule(6, TimelineEventKind.INFORMANT_AVAILABLE)
+        self.game_state.current_day = 6
+        result = DailyUpdateResult()
+
+        _process_due_timeline_entries(self.game_state, self.player_inventory, narco_configs, result)
+
+        self.assertIsNone(self.game_state.informant_unavailable_until_day)
+        self.assertIn("Your informant is available again.", result.ui_messages)
+
+    def test_turf_war_ends_when_due(self):
+        region_name = RegionName.DOCKS
+        self.game_state.active_turf_wars[region_name] = {"end_day": 5, "affected_drugs": [], "affected_contacts": []}
+        self.game_state.timeline.schedule(6, TimelineEventKind.TURF_WAR_END, region_name)
+        self.game_state.current_day = 6
+        result = DailyUpdateResult()
+
+        _process_due_timeline_entries(self.game_state, self.player_inventory, narco_configs, result)
+
+        self.assertNotIn(region_name, self.game_state.active_turf_wars)
+        self.assertEqual(len(result.ui_messages), 1)
+
+
+
+class TestLazyRegionUpdates(unittest.TestCase):
+
+    def setUp(self):
+        self.player_inventory = PlayerInventory()
+
+    def _stale_game(self):
+        game_state = GameState()
+        region = game_state.all_regions[RegionName.RIVERSIDE]
+        drug = next(iter(region.drug_market_data))
+        for key, value in (("player_buy_impact_modifier", 1.5), ("player_sell_impact_modifier", 0.6),
+                           ("rival_demand_modifier", 1.6), ("rival_supply_modifier", 0.7),
+                           ("last_rival_activity_turn", 2)):
+            region.set_drug_market_value(drug, key, value)
+        for duration in (2, 4, 20):
+            region.add_market_event(MarketEvent(
+                event_type=EventType.DEMAND_SPIKE, target_drug_name=drug, target_quality=DrugQuality.STANDARD,
+                sell_price_multiplier=1.5, buy_price_multiplier=1.2, duration_remaining_days=duration, start_day=1,
+            ))
+        return game_state, region, drug
+
+    def test_regions_start_up_to_date(self):
+        game_state = GameState()
+        self.assertTrue(all(region.last_updated_day == game_state.current_day for region in game_state.all_regions.values()))
+
+    def test_catch_up_matches_updating_every_day(self):
+        daily_state, daily_region, drug = self._stale_game()
+        lazy_state, lazy_region, _ = self._stale_game()
+        for day in range(2, 12):
+            daily_state.current_day = day
+            catch_up_region(daily_region, daily_state)
+        lazy_state.current_day = 11
+        catch_up_region(lazy_region, lazy_state)
+
+        self.assertEqual(lazy_region.last_updated_day, 11)
+        for key in ("player_buy_impact_modifier", "player_sell_impact_modifier", "rival_demand_modifier", "rival_supply_modifier"):
+            self.assertAlmostEqual(lazy_region.drug_market_data[drug][key], daily_region.drug_market_data[drug][key], msg=key)
+        self.assertEqual(
+            [event.duration_remaining_days for event in lazy_region.active_market_events],
+            [event.duration_remaining_days for event in daily_region.active_market_events],
+        )
+        self.assertEqual(
+            [(record.day, record.kind) for record in lazy_state.event_journal.recent()],
+            [(record.day, record.kind) for record in daily_state.event_journal.recent()],
+        )
+
+    def test_only_the_players_market_is_updated_daily(self):
+        game_state = GameState()
+        game_state.set_current_player_region(RegionName.DOWNTOWN)
+        remote_region = game_state.all_regions[RegionName.RIVERSIDE]
+        remote_region.current_heat = 50
+        game_state.current_day = 2
+
+        _perform_regional_updates(game_state, self.player_inventory, narco_configs)
+
+        self.assertEqual(game_state.all_regions[RegionName.DOWNTOWN].last_updated_day, 2)
+        self.assertEqual(remote_region.last_updated_day, 1)
+        self.assertLess(remote_region.current_heat, 50) # Heat still decays everywhere
+        catch_up_region(remote_region, game_state)
+        self.assertEqual(remote_region.last_updated_day, 2)
+
+
+
+class TestAdvanceDays(unittest.TestCase):
+
+    def _new_game(self, seed):
+        random.seed(seed)
+        player_inventory, game_state, _ = create_new_game()
+        for region in game_state.all_regions.values():
+            region.current_heat = 90
+        player_inventory.staked_drug_coin["staked_amount"] = 100.0
+        return player_inventory, game_state
+
+    def test_matches_daily_updates_under_common_random_numbers(self):
+        for seed in range(6):
+            with common_random_numbers(seed):
+                daily_inventory, daily_state = self._new_game(seed)
+                for _ in range(20):
+                    daily_state.current_day += 1
+                    set_stream_day(daily_state.current_day)
+                    daily_result = perform_daily_updates(daily_state, daily_inventory, narco_configs)
+                    if daily_result.game_over_message or daily_result.blocking_event_data:
+                        break
+            with common_random_numbers(seed):
+                inventory, game_state = self._new_game(seed)
+                result = advance_days(game_state, inventory, narco_configs, 20)
+
+            self.assertEqual(game_state.current_day, daily_state.current_day)
+            self.assertEqual(result.days_advanced, game_state.current_day - 1)
+            self.assertEqual(result.blocking_event_data is not None, daily_result.blocking_event_data is not None)
+            self.assertEqual(
+                {name: region.current_heat for name, region in game_state.all_regions.items()},
+                {name: region.current_heat for name, region in daily_state.all_regions.items()},
+            )
+            self.assertAlmostEqual(inventory.cash, daily_inventory.cash)
+            self.assertEqual(inventory.skill_points, daily_inventory.skill_points)
+            self.assertAlmostEqual(
+                inventory.staked_drug_coin["pending_rewards"], daily_inventory.staked_drug_coin["pending_rewards"]
+            )
+
+    def test_stops_at_the_first_popup(self):
+        player_inventory, game_state = self._new_game(1)
+        with patch.object(narco_configs, "OPPORTUNITY_EVENT_BASE_CHANCE", 1.0):
+            result = advance_days(game_state, player_inventory, narco_configs, 10)
+        self.assertLess(result.days_advanced, 10) # Some opportunities need the player to hold drugs
+        self.assertEqual(game_state.current_day, 1 + result.days_advanced)
+        self.assertIsNotNone(result.blocking_event_data)
+
+    def test_skill_points_count_award_days_in_the_span(self):
+        player_inventory = PlayerInventory()
+        game_state = GameState()
+        game_state.current_day = 22
+        interval = narco_configs.SKILL_POINTS_PER_X_DAYS
+        _award_skill_points(game_state, player_inventory, narco_configs, days=22)
+        self.assertEqual(player_inventory.skill_points, 22 // interval)
+        _award_skill_points(game_state, player_inventory, narco_configs, days=3, through_day=2 * interval)
+        self.assertEqual(player_inventory.skill_points, 22 // interval + 1)
+
+
 if __name__ == '__main__':
     unittest.main()
 [end of tests/mechanics/test_daily_updates_helpers.py]
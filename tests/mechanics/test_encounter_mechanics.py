@@ -0,0 +1,153 @@
+import copy
+import random
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src import narco_configs
+
+from src.core.enums import DrugName, DrugQuality, RegionName
+from src.core.player_inventory import PlayerInventory
+from src.core.region import Region
+from src.mechanics.encounter_mechanics import (
+    bribe_odds, police_stop_odds, resolve_bribe_attempt, resolve_police_stop, resolve_search_outcome, search_odds,
+)
+
+
+def make_configs(**overrides):
+    values = dict(
+        POLICE_STOP_BASE_CHANCE=0.2, POLICE_STOP_HEAT_THRESHOLD=50,
+        POLICE_STOP_CHANCE_PER_HEAT_POINT_ABOVE_THRESHOLD=0.01, MAX_POLICE_STOP_CHANCE=0.75,
+        POLICE_STOP_SEVERITY_THRESHOLD_WARNING=0.3, POLICE_STOP_SEVERITY_THRESHOLD_FINE=0.6,
+        POLICE_FINE_BASE_MIN=100, POLICE_FINE_BASE_MAX=100, POLICE_FINE_HEAT_DIVISOR=20,
+        POLICE_STOP_CONTRABAND_THRESHOLD_UNITS=10, POLICE_STOP_CONFISCATION_CHANCE=0.5,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestResolvePoliceStop(unittest.TestCase):
+
+    def setUp(self):
+        self.player_inv = PlayerInventory()
+        self.player_inv.cash = 1000.0
+        self.region = Region(RegionName.DOWNTOWN)
+        self.region.current_heat = 40
+        self.configs = make_configs()
+
+    def resolve(self, draws):
+        with patch("random.random", side_effect=draws):
+            return resolve_police_stop(self.player_inv, self.region, self.configs)
+
+    def test_no_stop(self):
+        result = self.resolve([0.5])
+        self.assertEqual(result["message_key"], "no_stop")
+        self.assertAlmostEqual(result["stop_chance"], 0.2)
+
+    def test_fine_scales_with_heat(self):
+        result = self.resolve([0.1, 0.5])
+        self.assertEqual(result["message_key"], "stop_fine")
+        self.assertEqual(result["fine_paid"], 300.0) # 100 * (1 + 40 // 20)
+        self.assertEqual(self.player_inv.cash, 700.0)
+
+    def test_search_confiscates_whole_stash_above_threshold(self):
+        self.player_inv.add_drug(DrugName.WEED, DrugQuality.STANDARD, 20)
+        result = self.resolve([0.1, 0.9, 0.2])
+        self.assertEqual(result["message_key"], "stop_search_confiscated")
+        self.assertEqual(result["contraband_units"], 20)
+        self.assertEqual(self.player_inv.get_quantity(DrugName.WEED, DrugQuality.STANDARD), 0)
+
+    def test_search_below_threshold_keeps_stash(self):
+        self.player_inv.add_drug(DrugName.WEED, DrugQuality.STANDARD, 5)
+        result = self.resolve([0.1, 0.9])
+        self.assertEqual(result["message_key"], "stop_search_missed")
+        self.assertEqual(self.player_inv.get_quantity(DrugName.WEED, DrugQuality.STANDARD), 5)
+
+
+class TestEncounterOdds(unittest.TestCase):
+
+    def setUp(self):
+        self.player_inv = PlayerInventory()
+        self.player_inv.cash = 1000.0
+        self.region = Region(RegionName.DOWNTOWN)
+        self.region.current_heat = 40
+
+    def sample_outcomes(self, resolve, runs=20000):
+        """Plays a resolver on copies of the state and returns the message key frequencies and mean results."""
+        random.seed(5)
+        counts, totals = Counter(), Counter()
+        for _ in range(runs):
+            player_inv, region = copy.deepcopy(self.player_inv), copy.deepcopy(self.region)
+            result = resolve(player_inv, region)
+            counts[result["message_key"]] += 1
+            totals["cash"] += self.player_inv.cash - player_inv.cash
+            totals["units"] += self.player_inv.current_load - player_inv.current_load
+            totals["heat"] += region.current_heat - self.region.current_heat
+            totals["jail"] += result.get("jail_days", 0) > 0
+        return {key: n / runs for key, n in counts.items()}, {key: n / runs for key, n in totals.items()}
+
+    def test_police_stop_branches(self):
+        self.player_inv.add_drug(DrugName.WEED, DrugQuality.STANDARD, 20)
+        configs = make_configs(POLICE_FINE_BASE_MAX=600)
+        odds = police_stop_odds(self.player_inv, self.region, configs)
+        self.assertAlmostEqual(odds.outcome_chances["no_stop"], 0.8)
+        self.assertAlmostEqual(odds.outcome_chances["stop_warning"], 0.06)
+        self.assertAlmostEqual(odds.outcome_chances["stop_search_confiscated"], 0.04)
+        self.assertAlmostEqual(sum(odds.outcome_chances.values()), 1.0)
+        self.assertAlmostEqual(odds.expected_confiscated_units, 0.8)
+        # Base fines 100..600 times 3, capped at the 1000 cash: bases above 333 pay 1000
+        expected_fine = (sum(min(1000.0, 3 * base) for base in range(100, 601)) / 501) * 0.06
+        self.assertAlmostEqual(odds.expected_cash_loss, expected_fine)
+        self.assertEqual(odds.jail_chance, 0.0)
+
+    def test_police_stop_odds_match_sampled_stops(self):
+        self.player_inv.add_drug(DrugName.COKE, DrugQuality.PURE, 15)
+        self.region.current_heat = 70
+        odds = police_stop_odds(self.player_inv, self.region, narco_configs)
+        frequencies, means = self.sample_outcomes(
+            lambda inv, region: resolve_police_stop(inv, region, narco_configs)
+        )
+        for key, chance in odds.outcome_chances.items():
+            self.assertAlmostEqual(frequencies.get(key, 0.0), chance, delta=0.01)
+        self.assertAlmostEqual(means["units"], odds.expected_confiscated_units, delta=0.2)
+        self.assertAlmostEqual(means["cash"], odds.expected_cash_loss, delta=5.0)
+
+    def test_bribe_odds(self):
+        self.region.current_heat = 60
+        odds = bribe_odds(self.player_inv, self.region, narco_configs)
+        self.assertAlmostEqual(odds.outcome_chances["bribe_success"], 0.5) # 0.6 - 10 heat points * 0.01
+        self.assertEqual(odds.expected_cash_loss, 100.0)
+        self.player_inv.cash = 10.0
+        self.assertEqual(bribe_odds(self.player_inv, self.region, narco_configs).outcome_chances, {"bribe_too_poor": 1.0})
+        frequencies, _ = self.sample_outcomes(
+            lambda inv, region: resolve_bribe_attempt(inv, region, narco_configs), runs=2000
+        )
+        self.assertEqual(frequencies, {"bribe_too_poor": 1.0})
+
+    def test_search_odds_match_sampled_searches(self):
+        # A single unit of coke is always taken whole, which removes the high-tier jail chance for that branch
+        self.player_inv.add_drug(DrugName.COKE, DrugQuality.PURE, 1)
+        self.player_inv.add_drug(DrugName.WEED, DrugQuality.STANDARD, 7)
+        self.player_inv.add_drug(DrugName.WEED, DrugQuality.CUT, 30)
+        self.region.current_heat = 90
+        odds = search_odds(self.player_inv, self.region, narco_configs)
+        self.assertAlmostEqual(sum(odds.outcome_chances.values()), 1.0)
+        self.assertEqual(set(odds.jail_day_chances), {0, 5}) # 3 days + 20 heat points over 70 * 0.1
+        frequencies, means = self.sample_outcomes(
+            lambda inv, region: resolve_search_outcome(inv, region, None, narco_configs)
+        )
+        for key, chance in odds.outcome_chances.items():
+            self.assertAlmostEqual(frequencies.get(key, 0.0), chance, delta=0.01)
+        self.assertAlmostEqual(means["units"], odds.expected_confiscated_units, delta=0.1)
+        self.assertAlmostEqual(means["heat"], odds.expected_heat_increase, delta=0.2)
+        self.assertAlmostEqual(means["jail"], odds.jail_chance, delta=0.01)
+
+    def test_search_of_empty_stash_is_clean(self):
+        odds = search_odds(self.player_inv, self.region, narco_configs)
+        self.assertEqual(odds.outcome_chances, {"search_clean": 1.0})
+        self.assertEqual(odds.jail_day_chances, {0: 1.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,8 +22,12 @@ from src.mechanics.event_manager import (
     _create_and_add_cheap_stash,
     _create_and_add_the_setup, # Assuming this exists and is data-driven
     _create_and_add_rival_busted, # Assuming this exists
-    trigger_random_market_event
+    trigger_random_market_event,
+    update_active_events,
+    format_journal_record,
 )
+from src.core.event_journal import EventJournal
+from src.core.enums import JournalRecordKind
 
 class TestEventManager(unittest.TestCase):
 
@@ -347,7 +351,7 @@ class TestEventManager(unittest.TestCase):
     @patch('src.mechanics.event_manager._create_and_add_black_market_event') # To prevent it from running
     @patch('src.mechanics.event_manager._handle_mugging_event') # To prevent it from running
     @patch('src.mechanics.event_manager._handle_forced_fire_sale_event') # To prevent it from running
-    @patch('random.choice') # To control the selection from weighted_event_list
+    @patch('src.mechanics.event_selection.MarketEventSelector.choose') # To control the weighted event selection
     @patch('random.random') # To control various probability checks
     @patch('src.mechanics.event_manager._create_and_add_demand_spike')
     @patch('src.mechanics.event_manager._create_and_add_supply_disruption')
@@ -380,8 +384,7 @@ class TestEventManager(unittest.TestCase):
             game_configs.EVENT_TRIGGER_CHANCE - 0.01
         ]
 
-        # Setup mock_random_choice to select DEMAND_SPIKE
-        # This assumes DEMAND_SPIKE is a valid choice in the weighted list
+        # Setup the event selector to select DEMAND_SPIKE
         mock_random_choice.return_value = EventType.DEMAND_SPIKE
 
         # Call the function
@@ -407,6 +410,75 @@ class TestEventManager(unittest.TestCase):
         mock_create_rival_busted.assert_not_called()
         mock_create_drug_market_crash.assert_not_called()
 
+    def test_trigger_random_market_event_uses_campaign_phase_overrides(self):
+        """A phase override changes which event is picked once the campaign reaches that phase."""
+        game_state = GameState()
+        region = game_state.all_regions[RegionName.DOWNTOWN]
+        spawners = {EventType.DEMAND_SPIKE: MagicMock(), EventType.POLICE_CRACKDOWN: MagicMock()}
+        with patch.object(game_configs, "BLACK_MARKET_CHANCE", 0.0), \
+                patch.object(game_configs, "MUGGING_EVENT_CHANCE", 0.0), \
+                patch.object(game_configs, "FORCED_FIRE_SALE_CHANCE", 0.0), \
+                patch.object(game_configs, "EVENT_TRIGGER_CHANCE", 1.0), \
+                patch.object(game_configs, "CAMPAIGN_PHASE_THRESHOLDS", [10, 20]), \
+                patch.object(game_configs, "MARKET_EVENT_WEIGHTS", {"DEMAND_SPIKE": 1}), \
+                patch.object(game_configs, "MARKET_EVENT_WEIGHT_OVERRIDES_BY_PHASE", {2: {"DEMAND_SPIKE": 0, "POLICE_CRACKDOWN": 1}}), \
+                patch.dict('src.mechanics.event_manager.MARKET_EVENT_SPAWNERS', spawners):
+            for day, expected_event in ((5, EventType.DEMAND_SPIKE), (15, EventType.POLICE_CRACKDOWN)):
+                game_state.current_day = day
+                trigger_random_market_event(
+                    region, game_state, self.mock_player_inventory, [],
+                    self.mock_show_event_message_callback, game_configs, self.mock_add_to_log_callback,
+                )
+                self.assertEqual(spawners[expected_event].call_count, 1, day)
+        self.assertEqual(spawners[EventType.DEMAND_SPIKE].call_count, 1)
+
+
+class TestUpdateActiveEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.region = Region(RegionName.DOWNTOWN)
+        self.journal = EventJournal()
+
+    def _event(self, event_type, duration, **kwargs):
+        return MarketEvent(
+            event_type=event_type, target_drug_name=kwargs.pop("target_drug_name", None),
+            target_quality=kwargs.pop("target_quality", None), sell_price_multiplier=1.0,
+            buy_price_multiplier=1.0, duration_remaining_days=duration, start_day=1, **kwargs
+        )
+
+    def test_expired_events_are_journaled_not_printed(self):
+        spike = self._event(EventType.DEMAND_SPIKE, 1, target_drug_name=DrugName.COKE, target_quality=DrugQuality.PURE)
+        crackdown = self._event(EventType.POLICE_CRACKDOWN, 3)
+        self.region.active_market_events = [spike, crackdown]
+
+        with patch('builtins.print') as mock_print:
+            update_active_events(self.region, 7, self.journal)
+        mock_print.assert_not_called()
+
+        self.assertEqual(self.region.active_market_events, [crackdown])
+        record, = self.journal.recent()
+        self.assertEqual((record.day, record.kind, record.region, record.drug, record.quality),
+                         (7, JournalRecordKind.MARKET_EVENT_ENDED, RegionName.DOWNTOWN, DrugName.COKE, DrugQuality.PURE))
+        self.assertEqual(
+            format_journal_record(record),
+            "Market Update in Downtown: The demand spike for PURE Coke has cooled off (Duration ended).",
+        )
+
+    def test_depleted_black_market_and_rival_busted_messages(self):
+        black_market = self._event(
+            EventType.BLACK_MARKET_OPPORTUNITY, 5, target_drug_name=DrugName.WEED,
+            target_quality=DrugQuality.STANDARD, black_market_quantity_available=0,
+        )
+        busted = self._event(EventType.RIVAL_BUSTED, 1, target_drug_name="The Chemist")
+        self.region.active_market_events = [black_market, busted]
+
+        update_active_events(self.region, 2, self.journal)
+        messages = [format_journal_record(record) for record in self.journal.recent()]
+        self.assertEqual(messages, [
+            "Market Update in Downtown: The black market opportunity for STANDARD Weed has ended (Stock depleted).",
+            "Market Update in Downtown: Looks like The Chemist is back on the streets (Duration ended).",
+        ])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from unittest.mock import Mock
+
+from src.core.enums import EventType, RegionName
+from src.mechanics.event_selection import (
+    MarketEventSelector,
+    WeightedEventTable,
+    get_market_event_selector,
+)
+
+
+class FixedRandom:
+    """Stand-in RNG that returns a fixed value from random()."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def random(self):
+        return self.value
+
+
+class TestWeightedEventTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = WeightedEventTable({
+            EventType.DEMAND_SPIKE: 3,
+            EventType.POLICE_CRACKDOWN: 1,
+            EventType.CHEAP_STASH: 0, # Zero weight is never chosen
+        })
+
+    def test_zero_weights_are_dropped(self):
+        self.assertEqual(self.table.event_types, (EventType.DEMAND_SPIKE, EventType.POLICE_CRACKDOWN))
+        self.assertEqual(self.table.total_weight, 4.0)
+
+    def test_choose_maps_draw_onto_cumulative_weights(self):
+        self.assertEqual(self.table.choose(FixedRandom(0.0)), EventType.DEMAND_SPIKE)
+        self.assertEqual(self.table.choose(FixedRandom(0.74)), EventType.DEMAND_SPIKE)
+        self.assertEqual(self.table.choose(FixedRandom(0.75)), EventType.POLICE_CRACKDOWN)
+        self.assertEqual(self.table.choose(FixedRandom(0.999999)), EventType.POLICE_CRACKDOWN)
+
+    def test_probability_of(self):
+        self.assertAlmostEqual(self.table.probability_of(EventType.DEMAND_SPIKE), 0.75)
+        self.assertAlmostEqual(self.table.probability_of(EventType.POLICE_CRACKDOWN), 0.25)
+        self.assertEqual(self.table.probability_of(EventType.CHEAP_STASH), 0.0)
+
+    def test_empty_table_returns_none(self):
+        self.assertIsNone(WeightedEventTable({}).choose(FixedRandom(0.5)))
+
+
+class TestMarketEventSelector(unittest.TestCase):
+
+    def setUp(self):
+        self.selector = MarketEventSelector(
+            {"DEMAND_SPIKE": 1, "POLICE_CRACKDOWN": 1, "NOT_AN_EVENT": 5},
+            region_overrides={RegionName.DOCKS: {"POLICE_CRACKDOWN": 0}},
+            phase_overrides={3: {"DEMAND_SPIKE": 0}},
+        )
+
+    def test_string_keys_are_converted_and_invalid_keys_skipped(self):
+        self.assertEqual(
+            self.selector.default_table.event_types,
+            (EventType.DEMAND_SPIKE, EventType.POLICE_CRACKDOWN),
+        )
+
+    def test_region_override(self):
+        table = self.selector.table_for(RegionName.DOCKS)
+        self.assertEqual(table.event_types, (EventType.DEMAND_SPIKE,))
+        # Regions without overrides share the default table
+        self.assertIs(self.selector.table_for(RegionName.SUBURBS), self.selector.default_table)
+
+    def test_phase_override_applies_on_top_of_region_override(self):
+        self.assertEqual(self.selector.table_for(None, 3).event_types, (EventType.POLICE_CRACKDOWN,))
+        self.assertIsNone(self.selector.choose(RegionName.DOCKS, 3, FixedRandom(0.5)))
+
+    def test_tables_are_compiled_once_per_key(self):
+        first = self.selector.table_for(RegionName.DOCKS, 3)
+        self.assertIs(self.selector.table_for(RegionName.DOCKS, 3), first)
+
+    def test_get_market_event_selector_reuses_until_config_changes(self):
+        configs = Mock()
+        configs.MARKET_EVENT_WEIGHTS = {"DEMAND_SPIKE": 1}
+        configs.MARKET_EVENT_WEIGHT_OVERRIDES_BY_REGION = {}
+        configs.MARKET_EVENT_WEIGHT_OVERRIDES_BY_PHASE = {}
+        selector = get_market_event_selector(configs)
+        self.assertIs(get_market_event_selector(configs), selector)
+
+        configs.MARKET_EVENT_WEIGHTS = {"POLICE_CRACKDOWN": 1}
+        rebuilt = get_market_event_selector(configs)
+        self.assertIsNot(rebuilt, selector)
+        self.assertEqual(rebuilt.default_table.event_types, (EventType.POLICE_CRACKDOWN,))
+
+
+if __name__ == '__main__':
+    unittest.main()
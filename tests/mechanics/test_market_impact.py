@@ -323,5 +323,17 @@ class TestHeatDecay(unittest.TestCase):
         # Expected: 100 - int(100 * 0.05 * 2.0) = 100 - 10 = 90
         self.assertEqual(self.region.current_heat, 90)
 
+    def test_decay_regional_heat_over_several_days_matches_daily(self):
+        other_region = Region(RegionName.DOCKS.value)
+        for ghost_protocol in (False, True):
+            if ghost_protocol:
+                self.player_inv.unlocked_skills.add(SkillID.GHOST_PROTOCOL.value)
+            for days in (1, 5, 40, 200):
+                self.region.current_heat = other_region.current_heat = 180
+                for _ in range(days):
+                    decay_regional_heat(self.region, 1.0, self.player_inv, self.mock_game_configs)
+                decay_regional_heat(other_region, 1.0, self.player_inv, self.mock_game_configs, days=days)
+                self.assertEqual(other_region.current_heat, self.region.current_heat, (ghost_protocol, days))
+
 if __name__ == '__main__':
     unittest.main()
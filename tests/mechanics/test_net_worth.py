@@ -0,0 +1,91 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from src.core.enums import CryptoCoin, DrugName, DrugQuality
+from src.core.player_inventory import PlayerInventory
+from src.mechanics.net_worth import (
+    NetWorthTracker,
+    calculate_net_worth,
+    get_drug_base_prices,
+    get_net_worth_tracker,
+)
+from src import narco_configs as game_configs
+
+TEST_REGION_DEFINITIONS = [
+    ("Region A", "Region A", [("Coke", 100, 200, 1, 1, 1, 1, 1)]),
+    ("Region B", "Region B", [("Coke", 999, 2000, 1, 1, 1, 1, 1), ("Weed", 10, 20, 1, 1, 1, 1, 1)]),
+]
+
+
+class TestNetWorthTracker(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.object(game_configs, "REGION_DEFINITIONS", TEST_REGION_DEFINITIONS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.inventory = PlayerInventory(max_capacity=1000, starting_cash=500.0)
+        self.game_state = SimpleNamespace(
+            current_crypto_prices={CryptoCoin.BITCOIN: 50.0, CryptoCoin.DRUG_COIN: 2.0},
+            crypto_prices_version=1,
+        )
+        self.tracker = NetWorthTracker(self.inventory, self.game_state)
+
+    def assertInSync(self):
+        self.assertAlmostEqual(self.tracker.net_worth, calculate_net_worth(self.inventory, self.game_state))
+
+    def test_first_region_listing_a_drug_sets_its_base_price(self):
+        prices = get_drug_base_prices()
+        self.assertEqual(prices[DrugName.COKE], 100.0)
+        self.assertEqual(prices[DrugName.WEED], 10.0)
+        self.assertIs(get_drug_base_prices(), prices) # Cached per REGION_DEFINITIONS
+
+    def test_tracks_drug_changes(self):
+        self.inventory.add_drug(DrugName.COKE, DrugQuality.STANDARD, 3)
+        self.inventory.add_drug(DrugName.WEED, DrugQuality.PURE, 5)
+        self.assertAlmostEqual(self.tracker.drug_stash_value, 350.0)
+        self.inventory.remove_drug(DrugName.COKE, DrugQuality.STANDARD, 2)
+        self.assertAlmostEqual(self.tracker.drug_stash_value, 150.0)
+        self.assertInSync()
+
+        self.inventory.clear_drugs()
+        self.assertAlmostEqual(self.tracker.drug_stash_value, 0.0)
+        self.assertEqual(self.inventory.current_load, 0)
+        self.assertInSync()
+
+    def test_tracks_crypto_and_price_changes(self):
+        self.inventory.add_crypto(CryptoCoin.BITCOIN, 2.0)
+        self.assertAlmostEqual(self.tracker.wallet_value, 100.0)
+        self.inventory.remove_crypto(CryptoCoin.BITCOIN, 0.5)
+        self.assertInSync()
+
+        self.game_state.current_crypto_prices[CryptoCoin.BITCOIN] = 80.0
+        self.game_state.crypto_prices_version += 1
+        self.assertAlmostEqual(self.tracker.crypto_value, 120.0)
+        self.assertInSync()
+
+    def test_staked_drug_coin_and_cash_are_read_live(self):
+        self.inventory.staked_drug_coin["staked_amount"] = 10.0
+        self.inventory.staked_drug_coin["pending_rewards"] = 5.0
+        self.inventory.cash = 1000.0
+        self.assertAlmostEqual(self.tracker.crypto_value, 30.0)
+        self.assertInSync()
+
+    def test_replacing_region_definitions_rebuilds_prices(self):
+        self.inventory.add_drug(DrugName.COKE, DrugQuality.STANDARD, 1)
+        with patch.object(game_configs, "REGION_DEFINITIONS", [("R", "R", [("Coke", 7, 10, 1, 1, 1, 1, 1)])]):
+            self.assertAlmostEqual(self.tracker.net_worth, 507.0)
+            self.assertInSync()
+
+    def test_get_net_worth_tracker_reuses_attached_tracker(self):
+        self.assertIs(get_net_worth_tracker(self.inventory, self.game_state), self.tracker)
+        self.tracker.detach()
+        self.assertNotIn(self.tracker, self.inventory.change_listeners)
+
+    def test_get_net_worth_tracker_returns_none_for_test_doubles(self):
+        self.assertIsNone(get_net_worth_tracker(Mock(spec=PlayerInventory), self.game_state))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import pickle
+import random
+import unittest
+
+from src import narco_configs
+from src.core.enums import CryptoCoin, DrugName, DrugQuality, EventType, RegionName
+from src.core.market_event import MarketEvent
+from src.game_setup import create_new_game
+from src.mechanics import market_impact
+from src.mechanics.event_manager import update_active_events
+from src.mechanics.legacy_scenarios import create_legacy_scenario_engine
+from src.mechanics.state_hash import compute_state_hash, get_state_hash_tracker, state_hash
+from src.mechanics.win_conditions import create_win_condition_engine
+from src.simulation.campaign import greedy_trader_policy, travel
+
+
+class TestStateHashTracker(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self.player_inv, self.game_state, _ = create_new_game()
+        self.tracker = get_state_hash_tracker(self.player_inv, self.game_state)
+        self.region = self.game_state.get_current_player_region()
+
+    def assertInSync(self):
+        self.assertEqual(self.tracker.state_hash(), compute_state_hash(self.player_inv, self.game_state))
+
+    def test_tracker_is_reused(self):
+        self.assertIs(get_state_hash_tracker(self.player_inv, self.game_state), self.tracker)
+        self.assertEqual(state_hash(self.player_inv, self.game_state), self.tracker.state_hash())
+
+    def test_every_tracked_mutation_changes_the_hash_and_stays_in_sync(self):
+        seen = {self.tracker.state_hash()}
+        mutations = [
+            lambda: self.player_inv.add_drug(DrugName.WEED, DrugQuality.STANDARD, 5),
+            lambda: self.player_inv.add_crypto(CryptoCoin.BITCOIN, 0.5),
+            lambda: self.region.modify_heat(7),
+            lambda: self.region.update_stock_on_buy(DrugName.WEED, DrugQuality.STANDARD, 1),
+            lambda: market_impact.apply_player_buy_impact(self.region, DrugName.WEED, 10),
+            lambda: self.region.add_market_event(MarketEvent(
+                event_type=EventType.DEMAND_SPIKE, target_drug_name=DrugName.WEED, target_quality=DrugQuality.STANDARD,
+                sell_price_multiplier=1.5, buy_price_multiplier=1.2, duration_remaining_days=3, start_day=1,
+            )),
+            lambda: update_active_events(self.region, 1),
+            lambda: setattr(self.player_inv, "cash", self.player_inv.cash + 1),
+            lambda: setattr(self.game_state.ai_rivals[0], "is_busted", True),
+        ]
+        for mutate in mutations:
+            mutate()
+            self.assertInSync()
+            seen.add(self.tracker.state_hash())
+        self.assertEqual(len(seen), len(mutations) + 1)
+
+    def test_undoing_a_change_restores_the_hash(self):
+        before = self.tracker.state_hash()
+        self.player_inv.add_drug(DrugName.COKE, DrugQuality.PURE, 3)
+        self.region.set_drug_market_value(DrugName.COKE, "rival_supply_modifier", 0.8)
+        self.player_inv.remove_drug(DrugName.COKE, DrugQuality.PURE, 3)
+        self.region.set_drug_market_value(DrugName.COKE, "rival_supply_modifier", 1.0)
+        self.assertEqual(self.tracker.state_hash(), before)
+
+    def test_stays_in_sync_over_played_days(self):
+        rng = random.Random(2)
+        win_engine, legacy_engine = create_win_condition_engine(), create_legacy_scenario_engine()
+        for _ in range(8):
+            destination = greedy_trader_policy(self.player_inv, self.game_state, narco_configs, rng)
+            if travel(self.player_inv, self.game_state, destination, narco_configs, win_engine, legacy_engine):
+                break
+            self.assertInSync()
+
+    def test_clones_and_loaded_copies_hash_the_same(self):
+        self.player_inv.add_drug(DrugName.WEED, DrugQuality.CUT, 2)
+        expected = self.tracker.state_hash()
+        inv_clone, state_clone = self.player_inv.clone(), self.game_state.clone()
+        copied = self.tracker.copy_to(inv_clone, state_clone)
+        self.assertEqual(copied.state_hash(), expected)
+        self.assertEqual(state_hash(*pickle.loads(pickle.dumps((self.player_inv, self.game_state)))), expected)
+
+        inv_clone.add_drug(DrugName.WEED, DrugQuality.CUT, 1)
+        self.assertNotEqual(copied.state_hash(), expected)
+        self.assertEqual(self.tracker.state_hash(), expected)
+        self.assertEqual(copied.state_hash(), compute_state_hash(inv_clone, state_clone))
+
+    def test_replaced_world_gets_a_new_tracker(self):
+        self.game_state.all_regions = {RegionName.DOCKS: self.game_state.all_regions[RegionName.DOCKS].clone()}
+        tracker = get_state_hash_tracker(self.player_inv, self.game_state)
+        self.assertIsNot(tracker, self.tracker)
+        self.assertNotIn(self.tracker, self.player_inv.change_listeners)
+        self.assertEqual(tracker.state_hash(), compute_state_hash(self.player_inv, self.game_state))
+
+
+if __name__ == '__main__':
+    unittest.main()
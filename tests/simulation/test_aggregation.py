@@ -0,0 +1,118 @@
+import random
+import statistics
+import unittest
+
+from src.simulation.aggregation import Histogram, OutcomeAggregate, QuantileSketch, RunningStats
+from src.simulation.campaign import CampaignOutcome
+
+
+def make_outcome(seed, **fields):
+    values = dict(
+        seed=seed, days_played=20, final_cash=1000.0 + seed, net_worth=2000.0 + seed * 3, game_over_day=-1,
+        won=False, win_condition=None, legacy_scenarios=(), peak_heat=seed % 120,
+    )
+    values.update(fields)
+    return CampaignOutcome(**values)
+
+
+class TestRunningStats(unittest.TestCase):
+
+    def test_matches_exact_statistics_and_merges(self):
+        rng = random.Random(1)
+        values = [rng.gauss(50, 12) for _ in range(1000)]
+        whole, left, right = RunningStats(), RunningStats(), RunningStats()
+        for i, value in enumerate(values):
+            whole.add(value)
+            (left if i < 300 else right).add(value)
+        left.merge(right)
+        for stats in (whole, left):
+            self.assertEqual(stats.count, 1000)
+            self.assertAlmostEqual(stats.mean, statistics.fmean(values), places=9)
+            self.assertAlmostEqual(stats.variance, statistics.variance(values), places=6)
+            self.assertEqual((stats.minimum, stats.maximum), (min(values), max(values)))
+
+        empty = RunningStats()
+        empty.merge(whole)
+        self.assertAlmostEqual(empty.mean, whole.mean)
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_bins_and_merge(self):
+        histogram = Histogram(0, 10, 5)
+        for value in (-1, 0, 1.9, 2, 9.99, 10, 42):
+            histogram.add(value)
+        self.assertEqual(histogram.counts, [2, 1, 0, 0, 1])
+        self.assertEqual((histogram.underflow, histogram.overflow), (1, 2))
+
+        other = Histogram(0, 10, 5)
+        other.add(5)
+        histogram.merge(other)
+        self.assertEqual(histogram.counts, [2, 1, 1, 0, 1])
+        with self.assertRaises(ValueError):
+            histogram.merge(Histogram(0, 20, 5))
+
+
+class TestQuantileSketch(unittest.TestCase):
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = sorted([rng.lognormvariate(8, 1.5) for _ in range(5000)] + [-rng.expovariate(0.01) for _ in range(500)] + [0.0] * 50)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+        for q in (0.01, 0.1, 0.25, 0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertLessEqual(abs(sketch.quantile(q) - exact), 0.01 * abs(exact) + 1e-9, q)
+
+    def test_merge_equals_single_sketch_and_size_is_bounded(self):
+        rng = random.Random(3)
+        values = [rng.uniform(1, 1e6) for _ in range(4000)]
+        whole, left, right = QuantileSketch(max_buckets=64), QuantileSketch(max_buckets=64), QuantileSketch(max_buckets=64)
+        for i, value in enumerate(values):
+            whole.add(value)
+            (left if i % 2 else right).add(value)
+        left.merge(right)
+        self.assertEqual(left.count, whole.count)
+        self.assertLessEqual(len(left._positive), 64)
+        self.assertEqual(left.quantile(0.99), whole.quantile(0.99))
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+
+class TestOutcomeAggregate(unittest.TestCase):
+
+    def test_counts_outcomes(self):
+        aggregate = OutcomeAggregate(max_days=30)
+        aggregate.add(make_outcome(1, won=True, win_condition="Digital Empire", legacy_scenarios=("The Cleaner",)))
+        aggregate.add(make_outcome(2, game_over_day=15))
+        aggregate.add(make_outcome(3, game_over_day=15))
+        summary = aggregate.summary()
+        self.assertEqual(summary["campaigns"], 3)
+        self.assertAlmostEqual(summary["win_rate"], 1 / 3)
+        self.assertAlmostEqual(summary["game_over_rate"], 2 / 3)
+        self.assertEqual(summary["win_conditions"]["Digital Empire"], 1)
+        self.assertEqual(summary["legacy_scenarios"]["The Cleaner"], 1)
+        self.assertEqual(summary["game_over_days"], {15: 2})
+        self.assertAlmostEqual(summary["final_cash"]["mean"], 1002.0)
+
+    def test_merged_partials_equal_one_aggregate(self):
+        outcomes = [make_outcome(seed, game_over_day=seed % 31 if seed % 3 else -1) for seed in range(300)]
+        whole = OutcomeAggregate(max_days=30)
+        partials = [OutcomeAggregate(max_days=30) for _ in range(4)]
+        for i, outcome in enumerate(outcomes):
+            whole.add(outcome)
+            partials[i % 4].add(outcome)
+        merged = OutcomeAggregate(max_days=30)
+        for partial in partials:
+            merged.merge(partial)
+        merged_summary, whole_summary = merged.summary(), whole.summary()
+        for key in ("campaigns", "win_rate", "game_over_rate", "game_over_days"):
+            self.assertEqual(merged_summary[key], whole_summary[key])
+        for metric in ("final_cash", "net_worth", "peak_heat"):
+            self.assertAlmostEqual(merged_summary[metric]["mean"], whole_summary[metric]["mean"])
+            self.assertAlmostEqual(merged_summary[metric]["stddev"], whole_summary[metric]["stddev"])
+            self.assertEqual(merged_summary[metric]["p50"], whole_summary[metric]["p50"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src import narco_configs
+from src.core.enums import DrugName, DrugQuality, RegionName
+from src.core.event_journal import read_journal_file
+from src.game_setup import create_new_game
+from src.simulation.campaign import (
+    CampaignOutcome, buy_drug, config_fingerprint, config_overrides, run_campaign, sell_drug, wait,
+)
+from src.mechanics.legacy_scenarios import create_legacy_scenario_engine
+from src.mechanics.win_conditions import create_win_condition_engine
+
+
+class TestCampaign(unittest.TestCase):
+
+    def test_same_seed_same_outcome(self):
+        self.assertEqual(run_campaign(11, max_days=12), run_campaign(11, max_days=12))
+
+    def test_recording_days_does_not_change_the_outcome(self):
+        days = []
+        outcome = run_campaign(11, max_days=12, on_day=days.append)
+        self.assertEqual(outcome, run_campaign(11, max_days=12))
+        self.assertEqual([day.day for day in days], list(range(days[0].day, outcome.days_played + 1)))
+        self.assertEqual(days[-1].cash, outcome.final_cash)
+        self.assertEqual(days[-1].game_over, outcome.game_over_day >= 0)
+
+    def test_common_random_numbers_are_deterministic_and_off_by_default(self):
+        outcome = run_campaign(11, max_days=12, common_random_numbers=True)
+        self.assertEqual(outcome, run_campaign(11, max_days=12, common_random_numbers=True))
+        self.assertEqual(run_campaign(11, max_days=12), run_campaign(11, max_days=12, common_random_numbers=False))
+
+    def test_config_fingerprint_ignores_runtime_settings(self):
+        configs = SimpleNamespace(DEBT_PAYMENT_1_AMOUNT=25000.0, SIMULATION_CHUNK_SIZE=16, BANNED={"b", "a"})
+        fingerprint = config_fingerprint(configs)
+        configs.SIMULATION_CHUNK_SIZE = 64
+        self.assertEqual(config_fingerprint(configs), fingerprint)
+        configs.EVENT_JOURNAL_SPILL_PATH = "journal.bin"
+        self.assertEqual(config_fingerprint(configs), fingerprint)
+        configs.DEBT_PAYMENT_1_AMOUNT = 30000.0
+        self.assertNotEqual(config_fingerprint(configs), fingerprint)
+
+    def test_config_overrides_are_applied_and_restored(self):
+        with config_overrides({"DEBT_PAYMENT_1_DUE_DAY": 3, "DEBT_PAYMENT_1_AMOUNT": 10_000_000.0}):
+            self.assertEqual(run_campaign(5, max_days=10).game_over_day, 3)
+        self.assertEqual(narco_configs.DEBT_PAYMENT_1_DUE_DAY, 15)
+        with self.assertRaises(ValueError):
+            with config_overrides({"DEBT_PAYMENT_ONE_AMOUNT": 1.0}):
+                pass
+        self.assertEqual(
+            config_fingerprint(narco_configs, {"DEBT_PAYMENT_1_AMOUNT": narco_configs.DEBT_PAYMENT_1_AMOUNT}),
+            config_fingerprint(narco_configs),
+        )
+
+    def test_outcome_row_round_trip(self):
+        outcome = CampaignOutcome(
+            seed=42, days_played=31, final_cash=1234.5, net_worth=9876.25, game_over_day=-1, won=True,
+            win_condition="Digital Empire", legacy_scenarios=("Regional Baron", "The Cleaner"), peak_heat=88,
+        )
+        self.assertEqual(CampaignOutcome.from_row(outcome.to_row()), outcome)
+
+    def test_campaign_ends_at_max_days_or_game_over(self):
+        outcome = run_campaign(3, max_days=5)
+        self.assertLessEqual(outcome.days_played, 5)
+        if outcome.game_over_day == -1:
+            self.assertEqual(outcome.days_played, 5)
+
+    def test_missed_debt_payment_ends_the_campaign(self):
+        with patch.object(narco_configs, "DEBT_PAYMENT_1_DUE_DAY", 3), \
+                patch.object(narco_configs, "DEBT_PAYMENT_1_AMOUNT", 10_000_000.0):
+            outcome = run_campaign(5, max_days=10)
+        self.assertEqual(outcome.game_over_day, 3)
+        self.assertFalse(outcome.won)
+
+    def test_buy_and_sell_update_market_and_inventory(self):
+        player_inv, game_state, region = create_new_game()
+        stock_before = region.drug_market_data[DrugName.WEED]['available_qualities'][DrugQuality.STANDARD]['quantity_available']
+        cash_before = player_inv.cash
+        self.assertTrue(buy_drug(player_inv, game_state, region, DrugName.WEED, DrugQuality.STANDARD, 5))
+        self.assertEqual(player_inv.get_quantity(DrugName.WEED, DrugQuality.STANDARD), 5)
+        self.assertLess(player_inv.cash, cash_before)
+        self.assertEqual(
+            region.drug_market_data[DrugName.WEED]['available_qualities'][DrugQuality.STANDARD]['quantity_available'],
+            stock_before - 5,
+        )
+
+        self.assertTrue(sell_drug(player_inv, game_state, region, DrugName.WEED, DrugQuality.STANDARD, 5))
+        self.assertEqual(player_inv.get_quantity(DrugName.WEED, DrugQuality.STANDARD), 0)
+        self.assertGreater(game_state.player_sales_profit_by_region[RegionName.DOWNTOWN], 0)
+        self.assertFalse(sell_drug(player_inv, game_state, region, DrugName.WEED, DrugQuality.STANDARD, 1))
+
+    def test_wait_fast_forwards_in_place(self):
+        player_inv, game_state, region = create_new_game()
+        results = []
+        with patch.object(narco_configs, "OPPORTUNITY_EVENT_BASE_CHANCE", 0.0), \
+                patch.object(narco_configs, "MUGGING_EVENT_CHANCE", 0.0):
+            game_over = wait(
+                player_inv, game_state, 5, narco_configs,
+                create_win_condition_engine(), create_legacy_scenario_engine(), results.append,
+            )
+        self.assertIsNone(game_over)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(game_state.current_day, 1 + results[0].days_advanced)
+        self.assertIs(game_state.get_current_player_region(), region)
+
+
+    def test_campaign_end_writes_buffered_journal_records(self):
+        games = []
+
+        def recording_new_game():
+            games.append(create_new_game())
+            return games[-1]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            spill_path = os.path.join(tmp_dir, "journal.bin")
+            with patch.object(narco_configs, "EVENT_JOURNAL_SPILL_PATH", spill_path), \
+                    patch("src.simulation.campaign.create_new_game", side_effect=recording_new_game):
+                run_campaign(3, max_days=40)
+            journal = games[0][1].event_journal
+            self.assertGreater(journal.total_records, 0)
+            self.assertLess(journal.total_records, journal.spill_batch_size) # Nothing was spilled mid-campaign
+            self.assertEqual(list(read_journal_file(spill_path)), journal.recent())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from src.simulation.campaign import CampaignOutcome
+from src.simulation.comparison import compare_variants, game_over_metric, paired_comparison
+from src.simulation.worker_pool import CampaignPool
+
+
+def outcome(seed, net_worth, game_over_day=-1):
+    return CampaignOutcome(seed, 10, net_worth, net_worth, game_over_day, False, None, (), 0)
+
+
+class TestPairedComparison(unittest.TestCase):
+
+    def test_pairing_removes_shared_variation(self):
+        baseline = [outcome(seed, 1000.0 * seed) for seed in range(5)]
+        variant = [outcome(seed, 1000.0 * seed + 50.0 + seed) for seed in range(5)]
+        comparison = paired_comparison(baseline, variant)
+        self.assertEqual(comparison.campaigns, 5)
+        self.assertAlmostEqual(comparison.mean_difference, 52.0)
+        self.assertAlmostEqual(comparison.variant_mean - comparison.baseline_mean, 52.0)
+        low, high = comparison.confidence_interval
+        self.assertLess(low, 52.0)
+        self.assertGreater(high, 52.0)
+        self.assertGreater(comparison.variance_reduction, 1000.0)
+
+    def test_game_over_metric_compares_rates(self):
+        baseline = [outcome(0, 0.0), outcome(1, 0.0, game_over_day=4)]
+        variant = [outcome(0, 0.0, game_over_day=3), outcome(1, 0.0, game_over_day=4)]
+        self.assertAlmostEqual(paired_comparison(baseline, variant, game_over_metric).mean_difference, 0.5)
+
+    def test_unpaired_seeds_are_rejected(self):
+        with self.assertRaises(ValueError):
+            paired_comparison([outcome(0, 0.0)], [outcome(1, 0.0)])
+        with self.assertRaises(ValueError):
+            paired_comparison([outcome(0, 0.0)], [])
+
+    def test_identical_variants_differ_by_nothing_under_common_random_numbers(self):
+        with CampaignPool(processes=2, max_days=8, common_random_numbers=True) as pool:
+            comparison = compare_variants(pool, None, {"POLICE_STOP_BASE_CHANCE": 0.0}, range(6))
+            same = compare_variants(pool, None, {}, range(6))
+        self.assertEqual(comparison.campaigns, 6)
+        self.assertEqual((same.mean_difference, same.stderr), (0.0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
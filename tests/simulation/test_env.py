@@ -0,0 +1,110 @@
+import unittest
+
+from src.simulation.env import (
+    ACTION_COUNT, OBSERVATION_LAYOUT, OBSERVATION_SIZE, REGION_ORDER, STACK_ORDER, NarcoEnv, VectorNarcoEnv,
+)
+
+_REGIONS = len(REGION_ORDER)
+
+
+def first_valid(mask, start=0):
+    return next(action for action in range(start, ACTION_COUNT) if mask[action])
+
+
+def play(env, steps):
+    """Buys when it can, else travels; returns the rewards and final observation."""
+    rewards = []
+    for _ in range(steps):
+        mask = env.action_mask
+        buys = [action for action in range(_REGIONS, ACTION_COUNT, 2) if mask[action]]
+        _, reward, terminated, truncated, _ = env.step(buys[0] if buys else first_valid(mask))
+        rewards.append(reward)
+        if terminated or truncated:
+            break
+    return rewards, bytes(env.observation)
+
+
+class TestNarcoEnv(unittest.TestCase):
+
+    def test_reset_fills_the_observation(self):
+        env = NarcoEnv(max_days=5)
+        observation = env.reset(3)
+        self.assertEqual(len(observation), OBSERVATION_SIZE)
+        cash_offset, _ = OBSERVATION_LAYOUT["player"]
+        self.assertEqual(observation[cash_offset], env.player_inventory.cash)
+        region = int(observation[cash_offset + 2])
+        self.assertEqual(REGION_ORDER[region], env.game_state.get_current_player_region().name)
+        self.assertFalse(env.action_mask[region]) # No travel to where the player already is
+        self.assertTrue(any(env.action_mask[action] for action in range(_REGIONS, ACTION_COUNT, 2)))
+
+    def test_buy_updates_inventory_and_rewards_net_worth_change(self):
+        env = NarcoEnv(max_days=5, trade_lot=3)
+        env.reset(3)
+        action = first_valid(env.action_mask, _REGIONS)
+        drug, quality = STACK_ORDER[(action - _REGIONS) // 2]
+        before = env._tracker.net_worth
+        _, reward, terminated, truncated, info = env.step(action)
+        self.assertEqual(env.player_inventory.get_quantity(drug, quality), 3)
+        inventory_offset, _ = OBSERVATION_LAYOUT["inventory"]
+        self.assertEqual(env.observation[inventory_offset + (action - _REGIONS) // 2], 3.0)
+        self.assertAlmostEqual(reward, env._tracker.net_worth - before)
+        self.assertEqual((terminated, truncated, dict(info)), (False, False, {}))
+        self.assertTrue(env.action_mask[action + 1]) # Now sellable
+
+    def test_masked_action_does_nothing(self):
+        env = NarcoEnv(max_days=5)
+        observation = bytes(env.reset(3))
+        current = int(env.observation[OBSERVATION_LAYOUT["player"][0] + 2])
+        _, reward, _, _, _ = env.step(current)
+        self.assertEqual((reward, bytes(env.observation)), (0.0, observation))
+        with self.assertRaises(ValueError):
+            env.step(ACTION_COUNT)
+
+    def test_same_seed_and_actions_replay(self):
+        # A lone env draws from the global random, so the two games are played one after the other
+        first, second = NarcoEnv(max_days=6), NarcoEnv(max_days=6)
+        first.reset(8)
+        first_play = play(first, 40)
+        second.reset(8)
+        self.assertEqual(play(second, 40), first_play)
+
+    def test_episode_is_truncated_at_max_days(self):
+        env = NarcoEnv(max_days=2)
+        env.reset(1)
+        truncated = terminated = False
+        while not (terminated or truncated):
+            _, _, terminated, truncated, info = env.step(first_valid(env.action_mask))
+        self.assertLessEqual(env.game_state.current_day, 2)
+        self.assertIn("net_worth", info)
+        self.assertFalse(any(env.action_mask))
+        with self.assertRaises(RuntimeError):
+            env.step(0)
+
+
+class TestVectorNarcoEnv(unittest.TestCase):
+
+    def test_games_play_as_they_would_alone(self):
+        vector = VectorNarcoEnv(3, max_days=30, observe_all_markets=True)
+        vector.reset(first_seed=10)
+        alone = NarcoEnv(max_days=30, observe_all_markets=True)
+        alone.reset(11)
+        for _ in range(6):
+            actions = [first_valid(env.action_mask) for env in vector.envs]
+            vector.step(actions)
+            alone.step(actions[1])
+        self.assertEqual(
+            bytes(vector.observations[OBSERVATION_SIZE:2 * OBSERVATION_SIZE]), bytes(alone.observation)
+        )
+
+    def test_finished_games_reset_with_the_next_seed(self):
+        vector = VectorNarcoEnv(2, max_days=1)
+        vector.reset(first_seed=0)
+        _, rewards, terminated, truncated, infos = vector.step([first_valid(env.action_mask) for env in vector.envs])
+        self.assertEqual([bool(a or b) for a, b in zip(terminated, truncated)], [True, True])
+        self.assertTrue(all("net_worth" in info for info in infos))
+        self.assertEqual([env.seed for env in vector.envs], [2, 3])
+        self.assertEqual(len(rewards), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
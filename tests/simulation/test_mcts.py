@@ -0,0 +1,121 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from src import narco_configs
+from src.game_setup import create_new_game
+from src.simulation.campaign import greedy_trader_policy, run_campaign
+from src.simulation.mcts import MctsPolicy, TradePlan, apply_trades, candidate_plans, mcts_policy, state_key
+
+
+def new_game(seed=4):
+    random.seed(seed)
+    player_inventory, game_state, _ = create_new_game()
+    return player_inventory, game_state
+
+
+class TestMctsPolicy(unittest.TestCase):
+
+    def test_search_leaves_the_game_and_its_randomness_untouched(self):
+        player_inventory, game_state = new_game()
+        key = state_key(player_inventory, game_state)
+        random.seed(99)
+        expected_draw = random.random()
+
+        random.seed(99)
+        result = MctsPolicy(time_budget=None, max_simulations=15).search(
+            player_inventory, game_state, narco_configs, random.Random(1)
+        )
+        self.assertEqual(random.random(), expected_draw)
+        self.assertEqual(state_key(player_inventory, game_state), key)
+        self.assertEqual(result.simulations, 15)
+        self.assertGreater(result.nodes, 1)
+        self.assertTrue(-1.0 <= result.value <= 1.0)
+
+    def test_searching_does_not_change_the_campaign(self):
+        search = MctsPolicy(time_budget=None, max_simulations=3)
+
+        def searching_greedy_policy(player_inventory, game_state, game_configs, rng):
+            search.search(player_inventory, game_state, game_configs, random.Random(7))
+            return greedy_trader_policy(player_inventory, game_state, game_configs, rng)
+
+        for common_random_numbers in (False, True):
+            self.assertEqual(
+                run_campaign(2, max_days=6, policy=searching_greedy_policy, common_random_numbers=common_random_numbers),
+                run_campaign(2, max_days=6, common_random_numbers=common_random_numbers),
+            )
+
+    def test_capped_search_is_reproducible(self):
+        outcomes = [run_campaign(5, max_days=4, policy=MctsPolicy(time_budget=None, max_simulations=8)) for _ in range(2)]
+        self.assertEqual(outcomes[0], outcomes[1])
+
+    def test_time_budget_bounds_the_search(self):
+        player_inventory, game_state = new_game()
+        result = MctsPolicy(time_budget=0.05).search(player_inventory, game_state, narco_configs, random.Random(1))
+        self.assertGreaterEqual(result.simulations, 1)
+        self.assertLess(result.elapsed, 1.0) # The budget plus at most one simulation
+
+    def test_search_needs_a_limit(self):
+        player_inventory, game_state = new_game()
+        with self.assertRaises(ValueError):
+            MctsPolicy(time_budget=None, max_simulations=None).search(
+                player_inventory, game_state, type("Configs", (), {
+                    "SIMULATION_MCTS_TIME_BUDGET": None, "SIMULATION_MCTS_MAX_SIMULATIONS": None,
+                }), random.Random(1),
+            )
+
+
+    def test_pooled_policy_ignores_the_time_budget(self):
+        searches = []
+        original_search = MctsPolicy.search
+
+        def recording_search(policy, *args):
+            searches.append(original_search(policy, *args))
+            return searches[-1]
+
+        with patch.object(narco_configs, "SIMULATION_MCTS_TIME_BUDGET", 0.0), \
+                patch.object(narco_configs, "SIMULATION_MCTS_MAX_SIMULATIONS", 12), \
+                patch.object(MctsPolicy, "search", autospec=True, side_effect=recording_search):
+            destinations = [mcts_policy(*new_game(), narco_configs, random.Random(3)) for _ in range(2)]
+        self.assertEqual(destinations[0], destinations[1])
+        self.assertEqual([search.simulations for search in searches], [12, 12])
+
+    def test_pooled_policy_needs_a_simulation_cap(self):
+        with patch.object(narco_configs, "SIMULATION_MCTS_MAX_SIMULATIONS", None):
+            with self.assertRaises(ValueError):
+                mcts_policy(*new_game(), narco_configs, random.Random(3))
+
+
+class TestPlans(unittest.TestCase):
+
+    def test_candidate_plans_cover_every_destination(self):
+        player_inventory, game_state = new_game()
+        here = game_state.get_current_player_region().name
+        plans = candidate_plans(player_inventory, game_state, buy_candidates=2, buy_fractions=(1.0, 0.5))
+        self.assertEqual({plan.destination for plan in plans}, set(game_state.all_regions) - {here})
+        self.assertFalse(any(plan.sell_stash for plan in plans)) # Nothing to sell yet
+        self.assertLessEqual(len({plan.buy for plan in plans if plan.buy is not None}), 2)
+        self.assertIn(None, {plan.buy for plan in plans})
+
+    def test_apply_trades_buys_then_sells(self):
+        player_inventory, game_state = new_game()
+        plan = next(plan for plan in candidate_plans(player_inventory, game_state, 1, (0.5,)) if plan.buy is not None)
+        cash = player_inventory.cash
+        apply_trades(plan, player_inventory, game_state)
+        drug, quality = plan.buy
+        self.assertGreater(player_inventory.get_quantity(drug, quality), 0)
+        self.assertGreaterEqual(player_inventory.cash, cash * 0.5 - 1e-6)
+
+        apply_trades(TradePlan(True, None, 0.0, plan.destination), player_inventory, game_state)
+        self.assertEqual(player_inventory.current_load, 0)
+
+    def test_state_key_matches_for_clones(self):
+        player_inventory, game_state = new_game()
+        self.assertEqual(state_key(player_inventory.clone(), game_state.clone()), state_key(player_inventory, game_state))
+        clone = player_inventory.clone()
+        clone.cash += 1
+        self.assertNotEqual(state_key(clone, game_state), state_key(player_inventory, game_state))
+
+
+if __name__ == '__main__':
+    unittest.main()
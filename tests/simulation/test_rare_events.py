@@ -0,0 +1,36 @@
+import unittest
+
+from src.simulation.campaign import CampaignOutcome, run_campaign
+from src.simulation.rare_events import estimate_rare_event, estimate_with_pool, game_over_by_day
+from src.simulation.worker_pool import CampaignPool
+
+
+def outcome(seed, game_over_day, likelihood_ratio):
+    return CampaignOutcome(seed, 10, 0.0, 0.0, game_over_day, False, None, (), 0, likelihood_ratio)
+
+
+class TestRareEvents(unittest.TestCase):
+
+    def test_estimate_weights_hits_by_likelihood_ratio(self):
+        outcomes = [outcome(0, 4, 0.1), outcome(1, -1, 1.5), outcome(2, 12, 0.3), outcome(3, -1, 1.2)]
+        estimate = estimate_rare_event(outcomes, game_over_by_day(10))
+        self.assertEqual((estimate.campaigns, estimate.hits), (4, 1))
+        self.assertAlmostEqual(estimate.rate, 0.025)
+        self.assertEqual(estimate.confidence_interval[0], 0.0)
+        self.assertAlmostEqual(estimate.effective_sample_size, 3.1 ** 2 / 3.79)
+
+    def test_unbiased_campaigns_have_unit_weight(self):
+        self.assertEqual(run_campaign(4, max_days=6).likelihood_ratio, 1.0)
+
+    def test_biased_campaigns_are_weighted_and_reproducible(self):
+        biased = {"POLICE_STOP_CONFISCATION_CHANCE": 0.9, "MUGGING_EVENT_CHANCE": 0.2}
+        with CampaignPool(processes=2, max_days=6) as pool:
+            outcomes = pool.run(range(4), biased_chances=biased)
+            estimate = estimate_with_pool(pool, range(4), biased)
+        self.assertEqual(outcomes, [run_campaign(seed, max_days=6, biased_chances=biased) for seed in range(4)])
+        self.assertTrue(any(o.likelihood_ratio != 1.0 for o in outcomes))
+        self.assertEqual(estimate, estimate_rare_event(outcomes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+
+from src.simulation.aggregation import OutcomeAggregate
+from src.simulation.campaign import CampaignOutcome
+from src.simulation.result_cache import MANIFEST_FILE_NAME, DiskResultCache, ResultCacheKey
+from src.utils.engine_fingerprint import engine_fingerprint
+
+
+def make_key(seed_start, config_hash="cfg"):
+    return ResultCacheKey(config_hash, "policy@1", engine_fingerprint(), 30, seed_start, seed_start + 10)
+
+
+def make_aggregate(net_worth):
+    aggregate = OutcomeAggregate(max_days=30)
+    aggregate.add(CampaignOutcome(1, 15, 10.0, net_worth, 15, False, None, (), 40))
+    return aggregate
+
+
+class TestDiskResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.directory = os.path.join(self.tmp_dir.name, "cache")
+
+    def test_round_trip_across_instances(self):
+        DiskResultCache(self.directory, max_bytes=10**6).put(make_key(0), make_aggregate(123.0))
+        cache = DiskResultCache(self.directory, max_bytes=10**6)
+        self.assertEqual(cache.get(make_key(0)).net_worth.stats.mean, 123.0)
+        self.assertIsNone(cache.get(make_key(10)))
+        self.assertIsNone(cache.get(make_key(0, config_hash="other")))
+        [entry] = cache.entries()
+        self.assertEqual(entry.key, make_key(0))
+        self.assertEqual(entry.size, os.path.getsize(os.path.join(self.directory, entry.file_name)))
+
+    def test_evicts_least_recently_used_beyond_max_bytes(self):
+        probe = DiskResultCache(os.path.join(self.tmp_dir.name, "probe"), max_bytes=10**6)
+        probe.put(make_key(0), make_aggregate(1.0))
+        entry_size = probe.total_bytes
+        cache = DiskResultCache(self.directory, max_bytes=entry_size * 2 + entry_size // 2)
+        cache.put(make_key(0), make_aggregate(1.0))
+        cache.put(make_key(10), make_aggregate(2.0))
+        cache.get(make_key(0)) # Now more recently used than seed 10
+        cache.put(make_key(20), make_aggregate(3.0))
+        self.assertEqual(sorted(entry.key.seed_start for entry in cache.entries()), [0, 20])
+        self.assertEqual(len(os.listdir(self.directory)), 3) # Two entries and the manifest
+
+    def test_prune_and_manifest_rebuild(self):
+        cache = DiskResultCache(self.directory, max_bytes=10**6)
+        for start in (0, 10, 20):
+            cache.put(make_key(start, config_hash=f"cfg{start % 20}"), make_aggregate(float(start)))
+        self.assertEqual(cache.prune(lambda entry: entry.key.config_hash == "cfg10"), 1)
+        os.remove(os.path.join(self.directory, MANIFEST_FILE_NAME))
+
+        rebuilt = DiskResultCache(self.directory, max_bytes=10**6)
+        self.assertEqual(sorted(entry.key.seed_start for entry in rebuilt.entries()), [0, 20])
+        self.assertEqual(rebuilt.get(make_key(20, config_hash="cfg0")).net_worth.stats.mean, 20.0)
+        self.assertEqual(rebuilt.clear(), 2)
+        self.assertEqual(len(rebuilt), 0)
+
+
+    def test_hits_are_recorded_on_flush(self):
+        DiskResultCache(self.directory, max_bytes=10**6).put(make_key(0), make_aggregate(1.0))
+        cache = DiskResultCache(self.directory, max_bytes=10**6)
+        manifest_path = os.path.join(self.directory, MANIFEST_FILE_NAME)
+        written = os.path.getmtime(manifest_path)
+        os.utime(manifest_path, (written - 100, written - 100))
+        for _ in range(3):
+            cache.get(make_key(0))
+        self.assertEqual(os.path.getmtime(manifest_path), written - 100) # No write per hit
+        cache.flush()
+        reloaded = DiskResultCache(self.directory, max_bytes=10**6)
+        self.assertEqual(reloaded.entries()[0].last_used, cache.entries()[0].last_used)
+
+    def test_caches_sharing_a_directory_keep_each_others_entries(self):
+        first = DiskResultCache(self.directory, max_bytes=10**6)
+        second = DiskResultCache(self.directory, max_bytes=10**6)
+        self.assertEqual(len(first), 0)
+        self.assertEqual(len(second), 0) # Both loaded before either wrote
+        first.put(make_key(0), make_aggregate(1.0))
+        second.put(make_key(10), make_aggregate(2.0))
+        second.prune(lambda entry: entry.key.seed_start == 0)
+        first.put(make_key(20), make_aggregate(3.0))
+        reloaded = DiskResultCache(self.directory, max_bytes=10**6)
+        self.assertEqual(sorted(entry.key.seed_start for entry in reloaded.entries()), [10, 20])
+        self.assertFalse([name for name in os.listdir(self.directory) if name.endswith(".tmp")])
+
+
+if __name__ == '__main__':
+    unittest.main()
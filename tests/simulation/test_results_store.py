@@ -0,0 +1,78 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.simulation.campaign import CampaignOutcome, run_campaign
+from src.simulation.results_store import ResultsStore, outcome_label
+
+
+class TestResultsStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, "results.sqlite")
+
+    def test_outcomes_and_days_round_trip(self):
+        days = []
+        outcome = run_campaign(4, max_days=6, on_day=days.append)
+        with ResultsStore(self.path, config_hash="abc", batch_size=2) as store:
+            store.add(outcome, days, policy="greedy")
+            store.add_many([run_campaign(seed, max_days=6) for seed in (2, 3)], policy="greedy")
+            stored = store.load_outcomes()
+            self.assertEqual([o.seed for o in stored], [2, 3, 4])
+            self.assertEqual(stored[2], outcome)
+            self.assertEqual(store.load_days(4), days)
+            self.assertEqual(store.load_outcomes(config_hash="other"), [])
+        self.assertEqual(store.campaigns_written, 3)
+        self.assertIsNone(store.last_error)
+
+    def test_database_is_wal_and_indexed(self):
+        with ResultsStore(self.path, config_hash="abc") as store:
+            store.add(CampaignOutcome(1, 15, -10.0, 0.0, 15, False, None, (), 40))
+        with sqlite3.connect(self.path) as connection:
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            indexes = {row[1] for row in connection.execute("PRAGMA index_list(campaigns)")}
+            self.assertTrue({"campaigns_by_config_seed", "campaigns_by_config_outcome", "campaigns_by_seed"} <= indexes)
+            self.assertEqual(connection.execute("SELECT outcome FROM campaigns").fetchall(), [("lost",)])
+
+    def test_likelihood_ratios_round_trip(self):
+        weighted = CampaignOutcome(1, 15, -10.0, 0.0, 15, False, None, (), 40, likelihood_ratio=0.125)
+        with ResultsStore(self.path, config_hash="abc") as store:
+            store.add(weighted)
+            store.add(weighted._replace(seed=2))
+            self.assertEqual(store.load_outcomes(), [weighted, weighted._replace(seed=2)])
+
+    def test_version_1_database_is_migrated(self):
+        with sqlite3.connect(self.path) as connection:
+            connection.execute(
+                "CREATE TABLE campaigns (id INTEGER PRIMARY KEY, config_hash TEXT NOT NULL, policy TEXT NOT NULL,"
+                " seed INTEGER NOT NULL, outcome TEXT NOT NULL, days_played INTEGER NOT NULL, final_cash REAL NOT NULL,"
+                " net_worth REAL NOT NULL, game_over_day INTEGER, win_condition TEXT, legacy_scenarios TEXT NOT NULL,"
+                " peak_heat INTEGER NOT NULL)"
+            )
+            connection.execute("INSERT INTO campaigns VALUES (1, 'abc', '', 7, 'survived', 60, 5.0, 9.0, NULL, NULL, '', 3)")
+        with ResultsStore(self.path, config_hash="abc") as store:
+            store.add(CampaignOutcome(8, 60, 0.0, 0.0, -1, False, None, (), 0, likelihood_ratio=2.0))
+            self.assertEqual([o.likelihood_ratio for o in store.load_outcomes()], [1.0, 2.0])
+        with sqlite3.connect(self.path) as connection:
+            self.assertEqual(connection.execute("PRAGMA user_version").fetchone()[0], 2)
+
+    def test_writer_survives_rows_sqlite_cannot_store(self):
+        with ResultsStore(self.path, config_hash="abc") as store:
+            store.add(CampaignOutcome(2 ** 63, 15, -10.0, 0.0, 15, False, None, (), 40)) # Overflows INTEGER
+            store.flush() # Must not hang
+            self.assertIsInstance(store.last_error, OverflowError)
+            store.add(CampaignOutcome(1, 15, -10.0, 0.0, 15, False, None, (), 40))
+            self.assertEqual([o.seed for o in store.load_outcomes()], [1])
+
+    def test_outcome_labels(self):
+        base = CampaignOutcome(1, 60, 0.0, 0.0, -1, False, None, (), 0)
+        self.assertEqual(outcome_label(base), "survived")
+        self.assertEqual(outcome_label(base._replace(game_over_day=15)), "lost")
+        self.assertEqual(outcome_label(base._replace(won=True)), "won")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from src.simulation.result_cache import MemoryResultCache
+from src.simulation.sweep import ParameterSweep, parameter_grid
+from src.simulation.worker_pool import CampaignPool
+
+
+class TestParameterGrid(unittest.TestCase):
+
+    def test_every_combination(self):
+        grid = parameter_grid({"MUGGING_EVENT_CHANCE": [0.0, 0.1], "DEBT_PAYMENT_1_AMOUNT": [1.0, 2.0, 3.0]})
+        self.assertEqual(len(grid), 6)
+        self.assertIn({"MUGGING_EVENT_CHANCE": 0.1, "DEBT_PAYMENT_1_AMOUNT": 2.0}, grid)
+
+
+class TestParameterSweep(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = CampaignPool(processes=2, max_days=16, chunk_size=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_successive_halving_drops_points_and_reuses_cached_batches(self):
+        points = parameter_grid({"DEBT_PAYMENT_1_AMOUNT": [1.0, 10_000_000.0, 20_000_000.0, 30_000_000.0]})
+        # Rewards surviving the first debt payment, which only the affordable amount allows
+        sweep = ParameterSweep(self.pool, objective=lambda aggregate: -aggregate.game_over_rate, initial_seeds=4, eta=2)
+        results = sweep.run(points)
+
+        self.assertEqual(results[0].overrides, {"DEBT_PAYMENT_1_AMOUNT": 1.0})
+        self.assertEqual([result.rounds for result in results], [3, 2, 1, 1])
+        self.assertEqual(results[0].aggregate.campaigns, 16) # 4 + 4 + 8 seeds
+        self.assertEqual(results[-1].aggregate.campaigns, 4)
+        self.assertEqual(len(sweep.cache), 7)
+
+        played = []
+        original = self.pool.aggregate_many
+        self.pool.aggregate_many = lambda jobs: played.append(jobs) or original(jobs)
+        try:
+            again = ParameterSweep(self.pool, objective=sweep.objective, cache=sweep.cache, initial_seeds=4, eta=2).run(points)
+        finally:
+            del self.pool.aggregate_many
+        self.assertEqual(played, [])
+        self.assertEqual([result.score for result in again], [result.score for result in results])
+
+    def test_overrides_reach_the_workers(self):
+        cheap, costly = ParameterSweep(self.pool, cache=MemoryResultCache()).evaluate(
+            [{"DEBT_PAYMENT_1_AMOUNT": 1.0}, {"DEBT_PAYMENT_1_AMOUNT": 10_000_000.0}], range(3)
+        )
+        self.assertEqual(costly.game_overs, 3)
+        self.assertEqual(costly.game_over_days.counts[15], 3)
+        self.assertLess(cheap.game_overs, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
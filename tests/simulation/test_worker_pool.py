@@ -0,0 +1,46 @@
+import unittest
+
+from src.simulation.aggregation import OutcomeAggregate
+from src.simulation.campaign import run_campaign
+from src.simulation.worker_pool import CampaignPool, default_start_method
+
+
+class TestCampaignPool(unittest.TestCase):
+
+    def test_pool_results_match_in_process_runs_in_seed_order(self):
+        seeds = [9, 2, 7, 4, 5]
+        with CampaignPool(processes=2, max_days=8, chunk_size=2) as pool:
+            self.assertEqual(pool.start_method, default_start_method())
+            outcomes = pool.run(seeds)
+            self.assertEqual(pool.run([]), [])
+        self.assertEqual(outcomes, [run_campaign(seed, max_days=8) for seed in seeds])
+
+    def test_pool_aggregate_matches_in_process_aggregate(self):
+        expected = OutcomeAggregate(max_days=8)
+        for seed in range(20):
+            expected.add(run_campaign(seed, max_days=8))
+        with CampaignPool(processes=2, max_days=8, chunk_size=3) as pool:
+            aggregate = pool.aggregate(range(20))
+        self.assertEqual(aggregate.campaigns, 20)
+        self.assertEqual(aggregate.game_overs, expected.game_overs)
+        self.assertEqual(aggregate.game_over_days.counts, expected.game_over_days.counts)
+        self.assertAlmostEqual(aggregate.net_worth.stats.mean, expected.net_worth.stats.mean)
+
+
+    def test_aggregate_many_keeps_feeding_workers_past_the_first_window(self):
+        jobs = [(range(start, start + 5), None) for start in (0, 5, 10)] # 15 one-seed tasks, window of 4
+        with CampaignPool(processes=1, max_days=6, chunk_size=1) as pool:
+            aggregates = pool.aggregate_many(jobs)
+            with self.assertRaises(ValueError):
+                pool.aggregate_many([(range(2), {"NOT_A_CONFIG_VALUE": 1})])
+        for (seeds, _), aggregate in zip(jobs, aggregates):
+            expected = OutcomeAggregate(max_days=6)
+            for seed in seeds:
+                expected.add(run_campaign(seed, max_days=6))
+            self.assertEqual(aggregate.campaigns, 5)
+            self.assertEqual(aggregate.game_overs, expected.game_overs)
+            self.assertAlmostEqual(aggregate.net_worth.stats.mean, expected.net_worth.stats.mean)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,12 @@ import unittest
 from unittest.mock import patch
 import random
 
+from src.game_setup import create_new_game
 from src.game_state import GameState
+from src.mechanics.legacy_scenarios import create_legacy_scenario_engine
+from src.mechanics.net_worth import calculate_net_worth
+from src.mechanics.win_conditions import create_win_condition_engine
+from src.simulation.campaign import greedy_trader_policy, travel
 from src.core.enums import RegionName, CryptoCoin, DrugName, DrugQuality
 from src import narco_configs as game_configs
 
@@ -133,6 +138,70 @@ class TestGameState(unittest.TestCase):
         self.assertTrue(len(summary['all_region_names']) > 0)
         self.assertIn(RegionName.DOWNTOWN.value, summary['all_region_names'])
 
+    def test_campaign_phase_follows_the_day(self):
+        with patch.object(game_configs, "CAMPAIGN_PHASE_THRESHOLDS", [10, 20]):
+            for day, phase in ((1, 1), (10, 1), (11, 2), (20, 2), (300, 2)):
+                self.game_state.current_day = day
+                self.assertEqual(self.game_state.campaign_phase, phase, day)
+
+
+class TestGameStateClone(unittest.TestCase):
+
+    def _play_days(self, player_inventory, game_state, days, seed):
+        random.seed(seed)
+        policy_rng = random.Random(seed)
+        win_engine, legacy_engine = create_win_condition_engine(), create_legacy_scenario_engine()
+        for _ in range(days):
+            destination = greedy_trader_policy(player_inventory, game_state, game_configs, policy_rng)
+            travel(player_inventory, game_state, destination, game_configs, win_engine, legacy_engine)
+
+    def _snapshot(self, player_inventory, game_state):
+        return (
+            game_state.current_day,
+            game_state.current_player_region.name,
+            dict(game_state.current_crypto_prices),
+            {name: (region.current_heat, region.drug_market_data, [str(event) for event in region.active_market_events])
+             for name, region in game_state.all_regions.items()},
+            [(rival.name, rival.is_busted, rival.busted_days_remaining) for rival in game_state.ai_rivals],
+            game_state.timeline.pending_entries(),
+            game_state.event_journal.recent(),
+            player_inventory.cash,
+            player_inventory.items,
+            player_inventory.heat,
+            calculate_net_worth(player_inventory, game_state),
+        )
+
+    def test_clone_plays_out_identically(self):
+        random.seed(11)
+        player_inventory, game_state, _ = create_new_game()
+        self._play_days(player_inventory, game_state, 8, seed=5)
+
+        player_clone, state_clone = player_inventory.clone(), game_state.clone()
+        self.assertEqual(self._snapshot(player_clone, state_clone), self._snapshot(player_inventory, game_state))
+        self._play_days(player_clone, state_clone, 10, seed=6)
+        self._play_days(player_inventory, game_state, 10, seed=6)
+        self.assertEqual(self._snapshot(player_clone, state_clone), self._snapshot(player_inventory, game_state))
+
+    def test_clone_is_independent(self):
+        game_state = GameState()
+        game_state.set_current_player_region(RegionName.DOCKS)
+        original_stock = game_state.all_regions[RegionName.DOCKS].drug_market_data[DrugName.WEED]["available_qualities"][DrugQuality.STANDARD]["quantity_available"]
+
+        clone = game_state.clone()
+        self.assertIs(clone.current_player_region, clone.all_regions[RegionName.DOCKS])
+        clone.current_player_region.update_stock_on_buy(DrugName.WEED, DrugQuality.STANDARD, 5)
+        clone.current_player_region.modify_heat(10)
+        clone.current_crypto_prices[CryptoCoin.BITCOIN] = 1.0
+        clone.timeline.cancel("debt_payment_1")
+        clone.current_day += 3
+
+        docks = game_state.all_regions[RegionName.DOCKS]
+        self.assertEqual(docks.drug_market_data[DrugName.WEED]["available_qualities"][DrugQuality.STANDARD]["quantity_available"], original_stock)
+        self.assertEqual(docks.current_heat, 0)
+        self.assertNotEqual(game_state.current_crypto_prices[CryptoCoin.BITCOIN], 1.0)
+        self.assertTrue(game_state.timeline.is_scheduled("debt_payment_1"))
+        self.assertEqual(game_state.current_day, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
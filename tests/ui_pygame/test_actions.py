@@ -1442,6 +1442,8 @@ class TestPygameActions(unittest.TestCase):
         mock_ui_state.player_inventory_cache.pending_laundered_sc_arrival_day = current_day_start + 1
         mock_ui_state.player_inventory_cache.laundered_crypto_type = CryptoCoin.BITCOIN # Use a valid coin
         mock_ui_state.player_inventory_cache.crypto_wallet = {CryptoCoin.BITCOIN: initial_stable_coin_balance}
+        crypto_listener = MagicMock()
+        mock_ui_state.player_inventory_cache.change_listeners.append(crypto_listener)
         # Explicitly set laundered_crypto_type or rely on getattr default in action.py
         # For this test, let's assume it defaults to STABLE_COIN if not set, or set it:
         # mock_ui_state.player_inventory_cache.laundered_crypto_type = CryptoCoin.STABLE_COIN
@@ -1483,6 +1485,9 @@ class TestPygameActions(unittest.TestCase):
         self.assertAlmostEqual(mock_ui_state.player_inventory_cache.crypto_wallet.get(CryptoCoin.BITCOIN, 0), expected_bitcoin_balance)
         self.assertEqual(mock_ui_state.player_inventory_cache.pending_laundered_sc, 0.0)
         self.assertIsNone(mock_ui_state.player_inventory_cache.pending_laundered_sc_arrival_day)
+        crypto_listener.on_crypto_balance_changed.assert_called_once_with(
+            CryptoCoin.BITCOIN, initial_stable_coin_balance, expected_bitcoin_balance
+        )
 
 
 if __name__ == '__main__':
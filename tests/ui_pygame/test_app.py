@@ -0,0 +1,92 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from src.ui_pygame import app
+from src.core.enums import EventType, JournalRecordKind, RegionName
+from src.core.event_journal import EventJournal
+from src.core.player_inventory import PlayerInventory
+from src.mechanics.daily_updates import DailyUpdateResult
+from src import narco_configs as game_configs
+
+
+class TestTravelAutosave(unittest.TestCase):
+    def setUp(self):
+        self.player_inventory = PlayerInventory("TestPlayer")
+        self.player_inventory.cash = 1000.0
+        self.game_state = MagicMock()
+        self.game_state.current_day = 1
+        self.game_state.game_won = False
+        self.game_state.achieved_legacy_scenarios = []
+        self.game_state.event_journal = EventJournal()
+        self.ui_manager = MagicMock()
+        self.ui_manager.game_over_message = None
+        self.ui_manager.active_blocking_event_data = None
+        self.autosave_service = MagicMock()
+        self.saved_cash = []
+        self.autosave_service.request_save.side_effect = (
+            lambda inventory, game_state: self.saved_cash.append(inventory.cash)
+        )
+        self.destination = MagicMock()
+        self.destination.name.value = "Uptown"
+        self.destination.current_heat = 40
+
+        patchers = [
+            patch.object(app, "player_inventory_cache", self.player_inventory),
+            patch.object(app, "game_state_data_cache", self.game_state),
+            patch.object(app, "game_configs_data_cache", game_configs),
+            patch.object(app, "ui_manager", self.ui_manager),
+            patch.object(app, "autosave_service", self.autosave_service),
+            patch.object(app, "perform_daily_updates_mechanics", return_value=DailyUpdateResult()),
+            patch.object(app.win_condition_engine, "evaluate", return_value={}),
+            patch.object(app.legacy_scenario_engine, "evaluate", return_value={}),
+            patch.object(app, "add_message_to_log"),
+            patch.object(app, "show_event_message_external"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_autosave_includes_police_stop_fine(self):
+        def fine_player(player_inventory, region, game_configs_data):
+            player_inventory.cash -= 250.0
+            return {"message_key": "stop_fine", "stop_chance": 1.0, "fine_paid": 250.0}
+
+        with patch.object(app, "resolve_police_stop", side_effect=fine_player):
+            app.action_travel_to_region(self.destination, self.player_inventory, self.game_state)
+
+        self.assertEqual(self.saved_cash, [750.0])
+        self.assertEqual(self.ui_manager.current_view, "blocking_event_popup")
+
+    def test_no_autosave_after_losing_the_game(self):
+        lost_day = DailyUpdateResult()
+        lost_day.game_over_message = "Busted."
+        with patch.object(app, "perform_daily_updates_mechanics", return_value=lost_day):
+            app.action_travel_to_region(self.destination, self.player_inventory, self.game_state)
+
+        self.autosave_service.request_save.assert_not_called()
+        self.assertEqual(self.ui_manager.game_over_message, "Busted.")
+
+    def test_journaled_expiries_reach_the_log(self):
+        journal = self.game_state.event_journal
+        journal.record(1, JournalRecordKind.MARKET_EVENT_ENDED, region=RegionName.DOWNTOWN)
+
+        def expire_event(game_state, player_inventory, game_configs_data):
+            journal.record(2, JournalRecordKind.MARKET_EVENT_ENDED, region=RegionName.DOWNTOWN, event_type=EventType.POLICE_CRACKDOWN)
+            return DailyUpdateResult()
+
+        with patch.object(app, "perform_daily_updates_mechanics", side_effect=expire_event), \
+                patch.object(app, "resolve_police_stop", return_value={"message_key": "no_stop", "stop_chance": 0.0}):
+            app.action_travel_to_region(self.destination, self.player_inventory, self.game_state)
+
+        logged = [call.args[0] for call in app.add_message_to_log.call_args_list]
+        expiry_messages = [message for message in logged if message.startswith("Market Update")]
+        self.assertEqual(expiry_messages, [
+            "Market Update in Downtown: The increased police scrutiny seems to have subsided (Duration ended)."
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from src.ui_pygame.message_log import MessageLog, wrap_message
+
+
+class CountingWidth:
+    """Measures text as one pixel per character and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return len(text)
+
+
+class TestWrapMessage(unittest.TestCase):
+
+    def test_wraps_on_word_boundaries(self):
+        self.assertEqual(wrap_message("aaa bbb ccc", 8, len), ("aaa bbb", "ccc"))
+
+    def test_overlong_word_gets_its_own_line(self):
+        self.assertEqual(wrap_message("a verylongword b", 5, len), ("a", "verylongword", "b"))
+
+
+class TestMessageLog(unittest.TestCase):
+
+    def setUp(self):
+        self.log = MessageLog(history_size=5)
+        self.measure = CountingWidth()
+
+    def test_adding_does_not_measure_text(self):
+        for i in range(100):
+            self.log.add(f"message number {i}")
+        self.assertEqual(self.measure.calls, 0)
+        self.assertEqual(len(self.log), 5) # Oldest messages dropped
+        self.assertEqual(self.log.messages()[0], "message number 95")
+
+    def test_visible_lines_wraps_only_newest_messages(self):
+        for i in range(5):
+            self.log.add(f"m{i}")
+        self.assertEqual(self.log.visible_lines(2, 100, self.measure), ["m3", "m4"])
+        # Single-word messages are never measured; "m0".."m2" were not even visited
+        self.assertEqual(self.measure.calls, 0)
+
+    def test_wrapped_layouts_are_cached(self):
+        self.log.add("one two three four")
+        self.assertEqual(self.log.visible_lines(3, 9, self.measure), ["one two", "three", "four"])
+        calls_after_first_render = self.measure.calls
+        self.log.visible_lines(3, 9, self.measure)
+        self.assertEqual(self.measure.calls, calls_after_first_render)
+
+    def test_scroll_offset_moves_back_through_history(self):
+        for i in range(5):
+            self.log.add(f"m{i}")
+        self.assertEqual(self.log.visible_lines(2, 100, len, scroll_offset=1), ["m2", "m3"])
+        self.assertEqual(self.log.visible_lines(2, 100, len, scroll_offset=50), ["m0", "m1"])
+
+    def test_max_scroll_offset_counts_wrapped_lines(self):
+        self.assertEqual(self.log.max_scroll_offset(2, 9, len), 0)
+        self.log.add("one two three four") # Three lines at width 9
+        self.log.add("m1")
+        self.assertEqual(self.log.max_scroll_offset(2, 9, len), 2)
+        self.assertEqual(self.log.visible_lines(2, 9, len, scroll_offset=2), ["one two", "three"])
+        self.assertEqual(self.log.max_scroll_offset(10, 9, len), 0)
+
+
+    def test_full_history_is_measured_once(self):
+        log = MessageLog(history_size=200)
+        for i in range(200):
+            log.add(f"message number {i}")
+        self.assertEqual(log.max_scroll_offset(5, 100, self.measure), 195)
+        calls_after_first_pass = self.measure.calls
+        log.max_scroll_offset(5, 100, self.measure)
+        log.visible_lines(5, 100, self.measure, scroll_offset=195)
+        self.assertEqual(self.measure.calls, calls_after_first_pass)
+
+    def test_line_count_follows_dropped_messages(self):
+        self.log.add("one two three four") # Three lines at width 9
+        self.assertEqual(self.log.max_scroll_offset(1, 9, len), 2)
+        for i in range(5):
+            self.log.add(f"m{i}")
+        self.assertEqual(self.log.max_scroll_offset(1, 9, len), 4)
+        self.assertEqual(self.log.max_scroll_offset(1, 100, len), 4) # Rewrapped at the new width
+        self.log.clear()
+        self.assertEqual(self.log.max_scroll_offset(1, 9, len), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.core.enums import DrugName, DrugQuality, JournalRecordKind, RegionName
+from src.core.event_journal import EventJournal, read_journal_file
+from src.core.player_inventory import PlayerInventory
+from src.game_state import GameState
+from src.mechanics.net_worth import get_net_worth_tracker
+from src.mechanics.regional_heat import get_regional_heat_aggregate
+from src.utils.autosave import AutosaveService
+from src.utils.save_files import load_save_file
+
+
+class TestAutosaveService(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        self.player_inv = PlayerInventory()
+        self.game_state = GameState()
+        self.game_state.set_current_player_region(RegionName.DOCKS)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.service = AutosaveService(os.path.join(self.tmp_dir.name, "saves"), slot_count=2)
+        self.addCleanup(self.service.close)
+
+    def test_save_round_trip_drops_listeners(self):
+        self.player_inv.add_drug(DrugName.COKE, DrugQuality.PURE, 4)
+        self.game_state.current_day = 9
+        get_net_worth_tracker(self.player_inv, self.game_state)
+        get_regional_heat_aggregate(self.game_state)
+
+        self.service.request_save(self.player_inv, self.game_state)
+        self.assertTrue(self.service.flush(timeout=5))
+
+        loaded_inv, loaded_state = load_save_file(self.service.slot_path(0))
+        self.assertEqual(loaded_inv.get_quantity(DrugName.COKE, DrugQuality.PURE), 4)
+        self.assertEqual(loaded_state.current_day, 9)
+        self.assertEqual(loaded_state.current_player_region.name, RegionName.DOCKS)
+        self.assertEqual(loaded_inv.change_listeners, [])
+        self.assertEqual(loaded_state.all_regions[RegionName.DOCKS].heat_listeners, [])
+        self.assertEqual(loaded_state.all_regions[RegionName.DOCKS].market_listeners, [])
+        # The live game keeps its listeners: the net worth tracker and the autosave's state hash tracker
+        self.assertEqual(len(self.player_inv.change_listeners), 2)
+
+    def test_snapshot_is_taken_at_request_time(self):
+        self.service.request_save(self.player_inv, self.game_state)
+        self.game_state.current_day = 50 # Mutating after the request must not leak into the save
+        self.assertTrue(self.service.flush(timeout=5))
+        self.assertEqual(load_save_file(self.service.slot_path(0))[1].current_day, 1)
+
+    def test_slots_rotate_and_no_temp_files_remain(self):
+        for day in (1, 2, 3):
+            self.game_state.current_day = day
+            self.service.request_save(self.player_inv, self.game_state)
+            self.assertTrue(self.service.flush(timeout=5))
+        self.assertEqual(self.service.saves_written, 3)
+        self.assertEqual(sorted(os.listdir(self.service.save_directory)), ["autosave_1.sav", "autosave_2.sav", "index.json"])
+        self.assertEqual(load_save_file(self.service.existing_saves()[0])[1].current_day, 3)
+        self.assertEqual(load_save_file(self.service.slot_path(0))[1].current_day, 3)
+        self.assertEqual(load_save_file(self.service.slot_path(1))[1].current_day, 2)
+
+    def test_unchanged_game_is_not_saved_again(self):
+        self.service.request_save(self.player_inv, self.game_state)
+        self.service.request_save(self.player_inv, self.game_state)
+        self.assertTrue(self.service.flush(timeout=5))
+        self.assertEqual((self.service.saves_written, self.service.saves_skipped), (1, 1))
+
+        self.game_state.get_current_player_region().update_stock_on_buy(DrugName.WEED, DrugQuality.STANDARD, 1)
+        self.service.request_save(self.player_inv, self.game_state)
+        self.assertTrue(self.service.flush(timeout=5))
+        self.assertEqual((self.service.saves_written, self.service.saves_skipped), (2, 1))
+
+    def test_write_failure_is_recorded_not_raised(self):
+        with patch("src.utils.autosave.write_file_atomically", side_effect=OSError("disk full")):
+            self.service.request_save(self.player_inv, self.game_state)
+            self.assertTrue(self.service.flush(timeout=5))
+        self.assertIsInstance(self.service.last_error, OSError)
+        self.assertEqual(self.service.saves_written, 0)
+        # A failed save is retried even though the game has not changed
+        self.service.request_save(self.player_inv, self.game_state)
+        self.assertTrue(self.service.flush(timeout=5))
+        self.assertEqual(self.service.saves_written, 1)
+
+    def test_rejects_non_save_files(self):
+        path = os.path.join(self.tmp_dir.name, "not_a_save.sav")
+        with open(path, "wb") as other_file:
+            other_file.write(b"hello")
+        with self.assertRaises(ValueError):
+            load_save_file(path)
+
+
+    def test_save_flushes_the_event_journal(self):
+        spill_path = os.path.join(self.tmp_dir.name, "journal.bin")
+        self.game_state.event_journal = EventJournal(spill_path=spill_path)
+        record = self.game_state.event_journal.record(3, JournalRecordKind.MARKET_EVENT_ENDED, RegionName.DOCKS)
+        self.service.request_save(self.player_inv, self.game_state)
+        self.assertEqual(list(read_journal_file(spill_path)), [record])
+
+
+if __name__ == '__main__':
+    unittest.main()
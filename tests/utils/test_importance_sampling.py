@@ -0,0 +1,42 @@
+import random
+import unittest
+
+from src.utils.importance_sampling import LikelihoodRatio, chance_event, importance_sampling
+
+
+class TestImportanceSampling(unittest.TestCase):
+
+    def test_unbiased_roll_is_a_plain_draw(self):
+        rng, reference = random.Random(3), random.Random(3)
+        self.assertEqual(
+            [chance_event("MUGGING_EVENT_CHANCE", 0.3, rng) for _ in range(50)],
+            [reference.random() < 0.3 for _ in range(50)],
+        )
+
+    def test_biased_rolls_carry_their_likelihood_ratio(self):
+        rng = random.Random(1)
+        with importance_sampling({"MUGGING_EVENT_CHANCE": 0.5}) as ratio:
+            results = [chance_event("MUGGING_EVENT_CHANCE", 0.1, rng) for _ in range(10)]
+            chance_event("INFORMANT_BETRAYAL_CHANCE", 0.5, rng) # Not biased: no weight
+        hits = sum(results)
+        self.assertEqual((ratio.rolls["MUGGING_EVENT_CHANCE"], ratio.hits["MUGGING_EVENT_CHANCE"]), (10, hits))
+        self.assertAlmostEqual(ratio.weight, 0.2 ** hits * 1.8 ** (10 - hits))
+        self.assertFalse(chance_event("MUGGING_EVENT_CHANCE", 0.0, rng)) # Restored after the block
+
+    def test_weighted_rate_is_unbiased(self):
+        rng, total = random.Random(7), 0.0
+        for _ in range(20000):
+            with importance_sampling({"POLICE_STOP_CONFISCATION_CHANCE": 0.5}) as ratio:
+                hit = chance_event("POLICE_STOP_CONFISCATION_CHANCE", 0.01, rng)
+            total += ratio.weight * hit
+        self.assertAlmostEqual(total / 20000, 0.01, delta=0.001)
+
+    def test_invalid_biases_are_rejected(self):
+        with self.assertRaises(ValueError):
+            LikelihoodRatio({"POLICE_STOP_BASE_CHANCE": 0.5})
+        with self.assertRaises(ValueError):
+            LikelihoodRatio({"MUGGING_EVENT_CHANCE": 1.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import logging
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.utils import logger as logger_module
+from src.utils.logger import RateLimitFilter, configure_logging, get_logger, set_subsystem_level, shutdown_logging
+
+
+def make_record(message, name="src.test", level=logging.INFO):
+    return logging.LogRecord(name, level, __file__, 1, message, None, None)
+
+
+class TestRateLimitFilter(unittest.TestCase):
+
+    def test_passes_budget_then_samples(self):
+        rate_filter = RateLimitFilter(max_per_interval=2, interval_seconds=60, sample_every=3)
+        results = [rate_filter.filter(make_record("Sold %s units")) for _ in range(8)]
+        # 2 within budget, then every 3rd suppressed record is sampled through
+        self.assertEqual(results, [True, True, False, False, True, False, False, True])
+        self.assertTrue(rate_filter.filter(make_record("A different message")))
+
+    def test_reports_suppressed_count_in_next_interval(self):
+        rate_filter = RateLimitFilter(max_per_interval=1, interval_seconds=10)
+        with patch("src.utils.logger.time.monotonic", side_effect=[0.0, 1.0, 2.0, 11.0]):
+            for _ in range(3):
+                rate_filter.filter(make_record("Rival moved"))
+            record = make_record("Rival moved")
+            self.assertTrue(rate_filter.filter(record))
+        self.assertIn("2 similar message(s) suppressed", record.getMessage())
+
+
+    def test_expired_groups_are_swept(self):
+        with patch("src.utils.logger.time.monotonic", side_effect=[0.0, 0.0, 5.0, 11.0]):
+            rate_filter = RateLimitFilter(interval_seconds=10)
+            for message in ("Old news", "Recent news", "Fresh news"):
+                rate_filter.filter(make_record(message))
+        self.assertEqual([key[2] for key in rate_filter._groups], ["Recent news", "Fresh news"])
+
+    def test_group_count_is_capped(self):
+        rate_filter = RateLimitFilter(interval_seconds=60, max_groups=2)
+        for day in range(5):
+            rate_filter.filter(make_record(f"Day {day} started")) # Pre-formatted: one group per message
+        self.assertEqual([key[2] for key in rate_filter._groups], ["Day 3 started", "Day 4 started"])
+
+
+class TestQueuedLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.log_path = os.path.join(self.temp_dir.name, "game.log")
+        configure_logging(file_path=self.log_path, console=False)
+        self.addCleanup(configure_logging)
+        self.addCleanup(logger_module._subsystem_levels.clear)
+
+    def read_log(self):
+        shutdown_logging() # Flushes the writer thread
+        with open(self.log_path, encoding="utf-8") as log_file:
+            return log_file.read()
+
+    def test_records_reach_file_through_writer_thread(self):
+        get_logger("src.test_queue").warning("Crypto prices not initialized")
+        self.assertIn("Crypto prices not initialized", self.read_log())
+
+    def test_subsystem_level_changes_at_runtime(self):
+        mechanics_logger = get_logger("src.mechanics.test_levels")
+        mechanics_logger.debug("hidden debug")
+        set_subsystem_level("src.mechanics", logging.DEBUG)
+        mechanics_logger.debug("visible debug")
+        self.assertEqual(get_logger("src.mechanics.created_later").level, logging.DEBUG)
+
+        log_text = self.read_log()
+        self.assertNotIn("hidden debug", log_text)
+        self.assertIn("visible debug", log_text)
+
+
+if __name__ == '__main__':
+    unittest.main()
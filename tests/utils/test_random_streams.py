@@ -0,0 +1,40 @@
+import random
+import unittest
+
+from src.utils.random_streams import RandomStreams, common_random_numbers, decision_rng, set_stream_day
+
+
+class TestRandomStreams(unittest.TestCase):
+
+    def test_default_mode_uses_the_global_generator(self):
+        self.assertIs(decision_rng("mugging"), random)
+        set_stream_day(4) # No-op outside common random numbers
+        self.assertIs(decision_rng("restock", "Downtown"), random)
+
+    def test_streams_depend_only_on_seed_day_site_and_key(self):
+        first, second = RandomStreams(7), RandomStreams(7)
+        first.set_day(3)
+        second.set_day(3)
+        first.stream("police_stop").random() # Draws at one site don't shift another
+        self.assertEqual(first.stream("mugging").random(), second.stream("mugging").random())
+        self.assertNotEqual(second.stream("restock", "A").random(), RandomStreams(7).stream("restock", "B").random())
+        self.assertNotEqual(RandomStreams(7).stream("mugging").random(), RandomStreams(8).stream("mugging").random())
+
+    def test_new_day_rederives_the_streams(self):
+        streams = RandomStreams(1)
+        day_zero = streams.stream("mugging").random()
+        streams.set_day(1)
+        self.assertNotEqual(streams.stream("mugging").random(), day_zero)
+        streams.set_day(0)
+        self.assertEqual(streams.stream("mugging").random(), day_zero)
+
+    def test_context_activates_and_restores(self):
+        with common_random_numbers(5) as streams:
+            set_stream_day(2)
+            self.assertEqual(streams.day, 2)
+            self.assertIs(decision_rng("mugging"), streams.stream("mugging"))
+        self.assertIs(decision_rng("mugging"), random)
+
+
+if __name__ == '__main__':
+    unittest.main()
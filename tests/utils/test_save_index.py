@@ -0,0 +1,155 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.core.enums import RegionName
+from src.core.player_inventory import PlayerInventory
+from src.game_state import GameState
+from src.utils.autosave import AutosaveService
+from src.utils.save_files import encode_save_file, read_save_header, snapshot_game, write_file_atomically
+from src.utils.save_index import INDEX_FILE_NAME, SaveIndex, SaveSummary, ThumbnailCache, build_save_summary
+
+
+def make_summary(file_name, day=1, timestamp=1000.0):
+    return SaveSummary(file_name, day, "Downtown", 500.0, 750.0, None, timestamp)
+
+
+class TestBuildSaveSummary(unittest.TestCase):
+
+    def test_summary_uses_game_state_summary_and_finances(self):
+        random.seed(2)
+        player_inv = PlayerInventory()
+        player_inv.cash = 1234.0
+        game_state = GameState()
+        game_state.set_current_player_region(RegionName.SUBURBS)
+        game_state.current_day = 12
+        game_state.all_regions[RegionName.DOCKS].current_heat = 30
+
+        summary = build_save_summary("slot.sav", player_inv, game_state, timestamp=99.0)
+        self.assertEqual(summary.day, 12)
+        self.assertEqual(summary.region, RegionName.SUBURBS.value)
+        self.assertEqual(summary.cash, 1234.0)
+        self.assertGreaterEqual(summary.net_worth, 1234.0)
+        self.assertEqual(summary.campaign_phase, 1)
+        self.assertEqual(summary.timestamp, 99.0)
+        self.assertEqual(summary.region_heat[RegionName.DOCKS.value], 30)
+
+    def test_summary_stores_and_shows_the_campaign_phase(self):
+        game_state = GameState()
+        game_state.set_current_player_region(RegionName.DOWNTOWN)
+        game_state.current_day = 50
+
+        with patch("src.narco_configs.CAMPAIGN_PHASE_THRESHOLDS", [45, 70, 100, 120]):
+            summary = build_save_summary("slot.sav", PlayerInventory(), game_state, timestamp=99.0)
+        self.assertEqual(summary.campaign_phase, 2)
+        self.assertEqual(SaveSummary.from_header(summary.to_header()).campaign_phase, 2)
+        self.assertEqual(summary.title(), f"slot.sav  -  Day 50 in {RegionName.DOWNTOWN.value} | Phase 2")
+        self.assertNotIn("Phase", make_summary("old.sav").title())
+
+
+class TestSaveIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.save_dir = self.tmp_dir.name
+
+    def write_save(self, summary):
+        path = os.path.join(self.save_dir, summary.file_name)
+        write_file_atomically(path, encode_save_file(snapshot_game("inventory", "state"), summary.to_header()))
+        return path
+
+    def test_header_is_readable_without_the_payload(self):
+        path = self.write_save(make_summary("a.sav", day=4))
+        self.assertEqual(SaveSummary.from_header(read_save_header(path)), make_summary("a.sav", day=4))
+
+    def test_load_reads_only_the_index(self):
+        index = SaveIndex(self.save_dir)
+        index.update(make_summary("old.sav", timestamp=1.0))
+        index.update(make_summary("new.sav", timestamp=2.0))
+
+        with patch("src.utils.save_index.read_save_header") as read_header:
+            entries = SaveIndex(self.save_dir).load()
+        read_header.assert_not_called()
+        self.assertEqual([entry.file_name for entry in entries], ["new.sav", "old.sav"])
+
+    def test_missing_or_corrupt_index_is_rebuilt_from_headers(self):
+        self.write_save(make_summary("a.sav", day=3, timestamp=5.0))
+        self.write_save(make_summary("b.sav", day=8, timestamp=6.0))
+        self.assertEqual([entry.day for entry in SaveIndex(self.save_dir).load()], [8, 3])
+        self.assertTrue(os.path.exists(os.path.join(self.save_dir, INDEX_FILE_NAME)))
+
+        with open(os.path.join(self.save_dir, INDEX_FILE_NAME), "w") as index_file:
+            index_file.write("{not json")
+        self.assertEqual(len(SaveIndex(self.save_dir).load()), 2)
+
+    def test_autosave_keeps_index_current(self):
+        random.seed(2)
+        player_inv, game_state = PlayerInventory(), GameState()
+        service = AutosaveService(self.save_dir, slot_count=2)
+        self.addCleanup(service.close)
+        for day in (1, 2, 3):
+            game_state.current_day = day
+            service.request_save(player_inv, game_state)
+            self.assertTrue(service.flush(timeout=5))
+
+        entries = SaveIndex(self.save_dir).load()
+        self.assertEqual([(entry.file_name, entry.day) for entry in entries],
+                         [("autosave_1.sav", 3), ("autosave_2.sav", 2)])
+
+
+class TestThumbnailCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache = ThumbnailCache(self.tmp_dir.name)
+        self.rendered = []
+
+    def render(self, summary, path):
+        self.rendered.append(summary.file_name)
+        with open(path, "wb") as thumbnail_file:
+            thumbnail_file.write(b"png")
+
+    def test_renders_once_per_save_version(self):
+        summary = make_summary("a.sav", timestamp=10.0)
+        first_path = self.cache.get(summary, self.render)
+        self.assertEqual(self.cache.get(summary, self.render), first_path)
+        self.assertEqual(self.rendered, ["a.sav"])
+
+        newer_path = self.cache.get(summary._replace(timestamp=20.0), self.render)
+        self.assertEqual(self.rendered, ["a.sav", "a.sav"])
+        self.assertFalse(os.path.exists(first_path)) # Stale thumbnail removed
+        self.assertTrue(os.path.exists(newer_path))
+
+    def test_render_failure_returns_none(self):
+        def failing_render(summary, path):
+            raise OSError("no space")
+        self.assertIsNone(self.cache.get(make_summary("a.sav"), failing_render))
+
+    def test_repeat_lookups_stay_off_the_disk(self):
+        summary = make_summary("a.sav")
+        path = self.cache.get(summary, self.render)
+        with patch("src.utils.save_index.os.path.exists") as exists:
+            for _ in range(3):
+                self.assertEqual(self.cache.get(summary, self.render), path)
+        exists.assert_not_called()
+
+    def test_failed_render_is_retried_only_for_a_new_save_version(self):
+        attempts = []
+        def failing_render(summary, path):
+            attempts.append(summary.timestamp)
+            raise RuntimeError("no display")
+        summary = make_summary("a.sav", timestamp=10.0)
+        self.assertIsNone(self.cache.get(summary, failing_render))
+        self.assertIsNone(self.cache.get(summary, failing_render))
+        self.assertEqual(attempts, [10.0])
+
+        self.assertIsNotNone(self.cache.get(summary._replace(timestamp=20.0), self.render))
+        self.assertEqual(self.rendered, ["a.sav"])
+
+
+if __name__ == '__main__':
+    unittest.main()
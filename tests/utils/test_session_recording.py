@@ -0,0 +1,153 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from src import narco_configs as game_configs
+from src.core.enums import DrugName, DrugQuality, RegionName, SkillID
+from src.core.player_inventory import PlayerInventory
+from src.game_state import GameState
+from src.utils import session_recording
+from src.utils.engine_fingerprint import engine_fingerprint
+from src.utils.session_recording import (
+    Checkpoint,
+    RecordedCommand,
+    ReplayContext,
+    SessionRecorder,
+    compute_state_hash,
+    decode_action_argument,
+    encode_action_argument,
+    read_recording,
+    recorded_action,
+    set_active_recorder,
+)
+
+
+def new_game(seed):
+    random.seed(seed)
+    player_inv = PlayerInventory()
+    game_state = GameState()
+    game_state.set_current_player_region(RegionName.DOWNTOWN)
+    return ReplayContext(player_inv, game_state, game_configs)
+
+
+class TestArgumentEncoding(unittest.TestCase):
+
+    def test_round_trip_resolves_against_replaying_game(self):
+        recorded_game = new_game(1)
+        replaying_game = new_game(1)
+        args = [SkillID.ADVANCED_MARKET_ANALYSIS, recorded_game.player_inventory, recorded_game.game_configs,
+                recorded_game.game_state.all_regions[RegionName.DOCKS], "service", 2.5, None]
+        encoded = [encode_action_argument(arg, recorded_game) for arg in args]
+        decoded = [decode_action_argument(arg, replaying_game) for arg in encoded]
+        self.assertEqual(decoded[0], SkillID.ADVANCED_MARKET_ANALYSIS)
+        self.assertIs(decoded[1], replaying_game.player_inventory)
+        self.assertIs(decoded[2], game_configs)
+        self.assertIs(decoded[3], replaying_game.game_state.all_regions[RegionName.DOCKS])
+        self.assertEqual(decoded[4:], ["service", 2.5, None])
+
+    def test_unknown_argument_type_is_rejected(self):
+        with self.assertRaises(TypeError):
+            encode_action_argument(object(), new_game(1))
+
+
+class TestStateHash(unittest.TestCase):
+
+    def test_same_seed_gives_same_hash(self):
+        first, second = new_game(7), new_game(7)
+        self.assertEqual(compute_state_hash(first.player_inventory, first.game_state),
+                         compute_state_hash(second.player_inventory, second.game_state))
+
+    def test_hash_changes_with_state(self):
+        game = new_game(7)
+        before = compute_state_hash(game.player_inventory, game.game_state)
+        game.player_inventory.add_drug(DrugName.WEED, DrugQuality.STANDARD, 1)
+        self.assertNotEqual(before, compute_state_hash(game.player_inventory, game.game_state))
+
+    def test_hash_covers_market_stock(self):
+        game = new_game(7)
+        before = compute_state_hash(game.player_inventory, game.game_state)
+        market = game.game_state.all_regions[RegionName.DOCKS].drug_market_data
+        quality_data = next(iter(next(iter(market.values()))["available_qualities"].values()))
+        quality_data["quantity_available"] += 1
+        self.assertNotEqual(before, compute_state_hash(game.player_inventory, game.game_state))
+
+
+class TestRecordedAction(unittest.TestCase):
+
+    def setUp(self):
+        self.game = new_game(3)
+        self.recorder = SessionRecorder(seed=3)
+        self.typed = {"quantity_input_string": "12", "tech_input_string": ""}
+        self.recorder.attach(self.game, lambda: dict(self.typed))
+        set_active_recorder(self.recorder)
+        self.addCleanup(set_active_recorder, None)
+
+        @recorded_action("inner")
+        def inner(region):
+            return region.name
+
+        @recorded_action("advance")
+        def advance(player_inv, days):
+            inner(self.game.game_state.current_player_region)
+            self.game.game_state.current_day += days
+
+        self.advance = advance
+
+    def test_records_outermost_action_with_inputs_and_checkpoints_new_day(self):
+        self.advance(self.game.player_inventory, 1)
+        self.assertEqual(self.recorder.commands, [
+            RecordedCommand(1, "advance", [{"ref": "player_inventory"}, 1], {"quantity_input_string": "12"})
+        ])
+        self.assertEqual([(c.step, c.day) for c in self.recorder.checkpoints], [(0, 1), (1, 2)])
+
+    def test_no_checkpoint_when_day_unchanged(self):
+        self.advance(self.game.player_inventory, 0)
+        self.assertEqual(len(self.recorder.checkpoints), 1)
+
+    def test_inactive_recorder_records_nothing(self):
+        set_active_recorder(None)
+        self.advance(self.game.player_inventory, 1)
+        self.assertEqual(self.recorder.commands, [])
+        self.assertEqual(session_recording._recording_depth, 0)
+
+    def test_save_and_read_round_trip(self):
+        self.advance(self.game.player_inventory, 1)
+        self.advance(self.game.player_inventory, 0)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "session.jsonl")
+            self.recorder.save(path)
+            seed, entries = read_recording(path)
+            entries = list(entries)
+        self.assertEqual(seed, 3)
+        self.assertEqual([type(entry) for entry in entries],
+                         [Checkpoint, RecordedCommand, Checkpoint, RecordedCommand])
+        self.assertEqual(entries[1], self.recorder.commands[0])
+        self.assertEqual(entries[2], self.recorder.checkpoints[1])
+
+    def test_rejects_files_that_are_not_recordings(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "other.jsonl")
+            with open(path, "w") as other_file:
+                other_file.write('{"hello": 1}\n')
+            with self.assertRaises(ValueError):
+                read_recording(path)
+
+    def test_rejects_recordings_from_another_engine(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "session.jsonl")
+            self.recorder.save(path)
+            with open(path) as recording_file:
+                lines = recording_file.read().splitlines()
+            header = json.loads(lines[0])
+            self.assertEqual(header["engine"], engine_fingerprint())
+            header["engine"] = "0" * 32
+            with open(path, "w") as recording_file:
+                recording_file.write("\n".join([json.dumps(header)] + lines[1:]) + "\n")
+            with self.assertRaisesRegex(ValueError, "different game engine"):
+                read_recording(path)
+
+
+if __name__ == '__main__':
+    unittest.main()